@@ -39,14 +39,15 @@ import numpy as np
 import requests
 import time
 import sqlite3
-import json
-import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 import warnings
 warnings.filterwarnings('ignore')
 import ccxt
 
+from utils.persistent_cache import PersistentCache
+from utils.streaming_indicators import get_indicator_engine
+
 # ML and Analysis Libraries
 try:
     from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
@@ -121,50 +122,16 @@ class AlphaVantageConnector:
         self.last_request_time = 0
         self.last_reset_date = datetime.now().date()
 
-        # Multi-level caching
-        self.memory_cache = {}
+        # Multi-level caching: in-memory LRU over an indexed on-disk cache (loaded lazily)
         self.cache_ttl = 300  # 5 minutes for real-time data
         self.indicator_cache_ttl = 3600  # 1 hour for indicators
-        self.cache_file = "alpha_vantage_cache.json"
-
-        # Load persistent cache
-        self._load_cache_from_file()
+        self.cache_file = "alpha_vantage_cache.db"
+        self.cache = PersistentCache(self.cache_file)
 
         # Rate limiting settings
         self.min_request_interval = 12  # seconds between requests
         self.max_monthly_requests = 500
 
-    def _load_cache_from_file(self):
-        """Load cache from persistent storage"""
-        try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r') as f:
-                    file_cache = json.load(f)
-                    current_time = time.time()
-
-                    # Filter out expired entries
-                    for key, value in file_cache.items():
-                        if isinstance(value, dict) and 'timestamp' in value:
-                            if current_time - value['timestamp'] < self.cache_ttl:
-                                self.memory_cache[key] = (value['data'], value['timestamp'])
-        except Exception as e:
-            print(f"Cache load error: {e}")
-
-    def _save_cache_to_file(self):
-        """Save cache to persistent storage"""
-        try:
-            file_cache = {}
-            for key, (data, timestamp) in self.memory_cache.items():
-                file_cache[key] = {
-                    'data': data,
-                    'timestamp': timestamp
-                }
-
-            with open(self.cache_file, 'w') as f:
-                json.dump(file_cache, f, default=str)
-        except Exception as e:
-            print(f"Cache save error: {e}")
-
     def _reset_monthly_counter(self):
         """Reset monthly request counter if new month"""
         current_date = datetime.now().date()
@@ -191,21 +158,18 @@ class AlphaVantageConnector:
         """Enhanced API request with exponential backoff and caching"""
         cache_key = f"{cache_type}_{str(sorted(params.items()))}"
 
-        # Check memory cache first
-        if cache_key in self.memory_cache:
-            cached_data, timestamp = self.memory_cache[cache_key]
-            ttl = self.indicator_cache_ttl if cache_type == 'indicator' else self.cache_ttl
+        ttl = self.indicator_cache_ttl if cache_type == 'indicator' else self.cache_ttl
 
-            if time.time() - timestamp < ttl:
-                return cached_data
+        # Check cache first
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached[0]
 
         # Check if we can make request
         if not self._can_make_request():
             # Return cached data even if expired, or None
-            if cache_key in self.memory_cache:
-                cached_data, _ = self.memory_cache[cache_key]
-                return cached_data
-            return None
+            cached = self.cache.get(cache_key, allow_expired=True)
+            return cached[0] if cached is not None else None
 
         # Wait for rate limit
         current_time = time.time()
@@ -234,9 +198,8 @@ class AlphaVantageConnector:
                 if 'Information' in data and 'API call frequency' in data['Information']:
                     raise Exception("API rate limit exceeded")
 
-                # Cache successful response
-                self.memory_cache[cache_key] = (data, current_time)
-                self._save_cache_to_file()
+                # Cache successful response (single-row write)
+                self.cache.set(cache_key, data, ttl)
 
                 return data
 
@@ -244,10 +207,8 @@ class AlphaVantageConnector:
                 if attempt == max_retries - 1:
                     print(f"API request failed after {max_retries} attempts: {e}")
                     # Return cached data if available
-                    if cache_key in self.memory_cache:
-                        cached_data, _ = self.memory_cache[cache_key]
-                        return cached_data
-                    return None
+                    cached = self.cache.get(cache_key, allow_expired=True)
+                    return cached[0] if cached is not None else None
                 else:
                     wait_time = (2 ** attempt) * 1  # Exponential backoff
                     time.sleep(wait_time)
@@ -499,7 +460,7 @@ class AlphaVantageConnector:
             'monthly_requests': self.monthly_requests,
             'monthly_limit': self.max_monthly_requests,
             'requests_remaining': self.max_monthly_requests - self.monthly_requests,
-            'cache_entries': len(self.memory_cache),
+            'cache_entries': len(self.cache),
             'last_request_time': datetime.fromtimestamp(self.last_request_time).isoformat() if self.last_request_time > 0 else 'None',
             'can_make_request': self._can_make_request()
         }
@@ -567,6 +528,32 @@ class TechnicalIndicators:
             'ema_20': prices.ewm(span=20).mean()
         }
 
+    @staticmethod
+    def update_streaming(symbol: str, timeframe: str, candle: List[float],
+                         closed: bool = False, exchange: str = 'binance') -> Dict[str, Any]:
+        """Update indicators for one [ts, open, high, low, close, volume] candle in O(1)
+
+        Uses the shared streaming engine and returns the latest values of the columns
+        add_all_indicators computes locally, without rebuilding a DataFrame.
+        """
+        values = get_indicator_engine().update_candle(exchange, symbol, timeframe, candle, closed)
+        return {
+            'rsi': values.get('rsi'),
+            'macd': values.get('macd_line'),
+            'macd_signal': values.get('macd_signal'),
+            'macd_histogram': values.get('macd_histogram'),
+            'bb_upper': values.get('bb_upper'),
+            'bb_middle': values.get('bb_middle'),
+            'bb_lower': values.get('bb_lower'),
+            'sma_10': values.get('sma_10'),
+            'sma_20': values.get('sma_20'),
+            'sma_50': values.get('sma_50'),
+            'ema_10': values.get('ema_10'),
+            'ema_20': values.get('ema_20'),
+            'atr': values.get('atr'),
+            'true_range': values.get('true_range')
+        }
+
     @classmethod
     def add_all_indicators(cls, df: pd.DataFrame, api_client=None) -> pd.DataFrame:
         """Add all technical indicators to dataframe with API integration"""
@@ -1468,6 +1455,63 @@ class MLSignalGenerator:
             "model_agreement": return_signal_agreement
         }
 
+    def predict_signals_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Score every bar of df in one pass.
+
+        Row i matches what predict_signal(df.iloc[:i+1]) returns for signal,
+        confidence, predicted_return and risk_level. Features are computed
+        once over the whole frame (they are strictly causal) and all models
+        are called once on the full feature matrix.
+        """
+        if not self.is_trained:
+            return pd.DataFrame()
+
+        n = len(df)
+        features_df = self.prepare_features(df)
+
+        result = pd.DataFrame(index=df.index)
+        result['has_features'] = False
+        result['signal'] = None
+        result['confidence'] = np.nan
+        result['predicted_return'] = np.nan
+        result['risk_level'] = None
+
+        if n == 0 or len(features_df) == 0:
+            return result
+
+        # Batched model calls over every valid feature row
+        scaled = self.scaler.transform(features_df.values)
+        signals = self.label_encoder.inverse_transform(self.classification_model.predict(scaled))
+        max_proba = self.classification_model.predict_proba(scaled).max(axis=1)
+        returns = self.return_regression_model.predict(scaled)
+
+        # A prefix ending at bar i uses the last valid feature row at or before i
+        valid_pos = np.flatnonzero(df.index.isin(features_df.index))
+        src = np.searchsorted(valid_pos, np.arange(n), side='right') - 1
+        has_features = src >= 0
+        src = np.where(has_features, src, 0)
+
+        bar_signals = signals[src]
+        bar_returns = returns[src]
+
+        is_buy = np.isin(bar_signals, ['BUY', 'STRONG_BUY'])
+        is_sell = np.isin(bar_signals, ['SELL', 'STRONG_SELL'])
+        agreement = np.full(n, 0.5)
+        agreement[is_buy & (bar_returns > 0)] = 0.8
+        agreement[is_sell & (bar_returns < 0)] = 0.8
+        agreement[(bar_signals == 'HOLD') & (np.abs(bar_returns) < 0.01)] = 0.7
+        confidence = (max_proba[src] + agreement) / 2
+
+        risk_level = self._assess_risk_batch(df, bar_returns)
+
+        result['has_features'] = has_features
+        result['signal'] = np.where(has_features, bar_signals, None)
+        result['confidence'] = np.where(has_features, confidence, np.nan)
+        result['predicted_return'] = np.where(has_features, bar_returns, np.nan)
+        result['risk_level'] = np.where(has_features, risk_level, None)
+
+        return result
+
     def _get_technical_confirmation(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Get technical indicator confirmation"""
         if len(df) == 0:
@@ -1539,6 +1583,37 @@ class MLSignalGenerator:
         else:
             return 'high'
 
+    def _assess_risk_batch(self, df: pd.DataFrame, predicted_returns: np.ndarray) -> np.ndarray:
+        """Vectorized _assess_risk for every prefix df.iloc[:i+1]"""
+        n = len(df)
+        risk_factors = np.zeros(n, dtype=int)
+
+        # Volatility risk (needs a full 20-bar window)
+        if 'close' in df.columns and n >= 20:
+            windows = np.lib.stride_tricks.sliding_window_view(df['close'].to_numpy(dtype=float), 20)
+            volatility = windows.std(axis=1, ddof=1) / windows.mean(axis=1)
+            risk_factors[19:] += (volatility > 0.05).astype(int)
+
+        # Magnitude of predicted return
+        risk_factors += (np.abs(predicted_returns) > 0.1).astype(int)
+
+        # Volume analysis (tail() on short prefixes uses every available bar)
+        if 'volume' in df.columns and n >= 10:
+            volume = df['volume'].to_numpy(dtype=float)
+            recent_volume = np.empty(n)
+            avg_volume = np.empty(n)
+            for i in range(min(n, 19)):
+                recent_volume[i] = volume[max(0, i - 4):i + 1].mean()
+                avg_volume[i] = volume[:i + 1].mean()
+            if n >= 20:
+                recent_volume[19:] = np.lib.stride_tricks.sliding_window_view(volume, 5)[15:].mean(axis=1)
+                avg_volume[19:] = np.lib.stride_tricks.sliding_window_view(volume, 20).mean(axis=1)
+            low_volume = recent_volume < avg_volume * 0.5
+            low_volume[:9] = False
+            risk_factors += low_volume.astype(int)
+
+        return np.select([risk_factors == 0, risk_factors == 1], ['low', 'medium'], default='high')
+
 # ==========================================
 # 5. BINANCE FUTURES INTEGRATION
 # ==========================================
@@ -2610,11 +2685,21 @@ class BacktestingEngine:
         self.initial_capital = initial_capital
         self.results = []
 
-    def run_backtest(self, df: pd.DataFrame, ml_model: MLSignalGenerator) -> Dict[str, Any]:
-        """Run comprehensive backtest with detailed performance metrics"""
+    def run_backtest(self, df: pd.DataFrame, ml_model: MLSignalGenerator,
+                     vectorized: bool = True) -> Dict[str, Any]:
+        """Run comprehensive backtest with detailed performance metrics
+
+        vectorized=True scores all bars with one batched model call and runs
+        the trade state machine over NumPy arrays. vectorized=False keeps the
+        original bar-by-bar loop, which re-predicts on every prefix (O(n^2)).
+        Both produce the same trades and metrics.
+        """
         if not ml_model.is_trained:
             return {"error": "ML model not trained"}
 
+        if vectorized:
+            return self._run_backtest_vectorized(df, ml_model)
+
         # Initialize portfolio
         capital = self.initial_capital
         position = 0
@@ -2784,6 +2869,120 @@ class BacktestingEngine:
             df, trades, portfolio_values, benchmark_values, daily_returns, min_lookback
         )
 
+    def _run_backtest_vectorized(self, df: pd.DataFrame, ml_model: MLSignalGenerator) -> Dict[str, Any]:
+        """Single-pass backtest: batched predictions + array-based state machine"""
+        min_lookback = max(Config.ML_LOOKBACK_PERIODS, 50)
+        n = len(df)
+
+        predictions = ml_model.predict_signals_batch(df)
+        close = df['close'].to_numpy(dtype=float)
+        dates = df.index
+
+        has_features = predictions['has_features'].to_numpy(dtype=bool)
+        signals = predictions['signal'].to_numpy()
+        confidences = predictions['confidence'].to_numpy(dtype=float)
+        risk_levels = predictions['risk_level'].to_numpy()
+
+        is_buy = np.isin(signals, ['BUY', 'STRONG_BUY'])
+        is_sell = np.isin(signals, ['SELL', 'STRONG_SELL'])
+        min_confidence = np.select([risk_levels == 'high', risk_levels == 'medium'], [0.7, 0.6], default=0.5)
+        buy_ready = is_buy & (confidences > min_confidence)
+        confidence_multiplier = np.minimum(confidences * 1.5, 1.0)
+        risk_multiplier = np.select([risk_levels == 'low', risk_levels == 'medium'], [1.0, 0.8], default=0.5)
+
+        # Track benchmark (buy and hold)
+        benchmark_start_price = close[min_lookback]
+        benchmark_values = (self.initial_capital * (1 + ((close[min_lookback:] / benchmark_start_price) - 1))).tolist()
+
+        capital = self.initial_capital
+        position = 0
+        position_price = 0
+        position_entry_date = None
+        trades = []
+        portfolio_values = []
+        daily_returns = []
+
+        def close_position(i, trade_type, signal, confidence, pnl_pct):
+            current_date = dates[i]
+            proceeds = position * close[i]
+            trades.append({
+                'date': current_date,
+                'type': trade_type,
+                'price': close[i],
+                'shares': position,
+                'value': proceeds,
+                'signal': signal,
+                'confidence': confidence,
+                'pnl': proceeds - (position * position_price),
+                'pnl_pct': pnl_pct,
+                'hold_days': (current_date - position_entry_date).days if position_entry_date else 0,
+                'entry_price': position_price,
+                'entry_date': position_entry_date
+            })
+            return proceeds
+
+        for i in range(min_lookback, n):
+            current_price = close[i]
+
+            if not has_features[i]:
+                portfolio_values.append(capital + position * current_price)
+                continue
+
+            if buy_ready[i] and position == 0:
+                position_size = capital * Config.MAX_POSITION_SIZE * confidence_multiplier[i] * risk_multiplier[i]
+                position_size = min(position_size, capital * 0.8)  # Never risk more than 80%
+
+                shares = position_size / current_price
+
+                if shares > 0 and position_size > 100:  # Minimum trade size
+                    position = shares
+                    position_price = current_price
+                    position_entry_date = dates[i]
+                    capital -= position_size
+
+                    trades.append({
+                        'date': position_entry_date,
+                        'type': 'BUY',
+                        'price': current_price,
+                        'shares': shares,
+                        'value': position_size,
+                        'signal': signals[i],
+                        'confidence': confidences[i],
+                        'risk_level': risk_levels[i]
+                    })
+
+            elif is_sell[i] and position > 0:
+                capital += close_position(i, 'SELL', signals[i], confidences[i],
+                                          (current_price / position_price) - 1)
+                position = 0
+                position_price = 0
+                position_entry_date = None
+
+            elif position > 0:
+                current_return = (current_price / position_price) - 1
+
+                if current_return <= -Config.STOP_LOSS_PCT:
+                    capital += close_position(i, 'STOP_LOSS', 'STOP_LOSS', 1.0, current_return)
+                    position = 0
+                    position_price = 0
+                    position_entry_date = None
+
+                elif current_return >= Config.TAKE_PROFIT_PCT:
+                    capital += close_position(i, 'TAKE_PROFIT', 'TAKE_PROFIT', 1.0, current_return)
+                    position = 0
+                    position_price = 0
+                    position_entry_date = None
+
+            total_value = capital + position * current_price
+            portfolio_values.append(total_value)
+
+            if len(portfolio_values) > 1:
+                daily_returns.append((total_value / portfolio_values[-2]) - 1)
+
+        return self._calculate_performance_metrics(
+            df, trades, portfolio_values, benchmark_values, daily_returns, min_lookback
+        )
+
     def _calculate_performance_metrics(self, df: pd.DataFrame, trades: List[Dict],
                                      portfolio_values: List[float], benchmark_values: List[float],
                                      daily_returns: List[float], min_lookback: int) -> Dict[str, Any]:
@@ -18,6 +18,8 @@ from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 
+from utils.streaming_indicators import get_indicator_engine
+
 @dataclass
 class MarketData:
     symbol: str
@@ -50,6 +52,10 @@ class MarketMonitor:
     - 볼라틸리티 분석
     """
 
+    # 공유 지표 엔진의 시리즈 키 (AISignalGenerator 와 동일하게 사용)
+    INDICATOR_EXCHANGE = 'binance'
+    INDICATOR_TIMEFRAME = '5m'
+
     def __init__(self, config_manager):
         """마켓 모니터 초기화"""
         self.logger = logging.getLogger(__name__)
@@ -68,6 +74,9 @@ class MarketMonitor:
         self.historical_data = {}
         self.last_update = {}
 
+        # 증분 기술적 지표 엔진 (모든 모니터가 공유)
+        self.indicator_engine = get_indicator_engine()
+
         # 이상 감지 설정
         self.anomaly_thresholds = {
             'price_spike': 0.05,  # 5% 급등/급락
@@ -159,6 +168,11 @@ class MarketMonitor:
             # 최신 캔들 데이터
             latest_candle = ohlcv[-1]
 
+            # 공유 지표 엔진 갱신 (새 캔들만 반영, 마지막 캔들은 진행 중)
+            self.indicator_engine.update_ohlcv(
+                self.INDICATOR_EXCHANGE, symbol, self.INDICATOR_TIMEFRAME, ohlcv
+            )
+
             # 24시간 변화율 계산
             change_24h = ticker.get('percentage', 0.0) or 0.0
 
@@ -18,6 +18,9 @@ import pandas as pd
 from dataclasses import dataclass
 from enum import Enum
 
+from utils.streaming_indicators import get_indicator_engine
+from .market_monitor import MarketMonitor
+
 # 기존 AI 시스템 import
 try:
     from ai_trading_signals import EnhancedAITradingSystem
@@ -83,6 +86,9 @@ class AISignalGenerator:
         self.ai_system = None
         self._initialize_ai_system()
 
+        # 증분 기술적 지표 엔진 (MarketMonitor 와 공유)
+        self.indicator_engine = get_indicator_engine()
+
         # 신호 캐시
         self.signal_cache = {}
         self.signal_history = []
@@ -325,18 +331,32 @@ class AISignalGenerator:
             self.logger.error(f"기술적 신호 생성 실패: {e}")
             return None
 
+    def _get_indicators(self, market_data) -> Dict[str, Any]:
+        """공유 스트리밍 엔진에서 최신 지표 조회 (현재 캔들이 반영되지 않았으면 갱신)"""
+        timestamp_ms = int(round(market_data.timestamp.timestamp() * 1000))
+        snapshot = self.indicator_engine.get_snapshot(
+            MarketMonitor.INDICATOR_EXCHANGE, market_data.symbol, MarketMonitor.INDICATOR_TIMEFRAME
+        )
+
+        if snapshot.get('timestamp') != timestamp_ms:
+            snapshot = self.indicator_engine.update_candle(
+                MarketMonitor.INDICATOR_EXCHANGE, market_data.symbol, MarketMonitor.INDICATOR_TIMEFRAME,
+                [timestamp_ms, market_data.open, market_data.high, market_data.low,
+                 market_data.close, market_data.volume]
+            )
+
+        return snapshot
+
     def _calculate_rsi(self, market_data, period: int = 14) -> float:
-        """RSI 계산 (시뮬레이션)"""
-        # 실제 구현에서는 historical data 필요
-        # 현재는 random 값으로 시뮬레이션
-        import random
-        return random.uniform(20, 80)
+        """RSI 조회 (데이터 부족 시 중립값 50)"""
+        rsi = self._get_indicators(market_data).get('rsi')
+        return rsi if rsi is not None else 50.0
 
     def _calculate_macd(self, market_data) -> Dict[str, Any]:
-        """MACD 계산 (시뮬레이션)"""
-        import random
-        macd_value = random.uniform(-1, 1)
-        signal_line = random.uniform(-1, 1)
+        """MACD 조회"""
+        indicators = self._get_indicators(market_data)
+        macd_value = indicators.get('macd_line') or 0.0
+        signal_line = indicators.get('macd_signal') or 0.0
 
         return {
             'macd': macd_value,
@@ -346,12 +366,18 @@ class AISignalGenerator:
         }
 
     def _calculate_bollinger_bands(self, market_data) -> Dict[str, Any]:
-        """볼린저 밴드 계산 (시뮬레이션)"""
+        """볼린저 밴드 조회 (워밍업 중에는 현재가 ±2% 근사 밴드 사용)"""
         price = market_data.close
-        # 시뮬레이션된 밴드
-        middle = price
-        upper = price * 1.02
-        lower = price * 0.98
+        indicators = self._get_indicators(market_data)
+
+        if indicators.get('bb_middle') is not None:
+            middle = indicators['bb_middle']
+            upper = indicators['bb_upper']
+            lower = indicators['bb_lower']
+        else:
+            middle = price
+            upper = price * 1.02
+            lower = price * 0.98
 
         signal = 'HOLD'
         if price <= lower:
@@ -364,7 +390,7 @@ class AISignalGenerator:
             'middle': middle,
             'lower': lower,
             'signal': signal,
-            'position': (price - lower) / (upper - lower)
+            'position': (price - lower) / (upper - lower) if upper != lower else 0.5
         }
 
     def _determine_trend(self, market_data) -> str:
@@ -11,7 +11,7 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple, Union
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import json
 try:
@@ -23,6 +23,14 @@ except ImportError:
     ThreadPoolExecutor = None
 import time
 
+try:
+    from .parameter_sweep import ParameterSweepRunner, run_signature
+    from .parameter_optimizer import StrategyOptimizer, ParamSpec, PARAMETER_SPACES
+except ImportError:
+    # 스크립트로 직접 실행하는 경우
+    from parameter_sweep import ParameterSweepRunner, run_signature
+    from parameter_optimizer import StrategyOptimizer, ParamSpec, PARAMETER_SPACES
+
 class BacktestStrategy(Enum):
     """백테스트 전략 유형"""
     RSI_CROSSOVER = "RSI 크로스오버"
@@ -224,11 +232,47 @@ class StrategyEngine:
 
         return signals
 
-    def execute_backtest(self, data: pd.DataFrame) -> BacktestResults:
-        """백테스트 실행"""
+    def execute_backtest(self, data: pd.DataFrame, vectorized: bool = True) -> BacktestResults:
+        """
+        백테스트 실행
+
+        vectorized=True이면 배열 기반 시뮬레이터를 사용 (기존 iterrows 루프와 동일한 결과)
+        """
         start_time = time.time()
 
         signals = self.generate_signals(data)
+
+        if vectorized:
+            equity_df, current_trade = self._simulate_arrays(data, signals)
+        else:
+            equity_df, current_trade = self._simulate_loop(data, signals)
+
+        # 마지막 포지션 청산
+        if current_trade and current_trade.exit_time is None:
+            final_price = data['close'].iloc[-1]
+            final_time = data.index[-1]
+            self._close_position(current_trade, final_price, final_time, "end_of_data")
+
+        execution_time = time.time() - start_time
+
+        # 결과 생성
+        performance_metrics = self._calculate_performance_metrics(equity_df)
+        monthly_returns = self._calculate_monthly_returns(equity_df)
+        drawdown_periods = self._calculate_drawdown_periods(equity_df)
+
+        return BacktestResults(
+            parameters=self.params,
+            trades=self.trades,
+            equity_curve=equity_df,
+            performance_metrics=performance_metrics,
+            monthly_returns=monthly_returns,
+            drawdown_periods=drawdown_periods,
+            execution_time=execution_time,
+            total_bars=len(data)
+        )
+
+    def _simulate_loop(self, data: pd.DataFrame, signals: pd.Series) -> Tuple[pd.DataFrame, Optional[Trade]]:
+        """캔들 단위 루프 시뮬레이션 (기존 구현)"""
         equity_history = []
         current_trade = None
 
@@ -268,30 +312,137 @@ class StrategyEngine:
                 'price': current_price
             })
 
-        # 마지막 포지션 청산
-        if current_trade and current_trade.exit_time is None:
-            final_price = data['close'].iloc[-1]
-            final_time = data.index[-1]
-            self._close_position(current_trade, final_price, final_time, "end_of_data")
+        return pd.DataFrame(equity_history), current_trade
 
-        execution_time = time.time() - start_time
+    def _simulate_arrays(self, data: pd.DataFrame, signals: pd.Series) -> Tuple[pd.DataFrame, Optional[Trade]]:
+        """
+        배열 기반 시뮬레이션
 
-        # 결과 생성
-        equity_df = pd.DataFrame(equity_history)
-        performance_metrics = self._calculate_performance_metrics(equity_df)
-        monthly_returns = self._calculate_monthly_returns(equity_df)
-        drawdown_periods = self._calculate_drawdown_periods(equity_df)
+        신호가 있거나 손절/익절/반대 신호가 발생하는 캔들만 기존 루프와 같은 순서로
+        처리하고, 그 사이 구간은 현금/포지션이 일정하므로 자산 가치를 배열 연산으로 채움
+        """
+        n = len(data)
+        if n == 0:
+            return pd.DataFrame(), None
 
-        return BacktestResults(
-            parameters=self.params,
-            trades=self.trades,
-            equity_curve=equity_df,
-            performance_metrics=performance_metrics,
-            monthly_returns=monthly_returns,
-            drawdown_periods=drawdown_periods,
-            execution_time=execution_time,
-            total_bars=len(data)
-        )
+        prices = data['close'].to_numpy(dtype=np.float64)
+        signal_values = signals.to_numpy()[:n]
+        if len(signal_values) < n:
+            signal_values = np.concatenate([signal_values, np.zeros(n - len(signal_values), dtype=signal_values.dtype)])
+        timestamps = data.index
+
+        equity = np.empty(n)
+        cash = np.empty(n)
+        position = np.zeros(n)
+
+        signal_bars = np.flatnonzero(signal_values != 0)
+        buy_bars = np.flatnonzero(signal_values > 0)
+        sell_bars = np.flatnonzero(signal_values < 0)
+
+        current_trade = None
+
+        # 첫 신호 전까지는 포지션 없음
+        i = int(signal_bars[0]) if len(signal_bars) else n
+        equity[:i] = self.cash
+        cash[:i] = self.cash
+        if i > 0:
+            self.equity = self.cash
+
+        while i < n:
+            current_price = prices[i]
+            timestamp = timestamps[i]
+            signal = signal_values[i]
+
+            # 기존 포지션 관리
+            if current_trade and current_trade.exit_time is None:
+                if self._should_exit_position(current_trade, current_price):
+                    self._close_position(current_trade, current_price, timestamp, "stop_loss_take_profit")
+
+            # 새로운 신호 처리
+            if signal != 0 and self.current_position == 0:
+                current_trade = self._open_position(signal, current_price, timestamp)
+
+            elif signal != 0 and self.current_position != 0:
+                if (signal > 0 and self.current_position < 0) or (signal < 0 and self.current_position > 0):
+                    if current_trade:
+                        self._close_position(current_trade, current_price, timestamp, "signal")
+                    current_trade = self._open_position(signal, current_price, timestamp)
+
+            # 자산 가치 업데이트
+            if self.current_position != 0:
+                self.equity = self.cash + self.current_position * current_price
+            else:
+                self.equity = self.cash
+
+            equity[i] = self.equity
+            cash[i] = self.cash
+            position[i] = self.current_position
+
+            # 다음 이벤트 캔들 찾기
+            if self.current_position != 0 and current_trade and current_trade.exit_time is None:
+                # 기존 루프는 거래 방향이 아닌 보유 수량의 부호로 반대 신호를 판단
+                # (자산이 음수가 되면 'buy' 거래도 음수 수량으로 열림)
+                opposite_bars = sell_bars if np.sign(self.current_position) > 0 else buy_bars
+                k = np.searchsorted(opposite_bars, i, side='right')
+                limit = int(opposite_bars[k]) if k < len(opposite_bars) else n
+
+                segment = prices[i + 1:limit]
+                exit_mask = self._exit_mask(current_trade, segment)
+                hits = np.flatnonzero(exit_mask)
+                next_event = i + 1 + int(hits[0]) if len(hits) else limit
+            else:
+                k = np.searchsorted(signal_bars, i, side='right')
+                next_event = int(signal_bars[k]) if k < len(signal_bars) else n
+
+            # 이벤트 사이 구간 채우기
+            if next_event > i + 1:
+                gap = slice(i + 1, next_event)
+                cash[gap] = self.cash
+                position[gap] = self.current_position
+                if self.current_position != 0:
+                    equity[gap] = self.cash + self.current_position * prices[gap]
+                else:
+                    equity[gap] = self.cash
+                self.equity = equity[next_event - 1]
+
+            i = next_event
+
+        # 포지션을 한 번도 잡지 않았다면 기존 루프처럼 초기 자본/정수 0의 타입을 유지
+        if not self.trades:
+            capital_dtype = np.asarray(self.cash).dtype
+            equity = equity.astype(capital_dtype)
+            cash = cash.astype(capital_dtype)
+            position = position.astype(np.int64)
+
+        equity_df = pd.DataFrame({
+            'timestamp': timestamps,
+            'equity': equity,
+            'cash': cash,
+            'position': position,
+            'price': prices
+        })
+        return equity_df, current_trade
+
+    def _exit_mask(self, trade: Trade, prices: np.ndarray) -> np.ndarray:
+        """_should_exit_position의 배열 버전"""
+        mask = np.zeros(len(prices), dtype=bool)
+
+        if trade.side == 'buy':
+            if self.params.stop_loss > 0:
+                stop_price = trade.entry_price * (1 - self.params.stop_loss)
+                mask |= prices <= stop_price
+            if self.params.take_profit > 0:
+                target_price = trade.entry_price * (1 + self.params.take_profit)
+                mask |= prices >= target_price
+        else:
+            if self.params.stop_loss > 0:
+                stop_price = trade.entry_price * (1 + self.params.stop_loss)
+                mask |= prices >= stop_price
+            if self.params.take_profit > 0:
+                target_price = trade.entry_price * (1 - self.params.take_profit)
+                mask |= prices <= target_price
+
+        return mask
 
     def _open_position(self, signal: int, price: float, timestamp: datetime) -> Trade:
         """포지션 열기"""
@@ -754,6 +905,12 @@ class BacktestingSystem:
                 key="opt_objective"
             )
 
+            opt_method = st.selectbox(
+                "탐색 방법",
+                ["그리드 탐색 (병렬)", "연속 반감 (Successive Halving)", "TPE (베이지안)"],
+                key="opt_method"
+            )
+
         with col2:
             opt_start_date = st.date_input(
                 "최적화 시작 날짜",
@@ -775,6 +932,20 @@ class BacktestingSystem:
                 key="max_iterations"
             )
 
+            early_stop_patience = st.number_input(
+                "조기 중단 (개선 없는 조합 수, 0=사용 안 함)",
+                min_value=0,
+                max_value=10000,
+                value=0,
+                key="early_stop_patience"
+            )
+
+            results_path = st.text_input(
+                "결과 파일 (같은 파일로 중단된 최적화 재개)",
+                value="",
+                key="optimization_results_path"
+            )
+
         # 파라미터 범위 설정
         st.markdown("#### 📊 파라미터 범위")
         param_ranges = self.show_parameter_ranges(opt_strategy)
@@ -785,11 +956,21 @@ class BacktestingSystem:
                 progress_bar = st.progress(0)
                 status_text = st.empty()
 
-                optimization_results = self.run_parameter_optimization(
-                    opt_strategy, opt_symbol, opt_objective, param_ranges,
-                    opt_start_date, opt_end_date, max_iterations,
-                    progress_bar, status_text
-                )
+                if opt_method == "그리드 탐색 (병렬)":
+                    optimization_results = self.run_parameter_optimization(
+                        opt_strategy, opt_symbol, opt_objective, param_ranges,
+                        opt_start_date, opt_end_date, max_iterations,
+                        progress_bar, status_text,
+                        results_path=results_path or None,
+                        early_stop_patience=early_stop_patience or None
+                    )
+                else:
+                    optimization_results = self.run_adaptive_optimization(
+                        opt_strategy, opt_symbol, opt_objective, param_ranges,
+                        opt_start_date, opt_end_date, max_iterations,
+                        "successive_halving" if opt_method.startswith("연속 반감") else "tpe",
+                        progress_bar, status_text
+                    )
 
                 if optimization_results:
                     st.session_state.optimization_results.append(optimization_results)
@@ -1021,62 +1202,70 @@ class BacktestingSystem:
     def run_parameter_optimization(self, strategy: str, symbol: str, objective: str,
                                  param_ranges: Dict[str, Tuple[float, float, float]],
                                  start_date, end_date, max_iterations: int,
-                                 progress_bar, status_text) -> Optional[Dict[str, Any]]:
-        """파라미터 최적화 실행"""
+                                 progress_bar, status_text,
+                                 max_workers: Optional[int] = None,
+                                 results_path: Optional[str] = None,
+                                 early_stop_patience: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """파라미터 최적화 실행 (시장 데이터 1회 로드 + 프로세스 풀 병렬 평가)"""
         try:
             # 파라미터 조합 생성
             param_combinations = self.generate_parameter_combinations(param_ranges, max_iterations)
 
-            best_result = None
-            best_score = float('-inf') if objective != "최대 드로다운 최소화" else float('inf')
-            all_results = []
+            base_params = self.build_optimization_parameters(strategy, symbol, start_date, end_date)
 
-            for i, params in enumerate(param_combinations):
-                # 진행률 업데이트
-                progress = (i + 1) / len(param_combinations)
-                progress_bar.progress(progress)
-                status_text.text(f"최적화 진행중: {i+1}/{len(param_combinations)} ({progress:.1%})")
+            # 모든 조합이 같은 데이터로 평가되도록 한 번만 로드
+            market_data = self.get_market_data(symbol, base_params.start_date, base_params.end_date)
+            if market_data.empty:
+                st.error("시장 데이터를 불러올 수 없습니다.")
+                return None
 
-                # 백테스트 실행
-                backtest_params = BacktestParameters(
-                    strategy=BacktestStrategy(strategy),
-                    symbol=symbol,
-                    timeframe=TimeFrame.H1,
-                    start_date=datetime.combine(start_date, datetime.min.time()),
-                    end_date=datetime.combine(end_date, datetime.min.time()),
-                    initial_capital=100000,
-                    max_position_size=10000,
-                    commission=0.001,
-                    slippage=0.0005,
-                    risk_per_trade=0.02,
-                    stop_loss=0.02,
-                    take_profit=0.04,
-                    custom_params=params
+            # 백테스트 설정 탭의 병렬 처리 설정 사용
+            if max_workers is None:
+                if st.session_state.get('parallel_processing', True):
+                    max_workers = st.session_state.get('num_threads')
+                else:
+                    max_workers = 1
+
+            minimize = objective == "최대 드로다운 최소화"
+
+            def on_progress(done, total, record, best):
+                progress = done / total if total else 1.0
+                progress_bar.progress(min(progress, 1.0))
+                status_text.text(
+                    f"최적화 진행중: {done}/{total} ({progress:.1%}) - 현재 최적 {objective}: {best.score:.4f}"
                 )
 
-                engine = StrategyEngine(backtest_params)
-                market_data = self.get_market_data(symbol, backtest_params.start_date, backtest_params.end_date)
+            runner = ParameterSweepRunner(
+                max_workers=max_workers,
+                results_path=results_path,
+                early_stop_patience=early_stop_patience
+            )
+            sweep = runner.run(
+                market_data, param_combinations, StrategyEngine, base_params,
+                score_fn=lambda metrics: self.score_metrics(metrics, objective),
+                minimize=minimize,
+                progress_callback=on_progress,
+                signature=run_signature(base_params, objective)
+            )
 
-                if not market_data.empty:
-                    result = engine.execute_backtest(market_data)
-                    score = self.calculate_optimization_score(result, objective)
+            if sweep['skipped']:
+                st.warning(f"⚠️ 결과 파일의 {sweep['skipped']}개 결과는 전략/심볼/기간/목적 함수가 달라 재사용하지 않았습니다.")
+
+            if sweep['best'] is None:
+                st.warning("평가된 파라미터 조합이 없습니다.")
+                return None
 
-                    all_results.append({
-                        'params': params,
-                        'score': score,
-                        'metrics': result.performance_metrics
-                    })
+            if sweep['stopped_early']:
+                st.info(f"⏹️ {early_stop_patience}개 조합 동안 개선이 없어 조기 중단했습니다 ({sweep['completed']}/{sweep['total']})")
 
-                    # 최적 결과 업데이트
-                    is_better = (score > best_score) if objective != "최대 드로다운 최소화" else (score < best_score)
-                    if is_better:
-                        best_score = score
-                        best_result = result
+            # 최적 조합만 다시 실행해 상세 결과(거래 내역, 자산 곡선) 생성
+            best_params = replace(base_params, custom_params=sweep['best'].params)
+            best_result = StrategyEngine(best_params).execute_backtest(market_data)
 
             return {
                 'best_result': best_result,
-                'best_score': best_score,
-                'all_results': all_results,
+                'best_score': sweep['best'].score,
+                'all_results': [record.to_dict() for record in sweep['records']],
                 'objective': objective,
                 'strategy': strategy,
                 'total_combinations': len(param_combinations)
@@ -1086,6 +1275,97 @@ class BacktestingSystem:
             st.error(f"최적화 중 오류가 발생했습니다: {e}")
             return None
 
+    def run_adaptive_optimization(self, strategy: str, symbol: str, objective: str,
+                                  param_ranges: Dict[str, Tuple[float, float, float]],
+                                  start_date, end_date, max_iterations: int, method: str,
+                                  progress_bar, status_text) -> Optional[Dict[str, Any]]:
+        """연속 반감 / TPE 최적화 실행 (max_iterations = 후보 수 또는 시도 횟수)"""
+        try:
+            base_params = self.build_optimization_parameters(strategy, symbol, start_date, end_date)
+
+            market_data = self.get_market_data(symbol, base_params.start_date, base_params.end_date)
+            if market_data.empty:
+                st.error("시장 데이터를 불러올 수 없습니다.")
+                return None
+
+            # UI에서 범위를 지정한 파라미터는 그 범위로, 나머지는 전략 기본 탐색 공간 사용
+            space = [
+                ParamSpec.from_range(spec.name, param_ranges[spec.name]) if spec.name in param_ranges else spec
+                for spec in PARAMETER_SPACES.get(strategy, [])
+            ]
+            known = {spec.name for spec in space}
+            space += [
+                ParamSpec.from_range(name, value_range)
+                for name, value_range in param_ranges.items()
+                if name not in known
+            ]
+
+            # 연속 반감은 단계별 평가 수가 줄어드므로 대략적인 총 평가 수로 진행률 표시
+            budget = max_iterations * 1.5 if method == "successive_halving" else max_iterations
+
+            def on_progress(point):
+                progress = min(point['evaluation'] / budget, 1.0)
+                progress_bar.progress(progress)
+                best = point['best_score']
+                best_text = f"{best:.4f}" if best is not None else "-"
+                status_text.text(
+                    f"최적화 진행중: 평가 {point['evaluation']}회 "
+                    f"(데이터 {point['window_fraction']:.0%}) - 현재 최적 {objective}: {best_text}"
+                )
+
+            optimizer = StrategyOptimizer(
+                market_data, StrategyEngine, base_params,
+                score_fn=lambda metrics: self.score_metrics(metrics, objective),
+                minimize=objective == "최대 드로다운 최소화",
+                space=space,
+                progress_callback=on_progress
+            )
+
+            if method == "successive_halving":
+                report = optimizer.successive_halving(n_candidates=max_iterations)
+            else:
+                report = optimizer.tpe_search(n_trials=max_iterations, n_startup=max(5, max_iterations // 4))
+            progress_bar.progress(1.0)
+
+            if report.best_params is None:
+                st.warning("평가된 파라미터 조합이 없습니다.")
+                return None
+
+            best_result = StrategyEngine(
+                replace(base_params, custom_params=report.best_params)
+            ).execute_backtest(market_data)
+
+            return {
+                'best_result': best_result,
+                'best_score': report.best_score,
+                'all_results': report.results,
+                'objective': objective,
+                'strategy': strategy,
+                'total_combinations': report.evaluations,
+                'report': report
+            }
+
+        except Exception as e:
+            st.error(f"최적화 중 오류가 발생했습니다: {e}")
+            return None
+
+    def build_optimization_parameters(self, strategy: str, symbol: str, start_date, end_date) -> BacktestParameters:
+        """최적화용 기본 백테스트 파라미터 (custom_params는 조합마다 교체)"""
+        return BacktestParameters(
+            strategy=BacktestStrategy(strategy),
+            symbol=symbol,
+            timeframe=TimeFrame.H1,
+            start_date=datetime.combine(start_date, datetime.min.time()),
+            end_date=datetime.combine(end_date, datetime.min.time()),
+            initial_capital=100000,
+            max_position_size=10000,
+            commission=0.001,
+            slippage=0.0005,
+            risk_per_trade=0.02,
+            stop_loss=0.02,
+            take_profit=0.04
+        )
+
     def generate_parameter_combinations(self, param_ranges: Dict[str, Tuple[float, float, float]],
                                       max_iterations: int) -> List[Dict[str, Any]]:
         """파라미터 조합 생성"""
@@ -1132,8 +1412,11 @@ class BacktestingSystem:
 
     def calculate_optimization_score(self, result: BacktestResults, objective: str) -> float:
         """최적화 점수 계산"""
-        metrics = result.performance_metrics
+        return self.score_metrics(result.performance_metrics, objective)
 
+    @staticmethod
+    def score_metrics(metrics: Dict[str, float], objective: str) -> float:
+        """성과 지표로부터 최적화 점수 계산"""
         if objective == "샤프 비율":
             return metrics.get('sharpe_ratio', 0)
         elif objective == "총 수익률":
@@ -1319,6 +1602,37 @@ class BacktestingSystem:
         scan_df = pd.DataFrame(scan_data)
         st.dataframe(scan_df, hide_index=True, use_container_width=True)
 
+        # 연속 반감 / TPE 수렴 곡선
+        report = optimization_results.get('report')
+        if report is not None:
+            st.markdown("#### 📉 수렴 곡선")
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("백테스트 평가 수", f"{report.evaluations}")
+            with col2:
+                st.metric("전체 구간 환산 평가 수", f"{report.full_equivalent_evaluations:.1f}")
+            with col3:
+                st.metric("초당 평가 수", f"{report.evaluations_per_second:.1f}")
+
+            convergence_df = pd.DataFrame(report.convergence)
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=convergence_df['evaluation'], y=convergence_df['score'],
+                mode='markers', name='평가 점수', opacity=0.5
+            ))
+            fig.add_trace(go.Scatter(
+                x=convergence_df['evaluation'], y=convergence_df['best_score'],
+                mode='lines', name='최적 점수', line=dict(shape='hv')
+            ))
+            fig.update_layout(
+                title=f"{objective} 수렴 곡선",
+                xaxis_title="평가 횟수",
+                yaxis_title=objective,
+                height=400
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
     def show_comparison_charts(self, selected_results: List[int]):
         """비교 차트 표시"""
         st.markdown("#### 📈 성과 비교 차트")
@@ -0,0 +1,367 @@
+"""
+🎯 전략 파라미터 최적화기 (Strategy Parameter Optimizer)
+그리드 전수 탐색 대신 연속 반감(Successive Halving)과 TPE 방식 탐색으로
+적은 백테스트 횟수로 최적 파라미터를 찾고 수렴 곡선을 기록
+"""
+
+import math
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .parameter_sweep import params_key
+except ImportError:
+    # 스크립트로 직접 실행하는 경우
+    from parameter_sweep import params_key
+
+@dataclass
+class ParamSpec:
+    """탐색할 파라미터 하나의 범위"""
+    name: str
+    low: float
+    high: float
+    step: Optional[float] = 1  # None이면 연속값
+
+    @classmethod
+    def from_range(cls, name: str, value_range: Tuple[float, float, float]) -> 'ParamSpec':
+        """UI의 (최소, 최대, 간격) 범위를 변환"""
+        low, high, step = value_range
+        return cls(name=name, low=low, high=high, step=step)
+
+    @property
+    def is_integer(self) -> bool:
+        return self.step is not None and float(self.step).is_integer() and float(self.low).is_integer()
+
+    def to_unit(self, value: float) -> float:
+        """[low, high] -> [0, 1]"""
+        if self.high == self.low:
+            return 0.0
+        return (value - self.low) / (self.high - self.low)
+
+    def from_unit(self, u: float) -> Any:
+        """[0, 1] -> 간격에 맞춘 실제 값"""
+        value = self.low + min(max(u, 0.0), 1.0) * (self.high - self.low)
+        if self.step:
+            value = self.low + round((value - self.low) / self.step) * self.step
+            value = min(value, self.high)
+        return int(round(value)) if self.is_integer else float(value)
+
+# 전략별 기본 탐색 공간 (StrategyEngine custom_params 키와 동일)
+PARAMETER_SPACES: Dict[str, List[ParamSpec]] = {
+    'RSI 크로스오버': [
+        ParamSpec('rsi_period', 5, 30, 1),
+        ParamSpec('oversold_level', 10, 40, 1),
+        ParamSpec('overbought_level', 60, 90, 1)
+    ],
+    '이동평균선': [
+        ParamSpec('short_ma', 5, 50, 1),
+        ParamSpec('long_ma', 20, 200, 5)
+    ],
+    '볼린저 밴드': [
+        ParamSpec('bb_period', 10, 50, 1),
+        ParamSpec('bb_std', 1.0, 3.0, 0.1)
+    ],
+    'MACD': [
+        ParamSpec('macd_fast', 5, 20, 1),
+        ParamSpec('macd_slow', 20, 50, 1),
+        ParamSpec('macd_signal', 5, 15, 1)
+    ],
+    '모멘텀': [
+        ParamSpec('momentum_period', 5, 50, 1),
+        ParamSpec('momentum_threshold', 0.005, 0.1, 0.005)
+    ],
+    '평균 회귀': [
+        ParamSpec('mean_period', 10, 50, 1),
+        ParamSpec('mean_threshold', 1.0, 3.0, 0.1)
+    ],
+    '돌파 전략': [
+        ParamSpec('breakout_period', 10, 100, 1)
+    ]
+}
+
+# (작아야 하는 파라미터, 커야 하는 파라미터) 쌍
+PARAMETER_CONSTRAINTS = [
+    ('short_ma', 'long_ma'),
+    ('macd_fast', 'macd_slow'),
+    ('oversold_level', 'overbought_level')
+]
+
+@dataclass
+class OptimizationReport:
+    """최적화 결과 보고서"""
+    method: str
+    best_params: Optional[Dict[str, Any]]
+    best_score: float
+    best_metrics: Dict[str, float]
+    evaluations: int
+    full_evaluations: int
+    full_equivalent_evaluations: float  # 평가한 캔들 수 / 전체 캔들 수
+    elapsed: float
+    evaluations_per_second: float
+    convergence: List[Dict[str, Any]] = field(default_factory=list)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+class StrategyOptimizer:
+    """StrategyEngine 전략용 연속 반감 / TPE 최적화기"""
+
+    def __init__(self, data: pd.DataFrame, engine_cls, base_params,
+                 score_fn: Callable[[Dict[str, float]], float], minimize: bool = False,
+                 space: Optional[List[ParamSpec]] = None, seed: Optional[int] = None,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Args:
+            data: 백테스트 시장 데이터
+            engine_cls: 백테스트 엔진 클래스 (StrategyEngine)
+            base_params: custom_params만 바꿔 쓸 기본 BacktestParameters
+            score_fn: 성과 지표 -> 점수 (BacktestingSystem.score_metrics)
+            minimize: True면 낮은 점수가 더 좋음
+            space: 탐색 공간 (기본: 전략별 PARAMETER_SPACES)
+            seed: 난수 시드
+            progress_callback: 평가마다 수렴 곡선의 새 지점을 받는 콜백
+        """
+        self.data = data
+        self.engine_cls = engine_cls
+        self.base_params = base_params
+        self.score_fn = score_fn
+        self.minimize = minimize
+        self.space = space if space is not None else PARAMETER_SPACES.get(base_params.strategy.value, [])
+        self.rng = np.random.default_rng(seed)
+        self.progress_callback = progress_callback
+
+        self._reset_run()
+
+    def _reset_run(self):
+        self._cache: Dict[Tuple[str, int], Tuple[float, Dict[str, float]]] = {}
+        self.evaluations = 0
+        self.full_evaluations = 0
+        self.bars_evaluated = 0
+        self.convergence: List[Dict[str, Any]] = []
+        self.results: List[Dict[str, Any]] = []
+        self.best_params: Optional[Dict[str, Any]] = None
+        self.best_score = math.inf if self.minimize else -math.inf
+        self.best_metrics: Dict[str, float] = {}
+        self._start_time = time.perf_counter()
+
+    def _is_better(self, score: float, reference: float) -> bool:
+        return score < reference if self.minimize else score > reference
+
+    def _is_valid(self, params: Dict[str, Any]) -> bool:
+        return all(
+            params[lower] < params[upper]
+            for lower, upper in PARAMETER_CONSTRAINTS
+            if lower in params and upper in params
+        )
+
+    def _sample_uniform(self) -> Dict[str, Any]:
+        """제약 조건을 만족하는 무작위 조합"""
+        params = {}
+        for _ in range(100):
+            params = {spec.name: spec.from_unit(self.rng.random()) for spec in self.space}
+            if self._is_valid(params):
+                break
+        return params
+
+    def _sample_unseen(self, seen: set, attempts: int = 100) -> Optional[Dict[str, Any]]:
+        """제약 조건을 만족하고 아직 평가하지 않은 무작위 조합 (attempts번 안에 못 찾으면 None)"""
+        for _ in range(attempts):
+            params = {spec.name: spec.from_unit(self.rng.random()) for spec in self.space}
+            if self._is_valid(params) and params_key(params) not in seen:
+                return params
+        return None
+
+    def evaluate(self, params: Dict[str, Any], fraction: float = 1.0) -> float:
+        """
+        최근 fraction 비율의 데이터로 백테스트 후 점수 반환 (같은 조합/구간은 캐시)
+
+        전체 구간 평가만 최적 결과와 수렴 곡선에 반영
+        """
+        window = max(2, int(round(len(self.data) * fraction)))
+        window = min(window, len(self.data))
+        cache_key = (params_key(params), window)
+
+        if cache_key in self._cache:
+            score, metrics = self._cache[cache_key]
+        else:
+            engine = self.engine_cls(replace(self.base_params, custom_params=params))
+            result = engine.execute_backtest(self.data.iloc[-window:])
+            metrics = {key: float(value) for key, value in result.performance_metrics.items()}
+            score = float(self.score_fn(metrics))
+            if math.isnan(score):
+                score = math.inf if self.minimize else -math.inf
+            self._cache[cache_key] = (score, metrics)
+            self.evaluations += 1
+            self.bars_evaluated += window
+
+        if window == len(self.data):
+            self.full_evaluations += 1
+            self.results.append({'params': params, 'score': score, 'metrics': metrics})
+            if self.best_params is None or self._is_better(score, self.best_score):
+                self.best_params, self.best_score, self.best_metrics = params, score, metrics
+
+        point = {
+            'evaluation': self.evaluations,
+            'elapsed': time.perf_counter() - self._start_time,
+            'window_fraction': window / len(self.data),
+            'score': score,
+            'best_score': self.best_score if self.best_params is not None else None
+        }
+        self.convergence.append(point)
+        if self.progress_callback:
+            self.progress_callback(point)
+        return score
+
+    def successive_halving(self, n_candidates: int = 81, eta: int = 3,
+                           min_fraction: Optional[float] = None,
+                           min_bars: int = 500) -> OptimizationReport:
+        """
+        연속 반감 탐색 - 작은 데이터 구간에서 많은 후보를 평가하고
+        상위 1/eta만 남겨 구간을 eta배씩 늘려가며 전체 구간까지 진행
+
+        Args:
+            n_candidates: 초기 후보 수
+            eta: 단계별 축소 비율
+            min_fraction: 첫 단계 데이터 비율 (기본: 전체 구간까지 도달하도록 자동)
+            min_bars: 첫 단계 최소 캔들 수 (지표 기간보다 짧은 구간에서 순위가 무의미해지는 것 방지)
+        """
+        self._reset_run()
+
+        rungs = max(1, int(math.floor(math.log(max(n_candidates, 1), eta))))
+        if min_fraction is None:
+            min_fraction = eta ** -(rungs - 1) if rungs > 1 else 1.0
+        min_fraction = min(1.0, max(min_fraction, min_bars / max(len(self.data), 1)))
+
+        candidates = []
+        seen = set()
+        for _ in range(n_candidates * 3):
+            params = self._sample_uniform()
+            key = params_key(params)
+            if key not in seen:
+                seen.add(key)
+                candidates.append(params)
+            if len(candidates) >= n_candidates:
+                break
+
+        # 후보가 하나뿐이면 순위를 매길 필요 없이 전체 구간만 평가
+        fraction = min_fraction if len(candidates) > 1 else 1.0
+        while candidates:
+            scores = [self.evaluate(params, fraction) for params in candidates]
+            if fraction >= 1.0:
+                break
+
+            order = np.argsort(scores, kind='stable')
+            if not self.minimize:
+                order = order[::-1]
+            keep = max(1, len(candidates) // eta)
+            candidates = [candidates[i] for i in order[:keep]]
+            fraction = min(1.0, fraction * eta)
+
+            # 마지막 단계는 항상 전체 구간
+            if keep == 1:
+                fraction = 1.0
+
+        return self._build_report('successive_halving')
+
+    def tpe_search(self, n_trials: int = 60, n_startup: int = 15, gamma: float = 0.25,
+                   n_ei_candidates: int = 24) -> OptimizationReport:
+        """
+        TPE(Tree-structured Parzen Estimator) 방식 탐색
+
+        상위 gamma 비율의 조합 분포 l(x)와 나머지 분포 g(x)를 파라미터별
+        파젠 추정으로 만들고, l(x)/g(x)가 가장 큰 후보를 다음에 평가
+
+        Args:
+            n_trials: 최대 평가 횟수 (평가하지 않은 조합을 더 찾지 못하면 먼저 종료)
+            n_startup: 무작위 탐색 횟수 (이후 TPE)
+            gamma: 상위 조합 비율
+            n_ei_candidates: 매 단계 l(x)에서 뽑는 후보 수
+        """
+        self._reset_run()
+
+        history: List[Tuple[Dict[str, Any], float]] = []
+        seen = set()
+
+        for trial in range(n_trials):
+            params = None
+            if trial >= n_startup and len(history) >= 2:
+                params = self._suggest_tpe(history, gamma, n_ei_candidates, seen)
+            if params is None:
+                params = self._sample_unseen(seen)
+            if params is None:
+                # 평가하지 않은 조합을 찾지 못함 (이산 공간을 거의 다 탐색) - 반복 평가 대신 종료
+                break
+            seen.add(params_key(params))
+
+            score = self.evaluate(params)
+            history.append((params, score))
+
+        return self._build_report('tpe')
+
+    def _suggest_tpe(self, history: List[Tuple[Dict[str, Any], float]], gamma: float,
+                     n_candidates: int, seen: set) -> Optional[Dict[str, Any]]:
+        """좋은 그룹 l(x) / 나쁜 그룹 g(x) 비율이 최대인 후보 선택 (평가하지 않은 후보가 없으면 None)"""
+        scores = np.array([score for _, score in history])
+        order = np.argsort(scores if self.minimize else -scores, kind='stable')
+        n_good = max(1, int(math.ceil(gamma * len(history))))
+
+        good = [history[i][0] for i in order[:n_good]]
+        bad = [history[i][0] for i in order[n_good:]] or good
+
+        good_units = {spec.name: np.array([spec.to_unit(p[spec.name]) for p in good]) for spec in self.space}
+        bad_units = {spec.name: np.array([spec.to_unit(p[spec.name]) for p in bad]) for spec in self.space}
+
+        best_params, best_ratio = None, -math.inf
+        for _ in range(n_candidates):
+            units = {spec.name: self._sample_parzen(good_units[spec.name]) for spec in self.space}
+            params = {spec.name: spec.from_unit(units[spec.name]) for spec in self.space}
+            if not self._is_valid(params) or params_key(params) in seen:
+                continue
+
+            ratio = sum(
+                math.log(self._parzen_density(good_units[spec.name], spec.to_unit(params[spec.name])))
+                - math.log(self._parzen_density(bad_units[spec.name], spec.to_unit(params[spec.name])))
+                for spec in self.space
+            )
+            if ratio > best_ratio:
+                best_params, best_ratio = params, ratio
+
+        return best_params
+
+    @staticmethod
+    def _bandwidth(observations: np.ndarray) -> float:
+        n = len(observations)
+        spread = observations.std() if n > 1 else 0.5
+        return float(np.clip(1.06 * spread * n ** (-0.2), 0.05, 0.5))
+
+    def _sample_parzen(self, observations: np.ndarray) -> float:
+        """관측값 주변 정규 커널 + 균등 사전분포 혼합에서 표본 추출"""
+        prior_weight = 1.0 / (len(observations) + 1)
+        if self.rng.random() < prior_weight:
+            return float(self.rng.random())
+        center = observations[self.rng.integers(len(observations))]
+        return float(np.clip(self.rng.normal(center, self._bandwidth(observations)), 0.0, 1.0))
+
+    def _parzen_density(self, observations: np.ndarray, u: float) -> float:
+        prior_weight = 1.0 / (len(observations) + 1)
+        bandwidth = self._bandwidth(observations)
+        kernels = np.exp(-0.5 * ((u - observations) / bandwidth) ** 2) / (bandwidth * math.sqrt(2 * math.pi))
+        return prior_weight + (1 - prior_weight) * float(kernels.mean()) + 1e-12
+
+    def _build_report(self, method: str) -> OptimizationReport:
+        elapsed = time.perf_counter() - self._start_time
+        return OptimizationReport(
+            method=method,
+            best_params=self.best_params,
+            best_score=self.best_score,
+            best_metrics=self.best_metrics,
+            evaluations=self.evaluations,
+            full_evaluations=self.full_evaluations,
+            full_equivalent_evaluations=self.bars_evaluated / max(len(self.data), 1),
+            elapsed=elapsed,
+            evaluations_per_second=self.evaluations / elapsed if elapsed > 0 else 0.0,
+            convergence=self.convergence,
+            results=self.results
+        )
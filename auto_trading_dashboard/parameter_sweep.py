@@ -0,0 +1,303 @@
+"""
+🔄 병렬 파라미터 스윕 엔진 (Parallel Parameter Sweep)
+시장 데이터를 한 번만 로드해 공유 메모리로 워커 프로세스에 전달하고,
+파라미터 조합을 병렬로 평가하면서 결과를 순차적으로 스트리밍
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import asdict, dataclass, replace
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 워커 프로세스별 공유 데이터 (initializer에서 한 번만 구성)
+_worker_state: Dict[str, Any] = {}
+
+@dataclass
+class SweepRecord:
+    """파라미터 조합 1개의 평가 결과"""
+    params: Dict[str, Any]
+    metrics: Dict[str, float]
+    score: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'params': self.params, 'score': self.score, 'metrics': self.metrics}
+
+def params_key(params: Dict[str, Any]) -> str:
+    """파라미터 조합의 정규화 키 (재개 시 중복 판별용)"""
+    return json.dumps(params, sort_keys=True, default=str)
+
+def run_signature(base_params, objective: Optional[str] = None) -> Dict[str, Any]:
+    """
+    결과 파일 재개용 실행 서명 (전략, 심볼, 기간, 목적 함수, custom_params 외 기본 파라미터)
+
+    서명이 다른 실행의 결과는 점수 기준이 달라 재사용하지 않음
+    """
+    fields = asdict(base_params) if hasattr(base_params, '__dataclass_fields__') else dict(vars(base_params))
+    fields.pop('custom_params', None)
+    fields['objective'] = objective
+    # JSON 왕복 후에도 같은 값이 되도록 정규화 (datetime, Enum -> 문자열)
+    return json.loads(json.dumps(fields, sort_keys=True, default=str))
+
+class SharedMarketData:
+    """OHLCV DataFrame을 공유 메모리 블록 하나로 노출 (인덱스 int64 ns + float64 컬럼)"""
+
+    def __init__(self, data: pd.DataFrame):
+        self.columns = list(data.columns)
+        self.length = len(data)
+        values = data.to_numpy(dtype=np.float64)
+        index_ns = pd.DatetimeIndex(data.index).asi8
+
+        size = max(1, self.length * (len(self.columns) + 1) * 8)
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        buffer = np.ndarray((self.length, len(self.columns) + 1), dtype=np.float64, buffer=self.shm.buf)
+        buffer[:, 0] = index_ns.view(np.float64)
+        buffer[:, 1:] = values
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+def attach_market_data(name: str, length: int, columns: List[str]) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+    """공유 메모리에서 읽기 전용 DataFrame 복원 (컬럼 값은 복사하지 않음)"""
+    shm = shared_memory.SharedMemory(name=name)
+    buffer = np.ndarray((length, len(columns) + 1), dtype=np.float64, buffer=shm.buf)
+    buffer.flags.writeable = False
+
+    index = pd.DatetimeIndex(buffer[:, 0].view(np.int64), name='timestamp')
+    data = pd.DataFrame(
+        {column: buffer[:, i + 1] for i, column in enumerate(columns)},
+        index=index,
+        copy=False
+    )
+    return shm, data
+
+def _init_worker(name: str, length: int, columns: List[str], engine_cls, base_params):
+    """워커 초기화 - 공유 데이터 연결 및 엔진 설정 보관"""
+    shm, data = attach_market_data(name, length, columns)
+    _worker_state.update(shm=shm, data=data, engine_cls=engine_cls, base_params=base_params)
+
+def _evaluate_params(engine_cls, base_params, data: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, float]:
+    """단일 조합 백테스트 후 성과 지표 반환"""
+    engine = engine_cls(replace(base_params, custom_params=params))
+    result = engine.execute_backtest(data)
+    return {key: float(value) for key, value in result.performance_metrics.items()}
+
+def _evaluate_chunk(chunk: List[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, Dict[str, Any], Optional[Dict[str, float]], Optional[str]]]:
+    """워커에서 조합 묶음 평가"""
+    state = _worker_state
+    results = []
+    for position, params in chunk:
+        try:
+            metrics = _evaluate_params(state['engine_cls'], state['base_params'], state['data'], params)
+            results.append((position, params, metrics, None))
+        except Exception as e:
+            results.append((position, params, None, str(e)))
+    return results
+
+class ParameterSweepRunner:
+    """공유 메모리 + 프로세스 풀 기반 파라미터 스윕 실행기"""
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                 results_path: Optional[str] = None, early_stop_patience: Optional[int] = None):
+        """
+        Args:
+            max_workers: 워커 프로세스 수 (기본: CPU 코어 수, 1이면 현재 프로세스에서 순차 실행)
+            chunk_size: 워커에 한 번에 넘길 조합 수 (기본: 자동)
+            results_path: 결과를 JSON Lines로 누적 기록할 파일 - 같은 실행 서명으로 기록된 조합은 건너뜀
+            early_stop_patience: 최적 점수가 이 횟수만큼 연속으로 개선되지 않으면 중단
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.results_path = results_path
+        self.early_stop_patience = early_stop_patience
+
+    def load_completed(self, signature: Dict[str, Any],
+                       score_fn: Callable[[Dict[str, float]], float]) -> Tuple[Dict[str, SweepRecord], int, Optional[Dict[str, Any]]]:
+        """
+        결과 파일에서 같은 서명으로 완료된 조합 로드
+
+        파일은 {"signature": ...} 줄로 구간이 나뉘며, 서명이 다르거나 서명 없이 기록된
+        결과는 건너뜀. 점수는 저장된 값 대신 성과 지표로 다시 계산
+
+        Returns:
+            (params_key -> 결과, 건너뛴 결과 수, 파일의 마지막 서명)
+        """
+        completed: Dict[str, SweepRecord] = {}
+        skipped = 0
+        current: Optional[Dict[str, Any]] = None
+        if not self.results_path or not os.path.exists(self.results_path):
+            return completed, skipped, current
+
+        with open(self.results_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 중단된 쓰기로 잘린 마지막 줄은 무시
+                    continue
+                if 'signature' in entry:
+                    current = entry['signature']
+                    continue
+                if current != signature:
+                    skipped += 1
+                    continue
+                completed[params_key(entry['params'])] = SweepRecord(
+                    params=entry['params'], metrics=entry['metrics'], score=float(score_fn(entry['metrics']))
+                )
+        return completed, skipped, current
+
+    def run(self, data: pd.DataFrame, combinations: List[Dict[str, Any]], engine_cls, base_params,
+            score_fn: Callable[[Dict[str, float]], float], minimize: bool = False,
+            progress_callback: Optional[Callable[[int, int, SweepRecord, SweepRecord], None]] = None,
+            signature: Optional[Dict[str, Any]] = None
+            ) -> Dict[str, Any]:
+        """
+        파라미터 조합 스윕 실행
+
+        Args:
+            data: 모든 조합이 공유하는 시장 데이터 (한 번만 로드)
+            combinations: 평가할 파라미터 조합 목록
+            engine_cls: 백테스트 엔진 클래스 (params를 받아 execute_backtest(data) 제공)
+            base_params: custom_params만 바꿔 쓸 기본 BacktestParameters
+            score_fn: 성과 지표 -> 점수
+            minimize: True면 낮은 점수가 더 좋음
+            progress_callback: (완료 수, 전체 수, 이번 결과, 현재 최적 결과) 콜백
+            signature: 결과 파일 재개용 실행 서명 (기본: run_signature(base_params))
+
+        Returns:
+            {'records', 'best', 'completed', 'total', 'resumed', 'skipped', 'stopped_early', 'errors'}
+            - skipped: 결과 파일에서 서명이 달라 재사용하지 않은 결과 수
+        """
+        total = len(combinations)
+        signature = run_signature(base_params) if signature is None else json.loads(
+            json.dumps(signature, sort_keys=True, default=str))
+        completed, skipped, file_signature = self.load_completed(signature, score_fn)
+        records: List[SweepRecord] = []
+        best: Optional[SweepRecord] = None
+
+        def is_better(record: SweepRecord) -> bool:
+            if best is None:
+                return True
+            return record.score < best.score if minimize else record.score > best.score
+
+        # 재개: 결과 파일에 있는 조합은 재평가하지 않음
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        resumed = 0
+        for position, params in enumerate(combinations):
+            record = completed.get(params_key(params))
+            if record is None:
+                pending.append((position, params))
+                continue
+            resumed += 1
+            records.append(record)
+            if is_better(record):
+                best = record
+
+        done = resumed
+        if progress_callback and resumed and best is not None:
+            progress_callback(done, total, best, best)
+
+        stale = 0
+        stopped_early = False
+        errors: List[Dict[str, Any]] = []
+        results_file = open(self.results_path, 'a', encoding='utf-8') if self.results_path else None
+        if results_file is not None and file_signature != signature:
+            # 이후 결과가 이번 실행의 서명에 속하도록 구간 시작
+            results_file.write(json.dumps({'signature': signature}) + '\n')
+            results_file.flush()
+        evaluations = self._iterate(data, pending, engine_cls, base_params)
+
+        try:
+            for position, params, metrics, error in evaluations:
+                done += 1
+                if metrics is None:
+                    errors.append({'params': params, 'error': error})
+                    continue
+
+                record = SweepRecord(params=params, metrics=metrics, score=float(score_fn(metrics)))
+                records.append(record)
+
+                if results_file is not None:
+                    results_file.write(json.dumps(record.to_dict(), default=float) + '\n')
+                    results_file.flush()
+
+                if is_better(record):
+                    best = record
+                    stale = 0
+                else:
+                    stale += 1
+
+                if progress_callback:
+                    progress_callback(done, total, record, best)
+
+                if self.early_stop_patience and stale >= self.early_stop_patience:
+                    stopped_early = True
+                    break
+        finally:
+            # 조기 중단 시 남은 워커 작업 취소 및 공유 메모리 해제
+            evaluations.close()
+            if results_file is not None:
+                results_file.close()
+
+        return {
+            'records': records,
+            'best': best,
+            'completed': done,
+            'total': total,
+            'resumed': resumed,
+            'skipped': skipped,
+            'stopped_early': stopped_early,
+            'errors': errors
+        }
+
+    def _iterate(self, data: pd.DataFrame, pending: List[Tuple[int, Dict[str, Any]]],
+                 engine_cls, base_params) -> Iterator[Tuple[int, Dict[str, Any], Optional[Dict[str, float]], Optional[str]]]:
+        """완료되는 순서대로 평가 결과를 내보냄"""
+        if not pending:
+            return
+
+        if self.max_workers <= 1 or len(pending) == 1:
+            for position, params in pending:
+                try:
+                    yield position, params, _evaluate_params(engine_cls, base_params, data, params), None
+                except Exception as e:
+                    yield position, params, None, str(e)
+            return
+
+        chunk_size = self.chunk_size or max(1, min(32, len(pending) // (self.max_workers * 4)))
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+
+        shared = SharedMarketData(data)
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(shared.shm.name, shared.length, shared.columns, engine_cls, base_params)
+        )
+        try:
+            # 워커 수의 두 배까지만 미리 제출해 조기 중단 시 남은 작업을 바로 버릴 수 있게 함
+            chunk_iter = iter(chunks)
+            in_flight = set()
+            for chunk in chunk_iter:
+                in_flight.add(executor.submit(_evaluate_chunk, chunk))
+                if len(in_flight) >= self.max_workers * 2:
+                    break
+
+            while in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    for item in future.result():
+                        yield item
+                    next_chunk = next(chunk_iter, None)
+                    if next_chunk is not None:
+                        in_flight.add(executor.submit(_evaluate_chunk, next_chunk))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            shared.close()
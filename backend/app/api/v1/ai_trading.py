@@ -18,6 +18,7 @@ from ...core.auto_trading_engine import AutoTradingEngine, AutoTradeConfig
 from ...core.safety_system import SafetySystem
 from ...core.api_key_validator import APIKeyValidator
 from ...services.binance_futures_client import BinanceFuturesClient
+from ...services.client_registry import get_client_registry
 from ...schemas.risk_management import (
     FuturesAISignal,
     AutoTradingRequest,
@@ -37,6 +38,43 @@ trading_engines: Dict[int, AutoTradingEngine] = {}  # user_id -> engine
 safety_systems: Dict[int, SafetySystem] = {}  # user_id -> safety
 
 
+def get_user_trading_components(user: User):
+    """사용자별 자동 거래 엔진과 안전 시스템 (같은 클라이언트와 계좌 스냅샷 공유)"""
+    if user.id not in trading_engines:
+        if not user.binance_api_key or not user.binance_api_secret:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="바이낸스 API 키가 설정되지 않았습니다"
+            )
+
+        registry = get_client_registry()
+        client = registry.get_futures_client(user)
+        account_state = registry.get_account_state(user)
+        # 엔진이 들고 있는 클라이언트/계좌 스냅샷이 유휴 만료되면 다른 엔드포인트와 공유가 끊김
+        registry.pin_user(user.id)
+        trading_engines[user.id] = AutoTradingEngine(client, account_state)
+        safety_systems[user.id] = SafetySystem(client, account_state)
+
+    return trading_engines[user.id], safety_systems[user.id]
+
+
+def drop_user_trading_components(user_id: int):
+    """API 키가 바뀐 사용자의 엔진과 안전 시스템 폐기 (다음 요청에서 새 키로 생성)"""
+    components = [trading_engines.pop(user_id, None), safety_systems.pop(user_id, None)]
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    for component in components:
+        if component is not None and loop is not None:
+            loop.create_task(component.stop_monitoring())
+
+
+get_client_registry().add_invalidation_listener(drop_user_trading_components)
+
+
 # Mock 데이터 생성 함수들
 def generate_mock_market_data():
     """Mock 시장 데이터 생성"""
@@ -227,16 +265,11 @@ async def update_auto_trading_config(
 ):
     """자동 거래 설정 업데이트"""
     try:
-        user_id = current_user.id
-
-        # 자동 거래 엔진이 없으면 생성 (Mock)
-        if user_id not in trading_engines:
-            # 실제로는 사용자의 API 키로 클라이언트 생성
-            mock_client = None  # BinanceFuturesClient("", "")
-            trading_engines[user_id] = AutoTradingEngine(mock_client)
+        # 자동 거래 엔진이 없으면 사용자 API 키로 생성
+        engine, _ = get_user_trading_components(current_user)
 
         # 설정 업데이트
-        trading_engines[user_id].update_config(config)
+        engine.update_config(config)
 
         return {
             "success": True,
@@ -244,6 +277,8 @@ async def update_auto_trading_config(
             "config": config
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Auto trading config update error: {e}")
         raise HTTPException(
@@ -53,7 +53,7 @@ async def configure_api_keys(
             testnet=False  # Always use LIVE trading
         )
 
-        spot_result = spot_client.test_connection()
+        spot_result = await spot_client.test_connection()
         if not spot_result["success"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -70,7 +70,7 @@ async def configure_api_keys(
         # 추가 검증: API 키가 메인넷에서 제대로 작동하는지 확인
         try:
             # 실제 서버 시간을 확인해서 테스트넷 여부를 재검증
-            server_time_response = spot_client.client.get_server_time()
+            server_time_response = await spot_client.client.get_server_time()
             logger.info(f"Server time check passed: {server_time_response}")
         except Exception as e:
             logger.error(f"Server time validation failed: {e}")
@@ -140,6 +140,10 @@ async def configure_api_keys(
     db.commit()
     print("데이터베이스 커밋 성공")
 
+    # 이전 키로 만든 거래소 클라이언트 폐기
+    from ...services.client_registry import get_client_registry
+    get_client_registry().invalidate_user(current_user.id)
+
     print("=== Option 1 성공: API 키 저장 완료 ===")
     logger.info(f"API keys successfully saved for user: {current_user.username}")
 
@@ -9,6 +9,7 @@ from typing import Optional, List, Dict
 
 from ...db.database import get_db
 from ...services.binance_futures_client import BinanceFuturesClient
+from ...services.client_registry import get_client_registry
 from ...schemas.futures_trading import (
     FuturesTestResponse,
     FuturesAccountInfoResponse,
@@ -88,10 +89,7 @@ def get_binance_futures_client(user: User) -> BinanceFuturesClient:
             detail="Binance Futures API keys not configured"
         )
 
-    return BinanceFuturesClient(
-        api_key=user.binance_api_key,
-        api_secret=user.binance_api_secret
-    )
+    return get_client_registry().get_futures_client(user)
 
 
 @router.post("/configure-keys")
@@ -108,7 +106,7 @@ async def configure_futures_api_keys(
             api_secret=keys.api_secret
         )
 
-        test_result = client.test_connection()
+        test_result = await client.test_connection()
         if not test_result["success"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -120,6 +118,7 @@ async def configure_futures_api_keys(
         current_user.binance_api_secret = keys.api_secret
         current_user.use_testnet = False  # LIVE TRADING ONLY
         db.commit()
+        get_client_registry().invalidate_user(current_user.id)
 
         return {
             "success": True,
@@ -145,7 +144,7 @@ async def test_futures_connection(
     """Test Binance Futures API connection"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.test_connection()
+        result = await client.test_connection()
 
         return FuturesTestResponse(**result)
 
@@ -174,7 +173,7 @@ async def get_futures_account_info(
 
     try:
         client = get_binance_futures_client(current_user)
-        result = client.get_account_info()
+        result = await client.get_account_info()
 
         return FuturesAccountInfoResponse(**result)
 
@@ -206,7 +205,7 @@ async def get_positions(
 
     try:
         client = get_binance_futures_client(current_user)
-        result = client.get_positions()
+        result = await client.get_positions()
 
         return PositionsResponse(**result)
 
@@ -232,7 +231,7 @@ async def get_futures_24hr_ticker(
     """Get futures 24hr ticker statistics"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.get_24hr_ticker(symbol)
+        result = await client.get_24hr_ticker(symbol)
 
         return FuturesMarketDataResponse(**result)
 
@@ -253,7 +252,7 @@ async def get_futures_exchange_info(
     """Get futures exchange information"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.get_exchange_info()
+        result = await client.get_exchange_info()
 
         return FuturesExchangeInfoResponse(**result)
 
@@ -275,7 +274,7 @@ async def place_futures_order(
     """Place a futures order"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.place_order(
+        result = await client.place_order(
             symbol=order.symbol,
             side=order.side,
             type=order.type,
@@ -306,7 +305,7 @@ async def get_open_futures_orders(
     """Get open futures orders"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.get_open_orders(symbol)
+        result = await client.get_open_orders(symbol)
 
         return OpenFuturesOrdersResponse(**result)
 
@@ -329,7 +328,7 @@ async def cancel_futures_order(
     """Cancel a futures order"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.cancel_order(symbol, order_id)
+        result = await client.cancel_order(symbol, order_id)
 
         return result
 
@@ -351,7 +350,7 @@ async def set_leverage(
     """Set leverage for a symbol"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.set_leverage(leverage_request.symbol, leverage_request.leverage)
+        result = await client.set_leverage(leverage_request.symbol, leverage_request.leverage)
 
         return LeverageResponse(**result)
 
@@ -373,7 +372,7 @@ async def set_margin_type(
     """Set margin type for a symbol (ISOLATED or CROSSED)"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.set_margin_type(margin_request.symbol, margin_request.margin_type)
+        result = await client.set_margin_type(margin_request.symbol, margin_request.margin_type)
 
         return MarginTypeResponse(**result)
 
@@ -394,7 +393,7 @@ async def emergency_stop_futures(
     """긴급 정지: 모든 선물 주문 취소 및 포지션 청산"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.emergency_stop()
+        result = await client.emergency_stop()
 
         return EmergencyStopResponse(**result)
 
@@ -415,7 +414,7 @@ async def cancel_all_futures_orders(
     """모든 열린 선물 주문 취소"""
     try:
         client = get_binance_futures_client(current_user)
-        result = client.cancel_all_orders()
+        result = await client.cancel_all_orders()
 
         return EmergencyStopResponse(**result)
 
@@ -34,7 +34,7 @@ async def configure_api_keys(
             testnet=False  # Always use LIVE trading
         )
 
-        spot_result = spot_client.test_connection()
+        spot_result = await spot_client.test_connection()
         if not spot_result["success"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -51,7 +51,7 @@ async def configure_api_keys(
         # 추가 검증: API 키가 메인넷에서 제대로 작동하는지 확인
         try:
             # 실제 서버 시간을 확인해서 테스트넷 여부를 재검증
-            server_time_response = spot_client.client.get_server_time()
+            server_time_response = await spot_client.client.get_server_time()
             logger.info(f"Server time check passed: {server_time_response}")
         except Exception as e:
             logger.error(f"Server time validation failed: {e}")
@@ -10,8 +10,7 @@ from ...db.database import get_db
 from ...auth.jwt_handler import get_current_user
 from ...models.user import User
 from ...services.portfolio_service import PortfolioService
-from ...services.binance_client import BinanceClient
-from ...services.binance_futures_client import BinanceFuturesClient
+from ...services.client_registry import get_client_registry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,7 +19,7 @@ router = APIRouter(prefix="/portfolio", tags=["portfolio"])
 
 
 def get_portfolio_service(current_user: User = Depends(get_current_user)) -> PortfolioService:
-    """Create portfolio service with user's API credentials"""
+    """Create portfolio service with the user's registered exchange clients"""
     try:
         # Check if API keys are configured
         if not current_user.binance_api_key or not current_user.binance_api_secret:
@@ -29,25 +28,18 @@ def get_portfolio_service(current_user: User = Depends(get_current_user)) -> Por
                 detail="Binance API keys not configured. Please configure your API keys first."
             )
 
-        # Create spot client
-        spot_client = BinanceClient(
-            api_key=current_user.binance_api_key,
-            api_secret=current_user.binance_api_secret,
-            testnet=False  # Always use LIVE trading
-        )
+        registry = get_client_registry()
+        spot_client = registry.get_spot_client(current_user)
 
-        # Try to create futures client (optional)
+        # Try to get futures client (optional)
         futures_client = None
         try:
-            futures_client = BinanceFuturesClient(
-                api_key=current_user.binance_api_key,
-                api_secret=current_user.binance_api_secret
-            )
-            logger.debug("Futures client created successfully")
+            futures_client = registry.get_futures_client(current_user)
         except Exception as e:
             logger.warning(f"Failed to create futures client (continuing with spot only): {e}")
 
-        return PortfolioService(spot_client, futures_client)
+        account_state = registry.get_account_state(current_user) if futures_client else None
+        return PortfolioService(spot_client, futures_client, account_state)
 
     except HTTPException:
         raise
@@ -11,6 +11,7 @@ from ...db.database import get_db
 from ...auth.jwt_handler import get_current_user
 from ...models.user import User
 from ...core.ai_risk_manager import AIRiskManager, FuturesRiskMonitor
+from ...services.client_registry import get_client_registry
 from ...schemas.risk_management import (
     RiskCalculationRequest,
     RiskCalculationResponse,
@@ -127,34 +128,29 @@ async def assess_portfolio_risk(
 ):
     """포트폴리오 리스크 평가"""
     try:
-        # 실제 구현에서는 바이낸스 API에서 포지션 정보를 가져와야 함
-        # 여기서는 Mock 데이터 사용
-        mock_positions = [
-            {
-                "symbol": "BTCUSDT",
-                "side": "LONG",
-                "entry_price": 42000,
-                "mark_price": 43250,
-                "unrealized_pnl": 62.5,
-                "initial_margin": 210.0,
-                "liquidation_price": 38500.0
-            }
-        ]
+        if not current_user.binance_api_key or not current_user.binance_api_secret:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="바이낸스 API 키가 설정되지 않았습니다"
+            )
 
-        mock_account_info = {
-            "total_wallet_balance": 1000.0,
-            "total_margin_balance": 1125.5,
-            "available_balance": 900.0
-        }
+        # 사용자별 공유 계정 스냅샷 사용 (SafetySystem, 포트폴리오와 동일한 상태)
+        account_state = get_client_registry().get_account_state(current_user)
+        snapshot = await account_state.get_snapshot()
 
         risk_monitor = FuturesRiskMonitor()
         portfolio_risk = risk_monitor.assess_portfolio_risk(
-            positions=mock_positions,
-            account_info=mock_account_info
+            positions=snapshot.positions,
+            account_info=snapshot.account
         )
+        portfolio_risk["snapshot_version"] = snapshot.version
+        portfolio_risk["snapshot_age_seconds"] = round(snapshot.age, 3)
+        portfolio_risk["snapshot_rest_age_seconds"] = round(snapshot.rest_age, 3)
 
         return portfolio_risk
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Portfolio risk assessment error: {e}")
         raise HTTPException(
@@ -3,12 +3,12 @@ WebSocket endpoints for real-time data
 """
 
 import json
-import asyncio
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
 from typing import Dict, Any
 import logging
 
 from ...services.websocket_service import websocket_manager
+from ...services.stream_broadcaster import StreamBroadcaster
 from ...auth.jwt_handler import get_current_user_ws
 from ...models.user import User
 
@@ -21,12 +21,16 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
         self.user_connections: Dict[str, str] = {}  # user_id -> connection_id
+        # Binance 스트림 메시지는 한 번만 직렬화되어 연결별 큐로 분배됨
+        self.broadcaster = StreamBroadcaster()
+        self.broadcaster.on_failure = self.disconnect
 
     async def connect(self, websocket: WebSocket, connection_id: str, user: User):
         """Accept WebSocket connection for authenticated user"""
         await websocket.accept()
         self.active_connections[connection_id] = websocket
         self.user_connections[str(user.id)] = connection_id
+        self.broadcaster.register(connection_id, websocket)
 
         # Start Binance WebSocket if not already running
         websocket_manager.start_binance_websocket(user.use_testnet)
@@ -49,17 +53,26 @@ class ConnectionManager:
             if user_id_to_remove:
                 del self.user_connections[user_id_to_remove]
 
+            # Stop Binance streams nobody listens to anymore
+            for stream_name in self.broadcaster.unregister(connection_id):
+                websocket_manager.binance_ws.unsubscribe(stream_name, self.broadcaster.publish_threadsafe)
+
             logger.info(f"WebSocket disconnected. Connection ID: {connection_id}")
 
+    def subscribe(self, connection_id: str, stream_name: str, start_stream):
+        """Subscribe a connection to a Binance stream, starting the stream for its first subscriber"""
+        if self.broadcaster.subscribe(connection_id, stream_name):
+            start_stream(self.broadcaster.publish_threadsafe)
+
+    def unsubscribe(self, connection_id: str, stream_name: str):
+        """Unsubscribe a connection, stopping the Binance stream after its last subscriber"""
+        if self.broadcaster.unsubscribe(connection_id, stream_name):
+            websocket_manager.binance_ws.unsubscribe(stream_name, self.broadcaster.publish_threadsafe)
+
     async def send_personal_message(self, message: dict, connection_id: str):
-        """Send message to specific connection"""
+        """Send message to specific connection (queued, delivered by the connection's sender task)"""
         if connection_id in self.active_connections:
-            try:
-                websocket = self.active_connections[connection_id]
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error sending message: {e}")
-                self.disconnect(connection_id)
+            self.broadcaster.send(connection_id, message)
 
     async def broadcast_to_user(self, message: dict, user_id: str):
         """Send message to specific user"""
@@ -124,10 +137,8 @@ async def handle_websocket_message(message: dict, connection_id: str, user: User
             symbol = data.get("symbol")
             if symbol:
                 # Subscribe to ticker updates
-                def ticker_callback(ticker_data):
-                    asyncio.create_task(manager.send_personal_message(ticker_data, connection_id))
-
-                websocket_manager.binance_ws.subscribe_ticker(symbol, ticker_callback)
+                manager.subscribe(connection_id, f"ticker_{symbol.lower()}",
+                                  lambda callback: websocket_manager.binance_ws.subscribe_ticker(symbol, callback))
 
                 # Send confirmation
                 await manager.send_personal_message({
@@ -140,10 +151,8 @@ async def handle_websocket_message(message: dict, connection_id: str, user: User
             interval = data.get("interval", "1m")
             if symbol:
                 # Subscribe to kline updates
-                def kline_callback(kline_data):
-                    asyncio.create_task(manager.send_personal_message(kline_data, connection_id))
-
-                websocket_manager.binance_ws.subscribe_kline(symbol, interval, kline_callback)
+                manager.subscribe(connection_id, f"kline_{symbol.lower()}_{interval}",
+                                  lambda callback: websocket_manager.binance_ws.subscribe_kline(symbol, interval, callback))
 
                 # Send confirmation
                 await manager.send_personal_message({
@@ -155,10 +164,8 @@ async def handle_websocket_message(message: dict, connection_id: str, user: User
             symbol = data.get("symbol")
             if symbol:
                 # Subscribe to order book depth updates
-                def depth_callback(depth_data):
-                    asyncio.create_task(manager.send_personal_message(depth_data, connection_id))
-
-                websocket_manager.binance_ws.subscribe_depth(symbol, depth_callback)
+                manager.subscribe(connection_id, f"depth_{symbol.lower()}",
+                                  lambda callback: websocket_manager.binance_ws.subscribe_depth(symbol, callback))
 
                 # Send confirmation
                 await manager.send_personal_message({
@@ -169,8 +176,7 @@ async def handle_websocket_message(message: dict, connection_id: str, user: User
         elif message_type == "unsubscribe":
             stream_name = data.get("stream")
             if stream_name:
-                # Note: Unsubscribe logic would need to be implemented
-                # This is a simplified version
+                manager.unsubscribe(connection_id, stream_name)
                 await manager.send_personal_message({
                     "type": "unsubscription_confirmed",
                     "data": {"stream": stream_name}
@@ -205,4 +211,10 @@ async def websocket_status():
         "active_connections": len(manager.active_connections),
         "binance_ws_running": websocket_manager.binance_ws.is_running,
         "active_streams": list(websocket_manager.binance_ws.active_streams.keys())
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/ws/stats")
+async def websocket_stats():
+    """Get per-connection queue and lag metrics of the stream broadcaster"""
+    return manager.broadcaster.get_stats()
\ No newline at end of file
@@ -273,7 +273,7 @@ class FuturesRiskMonitor:
 
         # 청산가까지의 거리 계산
         entry_price = position.get("entry_price", 0)
-        liquidation_price = position.get("liquidation_price", 0)
+        liquidation_price = position.get("liquidation_price") or 0
         mark_price = position.get("mark_price", entry_price)
 
         if liquidation_price > 0 and entry_price > 0:
@@ -14,6 +14,8 @@ import json
 from .ai_signal_generator import AISignal, SignalType, SignalValidator
 from .ai_risk_manager import AIRiskManager
 from ..services.binance_futures_client import BinanceFuturesClient
+from ..services.user_data_stream import UserDataStream
+from ..services.account_state import AccountStateService
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,8 @@ class AutoTradeConfig:
     enable_take_profit: bool = True
     emergency_stop_loss_percent: float = 10.0
     max_daily_loss_percent: float = 5.0
+    use_user_data_stream: bool = True  # 체결 감지를 폴링 대신 사용자 데이터 스트림으로
+    max_protective_replacements: int = 2  # 거래소가 취소한 손절/익절 주문 재설정 횟수
 
 
 @dataclass
@@ -85,6 +89,7 @@ class ActiveTrade:
     unrealized_pnl: float = 0.0
     max_profit: float = 0.0
     max_drawdown: float = 0.0
+    protective_replacements: int = 0
 
     def __post_init__(self):
         if self.created_time is None:
@@ -117,8 +122,10 @@ class TradingStats:
 class AutoTradingEngine:
     """자동 거래 엔진"""
 
-    def __init__(self, binance_client: BinanceFuturesClient):
+    def __init__(self, binance_client: BinanceFuturesClient,
+                 account_state: AccountStateService):
         self.binance_client = binance_client
+        self.account_state = account_state
         self.config = AutoTradeConfig()
         self.signal_validator = SignalValidator()
         self.risk_manager = None  # Will be initialized with account balance
@@ -138,12 +145,16 @@ class AutoTradingEngine:
         self.monitoring_task = None
         self.is_running = False
 
+        # 주문 체결 이벤트 (연결된 동안은 주문 상태 폴링 생략)
+        self.user_stream: Optional[UserDataStream] = None
+        self._closing_trades: set = set()
+
     async def initialize(self):
         """엔진 초기화"""
         try:
             # 계좌 정보 조회
-            account_info = await self.binance_client.get_account_info()
-            total_balance = float(account_info.get('totalWalletBalance', 1000))
+            snapshot = await self.account_state.get_snapshot()
+            total_balance = float(snapshot.account.get('total_wallet_balance', 1000))
 
             # 리스크 관리자 초기화
             self.risk_manager = AIRiskManager(
@@ -258,24 +269,28 @@ class AutoTradingEngine:
             entry_order_result = await self.binance_client.place_order(
                 symbol=symbol,
                 side=side,
-                order_type="MARKET",
+                type="MARKET",
                 quantity=quantity
             )
 
-            if entry_order_result.get("status") != "FILLED":
+            if not entry_order_result.get("success"):
+                return {"success": False, "reason": entry_order_result.get("error", "Entry order failed")}
+
+            entry_data = entry_order_result["data"]
+            if entry_data.get("status") != "FILLED":
                 return {"success": False, "reason": "Entry order failed"}
 
             # 주문 정보 생성
             entry_order = TradeOrder(
-                order_id=entry_order_result.get("orderId"),
+                order_id=entry_data.get("order_id"),
                 order_type="MARKET",
                 side=side,
                 symbol=symbol,
                 quantity=quantity,
                 price=None,
                 status=OrderStatus.FILLED,
-                filled_qty=float(entry_order_result.get("executedQty", 0)),
-                avg_price=float(entry_order_result.get("avgPrice", 0))
+                filled_qty=float(entry_data.get("executed_qty", 0)),
+                avg_price=float(entry_data.get("avg_price") or 0)
             )
 
             # 활성 거래 생성
@@ -324,13 +339,15 @@ class AutoTradingEngine:
             stop_order_result = await self.binance_client.place_order(
                 symbol=symbol,
                 side=opposite_side,
-                order_type="STOP_MARKET",
+                type="STOP_MARKET",
                 quantity=trade.position_size,
                 stop_price=signal.stop_loss
             )
+            if not stop_order_result.get("success"):
+                raise RuntimeError(stop_order_result.get("error"))
 
             trade.stop_loss_order = TradeOrder(
-                order_id=stop_order_result.get("orderId"),
+                order_id=stop_order_result["data"]["order_id"],
                 order_type="STOP_MARKET",
                 side=opposite_side,
                 symbol=symbol,
@@ -357,14 +374,16 @@ class AutoTradingEngine:
             tp_order_result = await self.binance_client.place_order(
                 symbol=symbol,
                 side=opposite_side,
-                order_type="LIMIT",
+                type="LIMIT",
                 quantity=trade.position_size,
                 price=signal.take_profit,
                 time_in_force="GTC"
             )
+            if not tp_order_result.get("success"):
+                raise RuntimeError(tp_order_result.get("error"))
 
             trade.take_profit_order = TradeOrder(
-                order_id=tp_order_result.get("orderId"),
+                order_id=tp_order_result["data"]["order_id"],
                 order_type="LIMIT",
                 side=opposite_side,
                 symbol=symbol,
@@ -408,24 +427,100 @@ class AutoTradingEngine:
             except Exception as e:
                 logger.error(f"Trade check error for {trade_id}: {e}")
 
-    async def _check_order_status(self, trade: ActiveTrade, order: TradeOrder):
-        """주문 상태 확인"""
+    async def _check_order_status(self, trade: ActiveTrade, order: TradeOrder, use_stream: bool = True):
+        """주문 상태 확인 (스트림 연결 중이면 REST 호출 없이 스트림 상태 사용)"""
         try:
-            order_info = await self.binance_client.get_order_status(
-                trade.symbol, order.order_id
-            )
+            if use_stream and self.user_stream is not None and self.user_stream.connected:
+                order_info = self.user_stream.get_order(order.order_id)
+                if order_info is None:
+                    return  # 이벤트가 없었으면 상태 변화 없음
+            else:
+                order_info = (await self.binance_client.get_order_status(
+                    trade.symbol, order.order_id
+                )).get("data", {})
 
-            if order_info.get("status") == "FILLED":
-                order.status = OrderStatus.FILLED
-                order.filled_qty = float(order_info.get("executedQty", 0))
-                order.avg_price = float(order_info.get("avgPrice", 0))
-                order.filled_time = datetime.now()
-
-                logger.info(f"Order filled: {order.order_id} for trade {trade.trade_id}")
+            await self._apply_order_state(trade, order, order_info)
 
         except Exception as e:
             logger.error(f"Order status check error: {e}")
 
+    async def _apply_order_state(self, trade: ActiveTrade, order: TradeOrder, order_info: Dict):
+        """거래소 주문 상태를 거래 주문에 반영"""
+        status = order_info.get("status")
+        if status == "FILLED":
+            order.status = OrderStatus.FILLED
+            order.filled_qty = float(order_info.get("executed_qty", 0))
+            order.avg_price = float(order_info.get("avg_price") or 0)
+            order.filled_time = datetime.now()
+
+            logger.info(f"Order filled: {order.order_id} for trade {trade.trade_id}")
+
+        elif status in ("CANCELED", "EXPIRED", "REJECTED"):
+            order.status = OrderStatus.CANCELLED
+            order.error_message = f"{status} by exchange"
+
+        else:
+            return
+
+        # 최종 상태를 반영했으므로 스트림의 주문 상태는 더 이상 필요 없음
+        if self.user_stream is not None:
+            self.user_stream.forget_order(order.order_id)
+
+        # 종료 중인 거래의 취소는 엔진이 보낸 것
+        if order.status == OrderStatus.CANCELLED and trade.trade_id not in self._closing_trades:
+            await self._replace_protective_order(trade, order)
+
+    async def _replace_protective_order(self, trade: ActiveTrade, order: TradeOrder):
+        """거래소가 취소/만료/거부한 손절·익절 주문 재설정 (실패 시 손절 없는 포지션은 청산)"""
+        is_stop_loss = order is trade.stop_loss_order
+        kind = "Stop loss" if is_stop_loss else "Take profit"
+        logger.error(f"ALERT: {kind} order {order.order_id} of trade {trade.trade_id} was "
+                     f"{order.error_message}, position is unprotected")
+
+        if trade.protective_replacements < self.config.max_protective_replacements:
+            trade.protective_replacements += 1
+            if is_stop_loss:
+                await self._set_stop_loss_order(trade)
+                replaced = trade.stop_loss_order is not order
+            else:
+                await self._set_take_profit_order(trade)
+                replaced = trade.take_profit_order is not order
+            if replaced:
+                logger.warning(f"{kind} order of trade {trade.trade_id} re-placed")
+                return
+
+        if is_stop_loss:
+            logger.error(f"ALERT: Stop loss of trade {trade.trade_id} could not be re-placed, closing trade")
+            await self._close_trade(trade)
+
+    def _find_pending_order(self, order_id) -> Optional[Tuple[ActiveTrade, TradeOrder]]:
+        for trade in self.active_trades.values():
+            for order in (trade.stop_loss_order, trade.take_profit_order):
+                if order is not None and order.order_id == order_id and order.status == OrderStatus.PENDING:
+                    return trade, order
+        return None
+
+    async def _on_order_update(self, order_info: Dict):
+        """사용자 데이터 스트림 주문 이벤트: 손절/익절 체결 즉시 거래 종료"""
+        match = self._find_pending_order(order_info["order_id"])
+        if match is None:
+            return
+
+        trade, order = match
+        await self._apply_order_state(trade, order, order_info)
+        if self._is_trade_closed(trade):
+            await self._close_trade(trade)
+
+    async def _reconcile_orders(self):
+        """스트림 (재)연결 시 끊긴 동안의 체결을 REST로 보정"""
+        for trade in list(self.active_trades.values()):
+            for order in (trade.stop_loss_order, trade.take_profit_order):
+                if order is not None and order.status == OrderStatus.PENDING:
+                    await self._check_order_status(trade, order, use_stream=False)
+
+            if self._is_trade_closed(trade):
+                await self._close_trade(trade)
+
     def _is_trade_closed(self, trade: ActiveTrade) -> bool:
         """거래 종료 여부 확인"""
         # 손절 또는 익절 주문이 체결된 경우
@@ -441,6 +536,11 @@ class AutoTradingEngine:
 
     async def _close_trade(self, trade: ActiveTrade):
         """거래 종료"""
+        # 스트림 이벤트와 모니터링 루프가 같은 거래를 동시에 종료하지 않도록
+        if trade.trade_id in self._closing_trades or trade.trade_id not in self.active_trades:
+            return
+        self._closing_trades.add(trade.trade_id)
+
         try:
             # 미체결 주문 취소
             if trade.stop_loss_order and trade.stop_loss_order.status == OrderStatus.PENDING:
@@ -450,8 +550,8 @@ class AutoTradingEngine:
                 await self.binance_client.cancel_order(trade.symbol, trade.take_profit_order.order_id)
 
             # 현재 포지션 확인 및 청산
-            position_info = await self.binance_client.get_position_info(trade.symbol)
-            if position_info and float(position_info.get("positionAmt", 0)) != 0:
+            position_info = (await self.binance_client.get_position_info(trade.symbol)).get("data")
+            if position_info and float(position_info.get("position_amt", 0)) != 0:
                 await self._close_position(trade)
 
             # 거래 종료 처리
@@ -475,6 +575,8 @@ class AutoTradingEngine:
 
         except Exception as e:
             logger.error(f"Trade close error for {trade.trade_id}: {e}")
+        finally:
+            self._closing_trades.discard(trade.trade_id)
 
     async def _close_position(self, trade: ActiveTrade):
         """포지션 강제 청산"""
@@ -484,7 +586,7 @@ class AutoTradingEngine:
             close_order_result = await self.binance_client.place_order(
                 symbol=trade.symbol,
                 side=opposite_side,
-                order_type="MARKET",
+                type="MARKET",
                 quantity=trade.position_size,
                 reduce_only=True
             )
@@ -497,8 +599,6 @@ class AutoTradingEngine:
     async def _calculate_realized_pnl(self, trade: ActiveTrade):
         """실현 손익 계산"""
         try:
-            # 거래 내역에서 PnL 계산
-            account_info = await self.binance_client.get_account_info()
             # 실제 구현에서는 거래 내역에서 정확한 PnL을 계산해야 함
             # 여기서는 간단한 추정치 사용
             if trade.signal.signal_type == SignalType.LONG:
@@ -520,7 +620,7 @@ class AutoTradingEngine:
         try:
             for trade in self.active_trades.values():
                 # 현재 가격 조회
-                ticker = await self.binance_client.get_ticker_price(trade.symbol)
+                ticker = (await self.binance_client.get_ticker_price(trade.symbol)).get("data", {})
                 current_price = float(ticker.get("price", 0))
 
                 if current_price > 0:
@@ -586,6 +686,14 @@ class AutoTradingEngine:
         """모니터링 시작"""
         if not self.is_running:
             self.is_running = True
+            if self.config.use_user_data_stream:
+                self.user_stream = UserDataStream(
+                    self.binance_client,
+                    on_order_update=self._on_order_update,
+                    on_account_update=self.account_state.apply_account_update,
+                    on_reconnect=self._reconcile_orders
+                )
+                await self.user_stream.start()
             self.monitoring_task = asyncio.create_task(self.monitor_trades())
             logger.info("Trade monitoring started")
 
@@ -599,6 +707,9 @@ class AutoTradingEngine:
                     await self.monitoring_task
                 except asyncio.CancelledError:
                     pass
+            if self.user_stream is not None:
+                await self.user_stream.stop()
+                self.user_stream = None
             logger.info("Trade monitoring stopped")
 
     def get_active_trades(self) -> List[Dict]:
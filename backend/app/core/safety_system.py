@@ -13,6 +13,7 @@ import json
 import hashlib
 
 from ..services.binance_futures_client import BinanceFuturesClient
+from ..services.account_state import AccountStateService
 
 logger = logging.getLogger(__name__)
 
@@ -107,8 +108,11 @@ class EmergencyStop:
 class SafetySystem:
     """종합 안전 관리 시스템"""
 
-    def __init__(self, binance_client: BinanceFuturesClient):
+    def __init__(self, binance_client: BinanceFuturesClient,
+                 account_state: AccountStateService):
         self.binance_client = binance_client
+        # 포트폴리오/리스크 API와 같은 계좌 스냅샷 공유
+        self.account_state = account_state
         self.config = SafetyConfig()
 
         # 상태 관리
@@ -149,13 +153,11 @@ class SafetySystem:
         """초기 상태 확인"""
         try:
             # 계좌 정보 확인
-            account_info = await self.binance_client.get_account_info()
-
-            # 활성 포지션 확인
-            positions = await self.binance_client.get_positions()
+            snapshot = await self.account_state.get_snapshot()
+            positions = snapshot.positions
 
             # 미결 주문 확인
-            open_orders = await self.binance_client.get_open_orders()
+            open_orders = (await self.binance_client.get_open_orders()).get('data', [])
 
             logger.info(f"Initial check: {len(positions)} positions, {len(open_orders)} open orders")
 
@@ -209,8 +211,13 @@ class SafetySystem:
             self._reset_daily_stats_if_needed()
 
             # 계좌 정보 조회
-            account_info = await self.binance_client.get_account_info()
-            positions = await self.binance_client.get_positions()
+            # 15초 이내 REST 로드분(다른 소비자 갱신분)은 재사용, 스트림 병합만으로는 갱신 안 됨
+            snapshot = await self.account_state.get_snapshot(max_age=15)
+            if snapshot.rest_age > 60:
+                raise RuntimeError(f"Account snapshot REST data is {snapshot.rest_age:.0f}s old")
+
+            account_info = snapshot.account
+            positions = snapshot.positions
 
             # 각종 안전 조건 확인
             await self._check_loss_limits(account_info, positions)
@@ -226,8 +233,8 @@ class SafetySystem:
     async def _check_loss_limits(self, account_info: Dict, positions: List[Dict]):
         """손실 제한 확인"""
         try:
-            total_balance = float(account_info.get('totalWalletBalance', 0))
-            total_unrealized_pnl = float(account_info.get('totalUnrealizedProfit', 0))
+            total_balance = float(account_info.get('total_wallet_balance', 0))
+            total_unrealized_pnl = float(account_info.get('total_unrealized_pnl', 0))
 
             # 일일 손실 확인 (간단한 추정)
             daily_loss_percent = abs(total_unrealized_pnl) / total_balance * 100
@@ -252,8 +259,8 @@ class SafetySystem:
     async def _check_margin_ratios(self, account_info: Dict, positions: List[Dict]):
         """마진 비율 확인"""
         try:
-            total_margin_balance = float(account_info.get('totalMarginBalance', 0))
-            total_maintenance_margin = float(account_info.get('totalMaintMargin', 0))
+            total_margin_balance = float(account_info.get('total_margin_balance', 0))
+            total_maintenance_margin = float(account_info.get('total_maint_margin', 0))
 
             if total_margin_balance > 0:
                 margin_ratio = (total_maintenance_margin / total_margin_balance) * 100
@@ -285,12 +292,12 @@ class SafetySystem:
         """청산 위험 확인"""
         try:
             for position in positions:
-                position_amt = float(position.get('positionAmt', 0))
+                position_amt = float(position.get('position_amt', 0))
                 if position_amt == 0:
                     continue
 
-                mark_price = float(position.get('markPrice', 0))
-                liquidation_price = float(position.get('liquidationPrice', 0))
+                mark_price = float(position.get('mark_price', 0))
+                liquidation_price = float(position.get('liquidation_price') or 0)
                 symbol = position.get('symbol')
 
                 if liquidation_price > 0 and mark_price > 0:
@@ -431,21 +438,19 @@ class SafetySystem:
         """긴급 상황시 모든 포지션/주문 정리"""
         try:
             # 모든 미결 주문 취소
-            open_orders = await self.binance_client.get_open_orders()
+            open_orders = (await self.binance_client.get_open_orders()).get('data', [])
             for order in open_orders:
-                try:
-                    await self.binance_client.cancel_order(
-                        order['symbol'], order['orderId']
-                    )
-                    self.emergency_stop.cancelled_orders.append(order['orderId'])
-                    logger.info(f"Cancelled order: {order['orderId']}")
-                except Exception as e:
-                    logger.error(f"Failed to cancel order {order['orderId']}: {e}")
+                result = await self.binance_client.cancel_order(order['symbol'], order['order_id'])
+                if result.get('success'):
+                    self.emergency_stop.cancelled_orders.append(order['order_id'])
+                    logger.info(f"Cancelled order: {order['order_id']}")
+                else:
+                    logger.error(f"Failed to cancel order {order['order_id']}: {result.get('error')}")
 
             # 모든 포지션 청산
-            positions = await self.binance_client.get_positions()
+            positions = (await self.binance_client.get_positions()).get('data', [])
             for position in positions:
-                position_amt = float(position.get('positionAmt', 0))
+                position_amt = float(position.get('position_amt', 0))
                 if position_amt == 0:
                     continue
 
@@ -457,10 +462,12 @@ class SafetySystem:
                     close_result = await self.binance_client.place_order(
                         symbol=symbol,
                         side=side,
-                        order_type="MARKET",
+                        type="MARKET",
                         quantity=quantity,
                         reduce_only=True
                     )
+                    if not close_result.get('success'):
+                        raise RuntimeError(close_result.get('error'))
 
                     self.emergency_stop.stopped_positions.append(symbol)
                     logger.info(f"Emergency closed position: {symbol}")
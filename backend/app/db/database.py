@@ -1,6 +1,6 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -15,6 +15,28 @@ engine = create_engine(
     echo_pool=True  # 커넥션 풀 로깅 활성화
 )
 
+# SQLite 연결 튜닝 - 루트 utils/sqlite_pool.py의 SQLITE_PRAGMAS와 같은 값
+# (백엔드는 단독 배포되므로 루트 패키지를 import하지 않음)
+SQLITE_PRAGMAS = (
+    "PRAGMA auto_vacuum=INCREMENTAL",  # 새 파일에만 적용 - journal_mode보다 먼저 실행
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(
     autocommit=False,
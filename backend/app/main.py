@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .core.config import settings
 from .api.v1.api import api_router
+from .services.async_binance import close_http_client
 
 # 로깅 설정
 logging.basicConfig(
@@ -70,6 +71,12 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+@app.on_event("shutdown")
+async def shutdown_exchange_session():
+    """거래소 keep-alive 세션을 닫습니다."""
+    await close_http_client()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -0,0 +1,208 @@
+"""
+Per-user futures account state shared by the safety system, portfolio and risk endpoints.
+
+One versioned snapshot (account totals, balances, positions) per user replaces the
+separate account/position requests each consumer used to send. The snapshot is
+refreshed on demand when older than the reader allows (concurrent readers share one
+refresh), by an optional background poller, or by user data stream ACCOUNT_UPDATE events.
+Stream events only carry balances and position amounts/PnL, so freshness is judged by
+the age of the last REST load; stream merges never make REST-only fields (maintenance
+margin, mark/liquidation price, notional) look newer than they are.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import logging
+
+from .binance_futures_client import BinanceFuturesClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """Consistent view of a futures account at one point in time"""
+    version: int
+    updated_at: float  # epoch seconds
+    source: str  # "rest" or "stream"
+    rest_updated_at: float  # epoch seconds of the REST load the REST-only fields come from
+    account: Dict[str, Any] = field(default_factory=dict)  # get_account_info data
+    positions: List[Dict[str, Any]] = field(default_factory=list)  # get_positions data
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.updated_at
+
+    @property
+    def rest_age(self) -> float:
+        """Age of the REST-only fields (maint margin, mark/liquidation price, notional)"""
+        return time.time() - self.rest_updated_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "updated_at": self.updated_at,
+            "source": self.source,
+            "rest_updated_at": self.rest_updated_at,
+            "account": self.account,
+            "positions": self.positions
+        }
+
+
+class AccountStateService:
+    """Authoritative futures account snapshot of one user"""
+
+    def __init__(self, client: BinanceFuturesClient, max_age: float = 10.0):
+        """
+        Args:
+            client: Futures client of the account
+            max_age: Default seconds a snapshot is served before readers trigger a refresh
+        """
+        self.client = client
+        self.max_age = max_age
+
+        self._snapshot: Optional[AccountSnapshot] = None
+        self._version = 0
+        self._refresh_task: Optional[asyncio.Future] = None
+        self._poller: Optional[asyncio.Task] = None
+        self.stats = {"reads": 0, "refreshes": 0, "shared_refreshes": 0, "stream_updates": 0, "errors": 0}
+
+    @property
+    def snapshot(self) -> Optional[AccountSnapshot]:
+        """Latest snapshot without refreshing (None before the first load)."""
+        return self._snapshot
+
+    async def get_snapshot(self, max_age: Optional[float] = None) -> AccountSnapshot:
+        """
+        Get a snapshot whose REST-loaded fields are no older than max_age seconds.
+
+        Raises:
+            RuntimeError: Refresh failed and no snapshot exists yet
+        """
+        self.stats["reads"] += 1
+        max_age = self.max_age if max_age is None else max_age
+        if self._snapshot is not None and self._snapshot.rest_age <= max_age:
+            return self._snapshot
+
+        try:
+            return await self.refresh()
+        except Exception as e:
+            if self._snapshot is None:
+                raise
+            logger.warning(f"Account refresh failed, serving snapshot v{self._snapshot.version} "
+                           f"(REST data {self._snapshot.rest_age:.0f}s old): {e}")
+            return self._snapshot
+
+    async def refresh(self) -> AccountSnapshot:
+        """Load account and positions; concurrent callers share one request pair."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self.stats["shared_refreshes"] += 1
+            return await asyncio.shield(self._refresh_task)
+
+        self._refresh_task = asyncio.ensure_future(self._load())
+        return await asyncio.shield(self._refresh_task)
+
+    async def _load(self) -> AccountSnapshot:
+        self.stats["refreshes"] += 1
+        account, positions = await asyncio.gather(self.client.get_account_info(), self.client.get_positions())
+        if not account.get("success") or not positions.get("success"):
+            self.stats["errors"] += 1
+            raise RuntimeError(account.get("error") or positions.get("error"))
+
+        return self._publish("rest", account["data"], positions["data"])
+
+    def _publish(self, source: str, account: Dict[str, Any], positions: List[Dict[str, Any]]) -> AccountSnapshot:
+        now = time.time()
+        self._version += 1
+        self._snapshot = AccountSnapshot(
+            version=self._version, updated_at=now, source=source,
+            rest_updated_at=now if source == "rest" else self._snapshot.rest_updated_at,
+            account=account, positions=positions
+        )
+        return self._snapshot
+
+    async def apply_account_update(self, update: Dict[str, Any]):
+        """
+        Merge a UserDataStream account update (usable as its on_account_update callback).
+
+        Wallet balances and positions come from the event; margin totals are derived
+        from them. REST-only fields keep their REST age; a position the snapshot has not
+        seen yet lacks them entirely, so a REST refresh is scheduled for it.
+        """
+        if self._snapshot is None:
+            return
+
+        self.stats["stream_updates"] += 1
+        account = dict(self._snapshot.account)
+        usdt = update.get("balances", {}).get("USDT")
+        if usdt is not None:
+            account["total_wallet_balance"] = usdt["wallet_balance"]
+            account["balances"] = [
+                {**balance, "wallet_balance": usdt["wallet_balance"]} if balance["asset"] == "USDT" else balance
+                for balance in account.get("balances", [])
+            ]
+
+        positions = {position["symbol"]: position for position in self._snapshot.positions}
+        unseen = False
+        for position in update.get("changed_positions", []):
+            if position["position_amt"] == 0:
+                positions.pop(position["symbol"], None)
+            else:
+                unseen = unseen or position["symbol"] not in positions
+                positions[position["symbol"]] = {**positions.get(position["symbol"], {}), **position}
+        positions = list(positions.values())
+        account["total_unrealized_pnl"] = sum(position.get("unrealized_pnl", 0) for position in positions)
+        account["total_margin_balance"] = account.get("total_wallet_balance", 0) + account["total_unrealized_pnl"]
+
+        self._publish("stream", account, positions)
+
+        if unseen:
+            # 신규 포지션은 마크/청산 가격, 명목가치가 없으므로 REST로 보완
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Start a background refresh (joins a running one)."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.ensure_future(self._load())
+        self._refresh_task.add_done_callback(self._log_refresh_failure)
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Future):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background account refresh failed: {task.exception()}")
+
+    def start_poller(self, interval: float = 30.0):
+        """Refresh in the background; skipped while other readers keep the REST data fresh."""
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll(interval))
+
+    async def _poll(self, interval: float):
+        while True:
+            try:
+                if self._snapshot is None or self._snapshot.rest_age >= interval:
+                    await self.refresh()
+            except Exception as e:
+                logger.warning(f"Account poll failed: {e}")
+            await asyncio.sleep(interval)
+
+    async def stop_poller(self):
+        if self._poller is not None:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **self.stats,
+            "version": snapshot.version if snapshot else 0,
+            "age_seconds": round(snapshot.age, 3) if snapshot else None,
+            "rest_age_seconds": round(snapshot.rest_age, 3) if snapshot else None,
+            "source": snapshot.source if snapshot else None
+        }
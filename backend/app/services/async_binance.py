@@ -0,0 +1,355 @@
+"""
+Native asyncio Binance REST transport shared by the backend exchange clients.
+
+- One pooled keep-alive httpx.AsyncClient per process (per event loop)
+- HMAC-SHA256 request signing
+- Per-endpoint request weight accounting against the per-minute IP budget,
+  synchronised with the X-MBX-USED-WEIGHT-1M response header
+- Per-request timeouts; 429/418 responses pause the budget until Retry-After
+
+Coroutine names mirror python-binance's Client so service code only adds ``await``.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+SPOT_BASE_URL = os.getenv("BINANCE_SPOT_BASE_URL", "https://api.binance.com")
+SPOT_TESTNET_BASE_URL = "https://testnet.binance.vision"
+FUTURES_BASE_URL = os.getenv("BINANCE_FUTURES_BASE_URL", "https://fapi.binance.com")
+FUTURES_WS_URL = os.getenv("BINANCE_FUTURES_WS_URL", "wss://fstream.binance.com/ws")
+
+# REQUEST_WEIGHT limits per IP and minute
+SPOT_WEIGHT_PER_MINUTE = 6000
+FUTURES_WEIGHT_PER_MINUTE = 2400
+
+# (method, path) -> (weight with symbol, weight without symbol)
+ENDPOINT_WEIGHTS: Dict[Tuple[str, str], Tuple[int, int]] = {
+    ("GET", "/api/v3/time"): (1, 1),
+    ("GET", "/api/v3/account"): (20, 20),
+    ("GET", "/api/v3/ticker/price"): (2, 4),
+    ("GET", "/api/v3/ticker/24hr"): (2, 80),
+    ("GET", "/api/v3/klines"): (2, 2),
+    ("POST", "/api/v3/order"): (1, 1),
+    ("POST", "/api/v3/order/test"): (1, 1),
+    ("DELETE", "/api/v3/order"): (1, 1),
+    ("GET", "/api/v3/openOrders"): (6, 80),
+    ("GET", "/fapi/v2/account"): (5, 5),
+    ("GET", "/fapi/v2/positionRisk"): (5, 5),
+    ("GET", "/fapi/v1/ticker/24hr"): (1, 40),
+    ("GET", "/fapi/v1/ticker/price"): (1, 2),
+    ("GET", "/fapi/v1/exchangeInfo"): (1, 1),
+    ("GET", "/fapi/v1/order"): (1, 1),
+    ("POST", "/fapi/v1/order"): (1, 1),
+    ("DELETE", "/fapi/v1/order"): (1, 1),
+    ("GET", "/fapi/v1/openOrders"): (1, 40),
+    ("POST", "/fapi/v1/leverage"): (1, 1),
+    ("POST", "/fapi/v1/marginType"): (1, 1),
+    ("POST", "/fapi/v1/listenKey"): (1, 1),
+    ("PUT", "/fapi/v1/listenKey"): (1, 1),
+    ("DELETE", "/fapi/v1/listenKey"): (1, 1),
+}
+
+
+class BinanceAPIException(Exception):
+    """Binance error response (same attributes as python-binance's exception)"""
+
+    def __init__(self, status_code: int, code: Optional[int], message: str):
+        self.status_code = status_code
+        self.code = code
+        self.message = message
+        super().__init__(f"APIError(code={code}): {message}")
+
+
+_http_clients: Dict[int, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Process-wide keep-alive HTTP client of the running event loop.
+
+    Connections are pooled and reused across requests and users; a client is bound to
+    the loop that created it, so each loop gets its own.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _http_clients.get(id(loop))
+    if entry is None or entry[0] is not loop or entry[1].is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+            headers={"User-Agent": "crypto-trader-pro"}
+        )
+        _http_clients[id(loop)] = (loop, client)
+        return client
+    return entry[1]
+
+
+async def close_http_client():
+    """Close the HTTP client of the running loop (application shutdown)."""
+    entry = _http_clients.pop(id(asyncio.get_running_loop()), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+class WeightLimiter:
+    """Sliding one-minute request weight budget shared by all clients of one API"""
+
+    def __init__(self, max_weight_per_minute: int):
+        self.max_weight_per_minute = max_weight_per_minute
+        self._events: Deque[Tuple[float, int]] = deque()
+        self._used = 0
+        self._server_used = 0
+        self._server_used_at = 0.0
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self.stats = {"requests": 0, "weight": 0, "waits": 0, "wait_seconds": 0.0, "by_endpoint": {}}
+
+    def _prune(self, now: float):
+        while self._events and now - self._events[0][0] >= 60.0:
+            self._used -= self._events.popleft()[1]
+
+    def used_weight(self) -> int:
+        """Weight used in the current window (the higher of local and server count)."""
+        now = time.monotonic()
+        self._prune(now)
+        server_used = self._server_used if now - self._server_used_at < 60.0 else 0
+        return max(self._used, server_used)
+
+    async def acquire(self, endpoint: str, weight: int):
+        """Wait until the request fits into the budget, then record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                elif self.used_weight() + weight <= self.max_weight_per_minute or not self._events:
+                    break
+                else:
+                    delay = max(60.0 - (now - self._events[0][0]), 0.01)
+
+                self.stats["waits"] += 1
+                self.stats["wait_seconds"] += delay
+                logger.warning(f"Binance weight budget exhausted, waiting {delay:.2f}s for {endpoint}")
+                await asyncio.sleep(delay)
+
+            self._events.append((time.monotonic(), weight))
+            self._used += weight
+            self.stats["requests"] += 1
+            self.stats["weight"] += weight
+            endpoint_stats = self.stats["by_endpoint"].setdefault(endpoint, {"requests": 0, "weight": 0})
+            endpoint_stats["requests"] += 1
+            endpoint_stats["weight"] += weight
+
+    def update_from_headers(self, headers: httpx.Headers):
+        """Adopt the server's own weight count of the current minute."""
+        used = headers.get("x-mbx-used-weight-1m")
+        if used is not None and used.isdigit():
+            self._server_used = int(used)
+            self._server_used_at = time.monotonic()
+
+    def block_for(self, seconds: float):
+        """Stop sending until the ban or rate limit window has passed."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "wait_seconds": round(self.stats["wait_seconds"], 3),
+            "used_weight_1m": self.used_weight(),
+            "max_weight_per_minute": self.max_weight_per_minute
+        }
+
+
+_limiters: Dict[Tuple[int, str], WeightLimiter] = {}
+
+
+def get_weight_limiter(base_url: str, max_weight_per_minute: int) -> WeightLimiter:
+    """Budget shared by every client of one API host in the running event loop."""
+    key = (id(asyncio.get_running_loop()), base_url)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = WeightLimiter(max_weight_per_minute)
+    return limiter
+
+
+def _format_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    formatted = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        formatted[key] = str(value).lower() if isinstance(value, bool) else value
+    return formatted
+
+
+class AsyncBinanceREST:
+    """Async Binance REST client with signing, weight accounting and timeouts"""
+
+    def __init__(self,
+                 api_key: str,
+                 api_secret: str,
+                 base_url: str,
+                 max_weight_per_minute: int,
+                 recv_window: int = 5000,
+                 timeout: float = 10.0):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.base_url = base_url.rstrip("/")
+        self.max_weight_per_minute = max_weight_per_minute
+        self.recv_window = recv_window
+        self.timeout = timeout
+
+    def _sign(self, query: str) -> str:
+        return hmac.new(self.api_secret.encode(), query.encode(), hashlib.sha256).hexdigest()
+
+    async def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                      signed: bool = False, timeout: Optional[float] = None) -> Any:
+        """
+        Send one request.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path (e.g. /fapi/v2/account)
+            params: Query parameters (None values are dropped)
+            signed: Add timestamp, recvWindow and HMAC signature
+            timeout: Seconds for this request (default: client timeout)
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            BinanceAPIException: Error response from Binance
+            httpx.TimeoutException: Request timed out
+        """
+        params = _format_params(params or {})
+        weights = ENDPOINT_WEIGHTS.get((method, path), (1, 1))
+        weight = weights[0] if "symbol" in params else weights[1]
+
+        limiter = get_weight_limiter(self.base_url, self.max_weight_per_minute)
+        await limiter.acquire(f"{method} {path}", weight)
+
+        headers = {"X-MBX-APIKEY": self.api_key} if self.api_key else {}
+        if signed:
+            params["recvWindow"] = self.recv_window
+            params["timestamp"] = int(time.time() * 1000)
+            query = urlencode(params)
+            query += f"&signature={self._sign(query)}"
+        else:
+            query = urlencode(params)
+
+        url = f"{self.base_url}{path}" + (f"?{query}" if query else "")
+        response = await get_http_client().request(
+            method, url, headers=headers, timeout=timeout if timeout is not None else self.timeout
+        )
+        limiter.update_from_headers(response.headers)
+
+        if response.status_code in (418, 429):
+            retry_after = float(response.headers.get("retry-after", 60))
+            limiter.block_for(retry_after)
+
+        if response.status_code >= 400:
+            try:
+                error = response.json()
+                raise BinanceAPIException(response.status_code, error.get("code"), error.get("msg", response.text))
+            except ValueError:
+                raise BinanceAPIException(response.status_code, None, response.text)
+
+        return response.json()
+
+    def get_weight_stats(self) -> Dict[str, Any]:
+        """Weight usage of this client's API host."""
+        return get_weight_limiter(self.base_url, self.max_weight_per_minute).get_stats()
+
+    # Spot endpoints
+
+    async def get_server_time(self) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v3/time")
+
+    async def get_account(self) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v3/account", signed=True)
+
+    async def get_symbol_ticker(self, symbol: str) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v3/ticker/price", {"symbol": symbol})
+
+    async def get_all_tickers(self) -> list:
+        return await self.request("GET", "/api/v3/ticker/price")
+
+    async def get_ticker(self, symbol: Optional[str] = None) -> Any:
+        return await self.request("GET", "/api/v3/ticker/24hr", {"symbol": symbol})
+
+    async def get_klines(self, symbol: str, interval: str, limit: int = 500) -> list:
+        return await self.request("GET", "/api/v3/klines",
+                                  {"symbol": symbol, "interval": interval, "limit": limit})
+
+    async def create_order(self, **params) -> Dict[str, Any]:
+        return await self.request("POST", "/api/v3/order", params, signed=True)
+
+    async def create_test_order(self, **params) -> Dict[str, Any]:
+        return await self.request("POST", "/api/v3/order/test", params, signed=True)
+
+    async def get_open_orders(self, symbol: Optional[str] = None) -> list:
+        return await self.request("GET", "/api/v3/openOrders", {"symbol": symbol}, signed=True)
+
+    async def cancel_order(self, symbol: str, orderId: int) -> Dict[str, Any]:
+        return await self.request("DELETE", "/api/v3/order", {"symbol": symbol, "orderId": orderId},
+                                  signed=True)
+
+    # USDT-M futures endpoints
+
+    async def futures_account(self) -> Dict[str, Any]:
+        return await self.request("GET", "/fapi/v2/account", signed=True)
+
+    async def futures_position_information(self, symbol: Optional[str] = None) -> list:
+        return await self.request("GET", "/fapi/v2/positionRisk", {"symbol": symbol}, signed=True)
+
+    async def futures_ticker(self, symbol: Optional[str] = None) -> Any:
+        return await self.request("GET", "/fapi/v1/ticker/24hr", {"symbol": symbol})
+
+    async def futures_symbol_ticker(self, symbol: Optional[str] = None) -> Any:
+        return await self.request("GET", "/fapi/v1/ticker/price", {"symbol": symbol})
+
+    async def futures_exchange_info(self) -> Dict[str, Any]:
+        return await self.request("GET", "/fapi/v1/exchangeInfo")
+
+    async def futures_create_order(self, **params) -> Dict[str, Any]:
+        return await self.request("POST", "/fapi/v1/order", params, signed=True)
+
+    async def futures_get_order(self, symbol: str, orderId: int) -> Dict[str, Any]:
+        return await self.request("GET", "/fapi/v1/order", {"symbol": symbol, "orderId": orderId},
+                                  signed=True)
+
+    async def futures_get_open_orders(self, symbol: Optional[str] = None) -> list:
+        return await self.request("GET", "/fapi/v1/openOrders", {"symbol": symbol}, signed=True)
+
+    async def futures_cancel_order(self, symbol: str, orderId: int) -> Dict[str, Any]:
+        return await self.request("DELETE", "/fapi/v1/order", {"symbol": symbol, "orderId": orderId},
+                                  signed=True)
+
+    async def futures_change_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
+        return await self.request("POST", "/fapi/v1/leverage", {"symbol": symbol, "leverage": leverage},
+                                  signed=True)
+
+    async def futures_change_margin_type(self, symbol: str, marginType: str) -> Dict[str, Any]:
+        return await self.request("POST", "/fapi/v1/marginType", {"symbol": symbol, "marginType": marginType},
+                                  signed=True)
+
+    # USDT-M futures user data stream (API key only, not signed)
+
+    async def futures_stream_get_listen_key(self) -> str:
+        return (await self.request("POST", "/fapi/v1/listenKey"))["listenKey"]
+
+    async def futures_stream_keepalive(self) -> Dict[str, Any]:
+        return await self.request("PUT", "/fapi/v1/listenKey")
+
+    async def futures_stream_close(self) -> Dict[str, Any]:
+        return await self.request("DELETE", "/fapi/v1/listenKey")
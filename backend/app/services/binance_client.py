@@ -2,41 +2,33 @@
 Binance API client for testnet and mainnet
 """
 
-import os
-import ccxt
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
 import logging
 from ..core.trading_config import validate_order_amount, get_min_order_amount
+from .async_binance import (
+    AsyncBinanceREST, BinanceAPIException, SPOT_BASE_URL, SPOT_TESTNET_BASE_URL, SPOT_WEIGHT_PER_MINUTE
+)
 
 logger = logging.getLogger(__name__)
 
 
 class BinanceClient:
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = False, base_url: Optional[str] = None):
         """Initialize Binance client"""
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
 
-        # Initialize python-binance client
-        self.client = Client(
+        # Async REST client (shared keep-alive session and weight budget)
+        self.client = AsyncBinanceREST(
             api_key,
             api_secret,
-            testnet=testnet
+            base_url=base_url or (SPOT_TESTNET_BASE_URL if testnet else SPOT_BASE_URL),
+            max_weight_per_minute=SPOT_WEIGHT_PER_MINUTE
         )
 
-        # Initialize ccxt client for additional functionality
-        self.ccxt_client = ccxt.binance({
-            'apiKey': api_key,
-            'secret': api_secret,
-            'sandbox': testnet,
-            'enableRateLimit': True,
-        })
-
-    def test_connection(self) -> Dict[str, Any]:
+    async def test_connection(self) -> Dict[str, Any]:
         """Test API connection and return account info with detailed logging"""
         try:
             logger.info(f"Testing Binance API connection - testnet mode: {self.testnet}")
@@ -53,12 +45,12 @@ class BinanceClient:
 
             # Test server time first
             logger.debug("Testing server connectivity...")
-            server_time = self.client.get_server_time()
+            server_time = await self.client.get_server_time()
             logger.debug(f"Server time received: {server_time}")
 
             # Test account access
             logger.debug("Fetching account information...")
-            account_info = self.client.get_account()
+            account_info = await self.client.get_account()
             logger.info(f"Account info retrieved - canTrade: {account_info.get('canTrade', False)}")
 
             return {
@@ -96,10 +88,10 @@ class BinanceClient:
                 "trading_mode": "ERROR"
             }
 
-    def get_account_info(self) -> Dict[str, Any]:
+    async def get_account_info(self) -> Dict[str, Any]:
         """Get account information"""
         try:
-            account = self.client.get_account()
+            account = await self.client.get_account()
             return {
                 "success": True,
                 "data": {
@@ -122,11 +114,11 @@ class BinanceClient:
             logger.error(f"Failed to get account info: {e}")
             return {"success": False, "error": str(e)}
 
-    def get_ticker_prices(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+    async def get_ticker_prices(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Get ticker prices for symbol or all symbols"""
         try:
             if symbol:
-                ticker = self.client.get_symbol_ticker(symbol=symbol)
+                ticker = await self.client.get_symbol_ticker(symbol=symbol)
                 return {
                     "success": True,
                     "data": {
@@ -135,7 +127,7 @@ class BinanceClient:
                     }
                 }
             else:
-                tickers = self.client.get_all_tickers()
+                tickers = await self.client.get_all_tickers()
                 return {
                     "success": True,
                     "data": [
@@ -150,11 +142,11 @@ class BinanceClient:
             logger.error(f"Failed to get ticker prices: {e}")
             return {"success": False, "error": str(e)}
 
-    def get_24hr_ticker(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+    async def get_24hr_ticker(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Get 24hr ticker statistics"""
         try:
             if symbol:
-                ticker = self.client.get_ticker(symbol=symbol)
+                ticker = await self.client.get_ticker(symbol=symbol)
                 return {
                     "success": True,
                     "data": {
@@ -169,7 +161,7 @@ class BinanceClient:
                     }
                 }
             else:
-                tickers = self.client.get_ticker()
+                tickers = await self.client.get_ticker()
                 return {
                     "success": True,
                     "data": [
@@ -190,10 +182,10 @@ class BinanceClient:
             logger.error(f"Failed to get 24hr ticker: {e}")
             return {"success": False, "error": str(e)}
 
-    def get_klines(self, symbol: str, interval: str, limit: int = 100) -> Dict[str, Any]:
+    async def get_klines(self, symbol: str, interval: str, limit: int = 100) -> Dict[str, Any]:
         """Get kline/candlestick data"""
         try:
-            klines = self.client.get_klines(
+            klines = await self.client.get_klines(
                 symbol=symbol,
                 interval=interval,
                 limit=limit
@@ -222,7 +214,7 @@ class BinanceClient:
             logger.error(f"Failed to get klines: {e}")
             return {"success": False, "error": str(e)}
 
-    def place_order(self,
+    async def place_order(self,
                    symbol: str,
                    side: str,
                    type: str,
@@ -235,7 +227,7 @@ class BinanceClient:
             if not self.testnet:
                 if type == "MARKET":
                     # 시장가 주문: quantity * 현재가격으로 추정
-                    current_price = float(self.client.get_symbol_ticker(symbol=symbol)["price"])
+                    current_price = float((await self.client.get_symbol_ticker(symbol=symbol))["price"])
                     order_value = quantity * current_price
                 else:
                     # 지정가 주문: quantity * price
@@ -262,14 +254,14 @@ class BinanceClient:
 
             # Use test order for safety in testnet
             if self.testnet:
-                result = self.client.create_test_order(**order_params)
+                result = await self.client.create_test_order(**order_params)
                 return {
                     "success": True,
                     "message": "Test order placed successfully",
                     "data": result
                 }
             else:
-                result = self.client.create_order(**order_params)
+                result = await self.client.create_order(**order_params)
                 return {
                     "success": True,
                     "data": {
@@ -297,13 +289,13 @@ class BinanceClient:
             logger.error(f"Failed to place order: {e}")
             return {"success": False, "error": str(e)}
 
-    def get_open_orders(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+    async def get_open_orders(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Get open orders"""
         try:
             if symbol:
-                orders = self.client.get_open_orders(symbol=symbol)
+                orders = await self.client.get_open_orders(symbol=symbol)
             else:
-                orders = self.client.get_open_orders()
+                orders = await self.client.get_open_orders()
 
             return {
                 "success": True,
@@ -326,10 +318,10 @@ class BinanceClient:
             logger.error(f"Failed to get open orders: {e}")
             return {"success": False, "error": str(e)}
 
-    def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
+    async def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """Cancel an order"""
         try:
-            result = self.client.cancel_order(symbol=symbol, orderId=order_id)
+            result = await self.client.cancel_order(symbol=symbol, orderId=order_id)
             return {
                 "success": True,
                 "data": {
@@ -342,16 +334,16 @@ class BinanceClient:
             logger.error(f"Failed to cancel order: {e}")
             return {"success": False, "error": str(e)}
 
-    def emergency_stop(self) -> Dict[str, Any]:
+    async def emergency_stop(self) -> Dict[str, Any]:
         """긴급 정지: 모든 열린 주문 취소 및 시장가 청산"""
         try:
             results = []
 
             # 1. 모든 열린 주문 취소
-            open_orders = self.client.get_open_orders()
+            open_orders = await self.client.get_open_orders()
             for order in open_orders:
                 try:
-                    cancel_result = self.client.cancel_order(
+                    cancel_result = await self.client.cancel_order(
                         symbol=order["symbol"],
                         orderId=order["orderId"]
                     )
@@ -371,7 +363,7 @@ class BinanceClient:
                     })
 
             # 2. 모든 포지션을 시장가로 청산
-            account = self.client.get_account()
+            account = await self.client.get_account()
             for balance in account["balances"]:
                 asset = balance["asset"]
                 free_amount = float(balance["free"])
@@ -381,7 +373,7 @@ class BinanceClient:
                     symbol = f"{asset}USDT"
                     try:
                         # 시장가 매도 주문
-                        sell_result = self.client.create_order(
+                        sell_result = await self.client.create_order(
                             symbol=symbol,
                             side="SELL",
                             type="MARKET",
@@ -413,15 +405,15 @@ class BinanceClient:
             logger.error(f"Emergency stop failed: {e}")
             return {"success": False, "error": str(e)}
 
-    def cancel_all_orders(self) -> Dict[str, Any]:
+    async def cancel_all_orders(self) -> Dict[str, Any]:
         """모든 열린 주문 취소"""
         try:
-            open_orders = self.client.get_open_orders()
+            open_orders = await self.client.get_open_orders()
             results = []
 
             for order in open_orders:
                 try:
-                    result = self.client.cancel_order(
+                    result = await self.client.cancel_order(
                         symbol=order["symbol"],
                         orderId=order["orderId"]
                     )
@@ -2,47 +2,44 @@
 Binance Futures API client for USDT-M Futures trading
 """
 
-import os
-import ccxt
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
+import asyncio
+import time
 import logging
 
+from .async_binance import (
+    AsyncBinanceREST, BinanceAPIException, FUTURES_BASE_URL, FUTURES_WEIGHT_PER_MINUTE
+)
+
 logger = logging.getLogger(__name__)
 
+# Exchange info is public and identical for every user, so it is loaded once per process
+EXCHANGE_INFO_TTL = 3600.0
+_exchange_info: Dict[str, Any] = {"data": None, "fetched_at": 0.0}
+_exchange_info_locks: Dict[int, asyncio.Lock] = {}
+
 
 class BinanceFuturesClient:
-    def __init__(self, api_key: str, api_secret: str):
+    def __init__(self, api_key: str, api_secret: str, base_url: Optional[str] = None):
         """Initialize Binance Futures client for LIVE TRADING ONLY"""
         self.api_key = api_key
         self.api_secret = api_secret
-        self.base_url = "https://fapi.binance.com"
+        self.base_url = base_url or FUTURES_BASE_URL
 
-        # Initialize python-binance client for LIVE futures trading
-        self.client = Client(
+        # Async REST client for LIVE futures trading (shared keep-alive session and weight budget)
+        self.client = AsyncBinanceREST(
             api_key,
             api_secret,
-            testnet=False  # LIVE TRADING ONLY
+            base_url=self.base_url,
+            max_weight_per_minute=FUTURES_WEIGHT_PER_MINUTE
         )
 
-        # Initialize ccxt client for LIVE futures trading
-        self.ccxt_client = ccxt.binance({
-            'apiKey': api_key,
-            'secret': api_secret,
-            'sandbox': False,  # LIVE TRADING ONLY
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'future',  # Use futures API by default
-            }
-        })
-
-    def test_connection(self) -> Dict[str, Any]:
+    async def test_connection(self) -> Dict[str, Any]:
         """Test futures API connection"""
         try:
             # Test futures connectivity
-            account_info = self.client.futures_account()
+            account_info = await self.client.futures_account()
 
             return {
                 "success": True,
@@ -69,10 +66,10 @@ class BinanceFuturesClient:
                 "error": str(e)
             }
 
-    def get_account_info(self) -> Dict[str, Any]:
+    async def get_account_info(self) -> Dict[str, Any]:
         """Get futures account information"""
         try:
-            account = self.client.futures_account()
+            account = await self.client.futures_account()
             return {
                 "success": True,
                 "data": {
@@ -83,6 +80,7 @@ class BinanceFuturesClient:
                     "total_wallet_balance": float(account.get('totalWalletBalance', 0)),
                     "total_unrealized_pnl": float(account.get('totalUnrealizedProfit', 0)),
                     "total_margin_balance": float(account.get('totalMarginBalance', 0)),
+                    "total_maint_margin": float(account.get('totalMaintMargin', 0)),
                     "available_balance": float(account.get('availableBalance', 0)),
                     "max_withdraw_amount": float(account.get('maxWithdrawAmount', 0)),
                     "balances": [
@@ -103,24 +101,28 @@ class BinanceFuturesClient:
             logger.error(f"Failed to get futures account info: {e}")
             return {"success": False, "error": str(e)}
 
-    def get_positions(self) -> Dict[str, Any]:
+    async def get_positions(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Get current futures positions"""
         try:
-            positions = self.client.futures_position_information()
+            positions = await self.client.futures_position_information(symbol=symbol)
             active_positions = []
 
             for position in positions:
                 position_amt = float(position.get('positionAmt', 0))
                 if position_amt != 0:  # Only include positions with size
+                    mark_price = float(position.get('markPrice', 0))
+                    leverage = int(position.get('leverage', 1))
                     active_positions.append({
                         "symbol": position["symbol"],
                         "position_amt": position_amt,
                         "entry_price": float(position.get('entryPrice', 0)),
-                        "mark_price": float(position.get('markPrice', 0)),
+                        "mark_price": mark_price,
                         "unrealized_pnl": float(position.get('unRealizedProfit', 0)),
                         "percentage": float(position.get('percentage', 0)),
                         "side": "LONG" if position_amt > 0 else "SHORT",
-                        "leverage": int(position.get('leverage', 1)),
+                        "leverage": leverage,
+                        "notional": abs(position_amt) * mark_price,
+                        "initial_margin": abs(position_amt) * mark_price / max(leverage, 1),
                         "margin_type": position.get('marginType', 'cross').lower(),
                         "isolated_margin": float(position.get('isolatedMargin', 0)),
                         "liquidation_price": float(position.get('liquidationPrice', 0)) if position.get('liquidationPrice') != '0' else None
@@ -134,11 +136,11 @@ class BinanceFuturesClient:
             logger.error(f"Failed to get positions: {e}")
             return {"success": False, "error": str(e)}
 
-    def get_24hr_ticker(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+    async def get_24hr_ticker(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Get futures 24hr ticker statistics"""
         try:
             if symbol:
-                ticker = self.client.futures_ticker(symbol=symbol)
+                ticker = await self.client.futures_ticker(symbol=symbol)
                 return {
                     "success": True,
                     "data": {
@@ -155,7 +157,7 @@ class BinanceFuturesClient:
                     }
                 }
             else:
-                tickers = self.client.futures_ticker()
+                tickers = await self.client.futures_ticker()
                 return {
                     "success": True,
                     "data": [
@@ -178,15 +180,16 @@ class BinanceFuturesClient:
             logger.error(f"Failed to get futures 24hr ticker: {e}")
             return {"success": False, "error": str(e)}
 
-    def place_order(self,
+    async def place_order(self,
                    symbol: str,
                    side: str,
                    type: str,
-                   quantity: float,
+                   quantity: Optional[float] = None,
                    price: Optional[float] = None,
                    time_in_force: str = "GTC",
                    reduce_only: bool = False,
-                   close_position: bool = False) -> Dict[str, Any]:
+                   close_position: bool = False,
+                   stop_price: Optional[float] = None) -> Dict[str, Any]:
         """Place a futures order"""
         try:
             order_params = {
@@ -196,6 +199,11 @@ class BinanceFuturesClient:
                 "quantity": quantity,
             }
 
+            if type in ("STOP", "STOP_MARKET", "TAKE_PROFIT", "TAKE_PROFIT_MARKET"):
+                if stop_price is None:
+                    raise ValueError(f"Stop price is required for {type} orders")
+                order_params["stopPrice"] = stop_price
+
             if type == "LIMIT":
                 if price is None:
                     raise ValueError("Price is required for LIMIT orders")
@@ -209,7 +217,7 @@ class BinanceFuturesClient:
                 order_params["closePosition"] = True
 
             # LIVE TRADING - Real orders only
-            result = self.client.futures_create_order(**order_params)
+            result = await self.client.futures_create_order(**order_params)
             return {
                 "success": True,
                 "message": "LIVE futures order placed successfully - REAL MONEY",
@@ -222,7 +230,8 @@ class BinanceFuturesClient:
                     "quantity": float(result["origQty"]),
                     "price": float(result["price"]) if result.get("price") and result["price"] != "0" else None,
                     "executed_qty": float(result["executedQty"]),
-                    "cumulative_quote_qty": float(result["cumQuoteQty"]),
+                    "avg_price": float(result["avgPrice"]) if result.get("avgPrice") and float(result["avgPrice"]) > 0 else None,
+                    "cumulative_quote_qty": float(result.get("cumQuote", 0)),
                     "time": result["updateTime"],
                     "reduce_only": result.get("reduceOnly", False),
                     "close_position": result.get("closePosition", False)
@@ -240,13 +249,13 @@ class BinanceFuturesClient:
             logger.error(f"Failed to place futures order: {e}")
             return {"success": False, "error": str(e)}
 
-    def get_open_orders(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+    async def get_open_orders(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Get open futures orders"""
         try:
             if symbol:
-                orders = self.client.futures_get_open_orders(symbol=symbol)
+                orders = await self.client.futures_get_open_orders(symbol=symbol)
             else:
-                orders = self.client.futures_get_open_orders()
+                orders = await self.client.futures_get_open_orders()
 
             return {
                 "success": True,
@@ -272,10 +281,54 @@ class BinanceFuturesClient:
             logger.error(f"Failed to get open futures orders: {e}")
             return {"success": False, "error": str(e)}
 
-    def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
+    async def get_order_status(self, symbol: str, order_id: int) -> Dict[str, Any]:
+        """Get the current state of a futures order"""
+        try:
+            order = await self.client.futures_get_order(symbol=symbol, orderId=order_id)
+            return {
+                "success": True,
+                "data": {
+                    "order_id": order["orderId"],
+                    "symbol": order["symbol"],
+                    "status": order["status"],
+                    "type": order["type"],
+                    "side": order["side"],
+                    "quantity": float(order["origQty"]),
+                    "executed_qty": float(order["executedQty"]),
+                    "avg_price": float(order["avgPrice"]) if float(order.get("avgPrice", 0)) > 0 else None,
+                    "time": order.get("updateTime", order.get("time"))
+                }
+            }
+        except Exception as e:
+            logger.error(f"Failed to get futures order status: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def get_position_info(self, symbol: str) -> Dict[str, Any]:
+        """Get the position of one symbol (data is None when flat)"""
+        result = await self.get_positions(symbol)
+        if not result["success"]:
+            return result
+        return {"success": True, "data": result["data"][0] if result["data"] else None}
+
+    async def get_ticker_price(self, symbol: str) -> Dict[str, Any]:
+        """Get the latest futures price of a symbol"""
+        try:
+            ticker = await self.client.futures_symbol_ticker(symbol=symbol)
+            return {
+                "success": True,
+                "data": {
+                    "symbol": ticker["symbol"],
+                    "price": float(ticker["price"])
+                }
+            }
+        except Exception as e:
+            logger.error(f"Failed to get futures ticker price: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """Cancel a futures order"""
         try:
-            result = self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
+            result = await self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
             return {
                 "success": True,
                 "data": {
@@ -288,10 +341,10 @@ class BinanceFuturesClient:
             logger.error(f"Failed to cancel futures order: {e}")
             return {"success": False, "error": str(e)}
 
-    def set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
+    async def set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
         """Set leverage for a symbol"""
         try:
-            result = self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
+            result = await self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
             return {
                 "success": True,
                 "data": {
@@ -304,10 +357,10 @@ class BinanceFuturesClient:
             logger.error(f"Failed to set leverage: {e}")
             return {"success": False, "error": str(e)}
 
-    def set_margin_type(self, symbol: str, margin_type: str) -> Dict[str, Any]:
+    async def set_margin_type(self, symbol: str, margin_type: str) -> Dict[str, Any]:
         """Set margin type for a symbol (ISOLATED or CROSSED)"""
         try:
-            result = self.client.futures_change_margin_type(symbol=symbol, marginType=margin_type.upper())
+            result = await self.client.futures_change_margin_type(symbol=symbol, marginType=margin_type.upper())
             return {
                 "success": True,
                 "data": {
@@ -332,10 +385,19 @@ class BinanceFuturesClient:
             logger.error(f"Failed to set margin type: {e}")
             return {"success": False, "error": str(e)}
 
-    def get_exchange_info(self) -> Dict[str, Any]:
+    async def _load_exchange_info(self) -> Dict[str, Any]:
+        """Raw exchange info, shared by all clients and loaded on first use"""
+        lock = _exchange_info_locks.setdefault(id(asyncio.get_running_loop()), asyncio.Lock())
+        async with lock:
+            if _exchange_info["data"] is None or time.monotonic() - _exchange_info["fetched_at"] > EXCHANGE_INFO_TTL:
+                _exchange_info["data"] = await self.client.futures_exchange_info()
+                _exchange_info["fetched_at"] = time.monotonic()
+            return _exchange_info["data"]
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
         """Get futures exchange information"""
         try:
-            info = self.client.futures_exchange_info()
+            info = await self._load_exchange_info()
             return {
                 "success": True,
                 "data": {
@@ -364,16 +426,16 @@ class BinanceFuturesClient:
             logger.error(f"Failed to get exchange info: {e}")
             return {"success": False, "error": str(e)}
 
-    def emergency_stop(self) -> Dict[str, Any]:
+    async def emergency_stop(self) -> Dict[str, Any]:
         """긴급 정지: 모든 선물 주문 취소 및 포지션 청산"""
         try:
             results = []
 
             # 1. 모든 열린 주문 취소
-            open_orders = self.client.futures_get_open_orders()
+            open_orders = await self.client.futures_get_open_orders()
             for order in open_orders:
                 try:
-                    cancel_result = self.client.futures_cancel_order(
+                    cancel_result = await self.client.futures_cancel_order(
                         symbol=order["symbol"],
                         orderId=order["orderId"]
                     )
@@ -393,7 +455,7 @@ class BinanceFuturesClient:
                     })
 
             # 2. 모든 포지션을 시장가로 청산
-            positions = self.client.futures_position_information()
+            positions = await self.client.futures_position_information()
             for position in positions:
                 position_amt = float(position.get('positionAmt', 0))
 
@@ -404,7 +466,7 @@ class BinanceFuturesClient:
 
                     try:
                         # 시장가 청산 주문 (closePosition=True 사용)
-                        sell_result = self.client.futures_create_order(
+                        sell_result = await self.client.futures_create_order(
                             symbol=symbol,
                             side=side,
                             type="MARKET",
@@ -438,15 +500,15 @@ class BinanceFuturesClient:
             logger.error(f"Futures emergency stop failed: {e}")
             return {"success": False, "error": str(e)}
 
-    def cancel_all_orders(self) -> Dict[str, Any]:
+    async def cancel_all_orders(self) -> Dict[str, Any]:
         """모든 열린 선물 주문 취소"""
         try:
-            open_orders = self.client.futures_get_open_orders()
+            open_orders = await self.client.futures_get_open_orders()
             results = []
 
             for order in open_orders:
                 try:
-                    result = self.client.futures_cancel_order(
+                    result = await self.client.futures_cancel_order(
                         symbol=order["symbol"],
                         orderId=order["orderId"]
                     )
@@ -0,0 +1,167 @@
+"""
+Process-wide registry of per-user exchange clients.
+
+Endpoints used to build a fresh client on every request. The registry hands out one
+client per (user, API key fingerprint, testnet) and drops clients that have been idle
+for a while or whose user re-configured their keys. Users whose clients a running
+trading engine holds are pinned, so endpoints keep sharing the engine's account snapshot.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import logging
+
+from .account_state import AccountStateService
+from .binance_client import BinanceClient
+from .binance_futures_client import BinanceFuturesClient
+
+logger = logging.getLogger(__name__)
+
+
+ClientKey = Tuple[str, int, str, bool]
+
+
+def key_fingerprint(api_key: str, api_secret: str) -> str:
+    """Short hash identifying a key pair without keeping the secret in the registry key."""
+    return hashlib.sha256(f"{api_key}:{api_secret}".encode()).hexdigest()[:16]
+
+
+class ExchangeClientRegistry:
+    """Thread-safe cache of exchange clients keyed by user and credentials"""
+
+    def __init__(self, idle_ttl: float = 900.0, max_clients: int = 1000, sweep_interval: float = 60.0):
+        self.idle_ttl = idle_ttl
+        self.max_clients = max_clients
+        self.sweep_interval = sweep_interval
+
+        self._clients: Dict[ClientKey, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+        self._pinned: Set[int] = set()  # user ids exempt from idle/capacity eviction
+        self._invalidation_listeners: List[Callable[[int], None]] = []
+        self.stats = {"hits": 0, "created": 0, "evicted": 0, "invalidated": 0}
+
+    def _get(self, kind: str, user, factory) -> Any:
+        key: ClientKey = (
+            kind, user.id, key_fingerprint(user.binance_api_key, user.binance_api_secret),
+            bool(getattr(user, "use_testnet", False))
+        )
+        now = time.monotonic()
+
+        with self._lock:
+            self._sweep(now)
+
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients[key] = (entry[0], now)
+                self.stats["hits"] += 1
+                return entry[0]
+
+            # Clients built for the user's previous keys are never used again
+            keys_changed = self._drop(lambda k: k[0] == kind and k[1] == user.id, "invalidated")
+
+            if len(self._clients) >= self.max_clients:
+                evictable = [k for k in self._clients if k[1] not in self._pinned]
+                if evictable:
+                    oldest = min(evictable, key=lambda k: self._clients[k][1])
+                    del self._clients[oldest]
+                    self.stats["evicted"] += 1
+
+        if keys_changed:
+            self._notify_invalidated(user.id)
+
+        # Factories may take other registry entries, so they run outside the lock
+        client = factory()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                return entry[0]
+            self._clients[key] = (client, now)
+            self.stats["created"] += 1
+            return client
+
+    def _sweep(self, now: float):
+        """Evict idle clients (caller holds the lock)."""
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        self._drop(lambda k: k[1] not in self._pinned and now - self._clients[k][1] > self.idle_ttl, "evicted")
+
+    def _drop(self, predicate, counter: str) -> int:
+        dropped = [k for k in self._clients if predicate(k)]
+        for key in dropped:
+            del self._clients[key]
+            self.stats[counter] += 1
+        return len(dropped)
+
+    def _notify_invalidated(self, user_id: int):
+        """Tell holders of a user's clients that the keys changed (called without the lock)."""
+        with self._lock:
+            self._pinned.discard(user_id)
+            listeners = list(self._invalidation_listeners)
+        for listener in listeners:
+            try:
+                listener(user_id)
+            except Exception as e:
+                logger.error(f"Client invalidation listener failed for user {user_id}: {e}")
+
+    def get_futures_client(self, user) -> BinanceFuturesClient:
+        """Futures client of a user with configured API keys."""
+        return self._get("futures", user, lambda: BinanceFuturesClient(
+            api_key=user.binance_api_key,
+            api_secret=user.binance_api_secret
+        ))
+
+    def get_spot_client(self, user) -> BinanceClient:
+        """Spot client of a user with configured API keys (always LIVE)."""
+        return self._get("spot", user, lambda: BinanceClient(
+            api_key=user.binance_api_key,
+            api_secret=user.binance_api_secret,
+            testnet=False
+        ))
+
+    def get_account_state(self, user) -> AccountStateService:
+        """Shared futures account snapshot of a user (one per user and key pair)."""
+        return self._get("account_state", user, lambda: AccountStateService(self.get_futures_client(user)))
+
+    def pin_user(self, user_id: int):
+        """Keep a user's clients until invalidated (a long-lived engine holds them)."""
+        with self._lock:
+            self._pinned.add(user_id)
+
+    def unpin_user(self, user_id: int):
+        """Let a user's clients expire when idle again."""
+        with self._lock:
+            self._pinned.discard(user_id)
+
+    def add_invalidation_listener(self, listener: Callable[[int], None]):
+        """Call listener(user_id) whenever a user's clients are dropped for new keys."""
+        with self._lock:
+            if listener not in self._invalidation_listeners:
+                self._invalidation_listeners.append(listener)
+
+    def invalidate_user(self, user_id: int):
+        """Drop every client of a user, e.g. after the API keys were changed."""
+        with self._lock:
+            self._drop(lambda k: k[1] == user_id, "invalidated")
+        self._notify_invalidated(user_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "clients": len(self._clients), "pinned_users": len(self._pinned),
+                    "idle_ttl": self.idle_ttl}
+
+
+_registry: Optional[ExchangeClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ExchangeClientRegistry:
+    """Get the process-wide client registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ExchangeClientRegistry()
+        return _registry
@@ -0,0 +1,530 @@
+"""
+Local Binance stand-in for exercising the async exchange clients without network access.
+
+Serves the spot and USDT-M futures REST endpoints used by BinanceClient and
+BinanceFuturesClient over HTTP/1.1 keep-alive, checks API keys and HMAC signatures,
+reports X-MBX-USED-WEIGHT-1M and keeps balances, orders and positions in memory.
+start_user_stream() adds a WebSocket user data stream pushing ORDER_TRADE_UPDATE and
+ACCOUNT_UPDATE events; fill_order() triggers a resting order.
+
+    python -m app.services.mock_exchange --port 9000
+    BINANCE_FUTURES_BASE_URL=http://127.0.0.1:9000 BINANCE_FUTURES_WS_URL=ws://127.0.0.1:9001/ws uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+import logging
+
+import websockets
+
+from .async_binance import ENDPOINT_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PRICES = {"BTCUSDT": 50000.0, "ETHUSDT": 3000.0, "BNBUSDT": 400.0}
+
+
+class MockExchangeServer:
+    """In-memory exchange served on a local asyncio socket"""
+
+    def __init__(self,
+                 api_key: str = "mock-api-key",
+                 api_secret: str = "mock-api-secret",
+                 latency: float = 0.0,
+                 balance: float = 10000.0,
+                 prices: Optional[Dict[str, float]] = None):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.latency = latency
+        self.prices = dict(prices or DEFAULT_PRICES)
+
+        self.spot_balances: Dict[str, float] = {"USDT": balance}
+        self.futures_balance = balance
+        self.positions: Dict[str, Dict[str, float]] = {}
+        self.orders: Dict[int, Dict[str, Any]] = {}
+        self.leverage: Dict[str, int] = {}
+        self.margin_type: Dict[str, str] = {}
+        self._next_order_id = 1
+
+        self._weight_events: List[Tuple[float, int]] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+        self.listen_key: Optional[str] = None
+        self._ws_server = None
+        self._stream_queues: Dict[asyncio.Queue, Any] = {}
+        self.stats = {"connections": 0, "requests": 0, "rejected": 0}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving; returns the base URL (port 0 picks a free port)."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Mock exchange listening on http://{host}:{port}")
+        return f"http://{host}:{port}"
+
+    async def start_user_stream(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start the user data stream; returns the stream base URL."""
+        self._ws_server = await websockets.serve(self._handle_stream, host, port)
+        port = self._ws_server.sockets[0].getsockname()[1]
+        return f"ws://{host}:{port}/ws"
+
+    async def stop(self):
+        if self._ws_server is not None:
+            await self.drop_stream_connections()
+            self._ws_server.close()
+            await self._ws_server.wait_closed()
+            self._ws_server = None
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections would otherwise keep their handlers waiting
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    # HTTP
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.stats["connections"] += 1
+        self._connections[asyncio.current_task()] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                method, target, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, value = line.decode().split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+
+                body = b""
+                if int(headers.get("content-length", 0)):
+                    body = await reader.readexactly(int(headers["content-length"]))
+
+                path, _, query = target.partition("?")
+                if body:
+                    query = f"{query}&{body.decode()}" if query else body.decode()
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                status, payload = self._dispatch(method, path, query, headers)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status < 400 else 'Error'}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"X-MBX-USED-WEIGHT-1M: {self.used_weight()}\r\n"
+                    f"Connection: keep-alive\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(asyncio.current_task(), None)
+            writer.close()
+
+    def used_weight(self) -> int:
+        cutoff = time.monotonic() - 60
+        self._weight_events = [event for event in self._weight_events if event[0] >= cutoff]
+        return sum(weight for _, weight in self._weight_events)
+
+    def _dispatch(self, method: str, path: str, query: str, headers: Dict[str, str]) -> Tuple[int, Any]:
+        self.stats["requests"] += 1
+        params = dict(parse_qsl(query))
+
+        weights = ENDPOINT_WEIGHTS.get((method, path), (1, 1))
+        self._weight_events.append((time.monotonic(), weights[0] if "symbol" in params else weights[1]))
+
+        route = self._routes().get((method, path))
+        if route is None:
+            return 404, {"code": -1000, "msg": f"Unknown endpoint {method} {path}"}
+
+        handler, signed = route
+        if signed:
+            error = self._verify(query, headers, check_signature=signed is True)
+            if error is not None:
+                self.stats["rejected"] += 1
+                return error
+
+        try:
+            return 200, handler(params)
+        except KeyError as e:
+            return 400, {"code": -1102, "msg": f"Mandatory parameter {e} was not sent."}
+        except ValueError as e:
+            code, _, msg = str(e).partition(":")
+            return 400, {"code": int(code), "msg": msg}
+
+    def _verify(self, query: str, headers: Dict[str, str],
+                check_signature: bool = True) -> Optional[Tuple[int, Dict[str, Any]]]:
+        if headers.get("x-mbx-apikey") != self.api_key:
+            return 401, {"code": -2015, "msg": "Invalid API-key, IP, or permissions for action."}
+        if not check_signature:
+            return None
+
+        payload, _, signature = query.rpartition("&signature=")
+        expected = hmac.new(self.api_secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
+        if not signature or not hmac.compare_digest(signature, expected):
+            return 400, {"code": -1022, "msg": "Signature for this request is not valid."}
+
+        params = dict(parse_qsl(payload))
+        if abs(int(params.get("timestamp", 0)) - time.time() * 1000) > int(params.get("recvWindow", 5000)):
+            return 400, {"code": -1021, "msg": "Timestamp for this request is outside of the recvWindow."}
+        return None
+
+    def _routes(self):
+        return {
+            ("GET", "/api/v3/time"): (lambda p: {"serverTime": int(time.time() * 1000)}, False),
+            ("GET", "/api/v3/account"): (self._spot_account, True),
+            ("GET", "/api/v3/ticker/price"): (self._ticker_price, False),
+            ("GET", "/api/v3/ticker/24hr"): (self._ticker_24hr, False),
+            ("GET", "/api/v3/klines"): (self._klines, False),
+            ("POST", "/api/v3/order"): (lambda p: self._new_order(p, futures=False), True),
+            ("POST", "/api/v3/order/test"): (lambda p: {}, True),
+            ("GET", "/api/v3/openOrders"): (lambda p: self._open_orders(p, futures=False), True),
+            ("DELETE", "/api/v3/order"): (self._cancel_order, True),
+            ("GET", "/fapi/v2/account"): (self._futures_account, True),
+            ("GET", "/fapi/v2/positionRisk"): (self._position_risk, True),
+            ("GET", "/fapi/v1/ticker/24hr"): (self._ticker_24hr, False),
+            ("GET", "/fapi/v1/ticker/price"): (self._ticker_price, False),
+            ("GET", "/fapi/v1/exchangeInfo"): (self._exchange_info, False),
+            ("POST", "/fapi/v1/order"): (lambda p: self._new_order(p, futures=True), True),
+            ("GET", "/fapi/v1/order"): (self._get_order, True),
+            ("GET", "/fapi/v1/openOrders"): (lambda p: self._open_orders(p, futures=True), True),
+            ("DELETE", "/fapi/v1/order"): (self._cancel_order, True),
+            ("POST", "/fapi/v1/leverage"): (self._change_leverage, True),
+            ("POST", "/fapi/v1/marginType"): (self._change_margin_type, True),
+            ("POST", "/fapi/v1/listenKey"): (self._new_listen_key, "apikey"),
+            ("PUT", "/fapi/v1/listenKey"): (self._keepalive_listen_key, "apikey"),
+            ("DELETE", "/fapi/v1/listenKey"): (self._close_listen_key, "apikey"),
+        }
+
+    # Market data
+
+    def _price(self, symbol: str) -> float:
+        if symbol not in self.prices:
+            raise ValueError("-1121:Invalid symbol.")
+        return self.prices[symbol]
+
+    def _ticker_price(self, params):
+        if "symbol" in params:
+            return {"symbol": params["symbol"], "price": str(self._price(params["symbol"]))}
+        return [{"symbol": symbol, "price": str(price)} for symbol, price in self.prices.items()]
+
+    def _ticker_24hr(self, params):
+        def ticker(symbol):
+            price = self._price(symbol)
+            return {
+                "symbol": symbol, "priceChange": "0", "priceChangePercent": "0",
+                "lastPrice": str(price), "highPrice": str(price * 1.02), "lowPrice": str(price * 0.98),
+                "volume": "1000", "quoteVolume": str(price * 1000), "count": 100
+            }
+        if "symbol" in params:
+            return ticker(params["symbol"])
+        return [ticker(symbol) for symbol in self.prices]
+
+    def _klines(self, params):
+        price = self._price(params["symbol"])
+        now = int(time.time() // 60 * 60000)
+        limit = int(params.get("limit", 500))
+        return [
+            [now - (limit - 1 - i) * 60000, str(price), str(price), str(price), str(price), "1",
+             now - (limit - 2 - i) * 60000 - 1, str(price), 1, "0.5", str(price / 2), "0"]
+            for i in range(limit)
+        ]
+
+    def _exchange_info(self, params):
+        return {
+            "timezone": "UTC",
+            "serverTime": int(time.time() * 1000),
+            "symbols": [
+                {
+                    "symbol": symbol, "baseAsset": symbol[:-4], "quoteAsset": "USDT", "status": "TRADING",
+                    "contractType": "PERPETUAL", "deliveryDate": 4133404800000, "onboardDate": 1569398400000,
+                    "pricePrecision": 2, "quantityPrecision": 3, "baseAssetPrecision": 8, "quotePrecision": 8
+                }
+                for symbol in self.prices
+            ]
+        }
+
+    # Accounts
+
+    def _spot_account(self, params):
+        return {
+            "canTrade": True, "canWithdraw": True, "canDeposit": True, "accountType": "SPOT",
+            "balances": [{"asset": asset, "free": str(amount), "locked": "0"}
+                         for asset, amount in self.spot_balances.items()]
+        }
+
+    def _unrealized(self, symbol: str) -> float:
+        position = self.positions[symbol]
+        return (self.prices[symbol] - position["entry_price"]) * position["amount"]
+
+    def _futures_account(self, params):
+        unrealized = sum(self._unrealized(symbol) for symbol in self.positions)
+        maint_margin = sum(abs(p["amount"]) * self.prices[s] * 0.004 for s, p in self.positions.items())
+        margin_balance = self.futures_balance + unrealized
+        return {
+            "canTrade": True, "canWithdraw": True, "canDeposit": True,
+            "totalWalletBalance": str(self.futures_balance),
+            "totalUnrealizedProfit": str(unrealized),
+            "totalMarginBalance": str(margin_balance),
+            "totalMaintMargin": str(maint_margin),
+            "availableBalance": str(margin_balance),
+            "maxWithdrawAmount": str(margin_balance),
+            "assets": [{
+                "asset": "USDT", "walletBalance": str(self.futures_balance),
+                "unrealizedProfit": str(unrealized), "marginBalance": str(margin_balance),
+                "availableBalance": str(margin_balance), "maxWithdrawAmount": str(margin_balance)
+            }]
+        }
+
+    def _position_risk(self, params):
+        symbols = [params["symbol"]] if "symbol" in params else list(self.prices)
+        result = []
+        for symbol in symbols:
+            position = self.positions.get(symbol, {"amount": 0.0, "entry_price": 0.0})
+            result.append({
+                "symbol": symbol,
+                "positionAmt": str(position["amount"]),
+                "entryPrice": str(position["entry_price"]),
+                "markPrice": str(self._price(symbol)),
+                "unRealizedProfit": str(self._unrealized(symbol) if symbol in self.positions else 0.0),
+                "leverage": str(self.leverage.get(symbol, 20)),
+                "marginType": self.margin_type.get(symbol, "cross"),
+                "isolatedMargin": "0",
+                "liquidationPrice": "0"
+            })
+        return result
+
+    def _change_leverage(self, params):
+        self.leverage[params["symbol"]] = int(params["leverage"])
+        return {"symbol": params["symbol"], "leverage": int(params["leverage"]), "maxNotionalValue": "1000000"}
+
+    def _change_margin_type(self, params):
+        if self.margin_type.get(params["symbol"]) == params["marginType"]:
+            raise ValueError("-4046:No need to change margin type.")
+        self.margin_type[params["symbol"]] = params["marginType"]
+        return {"code": 200, "msg": "success"}
+
+    # Orders
+
+    def _new_order(self, params, futures: bool):
+        symbol, side, order_type = params["symbol"], params["side"], params["type"]
+        price = self._price(symbol)
+        close_position = params.get("closePosition") == "true"
+
+        if close_position:
+            quantity = abs(self.positions.get(symbol, {}).get("amount", 0.0))
+        else:
+            quantity = float(params["quantity"])
+
+        order_id = self._next_order_id
+        self._next_order_id += 1
+        now = int(time.time() * 1000)
+        filled = order_type == "MARKET"
+
+        order = {
+            "orderId": order_id, "symbol": symbol, "side": side, "type": order_type,
+            "status": "FILLED" if filled else "NEW",
+            "origQty": str(quantity), "price": params.get("price", "0"),
+            "stopPrice": params.get("stopPrice", "0"),
+            "executedQty": str(quantity if filled else 0.0),
+            "avgPrice": str(price if filled else 0.0),
+            "reduceOnly": params.get("reduceOnly") == "true",
+            "closePosition": close_position,
+            "time": now, "updateTime": now, "transactTime": now,
+            "futures": futures
+        }
+        order["cumQuote"] = order["cummulativeQuoteQty"] = str(quantity * price if filled else 0.0)
+        self.orders[order_id] = order
+
+        if futures:
+            self._order_event(order, "NEW")
+        if filled and futures:
+            self._apply_fill(symbol, quantity if side == "BUY" else -quantity, price)
+            self._order_event(order, "TRADE", last_qty=quantity, last_price=price)
+            self._account_event(symbol)
+        return {k: v for k, v in order.items() if k != "futures"}
+
+    def fill_order(self, order_id: int, price: Optional[float] = None) -> Dict[str, Any]:
+        """Fill a resting order as if its price or stop was reached."""
+        order = self.orders[order_id]
+        if order["status"] != "NEW":
+            raise ValueError(f"-2011:Order {order_id} is {order['status']}")
+
+        price = price or float(order["price"]) or float(order["stopPrice"]) or self.prices[order["symbol"]]
+        quantity = float(order["origQty"])
+        order.update(status="FILLED", executedQty=str(quantity), avgPrice=str(price),
+                     cumQuote=str(quantity * price), updateTime=int(time.time() * 1000))
+        if order["futures"]:
+            self._apply_fill(order["symbol"], quantity if order["side"] == "BUY" else -quantity, price)
+            self._order_event(order, "TRADE", last_qty=quantity, last_price=price)
+            self._account_event(order["symbol"])
+        return {k: v for k, v in order.items() if k != "futures"}
+
+    def _apply_fill(self, symbol: str, signed_qty: float, price: float):
+        position = self.positions.setdefault(symbol, {"amount": 0.0, "entry_price": 0.0})
+        new_amount = position["amount"] + signed_qty
+        if position["amount"] * signed_qty >= 0 and new_amount != 0:
+            position["entry_price"] = (
+                position["entry_price"] * abs(position["amount"]) + price * abs(signed_qty)
+            ) / abs(new_amount)
+        else:
+            closed = min(abs(signed_qty), abs(position["amount"]))
+            direction = 1 if position["amount"] > 0 else -1
+            self.futures_balance += (price - position["entry_price"]) * closed * direction
+        position["amount"] = round(new_amount, 8)
+        if position["amount"] == 0:
+            del self.positions[symbol]
+
+    def _get_order(self, params):
+        order = self.orders.get(int(params["orderId"]))
+        if order is None:
+            raise ValueError("-2013:Order does not exist.")
+        return {k: v for k, v in order.items() if k != "futures"}
+
+    def _open_orders(self, params, futures: bool):
+        return [
+            {k: v for k, v in order.items() if k != "futures"}
+            for order in self.orders.values()
+            if order["status"] == "NEW" and order["futures"] == futures
+            and params.get("symbol", order["symbol"]) == order["symbol"]
+        ]
+
+    def _cancel_order(self, params):
+        order = self.orders.get(int(params["orderId"]))
+        if order is None or order["status"] != "NEW":
+            raise ValueError("-2011:Unknown order sent.")
+        order["status"] = "CANCELED"
+        if order["futures"]:
+            self._order_event(order, "CANCELED")
+        return {k: v for k, v in order.items() if k != "futures"}
+
+    def expire_order(self, order_id: int, status: str = "EXPIRED") -> Dict[str, Any]:
+        """End a resting order on the exchange side (EXPIRED, CANCELED or REJECTED)."""
+        order = self.orders[order_id]
+        if order["status"] != "NEW":
+            raise ValueError(f"-2011:Order {order_id} is {order['status']}")
+
+        order.update(status=status, updateTime=int(time.time() * 1000))
+        if order["futures"]:
+            self._order_event(order, status)
+        return {k: v for k, v in order.items() if k != "futures"}
+
+    # User data stream
+
+    def _new_listen_key(self, params):
+        if self.listen_key is None:
+            self.listen_key = secrets.token_hex(32)
+        return {"listenKey": self.listen_key}
+
+    def _keepalive_listen_key(self, params):
+        if self.listen_key is None:
+            raise ValueError("-1125:This listenKey does not exist.")
+        return {}
+
+    def _close_listen_key(self, params):
+        self.listen_key = None
+        return {}
+
+    async def _handle_stream(self, websocket, path: Optional[str] = None):
+        path = path or getattr(websocket, "path", None) or websocket.request.path
+        if self.listen_key is None or path.rsplit("/", 1)[-1] != self.listen_key:
+            await websocket.close(code=1008, reason="Invalid listenKey")
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        self._stream_queues[queue] = websocket
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                await websocket.send(json.dumps(event))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self._stream_queues.pop(queue, None)
+
+    def _emit(self, event: Dict[str, Any]):
+        for queue in self._stream_queues:
+            queue.put_nowait(event)
+
+    async def drop_stream_connections(self):
+        """Close every stream connection (clients are expected to reconnect)."""
+        for queue, websocket in list(self._stream_queues.items()):
+            queue.put_nowait(None)
+            await websocket.close()
+
+    def expire_listen_key(self):
+        """Invalidate the listenKey and tell connected streams."""
+        self.listen_key = None
+        self._emit({"e": "listenKeyExpired", "E": int(time.time() * 1000)})
+
+    def _order_event(self, order: Dict[str, Any], execution_type: str,
+                     last_qty: float = 0.0, last_price: float = 0.0):
+        now = int(time.time() * 1000)
+        self._emit({
+            "e": "ORDER_TRADE_UPDATE", "E": now, "T": now,
+            "o": {
+                "s": order["symbol"], "c": f"mock_{order['orderId']}", "S": order["side"],
+                "o": order["type"], "f": "GTC", "q": order["origQty"], "p": order["price"],
+                "ap": order["avgPrice"], "sp": order["stopPrice"], "x": execution_type,
+                "X": order["status"], "i": order["orderId"], "l": str(last_qty),
+                "z": order["executedQty"], "L": str(last_price), "T": now,
+                "R": order["reduceOnly"], "cp": order["closePosition"], "rp": "0"
+            }
+        })
+
+    def _account_event(self, symbol: str):
+        now = int(time.time() * 1000)
+        position = self.positions.get(symbol, {"amount": 0.0, "entry_price": 0.0})
+        self._emit({
+            "e": "ACCOUNT_UPDATE", "E": now, "T": now,
+            "a": {
+                "m": "ORDER",
+                "B": [{"a": "USDT", "wb": str(self.futures_balance), "cw": str(self.futures_balance), "bc": "0"}],
+                "P": [{
+                    "s": symbol, "pa": str(position["amount"]), "ep": str(position["entry_price"]),
+                    "cr": "0", "up": str(self._unrealized(symbol) if symbol in self.positions else 0.0),
+                    "mt": self.margin_type.get(symbol, "cross"), "iw": "0", "ps": "BOTH"
+                }]
+            }
+        })
+
+
+async def _serve(host: str, port: int, latency: float):
+    server = MockExchangeServer(latency=latency)
+    base_url = await server.start(host, port)
+    ws_url = await server.start_user_stream(host, port + 1)
+    print(f"Mock exchange at {base_url}, user data stream at {ws_url} "
+          f"(api key: {server.api_key}, secret: {server.api_secret})")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Binance REST stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(args.host, args.port, args.latency))
@@ -5,6 +5,7 @@ Portfolio service for real-time account balance and portfolio management
 from typing import Dict, List, Any, Optional
 from ..services.binance_client import BinanceClient
 from ..services.binance_futures_client import BinanceFuturesClient
+from ..services.account_state import AccountStateService
 from fastapi import HTTPException
 import logging
 
@@ -12,9 +13,12 @@ logger = logging.getLogger(__name__)
 
 
 class PortfolioService:
-    def __init__(self, binance_client: BinanceClient, futures_client: Optional[BinanceFuturesClient] = None):
+    def __init__(self, binance_client: BinanceClient, futures_client: Optional[BinanceFuturesClient] = None,
+                 account_state: Optional[AccountStateService] = None):
         self.spot_client = binance_client
         self.futures_client = futures_client
+        # Futures balances and positions come from the user's shared account snapshot
+        self.account_state = account_state or (AccountStateService(futures_client) if futures_client else None)
 
     async def get_account_balance(self) -> Dict[str, Any]:
         """계정 잔고 조회 with detailed logging"""
@@ -31,7 +35,7 @@ class PortfolioService:
             # Spot 계정 조회
             try:
                 logger.debug("Fetching spot account information...")
-                spot_account = self.spot_client.get_account_info()
+                spot_account = await self.spot_client.get_account_info()
 
                 if spot_account.get("success", False):
                     spot_balances = []
@@ -71,13 +75,13 @@ class PortfolioService:
                 results["spot"]["error"] = str(e)
 
             # Futures 계정 조회 (권한 있는 경우)
-            if self.futures_client:
+            if self.account_state:
                 try:
-                    logger.debug("Fetching futures account information...")
-                    futures_account = self.futures_client.get_account_info()
+                    logger.debug("Reading futures account snapshot...")
+                    snapshot = await self.account_state.get_snapshot()
 
-                    if futures_account.get("success", False):
-                        futures_data = futures_account.get("data", {})
+                    if snapshot:
+                        futures_data = snapshot.account
                         futures_balances = []
 
                         total_futures_value = float(futures_data.get("total_wallet_balance", 0))
@@ -102,16 +106,14 @@ class PortfolioService:
                             "balances": futures_balances,
                             "total_wallet_balance": total_futures_value,
                             "total_unrealized_pnl": float(futures_data.get("total_unrealized_pnl", 0)),
-                            "total_margin_balance": float(futures_data.get("total_margin_balance", 0))
+                            "total_margin_balance": float(futures_data.get("total_margin_balance", 0)),
+                            "snapshot_version": snapshot.version,
+                            "snapshot_updated_at": snapshot.updated_at
                         }
 
                         results["total_value_usdt"] += total_futures_value
                         logger.info(f"Futures account: {len(futures_balances)} assets, total value: {total_futures_value}")
 
-                    else:
-                        logger.warning(f"Futures account fetch failed: {futures_account.get('error', 'Unknown error')}")
-                        results["futures"]["error"] = futures_account.get("error", "Unknown error")
-
                 except Exception as e:
                     logger.warning(f"Error fetching futures account (continuing without futures): {e}")
                     results["futures"]["error"] = str(e)
@@ -137,14 +139,12 @@ class PortfolioService:
             }
 
             # Get futures positions if available
-            if self.futures_client:
+            if self.account_state:
                 try:
-                    positions_response = self.futures_client.get_positions()
-                    if positions_response.get("success", False):
-                        results["futures_positions"] = positions_response.get("data", [])
-                        logger.info(f"Found {len(results['futures_positions'])} active futures positions")
-                    else:
-                        logger.warning(f"Failed to get futures positions: {positions_response.get('error', 'Unknown error')}")
+                    snapshot = await self.account_state.get_snapshot()
+                    results["futures_positions"] = snapshot.positions
+                    results["snapshot_version"] = snapshot.version
+                    logger.info(f"Found {len(results['futures_positions'])} active futures positions")
                 except Exception as e:
                     logger.warning(f"Error getting futures positions: {e}")
 
@@ -0,0 +1,282 @@
+"""
+Fan-out of market stream messages to browser WebSocket connections.
+
+Binance stream callbacks run on ThreadedWebsocketManager threads. Messages are
+serialised once on that thread and handed to the event loop with
+call_soon_threadsafe, then queued for every subscribed connection. Each connection
+has its own bounded outbound queue and sender task, so a slow browser only delays
+(and loses) its own updates:
+
+- ticker updates are coalesced: a queued ticker of the same stream is replaced by
+  the newer one
+- other stream messages drop the oldest queued message when the queue is full
+- direct replies (confirmations, pong, errors) are never dropped; a connection whose
+  full queue has nothing left to drop is disconnected, so the queue stays bounded
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Message types whose latest value supersedes queued ones
+COALESCED_TYPES = {"ticker"}
+
+
+class _Outbound:
+    __slots__ = ("text", "key", "droppable", "created_at")
+
+    def __init__(self, text: str, key: Optional[str], droppable: bool, created_at: float):
+        self.text = text
+        self.key = key  # coalescing key (stream name) or None
+        self.droppable = droppable
+        self.created_at = created_at  # monotonic time the message was received
+
+
+class ClientChannel:
+    """Bounded outbound queue and sender task of one WebSocket connection"""
+
+    def __init__(self, connection_id: str, websocket, max_queue: int = 100, send_timeout: float = 10.0,
+                 on_failure=None):
+        """
+        Args:
+            connection_id: Connection identifier
+            websocket: Object with an async send_text(str) (FastAPI WebSocket)
+            max_queue: Maximum queued messages; stream messages are dropped beyond it, and
+                       the connection is dropped when nothing is left to drop
+            send_timeout: Seconds a single send may take before the connection is dropped
+            on_failure: Called with the connection id when the connection is dropped
+        """
+        self.connection_id = connection_id
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.on_failure = on_failure
+
+        self._queue: Deque[_Outbound] = deque()
+        self._latest: Dict[str, _Outbound] = {}  # coalescing key -> queued message
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.stats = {"sent": 0, "dropped": 0, "coalesced": 0, "overflowed": False,
+                      "last_lag_ms": 0.0, "max_lag_ms": 0.0, "total_lag_ms": 0.0}
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._sender())
+
+    def close(self):
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._queue.clear()
+        self._latest.clear()
+
+    def enqueue(self, text: str, key: Optional[str] = None, droppable: bool = True,
+                created_at: Optional[float] = None):
+        """Queue a serialised message (must run on the event loop)."""
+        if self._closed:
+            return
+        created_at = time.monotonic() if created_at is None else created_at
+
+        if key is not None:
+            queued = self._latest.get(key)
+            if queued is not None:
+                # 아직 전송되지 않은 이전 값을 최신 값으로 교체 (대기 순서 유지)
+                queued.text = text
+                queued.created_at = created_at
+                self.stats["coalesced"] += 1
+                return
+
+        if len(self._queue) >= self.max_queue and not self._drop_oldest():
+            # 버릴 수 있는 메시지가 없으면 큐를 늘리지 않고 연결 종료
+            self.stats["overflowed"] = True
+            reason = f"outbound queue full ({len(self._queue)} undroppable messages)"
+            self.close()
+            self._abort(reason)
+            return
+
+        message = _Outbound(text, key, droppable, created_at)
+        self._queue.append(message)
+        if key is not None:
+            self._latest[key] = message
+        self._ready.set()
+
+    def _drop_oldest(self) -> bool:
+        # 최신값 교체 대상(스트림당 1개)보다 일반 스트림 메시지를 먼저 버림
+        candidates = [m for m in self._queue if m.droppable and m.key is None] or \
+            [m for m in self._queue if m.droppable]
+        if candidates:
+            message = candidates[0]
+            self._queue.remove(message)
+            if message.key is not None:
+                self._latest.pop(message.key, None)
+            self.stats["dropped"] += 1
+            return True
+        return False
+
+    async def _sender(self):
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                while self._queue:
+                    message = self._queue.popleft()
+                    if message.key is not None:
+                        self._latest.pop(message.key, None)
+
+                    await asyncio.wait_for(self.websocket.send_text(message.text), self.send_timeout)
+
+                    lag_ms = (time.monotonic() - message.created_at) * 1000
+                    self.stats["sent"] += 1
+                    self.stats["last_lag_ms"] = lag_ms
+                    self.stats["max_lag_ms"] = max(self.stats["max_lag_ms"], lag_ms)
+                    self.stats["total_lag_ms"] += lag_ms
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._task = None
+            self._abort(f"send failed: {e}")
+
+    def _abort(self, reason: str):
+        """Close the socket in the background and let the owner drop the connection."""
+        logger.warning(f"Dropping WebSocket connection {self.connection_id}: {reason}")
+        close = getattr(self.websocket, "close", None)
+        if close is not None:
+            asyncio.ensure_future(self._close_quietly(close))
+        if self.on_failure is not None:
+            self.on_failure(self.connection_id)
+
+    @staticmethod
+    async def _close_quietly(close):
+        try:
+            await close(code=1013)
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        oldest = self._queue[0].created_at if self._queue else None
+        sent = self.stats["sent"]
+        return {
+            "queue_size": len(self._queue),
+            "sent": sent,
+            "dropped": self.stats["dropped"],
+            "coalesced": self.stats["coalesced"],
+            "overflowed": self.stats["overflowed"],
+            "last_lag_ms": round(self.stats["last_lag_ms"], 3),
+            "avg_lag_ms": round(self.stats["total_lag_ms"] / sent, 3) if sent else 0.0,
+            "max_lag_ms": round(self.stats["max_lag_ms"], 3),
+            "oldest_queued_ms": round((time.monotonic() - oldest) * 1000, 3) if oldest is not None else 0.0
+        }
+
+
+class StreamBroadcaster:
+    """Thread-safe fan-out of stream messages to subscribed connections"""
+
+    def __init__(self, max_queue: int = 100, send_timeout: float = 10.0):
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+
+        self.channels: Dict[str, ClientChannel] = {}
+        self.subscriptions: Dict[str, Set[str]] = {}  # stream_name -> connection ids
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.on_failure = None  # set by the owner to clean up failed connections
+        self.stats = {"published": 0, "deliveries": 0, "publish_errors": 0}
+
+    def register(self, connection_id: str, websocket) -> ClientChannel:
+        """Create the outbound channel of a connection (must run on the event loop)."""
+        self._loop = asyncio.get_running_loop()
+        self.unregister(connection_id)
+
+        channel = ClientChannel(connection_id, websocket, self.max_queue, self.send_timeout,
+                                on_failure=self._channel_failed)
+        self.channels[connection_id] = channel
+        channel.start()
+        return channel
+
+    def unregister(self, connection_id: str) -> List[str]:
+        """
+        Close a connection's channel and drop its subscriptions.
+
+        Returns:
+            Stream names that no longer have any subscriber
+        """
+        channel = self.channels.pop(connection_id, None)
+        if channel is not None:
+            channel.close()
+
+        unused = []
+        for stream_name in list(self.subscriptions):
+            if self.unsubscribe(connection_id, stream_name):
+                unused.append(stream_name)
+        return unused
+
+    def _channel_failed(self, connection_id: str):
+        if self.on_failure is not None:
+            self.on_failure(connection_id)
+        else:
+            self.unregister(connection_id)
+
+    def subscribe(self, connection_id: str, stream_name: str) -> bool:
+        """Subscribe a connection; returns True if the stream had no subscriber before."""
+        subscribers = self.subscriptions.setdefault(stream_name, set())
+        first = not subscribers
+        subscribers.add(connection_id)
+        return first
+
+    def unsubscribe(self, connection_id: str, stream_name: str) -> bool:
+        """Unsubscribe a connection; returns True if the stream has no subscriber left."""
+        subscribers = self.subscriptions.get(stream_name)
+        if subscribers is None or connection_id not in subscribers:
+            return False
+        subscribers.discard(connection_id)
+        if not subscribers:
+            del self.subscriptions[stream_name]
+            return True
+        return False
+
+    def send(self, connection_id: str, message: Dict[str, Any]):
+        """Queue a direct reply to one connection (never dropped)."""
+        channel = self.channels.get(connection_id)
+        if channel is not None:
+            channel.enqueue(json.dumps(message), droppable=False)
+
+    def publish_threadsafe(self, message: Dict[str, Any]):
+        """
+        Stream callback for any thread (e.g. ThreadedWebsocketManager).
+
+        The message is serialised here, once, and fanned out on the event loop.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            text = json.dumps(message)
+            loop.call_soon_threadsafe(self._fan_out, message.get("stream"), message.get("type"),
+                                      text, time.monotonic())
+        except Exception as e:
+            self.stats["publish_errors"] += 1
+            logger.error(f"Error publishing stream message: {e}")
+
+    def _fan_out(self, stream_name: Optional[str], message_type: Optional[str], text: str, created_at: float):
+        self.stats["published"] += 1
+        key = stream_name if message_type in COALESCED_TYPES else None
+        # A full channel may disconnect (and unsubscribe) while being fanned out to
+        for connection_id in list(self.subscriptions.get(stream_name, ())):
+            channel = self.channels.get(connection_id)
+            if channel is not None:
+                channel.enqueue(text, key=key, created_at=created_at)
+                self.stats["deliveries"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "connections": {connection_id: channel.get_stats() for connection_id, channel in self.channels.items()},
+            "subscriptions": {stream_name: len(ids) for stream_name, ids in self.subscriptions.items()}
+        }
@@ -0,0 +1,256 @@
+"""
+Futures user data stream: event-driven order and account state.
+
+Keeps the latest state of every order and position from ORDER_TRADE_UPDATE and
+ACCOUNT_UPDATE events, so order fills are seen within milliseconds instead of by
+polling the order endpoint. The listenKey is kept alive in the background; after
+every (re)connect the owner is asked to reconcile over REST, since events sent while
+disconnected are lost.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+import logging
+
+import websockets
+
+from .async_binance import FUTURES_WS_URL
+from .binance_futures_client import BinanceFuturesClient
+
+logger = logging.getLogger(__name__)
+
+
+EventCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+TERMINAL_ORDER_STATUSES = {"FILLED", "CANCELED", "EXPIRED", "REJECTED"}
+
+
+def parse_order_update(order: Dict[str, Any]) -> Dict[str, Any]:
+    """ORDER_TRADE_UPDATE payload ("o") in the client's snake_case order format"""
+    avg_price = float(order.get("ap", 0))
+    return {
+        "order_id": order["i"],
+        "symbol": order["s"],
+        "status": order["X"],
+        "execution_type": order.get("x"),
+        "type": order.get("o"),
+        "side": order.get("S"),
+        "quantity": float(order.get("q", 0)),
+        "price": float(order.get("p", 0)) or None,
+        "stop_price": float(order.get("sp", 0)) or None,
+        "executed_qty": float(order.get("z", 0)),
+        "avg_price": avg_price if avg_price > 0 else None,
+        "last_filled_qty": float(order.get("l", 0)),
+        "last_filled_price": float(order.get("L", 0)),
+        "realized_pnl": float(order.get("rp", 0)),
+        "reduce_only": order.get("R", False),
+        "close_position": order.get("cp", False),
+        "time": order.get("T")
+    }
+
+
+class UserDataStream:
+    """Futures user data stream with order/position state tracking"""
+
+    def __init__(self,
+                 client: BinanceFuturesClient,
+                 ws_url: Optional[str] = None,
+                 keepalive_interval: float = 1800.0,
+                 max_backoff: float = 30.0,
+                 max_terminal_orders: int = 500,
+                 on_order_update: Optional[EventCallback] = None,
+                 on_account_update: Optional[EventCallback] = None,
+                 on_reconnect: Optional[Callable[[], Awaitable[None]]] = None):
+        """
+        Args:
+            client: Futures client of the account (REST for listenKey management)
+            ws_url: Stream base URL (default: BINANCE_FUTURES_WS_URL or Binance)
+            keepalive_interval: Seconds between listenKey keep-alives (keys expire after 60 min)
+            max_backoff: Maximum seconds between reconnect attempts
+            max_terminal_orders: Finished orders kept for get_order() before the oldest is evicted
+            on_order_update: Awaited with each parsed order update
+            on_account_update: Awaited with each parsed account update
+            on_reconnect: Awaited after every successful connect, for REST reconciliation
+        """
+        self.client = client
+        self.ws_url = (ws_url or FUTURES_WS_URL).rstrip("/")
+        self.keepalive_interval = keepalive_interval
+        self.max_backoff = max_backoff
+        self.max_terminal_orders = max_terminal_orders
+        self.on_order_update = on_order_update
+        self.on_account_update = on_account_update
+        self.on_reconnect = on_reconnect
+
+        # 최신 주문/포지션/잔고 상태
+        self.orders: Dict[int, Dict[str, Any]] = {}
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.balances: Dict[str, Dict[str, float]] = {}
+        # 종료된 주문 ID (오래된 순), 상한 초과 시 orders에서 제거
+        self._terminal_orders: "OrderedDict[int, None]" = OrderedDict()
+
+        self.connected = False
+        self.listen_key: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._websocket = None
+        self.stats = {"connects": 0, "events": 0, "order_updates": 0, "account_updates": 0,
+                      "keepalives": 0, "errors": 0, "last_event_time": None}
+
+    async def start(self):
+        """Connect in the background (reconnecting until stop())."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Disconnect and release the listenKey."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self.listen_key is not None:
+            try:
+                await self.client.client.futures_stream_close()
+            except Exception as e:
+                logger.debug(f"listenKey close failed: {e}")
+            self.listen_key = None
+
+    async def wait_connected(self, timeout: float = 10.0) -> bool:
+        """Wait until the stream is connected."""
+        deadline = time.monotonic() + timeout
+        while not self.connected and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        return self.connected
+
+    def get_order(self, order_id: int) -> Optional[Dict[str, Any]]:
+        """Last streamed state of an order (None if no event was seen for it)."""
+        return self.orders.get(order_id)
+
+    def forget_order(self, order_id: int):
+        """Drop a finished order once its owner has consumed the final state."""
+        self.orders.pop(order_id, None)
+        self._terminal_orders.pop(order_id, None)
+
+    async def _run(self):
+        backoff = 1.0
+        while True:
+            keepalive_task = None
+            try:
+                self.listen_key = await self.client.client.futures_stream_get_listen_key()
+                async with websockets.connect(f"{self.ws_url}/{self.listen_key}",
+                                              ping_interval=20, ping_timeout=20) as websocket:
+                    self._websocket = websocket
+                    self.connected = True
+                    self.stats["connects"] += 1
+                    backoff = 1.0
+                    logger.info("User data stream connected")
+
+                    keepalive_task = asyncio.create_task(self._keepalive_loop(websocket))
+                    if self.on_reconnect is not None:
+                        # 연결이 끊긴 동안 놓친 이벤트는 REST로 보정
+                        await self.on_reconnect()
+
+                    async for message in websocket:
+                        if await self._handle_message(json.loads(message)) is False:
+                            break
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"User data stream error, reconnecting in {backoff:.0f}s: {e}")
+            finally:
+                self.connected = False
+                self._websocket = None
+                if keepalive_task is not None:
+                    keepalive_task.cancel()
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    async def _keepalive_loop(self, websocket):
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await self.client.client.futures_stream_keepalive()
+                self.stats["keepalives"] += 1
+            except Exception as e:
+                logger.warning(f"listenKey keep-alive failed, reconnecting: {e}")
+                await websocket.close()
+                return
+
+    async def _handle_message(self, event: Dict[str, Any]) -> Optional[bool]:
+        """Apply one event; returns False when the connection must be renewed."""
+        event_type = event.get("e")
+        self.stats["events"] += 1
+        self.stats["last_event_time"] = event.get("E")
+
+        if event_type == "ORDER_TRADE_UPDATE":
+            order = parse_order_update(event["o"])
+            self._track_order(order)
+            self.stats["order_updates"] += 1
+            await self._dispatch(self.on_order_update, order)
+
+        elif event_type == "ACCOUNT_UPDATE":
+            update = self._apply_account_update(event["a"])
+            self.stats["account_updates"] += 1
+            await self._dispatch(self.on_account_update, update)
+
+        elif event_type == "listenKeyExpired":
+            logger.warning("listenKey expired, reconnecting")
+            return False
+        return None
+
+    def _track_order(self, order: Dict[str, Any]):
+        self.orders[order["order_id"]] = order
+        if order["status"] not in TERMINAL_ORDER_STATUSES:
+            return
+
+        # 소유자가 가져가지 않은 종료 주문(진입/청산 시장가 등)이 쌓이지 않도록 상한 유지
+        self._terminal_orders[order["order_id"]] = None
+        while len(self._terminal_orders) > self.max_terminal_orders:
+            order_id, _ = self._terminal_orders.popitem(last=False)
+            self.orders.pop(order_id, None)
+
+    def _apply_account_update(self, account: Dict[str, Any]) -> Dict[str, Any]:
+        for balance in account.get("B", []):
+            self.balances[balance["a"]] = {
+                "wallet_balance": float(balance["wb"]),
+                "cross_wallet_balance": float(balance.get("cw", 0))
+            }
+        changed = []
+        for position in account.get("P", []):
+            amount = float(position["pa"])
+            parsed = {
+                "symbol": position["s"],
+                "position_amt": amount,
+                "entry_price": float(position["ep"]),
+                "unrealized_pnl": float(position.get("up", 0)),
+                "margin_type": position.get("mt", "cross"),
+                "side": "LONG" if amount > 0 else "SHORT"
+            }
+            changed.append(parsed)
+            if amount == 0:
+                self.positions.pop(position["s"], None)
+            else:
+                self.positions[position["s"]] = parsed
+
+        # 이벤트에는 변경된 포지션만 포함됨 (청산된 포지션은 수량 0)
+        return {"reason": account.get("m"), "balances": dict(self.balances),
+                "changed_positions": changed, "positions": dict(self.positions)}
+
+    async def _dispatch(self, callback: Optional[EventCallback], payload: Dict[str, Any]):
+        if callback is None:
+            return
+        try:
+            await callback(payload)
+        except Exception as e:
+            logger.error(f"User data stream callback error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "connected": self.connected, "tracked_orders": len(self.orders)}
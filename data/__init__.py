@@ -3,7 +3,12 @@ Data collection and storage module for Crypto Trader Pro.
 
 This module provides comprehensive cryptocurrency data management including:
 - Database management and storage (CryptoDatabaseManager)
+- Columnar OHLCV tier with memory-mapped reads (ColumnarOHLCVStore)
 - Real-time data collection (RealTimeDataCollector)
+- Since-based historical backfill with checkpoints (HistoricalBackfillEngine)
+- Single-writer batched ingest queue (BatchedIngestWriter)
+- Tiered retention with rollups and incremental vacuum (RetentionManager)
+- Read-through kline service over the local store (KlineService)
 - Intelligent scheduling system (DataCollectionScheduler)
 - Data integrity validation and optimization
 
@@ -11,7 +16,12 @@ Version: 1.0.0
 """
 
 from .database import CryptoDatabaseManager, validate_database_integrity, optimize_database
+from .columnar_store import ColumnarOHLCVStore, OHLCV_DTYPE
+from .backfill import HistoricalBackfillEngine, BackfillCheckpoint
+from .ingest import BatchedIngestWriter, IngestMetrics
+from .retention import RetentionManager, DEFAULT_RETENTION_POLICY
 from .collector import RealTimeDataCollector, CollectionStatistics
+from .kline_service import KlineService, get_kline_service
 from .scheduler import DataCollectionScheduler, create_and_start_scheduler
 
 __version__ = "1.0.0"
@@ -22,10 +32,20 @@ __all__ = [
     'CryptoDatabaseManager',
     'validate_database_integrity',
     'optimize_database',
+    'ColumnarOHLCVStore',
+    'OHLCV_DTYPE',
 
     # Data collection
     'RealTimeDataCollector',
     'CollectionStatistics',
+    'HistoricalBackfillEngine',
+    'BackfillCheckpoint',
+    'BatchedIngestWriter',
+    'IngestMetrics',
+    'RetentionManager',
+    'DEFAULT_RETENTION_POLICY',
+    'KlineService',
+    'get_kline_service',
 
     # Scheduling
     'DataCollectionScheduler',
@@ -0,0 +1,373 @@
+"""
+Historical OHLCV backfill engine for cryptocurrency trading bot.
+Pages through exchange history with since/endTime cursors, merges adjacent gaps into
+minimal request ranges and checkpoints progress so long backfills can resume.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+import logging
+
+from utils.exceptions import InsufficientDataError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+# Candle spacing per timeframe in milliseconds (exchange timestamps)
+TIMEFRAME_MS = {
+    '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000, '6h': 21_600_000,
+    '8h': 28_800_000, '12h': 43_200_000, '1d': 86_400_000, '3d': 259_200_000,
+    '1w': 604_800_000, '1M': 2_592_000_000
+}
+
+# Timeframes whose candles follow the calendar (no fixed spacing; '1M' above is 30 days)
+CALENDAR_TIMEFRAMES = {'1M'}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """
+    Get the candle spacing of a timeframe in milliseconds.
+
+    Args:
+        timeframe (str): Time interval ('1m', '5m', '1h', etc.)
+
+    Returns:
+        int: Interval in milliseconds (1m if unknown, 30 days for '1M')
+    """
+    return TIMEFRAME_MS.get(timeframe, TIMEFRAME_MS['1m'])
+
+
+def merge_gap_ranges(gaps: List[Tuple[int, int]], interval_ms: int,
+                     max_bridge_candles: int = 0) -> List[Tuple[int, int]]:
+    """
+    Merge overlapping or nearby gaps into minimal request ranges.
+
+    Gaps separated by at most max_bridge_candles stored candles are merged, since
+    re-fetching a few existing candles is cheaper than another request.
+
+    Args:
+        gaps (List[Tuple[int, int]]): (gap_start, gap_end) pairs, inclusive, in ms
+        interval_ms (int): Candle spacing in ms
+        max_bridge_candles (int): Largest run of stored candles to fetch again to join two gaps
+
+    Returns:
+        List[Tuple[int, int]]: Sorted, merged (start, end) ranges
+    """
+    merged: List[List[int]] = []
+    for start, end in sorted(gaps):
+        if end < start:
+            continue
+        if merged and start - merged[-1][1] <= (max_bridge_candles + 1) * interval_ms:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def plan_pages(start: int, end: int, interval_ms: int, page_limit: int) -> List[Tuple[int, int]]:
+    """
+    Split a range into request pages with precomputed cursors.
+
+    Args:
+        start (int): First candle open time (ms)
+        end (int): Last candle open time (ms, inclusive)
+        interval_ms (int): Candle spacing in ms
+        page_limit (int): Candles per request
+
+    Returns:
+        List[Tuple[int, int]]: (since, end_time) per page; pages are independent and can
+                               be fetched concurrently
+    """
+    # Align to candle boundaries so pages never split a candle
+    start = start - start % interval_ms
+    page_span = page_limit * interval_ms
+
+    pages = []
+    since = start
+    while since <= end:
+        pages.append((since, min(since + page_span - interval_ms, end)))
+        since += page_span
+    return pages
+
+
+class BackfillCheckpoint:
+    """
+    Thread-safe record of completed backfill ranges per series.
+
+    Stored as JSON ``{"BTC/USDT|1m": [[start, end], ...]}`` with merged, sorted ranges and
+    replaced atomically on every save so an interrupted backfill resumes where it stopped.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path (Optional[Union[str, Path]]): JSON checkpoint file (in-memory only if None)
+        """
+        self.path = Path(path) if path else None
+        self.lock = threading.Lock()
+        self.completed: Dict[str, List[List[int]]] = {}
+
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.completed = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Ignoring unreadable backfill checkpoint {self.path}: {e}")
+
+    @staticmethod
+    def _key(symbol: str, timeframe: str) -> str:
+        return f"{symbol}|{timeframe}"
+
+    def is_done(self, symbol: str, timeframe: str, start: int, end: int) -> bool:
+        """Return True if [start, end] lies inside one completed range."""
+        with self.lock:
+            return any(
+                done_start <= start and end <= done_end
+                for done_start, done_end in self.completed.get(self._key(symbol, timeframe), [])
+            )
+
+    def mark_done(self, symbol: str, timeframe: str, start: int, end: int, interval_ms: int):
+        """
+        Record a completed page.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+            start (int): Page since (ms)
+            end (int): Page end_time (ms, inclusive)
+            interval_ms (int): Candle spacing, used to join adjacent pages
+        """
+        with self.lock:
+            key = self._key(symbol, timeframe)
+            ranges = [tuple(r) for r in self.completed.get(key, [])] + [(start, end)]
+            self.completed[key] = [list(r) for r in merge_gap_ranges(ranges, interval_ms)]
+
+    def save(self):
+        """Atomically write the checkpoint file."""
+        if self.path is None:
+            return
+
+        with self.lock:
+            data = json.dumps(self.completed)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def clear(self, symbol: Optional[str] = None, timeframe: Optional[str] = None):
+        """Forget completed ranges for one series, or all series if no symbol is given."""
+        with self.lock:
+            if symbol is None:
+                self.completed.clear()
+            else:
+                self.completed.pop(self._key(symbol, timeframe), None)
+
+
+class HistoricalBackfillEngine:
+    """
+    Since-based historical OHLCV backfill.
+
+    Features:
+    - Pages through history with since/endTime cursors instead of "latest N" requests
+    - Merges adjacent gaps into minimal request ranges
+    - Fetches pages concurrently; all workers share the collector's rate limiter budget
+    - Single writer: pages are inserted by the calling thread as they complete
+    - Checkpointed progress for resumable multi-year bootstraps
+    """
+
+    def __init__(self,
+                 market_data_collector,
+                 database_manager,
+                 page_limit: int = 1000,
+                 max_workers: int = 4,
+                 max_bridge_candles: int = 10,
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_every: int = 20,
+                 stop_event: Optional[threading.Event] = None):
+        """
+        Initialize the backfill engine.
+
+        Args:
+            market_data_collector (MarketDataCollector): Source of klines (rate limited)
+            database_manager (CryptoDatabaseManager): Destination database
+            page_limit (int): Candles per request (Binance maximum is 1000)
+            max_workers (int): Concurrent page requests
+            max_bridge_candles (int): Stored candles to re-fetch when joining nearby gaps
+            checkpoint_path (Optional[str]): JSON file recording completed pages
+            checkpoint_every (int): Pages between checkpoint writes
+            stop_event (Optional[threading.Event]): Shared shutdown event (a private one if None)
+        """
+        self.market_data_collector = market_data_collector
+        self.database_manager = database_manager
+        self.page_limit = page_limit
+        self.max_workers = max(1, max_workers)
+        self.max_bridge_candles = max_bridge_candles
+        self.checkpoint = BackfillCheckpoint(checkpoint_path)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
+
+    def plan(self, symbol: str, timeframe: str,
+             gaps: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Build the pending page list for a set of gaps.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+            gaps (List[Tuple[int, int]]): (gap_start, gap_end) pairs in ms
+
+        Returns:
+            List[Tuple[int, int]]: (since, end_time) pages not yet checkpointed
+
+        Raises:
+            ValueError: For calendar timeframes ('1M'), whose candles cannot be paged
+                        by a fixed spacing
+        """
+        if timeframe in CALENDAR_TIMEFRAMES:
+            raise ValueError(f"Backfill does not support calendar timeframe {timeframe}")
+
+        interval_ms = timeframe_to_ms(timeframe)
+        pages = []
+        for start, end in merge_gap_ranges(gaps, interval_ms, self.max_bridge_candles):
+            for since, end_time in plan_pages(start, end, interval_ms, self.page_limit):
+                if not self.checkpoint.is_done(symbol, timeframe, since, end_time):
+                    pages.append((since, end_time))
+        return pages
+
+    def backfill(self, symbol: str, timeframe: str, start: int,
+                 end: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Backfill a whole time range for one series.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+            start (int): Range start (ms)
+            end (Optional[int]): Range end (ms, default: now)
+
+        Returns:
+            Dict[str, Any]: Backfill results (see run)
+        """
+        end = end if end is not None else int(time.time() * 1000)
+        return self.run({(symbol, timeframe): [(start, end)]})
+
+    def run(self, jobs: Dict[Tuple[str, str], List[Tuple[int, int]]]) -> Dict[str, Any]:
+        """
+        Fill gaps for many series at once.
+
+        Args:
+            jobs (Dict[Tuple[str, str], List[Tuple[int, int]]]): (symbol, timeframe) -> gaps in ms
+
+        Returns:
+            Dict[str, Any]: Results with pages planned/fetched/skipped, records inserted,
+                            per-series failure flags and errors
+        """
+        results = {
+            'pages_planned': 0,
+            'pages_fetched': 0,
+            'pages_empty': 0,
+            'records_inserted': 0,
+            'failed_series': [],
+            'errors': [],
+            'duration_seconds': 0.0
+        }
+        start_time = time.time()
+
+        work = []
+        failed = set()
+        for (symbol, timeframe), gaps in jobs.items():
+            try:
+                pages = self.plan(symbol, timeframe, gaps)
+            except ValueError as e:
+                failed.add((symbol, timeframe))
+                results['errors'].append(f"Backfill {symbol} {timeframe} skipped: {e}")
+                continue
+            for since, end_time in pages:
+                work.append((symbol, timeframe, since, end_time))
+        results['pages_planned'] = len(work)
+
+        if not work:
+            results['failed_series'] = sorted(failed)
+            return results
+
+        since_checkpoint = 0
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(work)),
+                                thread_name_prefix='backfill') as executor:
+            futures = {executor.submit(self._fetch_page, *page): page for page in work}
+            try:
+                for future in as_completed(futures):
+                    symbol, timeframe, since, end_time = futures[future]
+                    try:
+                        candles = future.result()
+                        if candles:
+                            results['records_inserted'] += self.database_manager.insert_ohlcv_data(
+                                symbol, timeframe, candles
+                            )
+                        else:
+                            results['pages_empty'] += 1
+
+                        results['pages_fetched'] += 1
+
+                        # Only closed history is final; the newest candles may still arrive
+                        interval_ms = timeframe_to_ms(timeframe)
+                        if end_time < time.time() * 1000 - interval_ms:
+                            self.checkpoint.mark_done(symbol, timeframe, since, end_time, interval_ms)
+                            since_checkpoint += 1
+                        if since_checkpoint >= self.checkpoint_every:
+                            self.checkpoint.save()
+                            since_checkpoint = 0
+
+                    except Exception as e:
+                        failed.add((symbol, timeframe))
+                        error_msg = f"Backfill page {symbol} {timeframe} since={since} failed: {e}"
+                        results['errors'].append(error_msg)
+                        logger.warning(error_msg)
+
+                    if self.stop_event.is_set():
+                        break
+            finally:
+                # Remaining pages stay unchecked in the checkpoint and run on the next call
+                for future in futures:
+                    future.cancel()
+                self.checkpoint.save()
+
+        results['failed_series'] = sorted(failed)
+        results['duration_seconds'] = round(time.time() - start_time, 3)
+        logger.info(f"Backfill: {results['pages_fetched']}/{results['pages_planned']} pages, "
+                   f"{results['records_inserted']} records in {results['duration_seconds']}s")
+        return results
+
+    def _fetch_page(self, symbol: str, timeframe: str, since: int, end_time: int) -> List[List[float]]:
+        """Fetch one page; candles outside [since, end_time] are dropped."""
+        if self.stop_event.is_set():
+            raise InterruptedError("Backfill stopped")
+
+        try:
+            candles = self.market_data_collector.get_klines(
+                symbol=symbol,
+                interval=timeframe,
+                limit=self.page_limit,
+                since=since,
+                end_time=end_time
+            )
+        except InsufficientDataError:
+            # Before the listing date or during an exchange outage - nothing to fill
+            return []
+
+        return [candle for candle in candles if since <= candle[0] <= end_time]
+
+    def stop(self):
+        """Stop after the pages currently in flight."""
+        self.stop_event.set()
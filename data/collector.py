@@ -18,6 +18,8 @@ import os
 
 from utils.market_data import MarketDataCollector
 from data.database import CryptoDatabaseManager
+from data.backfill import HistoricalBackfillEngine
+from data.ingest import BatchedIngestWriter
 from utils.exceptions import (
     ConfigurationError,
     DataValidationError,
@@ -156,8 +158,10 @@ class RealTimeDataCollector:
         if database_manager is not None:
             self.database_manager = database_manager
         else:
+            database_config = self.config.get('database', {})
             self.database_manager = CryptoDatabaseManager(
-                db_path=self.config.get('database', {}).get('path', 'data/crypto_data.db')
+                db_path=database_config.get('path', 'data/crypto_data.db'),
+                columnar_path=database_config.get('columnar_path')
             )
 
         # Collection settings (use provided values or config defaults)
@@ -188,6 +192,31 @@ class RealTimeDataCollector:
         self.stats = self.statistics  # Alias for backward compatibility
         self.shutdown_event = threading.Event()
 
+        # Since-based backfill (gap filling and historical bootstrap)
+        backfill_config = self.config.get('data_collection', {}).get('backfill', {})
+        self.gap_check_hours = self.config.get('data_collection', {}).get('max_data_age_hours', 24)
+        self.backfill_engine = HistoricalBackfillEngine(
+            self.market_data_collector,
+            self.database_manager,
+            page_limit=backfill_config.get('page_limit', 1000),
+            max_workers=backfill_config.get('max_workers', 4),
+            max_bridge_candles=backfill_config.get('max_bridge_candles', 10),
+            checkpoint_path=backfill_config.get('checkpoint_path', 'data/backfill_checkpoint.json'),
+            stop_event=self.shutdown_event
+        )
+
+        # Single-writer batched ingest (started with the collection loop)
+        ingest_config = self.config.get('data_collection', {}).get('ingest', {})
+        self.ingest_writer = None
+        if ingest_config.get('enabled', True):
+            self.ingest_writer = BatchedIngestWriter(
+                self.database_manager,
+                max_queue_size=ingest_config.get('max_queue_size', 10000),
+                max_batch_rows=ingest_config.get('max_batch_rows', 5000),
+                flush_interval=ingest_config.get('flush_interval_seconds', 1.0),
+                put_timeout=ingest_config.get('put_timeout_seconds', 30.0)
+            )
+
         # Memory management
         self.memory_check_interval = 300  # Check every 5 minutes
         self.max_memory_mb = self.config.get('data_collection', {}).get('max_memory_mb', 512)
@@ -275,15 +304,12 @@ class RealTimeDataCollector:
             last_timestamp = self.database_manager.get_latest_timestamp(symbol, timeframe)
 
             # Calculate how many candles to fetch
+            interval_ms = self._get_interval_seconds(timeframe) * 1000
+            now_ms = int(time.time() * 1000)
+
             if last_timestamp:
-                # Fetch from last timestamp + 1 interval
-                interval_seconds = self._get_interval_seconds(timeframe)
-                since_timestamp = last_timestamp + interval_seconds
-
-                # Calculate limit based on time gap
-                current_time = int(time.time())
-                time_gap = current_time - since_timestamp
-                estimated_candles = min(max(int(time_gap / interval_seconds), 1), 500)
+                # Candles after the last stored one, up to and including the open one
+                estimated_candles = min(max((now_ms - last_timestamp) // interval_ms + 1, 2), 500)
             else:
                 # First time collection - get recent data
                 estimated_candles = 100
@@ -301,8 +327,24 @@ class RealTimeDataCollector:
                     ohlcv_data = [candle for candle in ohlcv_data
                                  if candle[0] > last_timestamp]
 
+                # Store closed candles only; rows are never rewritten, so the open
+                # candle is stored on a later run once it has closed
+                ohlcv_data = [candle for candle in ohlcv_data
+                              if candle[0] + interval_ms <= now_ms]
+
                 # Insert into database
-                if ohlcv_data:
+                if ohlcv_data and self._ingest_enabled():
+                    future = self.ingest_writer.submit_ohlcv(symbol, timeframe, ohlcv_data)
+                    future.add_done_callback(
+                        lambda f: self._record_ingest(f, symbol, f"ohlcv_{timeframe}")
+                    )
+                    result['records_queued'] = len(ohlcv_data)
+                    result['success'] = True
+
+                    # Statistics are recorded by the callback once the batch is committed
+                    logger.debug(f"Queued {len(ohlcv_data)} new {timeframe} candles for {symbol}")
+                    return result
+                elif ohlcv_data:
                     records_inserted = self.database_manager.insert_ohlcv_data(
                         symbol, timeframe, ohlcv_data
                     )
@@ -368,7 +410,13 @@ class RealTimeDataCollector:
                         }
 
                         # Insert into database
-                        if self.database_manager.insert_realtime_price(symbol, price_record):
+                        if self._ingest_enabled():
+                            future = self.ingest_writer.submit_price(symbol, price_record)
+                            future.add_done_callback(
+                                lambda f, symbol=symbol: self._record_ingest(f, symbol, "price")
+                            )
+                            results['success_count'] += 1
+                        elif self.database_manager.insert_realtime_price(symbol, price_record):
                             results['success_count'] += 1
                             self.statistics.record_request(True, symbol, "price", 1)
                         else:
@@ -392,10 +440,28 @@ class RealTimeDataCollector:
 
         return results
 
+    def _ingest_enabled(self) -> bool:
+        """True if writes go through the batched ingest writer."""
+        return self.ingest_writer is not None and self.ingest_writer.is_running
+
+    def _record_ingest(self, future, symbol: str, data_type: str):
+        """Record statistics for a queued write once its batch is committed."""
+        error = future.exception()
+        if error is None:
+            result = future.result()
+            records = 1 if result is True else result
+            self.statistics.record_request(True, symbol, data_type, records)
+        else:
+            logger.error(f"Batched {data_type} write for {symbol} failed: {error}")
+            self.statistics.record_request(False, symbol, data_type, 0, type(error).__name__)
+
     def check_and_fill_gaps(self) -> Dict[str, Any]:
         """
         Check for data gaps and attempt to fill them.
 
+        Gaps of all symbols and timeframes are merged into minimal ranges and fetched
+        page by page from their start, so gaps older than the latest window are filled too.
+
         Returns:
             Dict[str, Any]: Gap filling results
         """
@@ -403,66 +469,84 @@ class RealTimeDataCollector:
             'gaps_found': 0,
             'gaps_filled': 0,
             'symbols_checked': 0,
+            'records_inserted': 0,
+            'pages_fetched': 0,
             'errors': []
         }
 
-        # Check gaps for the last 24 hours
-        end_time = int(time.time())
-        start_time = end_time - (24 * 60 * 60)  # 24 hours ago
+        # Check gaps over the configured window (stored candles use exchange ms timestamps)
+        end_time = int(time.time() * 1000)
+        start_time = end_time - int(self.gap_check_hours * 60 * 60 * 1000)
 
+        jobs = {}
         for symbol in self.symbols:
             for timeframe in self.timeframes:
                 try:
                     results['symbols_checked'] += 1
 
-                    # Check for gaps
                     gaps = self.database_manager.check_data_gaps(
                         symbol, timeframe, start_time, end_time
                     )
 
-                    results['gaps_found'] += len(gaps)
-
-                    # Fill gaps
-                    for gap_start, gap_end in gaps:
-                        try:
-                            # Calculate how many candles needed
-                            interval_seconds = self._get_interval_seconds(timeframe)
-                            candles_needed = min(int((gap_end - gap_start) / interval_seconds), 500)
-
-                            if candles_needed > 0:
-                                # Fetch historical data for gap
-                                gap_data = self.market_data_collector.get_klines(
-                                    symbol=symbol,
-                                    interval=timeframe,
-                                    limit=candles_needed
-                                )
-
-                                # Filter data to gap range
-                                filtered_data = [
-                                    candle for candle in gap_data
-                                    if gap_start <= candle[0] <= gap_end
-                                ]
-
-                                if filtered_data:
-                                    inserted = self.database_manager.insert_ohlcv_data(
-                                        symbol, timeframe, filtered_data
-                                    )
-                                    results['gaps_filled'] += 1
-                                    logger.info(f"Filled gap for {symbol} {timeframe}: "
-                                              f"{inserted} records")
-
-                        except Exception as e:
-                            error_msg = f"Failed to fill gap for {symbol} {timeframe}: {e}"
-                            results['errors'].append(error_msg)
-                            logger.warning(error_msg)
+                    if gaps:
+                        results['gaps_found'] += len(gaps)
+                        jobs[(symbol, timeframe)] = gaps
 
                 except Exception as e:
                     error_msg = f"Failed to check gaps for {symbol} {timeframe}: {e}"
                     results['errors'].append(error_msg)
                     logger.warning(error_msg)
 
+        if not jobs:
+            return results
+
+        backfill_results = self.backfill_engine.run(jobs)
+        results['records_inserted'] = backfill_results['records_inserted']
+        results['pages_fetched'] = backfill_results['pages_fetched']
+        results['errors'].extend(backfill_results['errors'])
+
+        failed_series = set(backfill_results['failed_series'])
+        results['gaps_filled'] = sum(
+            len(gaps) for series, gaps in jobs.items() if series not in failed_series
+        )
+
+        for symbol, timeframe in jobs:
+            self.statistics.record_request(
+                (symbol, timeframe) not in failed_series, symbol, f"backfill_{timeframe}"
+            )
+
+        if results['records_inserted']:
+            logger.info(f"Filled {results['gaps_filled']} gaps: {results['records_inserted']} records")
+
         return results
 
+    def backfill_history(self, start_time: int, end_time: Optional[int] = None,
+                         symbols: Optional[List[str]] = None,
+                         timeframes: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Bootstrap historical data for many symbols, resuming from the checkpoint.
+
+        Args:
+            start_time (int): Range start (ms)
+            end_time (Optional[int]): Range end (ms, default: now)
+            symbols (Optional[List[str]]): Symbols to backfill (default: configured symbols)
+            timeframes (Optional[List[str]]): Timeframes to backfill (default: configured timeframes)
+
+        Returns:
+            Dict[str, Any]: Backfill results
+        """
+        end_time = end_time if end_time is not None else int(time.time() * 1000)
+
+        jobs = {}
+        for symbol in symbols or self.symbols:
+            for timeframe in timeframes or self.timeframes:
+                # Only request what the database is missing
+                jobs[(symbol, timeframe)] = self.database_manager.check_data_gaps(
+                    symbol, timeframe, start_time, end_time
+                )
+
+        return self.backfill_engine.run(jobs)
+
     def collect_all_data(self) -> Dict[str, Any]:
         """
         Collect all data types using multi-threading.
@@ -478,6 +562,7 @@ class RealTimeDataCollector:
             'price_results': {},
             'gap_fill_results': {},
             'total_records': 0,
+            'total_queued': 0,
             'total_errors': 0,
             'collection_duration': 0
         }
@@ -502,6 +587,7 @@ class RealTimeDataCollector:
 
                         if result['success']:
                             results['total_records'] += result['records_inserted']
+                            results['total_queued'] += result.get('records_queued', 0)
                         else:
                             results['total_errors'] += 1
 
@@ -557,6 +643,9 @@ class RealTimeDataCollector:
         self.shutdown_event.clear()
         self.statistics.reset()
 
+        if self.ingest_writer is not None:
+            self.ingest_writer.start()
+
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -587,6 +676,10 @@ class RealTimeDataCollector:
         if self.collection_thread and self.collection_thread.is_alive():
             self.collection_thread.join(timeout=30)
 
+        # Write everything still queued before reporting the collector stopped
+        if self.ingest_writer is not None:
+            self.ingest_writer.stop()
+
         logger.info("Real-time data collection stopped")
 
     def get_collection_status(self) -> Dict[str, Any]:
@@ -605,7 +698,8 @@ class RealTimeDataCollector:
             'max_workers': self.max_workers,
             'memory_usage_mb': self._get_memory_usage(),
             'database_stats': self.database_manager.get_statistics(),
-            'collection_statistics': self.statistics.get_stats()
+            'collection_statistics': self.statistics.get_stats(),
+            'ingest': self.ingest_writer.get_metrics() if self.ingest_writer is not None else None
         }
 
         return status
@@ -630,6 +724,7 @@ class RealTimeDataCollector:
 
                 # Log collection summary
                 logger.info(f"Collection cycle completed: {results['total_records']} records, "
+                           f"{results['total_queued']} queued, "
                            f"{results['total_errors']} errors, "
                            f"{results['collection_duration']:.2f}s")
 
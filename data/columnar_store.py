@@ -0,0 +1,280 @@
+"""
+Columnar OHLCV storage tier for cryptocurrency trading bot.
+Keeps one fixed-width binary file per (symbol, timeframe) next to the SQLite database
+and serves zero-copy, memory-mapped NumPy views for indicator and backtest paths.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import logging
+
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+# One record per candle, sorted by timestamp with no duplicates
+OHLCV_DTYPE = np.dtype([
+    ('timestamp', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+
+class ColumnarOHLCVStore:
+    """
+    Append-friendly columnar mirror of the ohlcv_data table.
+
+    Each series lives in ``<root>/<BASE_QUOTE>/<timeframe>.ohlcv`` as a flat array of
+    OHLCV_DTYPE records. Candles newer than the last stored timestamp are appended in
+    place; anything else triggers an atomic merge-and-rewrite of the series file.
+    Readers get slices of a cached np.memmap, so no data is copied on read.
+    """
+
+    FILE_SUFFIX = '.ohlcv'
+
+    def __init__(self, root_path: Union[str, Path] = 'data/columnar'):
+        """
+        Initialize the columnar store.
+
+        Args:
+            root_path (Union[str, Path]): Directory holding the per-series files
+        """
+        self.root_path = Path(root_path)
+        self.root_path.mkdir(parents=True, exist_ok=True)
+
+        # Re-entrant so a caller holding series_lock() can still call the write methods
+        self._locks: Dict[Tuple[str, str], threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+
+        # (symbol, timeframe) -> ((st_ino, record_count), memmap)
+        self._maps: Dict[Tuple[str, str], Tuple[Tuple[int, int], np.memmap]] = {}
+
+    def _series_path(self, symbol: str, timeframe: str) -> Path:
+        return self.root_path / symbol.replace('/', '_') / f"{timeframe}{self.FILE_SUFFIX}"
+
+    def series_lock(self, symbol: str, timeframe: str) -> threading.RLock:
+        """
+        Get the lock that serializes writes to one series.
+
+        Hold it across reading a source snapshot and replace_series() so a concurrent
+        write_candles() cannot land in between and be overwritten by the older snapshot.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+
+        Returns:
+            threading.RLock: Re-entrant per-series lock
+        """
+        key = (symbol, timeframe)
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.RLock()
+            return lock
+
+    def has_series(self, symbol: str, timeframe: str) -> bool:
+        """Return True if a columnar file exists for the series."""
+        return self._series_path(symbol, timeframe).exists()
+
+    @staticmethod
+    def to_records(ohlcv_list: List[List[Union[int, float]]]) -> np.ndarray:
+        """
+        Convert validated [timestamp, open, high, low, close, volume] rows into records.
+
+        Args:
+            ohlcv_list (List[List[Union[int, float]]]): OHLCV rows
+
+        Returns:
+            np.ndarray: Record array sorted by timestamp, first occurrence kept on duplicates
+        """
+        raw = np.asarray(ohlcv_list, dtype=np.float64).reshape(-1, 6)
+        records = np.empty(len(raw), dtype=OHLCV_DTYPE)
+        records['timestamp'] = raw[:, 0].astype(np.int64)
+        for column, name in enumerate(OHLCV_DTYPE.names[1:], start=1):
+            records[name] = raw[:, column]
+
+        # Stable sort keeps the first occurrence of a duplicated timestamp first
+        order = np.argsort(records['timestamp'], kind='stable')
+        records = records[order]
+        if len(records) > 1:
+            keep = np.ones(len(records), dtype=bool)
+            keep[1:] = records['timestamp'][1:] != records['timestamp'][:-1]
+            records = records[keep]
+        return records
+
+    def write_candles(self, symbol: str, timeframe: str,
+                      ohlcv_list: List[List[Union[int, float]]]) -> int:
+        """
+        Merge candles into the series file with INSERT OR IGNORE semantics.
+
+        Args:
+            symbol (str): Trading symbol (validated, e.g. 'BTC/USDT')
+            timeframe (str): Time interval
+            ohlcv_list (List[List[Union[int, float]]]): Validated OHLCV rows
+
+        Returns:
+            int: Number of new candles written
+        """
+        if not len(ohlcv_list):
+            return 0
+
+        new_records = self.to_records(ohlcv_list)
+        path = self._series_path(symbol, timeframe)
+
+        with self.series_lock(symbol, timeframe):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            existing = self._open_map(symbol, timeframe, path)
+
+            if existing is None or len(existing) == 0:
+                self._rewrite(path, new_records)
+                return len(new_records)
+
+            last_timestamp = int(existing['timestamp'][-1])
+
+            # Fast path: strictly newer candles are appended in place
+            if new_records['timestamp'][0] > last_timestamp:
+                with open(path, 'r+b') as f:
+                    f.truncate(len(existing) * OHLCV_DTYPE.itemsize)
+                    f.seek(0, os.SEEK_END)
+                    f.write(new_records.tobytes())
+                return len(new_records)
+
+            # Slow path: drop candles already stored, then merge and rewrite atomically
+            positions = np.searchsorted(existing['timestamp'], new_records['timestamp'])
+            in_range = positions < len(existing)
+            duplicate = np.zeros(len(new_records), dtype=bool)
+            duplicate[in_range] = existing['timestamp'][positions[in_range]] == new_records['timestamp'][in_range]
+            fresh = new_records[~duplicate]
+
+            if len(fresh) == 0:
+                return 0
+
+            merged = np.concatenate([np.asarray(existing), fresh])
+            merged = merged[np.argsort(merged['timestamp'], kind='stable')]
+            self._rewrite(path, merged)
+            return len(fresh)
+
+    def replace_series(self, symbol: str, timeframe: str, records: np.ndarray):
+        """
+        Replace a whole series file (used when rebuilding from SQLite).
+
+        Callers must take series_lock() before reading the records they pass in;
+        otherwise candles written after that read are lost.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+            records (np.ndarray): Sorted, de-duplicated OHLCV_DTYPE records
+        """
+        path = self._series_path(symbol, timeframe)
+        with self.series_lock(symbol, timeframe):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._rewrite(path, records.astype(OHLCV_DTYPE, copy=False))
+
+    def delete_before(self, symbol: str, timeframe: str, cutoff_timestamp: int) -> int:
+        """
+        Drop candles older than cutoff_timestamp from a series.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+            cutoff_timestamp (int): Candles with timestamp < cutoff are removed
+
+        Returns:
+            int: Number of candles removed
+        """
+        path = self._series_path(symbol, timeframe)
+        with self.series_lock(symbol, timeframe):
+            existing = self._open_map(symbol, timeframe, path)
+            if existing is None or len(existing) == 0:
+                return 0
+
+            start = int(np.searchsorted(existing['timestamp'], cutoff_timestamp, side='left'))
+            if start == 0:
+                return 0
+
+            self._rewrite(path, np.array(existing[start:]))
+            return start
+
+    def get_ohlcv_array(self, symbol: str, timeframe: str,
+                        start: Optional[int] = None, end: Optional[int] = None) -> np.ndarray:
+        """
+        Get a zero-copy memory-mapped view of a series.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+            start (Optional[int]): Inclusive start timestamp
+            end (Optional[int]): Inclusive end timestamp
+
+        Returns:
+            np.ndarray: Read-only OHLCV_DTYPE view; columns are accessed as arr['close'] etc.
+                        Empty array if the series has no data in range.
+        """
+        path = self._series_path(symbol, timeframe)
+        data = self._open_map(symbol, timeframe, path)
+        if data is None or len(data) == 0:
+            return np.empty(0, dtype=OHLCV_DTYPE)
+
+        timestamps = data['timestamp']
+        lo = 0 if start is None else int(np.searchsorted(timestamps, start, side='left'))
+        hi = len(data) if end is None else int(np.searchsorted(timestamps, end, side='right'))
+        return data[lo:hi]
+
+    def list_series(self) -> List[Tuple[str, str]]:
+        """
+        List all stored series.
+
+        Returns:
+            List[Tuple[str, str]]: (symbol, timeframe) pairs
+        """
+        series = []
+        for series_file in self.root_path.glob(f"*/*{self.FILE_SUFFIX}"):
+            symbol = series_file.parent.name.replace('_', '/', 1)
+            series.append((symbol, series_file.name[:-len(self.FILE_SUFFIX)]))
+        return sorted(series)
+
+    def _open_map(self, symbol: str, timeframe: str, path: Path) -> Optional[np.memmap]:
+        """Return a cached memmap for the series, reopening it if the file changed."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._maps.pop((symbol, timeframe), None)
+            return None
+
+        # Ignore a trailing partial record from an interrupted append
+        record_count = stat.st_size // OHLCV_DTYPE.itemsize
+        signature = (stat.st_ino, record_count)
+
+        cached = self._maps.get((symbol, timeframe))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        if record_count == 0:
+            data = np.empty(0, dtype=OHLCV_DTYPE)
+        else:
+            data = np.memmap(path, dtype=OHLCV_DTYPE, mode='r', shape=(record_count,))
+
+        self._maps[(symbol, timeframe)] = (signature, data)
+        return data
+
+    def _rewrite(self, path: Path, records: np.ndarray):
+        """Atomically replace a series file; open memmaps keep the old inode alive."""
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(np.ascontiguousarray(records, dtype=OHLCV_DTYPE).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def close(self):
+        """Drop cached memory maps."""
+        self._maps.clear()
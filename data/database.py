@@ -4,7 +4,6 @@ Provides comprehensive data storage and retrieval for OHLCV data, real-time pric
 """
 
 import sqlite3
-import threading
 import time
 import os
 import shutil
@@ -23,51 +22,54 @@ from utils.exceptions import (
     InsufficientDataError,
     ConfigurationError
 )
-from utils.validation_helpers import validate_symbol, validate_ohlcv_candle
+from utils.validation_helpers import validate_symbol, validate_ohlcv_array
+from utils.sqlite_pool import SQLiteConnectionPool
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Timestamps at or above this value are milliseconds (1e11 s is the year 5138)
+MILLISECOND_TIMESTAMP_THRESHOLD = 10 ** 11
 
-class ConnectionPool:
+# Candle spacing per timeframe in seconds
+TIMEFRAME_SECONDS = {
+    '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '2h': 7200, '4h': 14400, '6h': 21600, '8h': 28800, '12h': 43200,
+    '1d': 86400, '3d': 259200, '1w': 604800, '1M': 2592000
+}
+
+
+def candle_step(timeframe: str, reference_timestamp: int) -> Optional[int]:
     """
-    Simple connection pool for SQLite database connections.
+    Get the candle spacing of a timeframe in the unit of a reference timestamp.
+
+    Args:
+        timeframe (str): Time interval ('1m', '5m', '1h', etc.)
+        reference_timestamp (int): Any timestamp of the series (seconds or milliseconds)
+
+    Returns:
+        Optional[int]: Spacing in seconds or milliseconds, None for unknown timeframes
+    """
+    interval_seconds = TIMEFRAME_SECONDS.get(timeframe)
+    if not interval_seconds:
+        return None
+    # ccxt candles are stored in ms
+    if reference_timestamp >= MILLISECOND_TIMESTAMP_THRESHOLD:
+        return interval_seconds * 1000
+    return interval_seconds
+
+
+class ConnectionPool(SQLiteConnectionPool):
+    """
+    Connection pool for the crypto database: one writer plus read-only readers.
+
+    Connections use the tuned project PRAGMAs (WAL, synchronous=NORMAL, mmap, cache).
     """
 
     def __init__(self, database_path: str, max_connections: int = 5):
-        self.database_path = database_path
+        # One connection is the writer, the rest serve concurrent reads
+        super().__init__(database_path, max_readers=max(1, max_connections - 1))
         self.max_connections = max_connections
-        self.connections = []
-        self.lock = threading.Lock()
-
-    def get_connection(self) -> sqlite3.Connection:
-        """Get a connection from the pool or create a new one."""
-        with self.lock:
-            if self.connections:
-                return self.connections.pop()
-            else:
-                conn = sqlite3.connect(
-                    self.database_path,
-                    timeout=30.0,
-                    check_same_thread=False
-                )
-                conn.row_factory = sqlite3.Row  # Enable column access by name
-                return conn
-
-    def return_connection(self, conn: sqlite3.Connection):
-        """Return a connection to the pool."""
-        with self.lock:
-            if len(self.connections) < self.max_connections:
-                self.connections.append(conn)
-            else:
-                conn.close()
-
-    def close_all(self):
-        """Close all connections in the pool."""
-        with self.lock:
-            for conn in self.connections:
-                conn.close()
-            self.connections.clear()
 
 
 class CryptoDatabaseManager:
@@ -78,13 +80,15 @@ class CryptoDatabaseManager:
     - OHLCV candlestick data storage with automatic deduplication
     - Real-time price tracking
     - Trading history and statistics
-    - Connection pooling for performance
+    - Connection pooling for performance (WAL, single writer + concurrent readers)
     - Transaction management with rollback support
     - Data integrity validation
     - Automatic cleanup and backup functionality
+    - Optional columnar tier with memory-mapped OHLCV reads
     """
 
-    def __init__(self, db_path: str = 'data/crypto_data.db', max_connections: int = 5, strict_validation: bool = False):
+    def __init__(self, db_path: str = 'data/crypto_data.db', max_connections: int = 5, strict_validation: bool = False,
+                 columnar_path: Optional[str] = None):
         """
         Initialize the database manager.
 
@@ -92,6 +96,7 @@ class CryptoDatabaseManager:
             db_path (str): Path to SQLite database file
             max_connections (int): Maximum connections in pool
             strict_validation (bool): Enable strict data validation (default: False for testing compatibility)
+            columnar_path (Optional[str]): Directory for the columnar OHLCV tier (disabled if None)
 
         Raises:
             ConfigurationError: If database setup fails
@@ -100,6 +105,12 @@ class CryptoDatabaseManager:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.strict_validation = strict_validation
 
+        # Optional columnar mirror of ohlcv_data (SQLite stays the source of truth)
+        self.columnar_store = None
+        if columnar_path is not None:
+            from .columnar_store import ColumnarOHLCVStore
+            self.columnar_store = ColumnarOHLCVStore(columnar_path)
+
         try:
             # Initialize connection pool
             self.connection_pool = ConnectionPool(str(self.db_path), max_connections)
@@ -122,16 +133,35 @@ class CryptoDatabaseManager:
     @contextmanager
     def get_connection(self):
         """
-        Context manager for database connections.
+        Context manager for the writer connection.
+
+        Writers are serialised by the pool; uncommitted changes are rolled back on exit.
 
         Yields:
             sqlite3.Connection: Database connection with automatic cleanup
         """
-        conn = self.connection_pool.get_connection()
-        try:
+        with self.connection_pool.writer() as conn:
             yield conn
-        finally:
-            self.connection_pool.return_connection(conn)
+
+    @contextmanager
+    def read_connection(self):
+        """
+        Context manager for a read-only connection that runs concurrently with writes.
+
+        Yields:
+            sqlite3.Connection: Read-only database connection
+        """
+        with self.connection_pool.reader() as conn:
+            yield conn
+
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """
+        Get connection pool wait-time and utilisation metrics.
+
+        Returns:
+            Dict[str, Any]: Metrics per connection kind ('writer', 'reader')
+        """
+        return self.connection_pool.get_metrics()
 
     def initialize_database(self):
         """
@@ -178,10 +208,15 @@ class CryptoDatabaseManager:
         - arbitrage_opportunities: Detected arbitrage opportunities
         - system_logs: System activity and error logs
         - system_stats: Database statistics and metadata
+        - ohlcv_coverage: Runs of consecutive candles per series (gap detection)
+        - realtime_price_bars: Per-minute OHLC compacted from expired real-time prices
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='ohlcv_coverage'")
+            coverage_exists = cursor.fetchone() is not None
+
             # OHLCV candlestick data table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS ohlcv_data (
@@ -273,9 +308,40 @@ class CryptoDatabaseManager:
                 )
             """)
 
+            # Runs of consecutive candles per series, maintained on insert so gap
+            # checks read run boundaries instead of every stored timestamp
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ohlcv_coverage (
+                    symbol TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    start_timestamp INTEGER NOT NULL,
+                    end_timestamp INTEGER NOT NULL,
+                    PRIMARY KEY (symbol, timeframe, start_timestamp)
+                )
+            """)
+
+            # Per-minute bars that replace real-time prices once they expire
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS realtime_price_bars (
+                    symbol TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
+                    open_price REAL NOT NULL,
+                    high_price REAL NOT NULL,
+                    low_price REAL NOT NULL,
+                    close_price REAL NOT NULL,
+                    volume_24h REAL,
+                    samples INTEGER NOT NULL,
+                    PRIMARY KEY (symbol, timestamp)
+                )
+            """)
+
             conn.commit()
             logger.info("Database tables created successfully")
 
+        # Databases created before the coverage table get it built once from ohlcv_data
+        if not coverage_exists:
+            self.rebuild_coverage()
+
     def setup_indexes(self):
         """
         Create performance indexes for all database tables.
@@ -301,6 +367,7 @@ class CryptoDatabaseManager:
                 "CREATE INDEX IF NOT EXISTS idx_realtime_symbol ON realtime_prices (symbol)",
                 "CREATE INDEX IF NOT EXISTS idx_realtime_timestamp ON realtime_prices (timestamp)",
                 "CREATE INDEX IF NOT EXISTS idx_realtime_symbol_timestamp ON realtime_prices (symbol, timestamp)",
+                "CREATE INDEX IF NOT EXISTS idx_price_bars_timestamp ON realtime_price_bars (timestamp)",
 
                 # Trading history indexes
                 "CREATE INDEX IF NOT EXISTS idx_trading_symbol ON trading_history (symbol)",
@@ -351,7 +418,9 @@ class CryptoDatabaseManager:
             'trading_history',
             'arbitrage_opportunities',
             'system_logs',
-            'system_stats'
+            'system_stats',
+            'ohlcv_coverage',
+            'realtime_price_bars'
         ]
 
         required_columns = {
@@ -364,7 +433,7 @@ class CryptoDatabaseManager:
         }
 
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 # Check if all required tables exist
@@ -459,87 +528,241 @@ class CryptoDatabaseManager:
         Raises:
             DataValidationError: If input data is invalid
         """
+        symbol = validate_symbol(symbol)
+        rows = self.prepare_ohlcv_rows(symbol, timeframe, ohlcv_list)
+
+        inserted = self.write_batch({(symbol, timeframe): rows})
+        return inserted[(symbol, timeframe)]
+
+    def prepare_ohlcv_rows(self, symbol: str, timeframe: str,
+                           ohlcv_list: List[List[Union[int, float]]]) -> List[Tuple]:
+        """
+        Validate OHLCV candles and convert them to ohlcv_data rows.
+
+        Runs without touching the database, so collector threads can validate in
+        parallel and leave only the write to the single writer.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'BTC/USDT')
+            timeframe (str): Time interval ('1m', '5m', '1h', etc.)
+            ohlcv_list (List[List[Union[int, float]]]): List of OHLCV arrays or an (n, 6) array
+
+        Returns:
+            List[Tuple]: (symbol, timeframe, timestamp, open, high, low, close, volume) rows
+
+        Raises:
+            DataValidationError: If the list is empty or every candle is invalid
+        """
         # Validate inputs
         symbol = validate_symbol(symbol)
 
-        if not ohlcv_list:
+        if ohlcv_list is None or len(ohlcv_list) == 0:
             raise DataValidationError(
                 field="ohlcv_list",
                 value="empty list",
                 expected_type="non-empty list of OHLCV data"
             )
 
-        # Validate OHLCV data structure with flexible validation
-        validated_data = []
-        for i, candle in enumerate(ohlcv_list):
-            try:
-                # Use validation mode based on instance setting
-                # This allows test data to pass while still catching major issues
-                validated_candle = validate_ohlcv_candle(candle, i, strict=self.strict_validation)
-                validated_data.append(validated_candle)
-            except DataValidationError as e:
-                logger.warning(f"Skipping invalid candle {i} for {symbol}: {e}")
-                continue
-
-        if not validated_data:
-            # If no data was validated, provide more helpful error message
-            total_candles = len(ohlcv_list)
-            if total_candles == 0:
-                raise DataValidationError(
-                    field="ohlcv_list",
-                    value="empty list",
-                    expected_type="non-empty list of OHLCV data"
-                )
-            else:
-                # All candles were invalid
+        # Validate the whole batch at once (strictness follows the instance setting,
+        # which lets test data pass while still catching major issues)
+        values, accepted, rejections = validate_ohlcv_array(ohlcv_list, strict=self.strict_validation)
+
+        if rejections:
+            logger.warning(f"Skipping {len(ohlcv_list) - int(accepted.sum())}/{len(ohlcv_list)} invalid "
+                          f"candles for {symbol} {timeframe}: {rejections}")
+
+        if not accepted.any():
+            # All candles were invalid
+            raise DataValidationError(
+                field="ohlcv_list",
+                value=f"all {len(ohlcv_list)} candles failed validation",
+                expected_type="at least one valid OHLCV candle"
+            )
+
+        rows = [
+            (symbol, timeframe, int(timestamp), open_price, high, low, close, volume)
+            for timestamp, open_price, high, low, close, volume in values[accepted].tolist()
+        ]
+
+        return rows
+
+    def prepare_price_row(self, symbol: str, price_data: Dict[str, Any]) -> Tuple:
+        """
+        Validate real-time price data and convert it to a realtime_prices row.
+
+        Args:
+            symbol (str): Trading symbol
+            price_data (Dict[str, Any]): Price data dictionary
+
+        Returns:
+            Tuple: (symbol, price, volume_24h, price_change_24h, price_change_percent_24h,
+                   market_cap, timestamp) row
+
+        Raises:
+            DataValidationError: If price data is invalid
+        """
+        symbol = validate_symbol(symbol)
+
+        # Validate required price data
+        required_fields = ['price', 'timestamp']
+        for field in required_fields:
+            if field not in price_data:
                 raise DataValidationError(
-                    field="ohlcv_list",
-                    value=f"all {total_candles} candles failed validation",
-                    expected_type="at least one valid OHLCV candle"
+                    field=f"price_data.{field}",
+                    value="missing",
+                    expected_type="required field"
                 )
 
-        inserted_count = 0
-
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+            return (
+                symbol,
+                float(price_data['price']),
+                price_data.get('volume_24h'),
+                price_data.get('price_change_24h'),
+                price_data.get('price_change_percent_24h'),
+                price_data.get('market_cap'),
+                int(price_data['timestamp'])
+            )
+        except (TypeError, ValueError) as e:
+            raise DataValidationError(
+                field="price_data",
+                value=str(e),
+                expected_type="numeric price and timestamp"
+            )
 
-                # Prepare batch insert with conflict resolution
-                insert_sql = """
-                    INSERT OR IGNORE INTO ohlcv_data
-                    (symbol, timeframe, timestamp, open_price, high_price, low_price, close_price, volume)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """
+    def write_batch(self, ohlcv_rows: Optional[Dict[Tuple[str, str], List[Tuple]]] = None,
+                    price_rows: Optional[List[Tuple]] = None) -> Dict[Tuple[str, str], int]:
+        """
+        Write prepared OHLCV and real-time price rows in one transaction.
 
-                # Prepare data for batch insert
-                batch_data = []
-                for candle in validated_data:
-                    timestamp, open_price, high, low, close, volume = candle
-                    batch_data.append((
-                        symbol, timeframe, int(timestamp),
-                        float(open_price), float(high), float(low), float(close), float(volume)
-                    ))
+        Coverage runs and the per-series last_update statistic are updated once per
+        series, however many candle batches were merged into it.
 
-                # Execute batch insert
-                cursor.executemany(insert_sql, batch_data)
-                inserted_count = cursor.rowcount
+        Args:
+            ohlcv_rows (Optional[Dict[Tuple[str, str], List[Tuple]]]): (symbol, timeframe) ->
+                rows from prepare_ohlcv_rows
+            price_rows (Optional[List[Tuple]]): Rows from prepare_price_row
 
-                # Update statistics
-                self._update_stat(cursor, f"{symbol}_{timeframe}_last_update", str(int(time.time())))
+        Returns:
+            Dict[Tuple[str, str], int]: Records inserted per series (duplicates are ignored)
 
-                conn.commit()
+        Raises:
+            DataValidationError: If the transaction fails (nothing is written)
+        """
+        ohlcv_rows = ohlcv_rows or {}
+        inserted: Dict[Tuple[str, str], int] = {}
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
 
-                logger.info(f"Inserted {inserted_count}/{len(validated_data)} OHLCV records for {symbol} {timeframe}")
+                for (symbol, timeframe), rows in ohlcv_rows.items():
+                    # Batch insert with conflict resolution
+                    cursor.executemany("""
+                        INSERT OR IGNORE INTO ohlcv_data
+                        (symbol, timeframe, timestamp, open_price, high_price, low_price, close_price, volume)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, rows)
+                    inserted[(symbol, timeframe)] = max(cursor.rowcount, 0)
+
+                    # Extend coverage runs in the same transaction
+                    self._extend_coverage(cursor, symbol, timeframe, [row[2] for row in rows])
+
+                    # Update statistics
+                    self._update_stat(cursor, f"{symbol}_{timeframe}_last_update", str(int(time.time())))
+
+                if price_rows:
+                    cursor.executemany("""
+                        INSERT OR REPLACE INTO realtime_prices
+                        (symbol, price, volume_24h, price_change_24h, price_change_percent_24h,
+                         market_cap, timestamp)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, price_rows)
+
+                conn.commit()
 
         except Exception as e:
-            logger.error(f"Failed to insert OHLCV data for {symbol}: {e}")
+            logger.error(f"Failed to write batch of {len(ohlcv_rows)} OHLCV series "
+                        f"and {len(price_rows or [])} prices: {e}")
             raise DataValidationError(
                 field="database_insert",
                 value=str(e),
                 expected_type="successful database operation"
             )
 
-        return inserted_count
+        for (symbol, timeframe), rows in ohlcv_rows.items():
+            logger.info(f"Inserted {inserted[(symbol, timeframe)]}/{len(rows)} OHLCV records "
+                       f"for {symbol} {timeframe}")
+            if self.columnar_store is not None:
+                self._sync_columnar_series(symbol, timeframe, [list(row[2:]) for row in rows])
+
+        return inserted
+
+    def _sync_columnar_series(self, symbol: str, timeframe: str, validated_data: List[List[float]]):
+        """
+        Mirror freshly inserted candles into the columnar tier.
+
+        A series that has no columnar file yet is rebuilt from SQLite so it never holds
+        only the tail of the history. On failure the series file is dropped and rebuilt
+        on the next read.
+
+        Args:
+            symbol (str): Validated trading symbol
+            timeframe (str): Time interval
+            validated_data (List[List[float]]): Candles that passed validation
+        """
+        try:
+            if self.columnar_store.has_series(symbol, timeframe):
+                self.columnar_store.write_candles(symbol, timeframe, validated_data)
+            else:
+                self.rebuild_columnar_series(symbol, timeframe)
+        except Exception as e:
+            logger.warning(f"Columnar sync failed for {symbol} {timeframe}, will rebuild on read: {e}")
+            try:
+                self.columnar_store._series_path(symbol, timeframe).unlink()
+            except OSError:
+                pass
+
+    def rebuild_columnar_series(self, symbol: str, timeframe: str) -> int:
+        """
+        Rebuild one columnar series file from the ohlcv_data table.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+
+        Returns:
+            int: Number of candles written to the columnar file
+
+        Raises:
+            ConfigurationError: If the columnar tier is not enabled
+        """
+        if self.columnar_store is None:
+            raise ConfigurationError(
+                config_key="columnar_path",
+                message="Columnar OHLCV tier is not enabled"
+            )
+
+        symbol = validate_symbol(symbol)
+
+        # Hold the series lock from the snapshot to the replace: a write_batch that
+        # commits in between waits to append its candles after the rebuilt file lands
+        with self.columnar_store.series_lock(symbol, timeframe):
+            with self.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT timestamp, open_price, high_price, low_price, close_price, volume
+                    FROM ohlcv_data
+                    WHERE symbol = ? AND timeframe = ?
+                    ORDER BY timestamp
+                """, (symbol, timeframe))
+                rows = cursor.fetchall()
+
+            records = self.columnar_store.to_records([tuple(row) for row in rows])
+            self.columnar_store.replace_series(symbol, timeframe, records)
+
+        logger.info(f"Rebuilt columnar series {symbol} {timeframe}: {len(records)} candles")
+        return len(records)
 
     def store_ohlcv_data(self, symbol: str, timeframe: str, data: List[List[Union[int, float]]]) -> int:
         """
@@ -575,51 +798,10 @@ class CryptoDatabaseManager:
         Raises:
             DataValidationError: If price data is invalid
         """
-        symbol = validate_symbol(symbol)
-
-        # Validate required price data
-        required_fields = ['price', 'timestamp']
-        for field in required_fields:
-            if field not in price_data:
-                raise DataValidationError(
-                    field=f"price_data.{field}",
-                    value="missing",
-                    expected_type="required field"
-                )
+        self.write_batch(price_rows=[self.prepare_price_row(symbol, price_data)])
 
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                insert_sql = """
-                    INSERT OR REPLACE INTO realtime_prices
-                    (symbol, price, volume_24h, price_change_24h, price_change_percent_24h,
-                     market_cap, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """
-
-                cursor.execute(insert_sql, (
-                    symbol,
-                    float(price_data['price']),
-                    price_data.get('volume_24h'),
-                    price_data.get('price_change_24h'),
-                    price_data.get('price_change_percent_24h'),
-                    price_data.get('market_cap'),
-                    int(price_data['timestamp'])
-                ))
-
-                conn.commit()
-
-                logger.debug(f"Inserted real-time price for {symbol}: ${price_data['price']:,.2f}")
-                return True
-
-        except Exception as e:
-            logger.error(f"Failed to insert real-time price for {symbol}: {e}")
-            raise DataValidationError(
-                field="realtime_price_insert",
-                value=str(e),
-                expected_type="successful database operation"
-            )
+        logger.debug(f"Inserted real-time price for {symbol}: ${float(price_data['price']):,.2f}")
+        return True
 
     def store_arbitrage_opportunity(self, opportunity_data: Dict[str, Any]) -> bool:
         """
@@ -735,6 +917,158 @@ class CryptoDatabaseManager:
             logger.error(f"Failed to store system log: {e}")
             return False
 
+    def _extend_coverage(self, cursor: sqlite3.Cursor, symbol: str, timeframe: str,
+                         timestamps: List[int]):
+        """
+        Merge the runs of freshly stored candles into ohlcv_coverage.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor inside the insert transaction
+            symbol (str): Validated trading symbol
+            timeframe (str): Time interval
+            timestamps (List[int]): Timestamps of the inserted (or already present) candles
+        """
+        if not timestamps:
+            return
+
+        timestamps = sorted(set(timestamps))
+        step = candle_step(timeframe, timestamps[0])
+        if step is None:
+            return
+
+        # Split the batch into runs of consecutive candles
+        runs = []
+        run_start = previous = timestamps[0]
+        for timestamp in timestamps[1:]:
+            if timestamp - previous > step:
+                runs.append((run_start, previous))
+                run_start = timestamp
+            previous = timestamp
+        runs.append((run_start, previous))
+
+        for run_start, run_end in runs:
+            # Stored runs that overlap or touch this one are merged into it
+            cursor.execute("""
+                SELECT start_timestamp, end_timestamp
+                FROM ohlcv_coverage
+                WHERE symbol = ? AND timeframe = ?
+                  AND start_timestamp <= ? AND end_timestamp >= ?
+            """, (symbol, timeframe, run_end + step, run_start - step))
+            touching = cursor.fetchall()
+
+            if touching:
+                run_start = min(run_start, min(row[0] for row in touching))
+                run_end = max(run_end, max(row[1] for row in touching))
+                cursor.executemany("""
+                    DELETE FROM ohlcv_coverage
+                    WHERE symbol = ? AND timeframe = ? AND start_timestamp = ?
+                """, [(symbol, timeframe, row[0]) for row in touching])
+
+            cursor.execute("""
+                INSERT INTO ohlcv_coverage (symbol, timeframe, start_timestamp, end_timestamp)
+                VALUES (?, ?, ?, ?)
+            """, (symbol, timeframe, run_start, run_end))
+
+    def rebuild_coverage(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> int:
+        """
+        Rebuild ohlcv_coverage from ohlcv_data ("gaps and islands" with LAG()).
+
+        Args:
+            symbol (Optional[str]): Only rebuild this symbol (all series if None)
+            timeframe (Optional[str]): Only rebuild this timeframe of the symbol
+
+        Returns:
+            int: Number of coverage runs written
+        """
+        runs_written = 0
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            if symbol is not None:
+                symbol = validate_symbol(symbol)
+                cursor.execute("""
+                    SELECT symbol, timeframe, MIN(timestamp) AS first_timestamp
+                    FROM ohlcv_data
+                    WHERE symbol = ? AND (? IS NULL OR timeframe = ?)
+                    GROUP BY symbol, timeframe
+                """, (symbol, timeframe, timeframe))
+            else:
+                cursor.execute("""
+                    SELECT symbol, timeframe, MIN(timestamp) AS first_timestamp
+                    FROM ohlcv_data
+                    GROUP BY symbol, timeframe
+                """)
+            series = cursor.fetchall()
+
+            for row in series:
+                series_symbol, series_timeframe = row['symbol'], row['timeframe']
+                cursor.execute(
+                    "DELETE FROM ohlcv_coverage WHERE symbol = ? AND timeframe = ?",
+                    (series_symbol, series_timeframe)
+                )
+
+                step = candle_step(series_timeframe, row['first_timestamp'])
+                if step is None:
+                    continue
+
+                # A new run starts wherever the distance to the previous candle exceeds one step
+                cursor.execute("""
+                    INSERT INTO ohlcv_coverage (symbol, timeframe, start_timestamp, end_timestamp)
+                    SELECT ?, ?, MIN(timestamp), MAX(timestamp)
+                    FROM (
+                        SELECT timestamp,
+                               SUM(is_run_start) OVER (ORDER BY timestamp) AS run_id
+                        FROM (
+                            SELECT timestamp,
+                                   CASE WHEN timestamp - LAG(timestamp) OVER (ORDER BY timestamp) <= ?
+                                        THEN 0 ELSE 1 END AS is_run_start
+                            FROM ohlcv_data
+                            WHERE symbol = ? AND timeframe = ?
+                        )
+                    )
+                    GROUP BY run_id
+                """, (series_symbol, series_timeframe, step, series_symbol, series_timeframe))
+                runs_written += cursor.rowcount
+
+            conn.commit()
+
+        if series:
+            logger.info(f"Rebuilt OHLCV coverage for {len(series)} series: {runs_written} runs")
+        return runs_written
+
+    def _trim_coverage(self, cursor: sqlite3.Cursor, cutoff_timestamp: int,
+                       symbol: Optional[str] = None, timeframe: Optional[str] = None):
+        """
+        Trim coverage runs after candles older than a cutoff were deleted.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor inside the deleting transaction
+            cutoff_timestamp (int): Candles before this timestamp are gone
+            symbol (Optional[str]): Restrict to one series (all series if None)
+            timeframe (Optional[str]): Timeframe of that series
+        """
+        series_filter = ""
+        params: Tuple = ()
+        if symbol is not None:
+            series_filter = "AND symbol = ? AND timeframe = ?"
+            params = (symbol, timeframe)
+
+        cursor.execute(f"""
+            DELETE FROM ohlcv_coverage
+            WHERE end_timestamp < ? {series_filter}
+        """, (cutoff_timestamp,) + params)
+        cursor.execute(f"""
+            UPDATE ohlcv_coverage
+            SET start_timestamp = (
+                SELECT MIN(timestamp) FROM ohlcv_data
+                WHERE ohlcv_data.symbol = ohlcv_coverage.symbol
+                  AND ohlcv_data.timeframe = ohlcv_coverage.timeframe
+                  AND ohlcv_data.timestamp >= ?
+            )
+            WHERE start_timestamp < ? {series_filter}
+        """, (cutoff_timestamp, cutoff_timestamp) + params)
+
     def get_latest_timestamp(self, symbol: str, timeframe: str) -> Optional[int]:
         """
         Get the latest timestamp for a symbol and timeframe.
@@ -749,7 +1083,7 @@ class CryptoDatabaseManager:
         symbol = validate_symbol(symbol)
 
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -769,10 +1103,13 @@ class CryptoDatabaseManager:
         """
         Check for gaps in OHLCV data within a time range.
 
+        Reads the coverage runs maintained on insert, so the cost grows with the number
+        of gaps instead of the number of stored candles.
+
         Args:
             symbol (str): Trading symbol
             timeframe (str): Time interval
-            start_time (int): Start timestamp
+            start_time (int): Start timestamp (same unit as the stored candles, i.e. ms for ccxt data)
             end_time (int): End timestamp
 
         Returns:
@@ -780,47 +1117,31 @@ class CryptoDatabaseManager:
         """
         symbol = validate_symbol(symbol)
 
-        # Calculate expected interval in seconds
-        interval_map = {
-            '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
-            '1h': 3600, '2h': 7200, '4h': 14400, '6h': 21600, '8h': 28800, '12h': 43200,
-            '1d': 86400, '3d': 259200, '1w': 604800, '1M': 2592000
-        }
-
-        interval_seconds = interval_map.get(timeframe)
-        if not interval_seconds:
+        step = candle_step(timeframe, start_time)
+        if not step:
             logger.warning(f"Unknown timeframe {timeframe}, cannot check for gaps")
             return []
 
         gaps = []
 
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
-                # Get all timestamps in the range
                 cursor.execute("""
-                    SELECT timestamp
-                    FROM ohlcv_data
+                    SELECT start_timestamp, end_timestamp
+                    FROM ohlcv_coverage
                     WHERE symbol = ? AND timeframe = ?
-                      AND timestamp BETWEEN ? AND ?
-                    ORDER BY timestamp
-                """, (symbol, timeframe, start_time, end_time))
-
-                timestamps = [row['timestamp'] for row in cursor.fetchall()]
-
-                if not timestamps:
-                    # No data at all - entire range is a gap
-                    return [(start_time, end_time)]
+                      AND start_timestamp <= ? AND end_timestamp >= ?
+                    ORDER BY start_timestamp
+                """, (symbol, timeframe, end_time, start_time))
 
-                # Check for gaps
+                # Everything between covered runs is a gap
                 expected_time = start_time
-                for timestamp in timestamps:
-                    if timestamp > expected_time:
-                        # Found a gap
-                        gaps.append((expected_time, timestamp - interval_seconds))
-
-                    expected_time = timestamp + interval_seconds
+                for run_start, run_end in cursor.fetchall():
+                    if run_start - expected_time >= step:
+                        gaps.append((expected_time, run_start - step))
+                    expected_time = max(expected_time, run_end + step)
 
                 # Check if there's a gap at the end
                 if expected_time <= end_time:
@@ -852,7 +1173,7 @@ class CryptoDatabaseManager:
         symbol = validate_symbol(symbol)
 
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 # Build query with optional time filters
@@ -910,10 +1231,44 @@ class CryptoDatabaseManager:
                 expected_type="successful database operation"
             )
 
+    def get_ohlcv_array(self, symbol: str, timeframe: str,
+                        start: Optional[int] = None, end: Optional[int] = None):
+        """
+        Retrieve OHLCV data as a zero-copy memory-mapped NumPy view.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+            start (Optional[int]): Inclusive start timestamp
+            end (Optional[int]): Inclusive end timestamp
+
+        Returns:
+            np.ndarray: Structured array with fields timestamp, open, high, low, close, volume
+
+        Raises:
+            ConfigurationError: If the columnar tier is not enabled
+        """
+        if self.columnar_store is None:
+            raise ConfigurationError(
+                config_key="columnar_path",
+                message="Columnar OHLCV tier is not enabled"
+            )
+
+        symbol = validate_symbol(symbol)
+
+        # First read of a series that predates the columnar tier
+        if not self.columnar_store.has_series(symbol, timeframe):
+            self.rebuild_columnar_series(symbol, timeframe)
+
+        return self.columnar_store.get_ohlcv_array(symbol, timeframe, start, end)
+
     def cleanup_old_data(self, days: int = 30) -> Dict[str, int]:
         """
         Clean up old data from the database.
 
+        Deletes every timeframe alike; data.retention.RetentionManager keeps
+        rolled-up history instead.
+
         Args:
             days (int): Number of days of data to keep
 
@@ -921,6 +1276,8 @@ class CryptoDatabaseManager:
             Dict[str, int]: Count of deleted records by table
         """
         cutoff_timestamp = int(time.time()) - (days * 24 * 60 * 60)
+        # Candles carry exchange timestamps in milliseconds
+        ohlcv_cutoff = cutoff_timestamp * 1000
         deleted_counts = {}
 
         try:
@@ -931,9 +1288,12 @@ class CryptoDatabaseManager:
                 cursor.execute("""
                     DELETE FROM ohlcv_data
                     WHERE timestamp < ?
-                """, (cutoff_timestamp,))
+                """, (ohlcv_cutoff,))
                 deleted_counts['ohlcv_data'] = cursor.rowcount
 
+                # Trim coverage runs to the candles that remain
+                self._trim_coverage(cursor, ohlcv_cutoff)
+
                 # Clean old real-time price data
                 cursor.execute("""
                     DELETE FROM realtime_prices
@@ -954,6 +1314,10 @@ class CryptoDatabaseManager:
                 total_deleted = sum(deleted_counts.values())
                 logger.info(f"Cleanup completed: {total_deleted} total records deleted")
 
+            if self.columnar_store is not None:
+                for symbol, timeframe in self.columnar_store.list_series():
+                    self.columnar_store.delete_before(symbol, timeframe, ohlcv_cutoff)
+
         except Exception as e:
             logger.error(f"Failed to cleanup old data: {e}")
 
@@ -973,7 +1337,8 @@ class CryptoDatabaseManager:
             'symbol_counts': {},
             'timeframe_distribution': {},
             'data_date_range': {},
-            'last_updated': None
+            'last_updated': None,
+            'connection_pool': {}
         }
 
         try:
@@ -981,11 +1346,11 @@ class CryptoDatabaseManager:
             if self.db_path.exists():
                 stats['database_size_mb'] = round(self.db_path.stat().st_size / (1024 * 1024), 2)
 
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 # Get table record counts
-                tables = ['ohlcv_data', 'realtime_prices', 'trading_history', 'system_stats']
+                tables = ['ohlcv_data', 'realtime_prices', 'realtime_price_bars', 'trading_history', 'system_stats']
                 for table in tables:
                     cursor.execute(f"SELECT COUNT(*) as count FROM {table}")
                     result = cursor.fetchone()
@@ -1018,14 +1383,19 @@ class CryptoDatabaseManager:
                 """)
                 result = cursor.fetchone()
                 if result and result['earliest']:
+                    # Exchange candles are stamped in milliseconds
+                    scale = 1000 if result['latest'] >= MILLISECOND_TIMESTAMP_THRESHOLD else 1
+                    earliest, latest = result['earliest'] / scale, result['latest'] / scale
                     stats['data_date_range'] = {
-                        'earliest': datetime.fromtimestamp(result['earliest']).isoformat(),
-                        'latest': datetime.fromtimestamp(result['latest']).isoformat(),
-                        'days_of_data': (result['latest'] - result['earliest']) / (24 * 60 * 60)
+                        'earliest': datetime.fromtimestamp(earliest).isoformat(),
+                        'latest': datetime.fromtimestamp(latest).isoformat(),
+                        'days_of_data': (latest - earliest) / (24 * 60 * 60)
                     }
 
                 stats['last_updated'] = datetime.now().isoformat()
 
+            stats['connection_pool'] = self.get_pool_metrics()
+
         except Exception as e:
             logger.error(f"Failed to get database statistics: {e}")
             stats['error'] = str(e)
@@ -1056,7 +1426,7 @@ class CryptoDatabaseManager:
             backup_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Create backup using SQLite backup API
-            with self.get_connection() as source_conn:
+            with self.read_connection() as source_conn:
                 with sqlite3.connect(str(backup_path)) as backup_conn:
                     source_conn.backup(backup_conn)
 
@@ -1087,6 +1457,8 @@ class CryptoDatabaseManager:
         """Close all database connections and cleanup resources."""
         try:
             self.connection_pool.close_all()
+            if self.columnar_store is not None:
+                self.columnar_store.close()
             logger.info("Database manager closed successfully")
         except Exception as e:
             logger.error(f"Error closing database manager: {e}")
@@ -1119,7 +1491,7 @@ def validate_database_integrity(db_manager: CryptoDatabaseManager) -> Dict[str,
     }
 
     try:
-        with db_manager.get_connection() as conn:
+        with db_manager.read_connection() as conn:
             cursor = conn.cursor()
 
             # Check 1: SQLite integrity
@@ -1194,9 +1566,16 @@ def optimize_database(db_manager: CryptoDatabaseManager) -> Dict[str, Any]:
         with db_manager.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Optimize 1: VACUUM to reclaim space
-            cursor.execute("VACUUM")
-            results['optimizations_performed'].append('vacuum')
+            # Optimize 1: Reclaim space - incrementally when the file supports it,
+            # otherwise with a full VACUUM (which also switches it to incremental mode)
+            cursor.execute("PRAGMA auto_vacuum")
+            if cursor.fetchone()[0] == 2:
+                conn.executescript("PRAGMA incremental_vacuum;")
+                results['optimizations_performed'].append('incremental_vacuum')
+            else:
+                cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                cursor.execute("VACUUM")
+                results['optimizations_performed'].append('vacuum')
 
             # Optimize 2: ANALYZE to update statistics
             cursor.execute("ANALYZE")
@@ -1206,6 +1585,10 @@ def optimize_database(db_manager: CryptoDatabaseManager) -> Dict[str, Any]:
             cursor.execute("PRAGMA optimize")
             results['optimizations_performed'].append('pragma_optimize')
 
+            # Optimize 4: Fold the WAL back into the main file
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            results['optimizations_performed'].append('wal_checkpoint')
+
         # Get final size
         if db_manager.db_path.exists():
             results['size_after_mb'] = round(db_manager.db_path.stat().st_size / (1024 * 1024), 2)
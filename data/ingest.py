@@ -0,0 +1,461 @@
+"""
+Batched OHLCV and real-time price ingest for cryptocurrency trading bot.
+Collector threads validate and enqueue rows; a single writer thread commits them
+in large transactions so SQLite never sees more than one writer.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional, Tuple, Union
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class _IngestItem:
+    """One submitted unit of work: candles of one series, a price row, or a control marker."""
+
+    __slots__ = ('kind', 'key', 'rows', 'future', 'enqueued_at')
+
+    def __init__(self, kind: str, key: Any = None, rows: Optional[List[Tuple]] = None):
+        self.kind = kind
+        self.key = key
+        self.rows = rows or []
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class IngestMetrics:
+    """
+    Thread-safe throughput, latency and backpressure counters for BatchedIngestWriter.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.lock = threading.Lock()
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """Reset all counters."""
+        with self.lock:
+            self.flushes = 0
+            self.failed_flushes = 0
+            self.items_written = 0
+            self.ohlcv_rows = 0
+            self.records_inserted = 0
+            self.price_rows = 0
+            self.backpressure_waits = 0
+            self.backpressure_time = 0.0
+            self.rejected = 0
+            self.flush_times = deque(maxlen=self.window)
+            self.batch_sizes = deque(maxlen=self.window)
+            self.queue_latencies = deque(maxlen=self.window)
+
+    def record_enqueue(self, wait: float, blocked: bool):
+        with self.lock:
+            if blocked:
+                self.backpressure_waits += 1
+                self.backpressure_time += wait
+
+    def record_rejected(self):
+        with self.lock:
+            self.rejected += 1
+
+    def record_flush(self, items: int, ohlcv_rows: int, inserted: int, price_rows: int,
+                     duration: float, latencies: List[float], success: bool):
+        with self.lock:
+            self.flushes += 1
+            if not success:
+                self.failed_flushes += 1
+            self.items_written += items
+            self.ohlcv_rows += ohlcv_rows
+            self.records_inserted += inserted
+            self.price_rows += price_rows
+            self.flush_times.append(duration)
+            self.batch_sizes.append(ohlcv_rows + price_rows)
+            self.queue_latencies.extend(latencies)
+
+    @staticmethod
+    def _percentile(values: List[float], percent: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get current metrics.
+
+        Returns:
+            Dict[str, Any]: Flush counts, rows written, flush and end-to-end latencies (ms)
+                            over the recent window, and backpressure counters
+        """
+        with self.lock:
+            flush_times = list(self.flush_times)
+            latencies = list(self.queue_latencies)
+            batch_sizes = list(self.batch_sizes)
+
+            return {
+                'flushes': self.flushes,
+                'failed_flushes': self.failed_flushes,
+                'items_written': self.items_written,
+                'ohlcv_rows': self.ohlcv_rows,
+                'records_inserted': self.records_inserted,
+                'price_rows': self.price_rows,
+                'avg_batch_rows': round(sum(batch_sizes) / len(batch_sizes), 1) if batch_sizes else 0.0,
+                'avg_flush_ms': round(sum(flush_times) / len(flush_times) * 1000, 3) if flush_times else 0.0,
+                'max_flush_ms': round(max(flush_times) * 1000, 3) if flush_times else 0.0,
+                'p95_flush_ms': round(self._percentile(flush_times, 0.95) * 1000, 3),
+                'avg_latency_ms': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+                'p95_latency_ms': round(self._percentile(latencies, 0.95) * 1000, 3),
+                'backpressure_waits': self.backpressure_waits,
+                'backpressure_wait_ms': round(self.backpressure_time * 1000, 3),
+                'rejected': self.rejected
+            }
+
+
+class BatchedIngestWriter:
+    """
+    Single-writer ingest queue for OHLCV candles and real-time prices.
+
+    Features:
+    - Validation runs in the submitting threads; only the write is serialized
+    - Bounded queue: submitters block (backpressure) when the writer falls behind
+    - Flushes on batch size or age, one transaction per flush
+    - Coverage and statistics updated once per series per flush
+    - Guaranteed final flush on stop()
+    """
+
+    _FLUSH = 'flush'
+    _STOP = 'stop'
+
+    def __init__(self,
+                 database_manager,
+                 max_queue_size: int = 10000,
+                 max_batch_rows: int = 5000,
+                 flush_interval: float = 1.0,
+                 put_timeout: Optional[float] = 30.0):
+        """
+        Initialize the writer. Call start() to launch the writer thread.
+
+        Args:
+            database_manager (CryptoDatabaseManager): Destination database
+            max_queue_size (int): Maximum pending submissions before submitters block
+            max_batch_rows (int): Rows that trigger an immediate flush
+            flush_interval (float): Maximum seconds a submission waits before it is flushed
+            put_timeout (Optional[float]): Seconds a submitter may block on a full queue
+                                           before TimeoutError (None waits forever)
+        """
+        self.database_manager = database_manager
+        self.max_queue_size = max(1, max_queue_size)
+        self.max_batch_rows = max(1, max_batch_rows)
+        self.flush_interval = max(0.0, flush_interval)
+        self.put_timeout = put_timeout
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._state_lock = threading.Lock()
+        self._stopping = False  # stop() called; no new submissions are accepted
+        self._stop_queued = False  # stop marker is in the queue
+        self._stopped = False  # writer thread exited and the queue was drained
+
+        self.metrics = IngestMetrics()
+
+    @property
+    def is_running(self) -> bool:
+        """True while the writer thread accepts submissions."""
+        return self._thread is not None and self._thread.is_alive() and not self._stopping
+
+    def start(self):
+        """
+        Start the writer thread (no-op if already running).
+
+        Raises:
+            RuntimeError: If the writer of a timed-out stop() is still finishing
+        """
+        with self._state_lock:
+            if self._thread is not None and self._thread.is_alive():
+                if self._stopping:
+                    # A second writer on the same queue would break the single-writer design
+                    raise RuntimeError("Previous ingest writer is still finishing; call stop() again first")
+                return
+            if self._stopping:
+                # The writer of a timed-out stop() exited since; fail what queued behind its marker
+                self._fail_abandoned()
+            self._stopping = False
+            self._stop_queued = False
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name='ingest-writer', daemon=True)
+            self._thread.start()
+
+        logger.info(f"Ingest writer started: batch {self.max_batch_rows} rows, "
+                   f"flush every {self.flush_interval}s, queue {self.max_queue_size}")
+
+    def stop(self, timeout: Optional[float] = 30.0):
+        """
+        Flush everything submitted so far and stop the writer thread.
+
+        If the writer does not finish in time it keeps draining the queue; calling
+        stop() again waits for it, and start() refuses to run a second writer meanwhile.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the stop marker to be queued
+                                       and the final flush to finish (None waits forever)
+        """
+        with self._state_lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stopping = True
+            queue_marker = not self._stop_queued
+            self._stop_queued = True
+
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        if thread.is_alive():
+            if queue_marker:
+                # Queued behind every pending submission, so nothing is left unwritten
+                try:
+                    self._queue.put(_IngestItem(self._STOP), timeout=timeout)
+                except queue.Full:
+                    self._stop_queued = False
+                    logger.error(f"Ingest writer stalled: queue still full after {timeout}s, "
+                                f"stop marker not queued")
+                    return
+
+            thread.join(timeout=None if deadline is None else max(0.0, deadline - time.perf_counter()))
+            if thread.is_alive():
+                logger.error(f"Ingest writer did not finish within {timeout}s; "
+                            f"{self._queue.qsize()} submissions pending")
+                return
+
+        with self._state_lock:
+            if self._thread is thread:
+                self._thread = None
+
+        # Submitters that saw the writer running may have queued behind the stop marker
+        self._stopped = True
+        self._fail_abandoned()
+
+        logger.info("Ingest writer stopped")
+
+    def _fail_abandoned(self):
+        """Fail items left in the queue after the writer thread exited (same error as _submit)."""
+        abandoned = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item.kind == self._FLUSH:
+                item.future.set_result(True)
+            elif not item.future.done():
+                item.future.set_exception(RuntimeError("Ingest writer is not running"))
+                abandoned += 1
+
+        if abandoned:
+            logger.warning(f"{abandoned} ingest submissions arrived after stop() and were not written")
+
+    def submit_ohlcv(self, symbol: str, timeframe: str,
+                     ohlcv_list: List[List[Union[int, float]]]) -> Future:
+        """
+        Validate candles and queue them for the next flush.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Time interval
+            ohlcv_list (List[List[Union[int, float]]]): List of OHLCV arrays
+
+        Returns:
+            Future: Resolves to the number of records inserted once committed
+                    (RuntimeError if the writer is not running)
+
+        Raises:
+            DataValidationError: If the candles are invalid
+            TimeoutError: If the queue stayed full for put_timeout seconds
+        """
+        rows = self.database_manager.prepare_ohlcv_rows(symbol, timeframe, ohlcv_list)
+        return self._submit(_IngestItem('ohlcv', (rows[0][0], timeframe), rows))
+
+    def submit_price(self, symbol: str, price_data: Dict[str, Any]) -> Future:
+        """
+        Validate a real-time price and queue it for the next flush.
+
+        Args:
+            symbol (str): Trading symbol
+            price_data (Dict[str, Any]): Price data dictionary
+
+        Returns:
+            Future: Resolves to True once committed (RuntimeError if the writer is not running)
+
+        Raises:
+            DataValidationError: If price data is invalid
+            TimeoutError: If the queue stayed full for put_timeout seconds
+        """
+        row = self.database_manager.prepare_price_row(symbol, price_data)
+        return self._submit(_IngestItem('price', row[0], [row]))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write everything submitted before this call and wait for it.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait (None waits forever)
+
+        Returns:
+            bool: True if the flush completed in time
+        """
+        if not self.is_running:
+            return True
+
+        marker = self._submit(_IngestItem(self._FLUSH))
+        try:
+            marker.result(timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get ingest throughput, latency and backpressure metrics.
+
+        Returns:
+            Dict[str, Any]: Metrics plus current queue depth
+        """
+        metrics = self.metrics.snapshot()
+        metrics.update(
+            running=self.is_running,
+            queue_depth=self._queue.qsize(),
+            max_queue_size=self.max_queue_size
+        )
+        return metrics
+
+    def _submit(self, item: _IngestItem) -> Future:
+        """Enqueue an item; without a running writer the item fails like one abandoned by stop()."""
+        if not self.is_running:
+            if item.kind == self._FLUSH:
+                item.future.set_result(True)
+            else:
+                # Callers (see RealTimeDataCollector._ingest_enabled) write directly instead
+                item.future.set_exception(RuntimeError("Ingest writer is not running"))
+            return item.future
+
+        try:
+            self._queue.put_nowait(item)
+            self.metrics.record_enqueue(0.0, blocked=False)
+        except queue.Full:
+            start = time.perf_counter()
+            try:
+                self._queue.put(item, timeout=self.put_timeout)
+            except queue.Full:
+                self.metrics.record_rejected()
+                raise TimeoutError(f"Ingest queue full ({self.max_queue_size} pending) "
+                                   f"for {self.put_timeout}s")
+            self.metrics.record_enqueue(time.perf_counter() - start, blocked=True)
+
+        if self._stopped:
+            # stop() already drained the queue, nothing will pick this item up
+            self._fail_abandoned()
+        return item.future
+
+    def _run(self):
+        """Writer thread: collect a batch, write it, repeat until stopped."""
+        stopping = False
+        while not stopping:
+            batch: List[_IngestItem] = []
+            markers: List[_IngestItem] = []
+            rows = 0
+
+            item = self._queue.get()
+            deadline = time.perf_counter() + self.flush_interval
+
+            while True:
+                if item.kind == self._STOP:
+                    stopping = True
+                    markers.append(item)
+                    break
+                if item.kind == self._FLUSH:
+                    markers.append(item)
+                    break
+
+                batch.append(item)
+                rows += len(item.rows)
+                if rows >= self.max_batch_rows:
+                    break
+
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    # _write resolves the futures; never let the writer thread die
+                    logger.error(f"Ingest writer error: {e}")
+
+            for marker in markers:
+                marker.future.set_result(True)
+
+    def _write(self, batch: List[_IngestItem]):
+        """
+        Write a batch in one transaction and resolve its futures.
+
+        If the combined transaction fails, items are retried one by one so a single
+        bad series does not discard the rest of the batch.
+        """
+        start = time.perf_counter()
+        success = True
+
+        try:
+            inserted = self._write_items(batch)
+        except Exception as e:
+            success = False
+            logger.warning(f"Batched ingest of {len(batch)} submissions failed, retrying individually: {e}")
+            inserted = 0
+            for item in batch:
+                try:
+                    inserted += self._write_items([item])
+                except Exception as item_error:
+                    item.future.set_exception(item_error)
+
+        finished = time.perf_counter()
+        self.metrics.record_flush(
+            items=len(batch),
+            ohlcv_rows=sum(len(item.rows) for item in batch if item.kind == 'ohlcv'),
+            inserted=inserted,
+            price_rows=sum(len(item.rows) for item in batch if item.kind == 'price'),
+            duration=finished - start,
+            latencies=[finished - item.enqueued_at for item in batch],
+            success=success
+        )
+
+    def _write_items(self, items: List[_IngestItem]) -> int:
+        """Merge items per series, write them and resolve their futures. Returns records inserted."""
+        ohlcv_rows: Dict[Tuple[str, str], List[Tuple]] = {}
+        price_rows: List[Tuple] = []
+        for item in items:
+            if item.kind == 'ohlcv':
+                ohlcv_rows.setdefault(item.key, []).extend(item.rows)
+            else:
+                price_rows.extend(item.rows)
+
+        inserted = self.database_manager.write_batch(ohlcv_rows, price_rows)
+
+        # Attribute each series' insert count to its submissions in order; duplicates
+        # submitted twice in one batch count towards the first submission
+        remaining = dict(inserted)
+        for item in items:
+            if item.kind == 'ohlcv':
+                count = min(len(item.rows), remaining.get(item.key, 0))
+                remaining[item.key] = remaining.get(item.key, 0) - count
+                item.future.set_result(count)
+            else:
+                item.future.set_result(True)
+
+        return sum(inserted.values())
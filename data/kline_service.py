@@ -0,0 +1,254 @@
+"""
+Read-through kline service for cryptocurrency trading bot.
+Serves candles from the local store filled by RealTimeDataCollector and fetches only the
+missing tail from the exchange, so UI reruns and trading consumers share one source.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+import logging
+
+from data.backfill import timeframe_to_ms
+from data.database import CryptoDatabaseManager
+from utils.exceptions import InsufficientDataError
+from utils.market_data import MarketDataCollector
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def _load_config(config_path: str) -> Dict[str, Any]:
+    """Read the configuration file ({} if unreadable)."""
+    try:
+        with open(Path(config_path), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not read {config_path}, using defaults: {e}")
+        return {}
+
+
+class KlineService:
+    """
+    Local-store-first OHLCV access.
+
+    Features:
+    - Closed candles come from ohlcv_data; only candles after the newest stored closed
+      candle (including the open one) are requested from the exchange
+    - Short stored history or holes in the requested window trigger one full request
+    - Fetched closed candles are written back, so the next call needs the store only
+    - Exchange requests go through MarketDataCollector, sharing its rate limiter and its
+      coalescing kline cache across all consumers
+    - Latest prices from fresh realtime_prices rows, else one bulk ticker request
+    """
+
+    def __init__(self,
+                 database_manager: Optional[CryptoDatabaseManager] = None,
+                 market_data_collector: Optional[MarketDataCollector] = None,
+                 config_path: str = "config/config.json",
+                 testnet: Optional[bool] = None,
+                 persist: bool = True,
+                 price_max_age_seconds: float = 10.0):
+        """
+        Initialize the kline service.
+
+        Args:
+            database_manager (Optional[CryptoDatabaseManager]): Local store (config database path if None)
+            market_data_collector (Optional[MarketDataCollector]): Exchange source (network of
+                                                                   `testnet` if None)
+            config_path (str): Configuration file used for missing components
+            testnet (Optional[bool]): Network to serve (config exchange setting if None); a network
+                                      other than the configured one gets its own store file
+            persist (bool): Write fetched closed candles back to the store
+            price_max_age_seconds (float): Maximum age of a stored real-time price served as latest
+        """
+        config = {}
+        if database_manager is None or market_data_collector is None:
+            config = _load_config(config_path)
+
+        config_testnet = config.get('exchange', {}).get('testnet', True)
+        if market_data_collector is not None:
+            self.testnet = market_data_collector.testnet
+        else:
+            self.testnet = config_testnet if testnet is None else testnet
+
+        db_path = config.get('database', {}).get('path', 'data/crypto_data.db')
+        columnar_path = config.get('database', {}).get('columnar_path')
+        if self.testnet != config_testnet:
+            # The configured store is filled by the collector of the other network
+            network = 'testnet' if self.testnet else 'mainnet'
+            path = Path(db_path)
+            db_path = str(path.with_name(f"{path.stem}_{network}{path.suffix}"))
+            if columnar_path:
+                columnar_path = f"{columnar_path.rstrip('/')}_{network}"
+
+        self.database_manager = database_manager or CryptoDatabaseManager(db_path=db_path,
+                                                                          columnar_path=columnar_path)
+        # Same network as the store's candles, so stored and fetched candles match
+        self.market_data_collector = market_data_collector or MarketDataCollector(testnet=self.testnet)
+        self.persist = persist
+        self.price_max_age_seconds = price_max_age_seconds
+
+        self.lock = threading.Lock()
+        self.stats = dict.fromkeys(
+            ('requests', 'store_only', 'tail_fetches', 'full_fetches', 'store_fallbacks',
+             'candles_from_store', 'candles_fetched', 'candles_persisted'), 0
+        )
+
+    def _count(self, **increments: int):
+        with self.lock:
+            for name, value in increments.items():
+                self.stats[name] += value
+
+    def get_klines(self, symbol: str, timeframe: str = '1h', limit: int = 100) -> List[List[float]]:
+        """
+        Get the most recent candles of a series.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'BTC/USDT')
+            timeframe (str): Time interval ('1m', '5m', '1h', etc.)
+            limit (int): Number of candles (max 1000)
+
+        Returns:
+            List[List[float]]: Chronological OHLCV arrays [timestamp, open, high, low, close, volume];
+                               the last one may be the still-open candle
+
+        Raises:
+            InsufficientDataError: If neither the store nor the exchange has candles
+        """
+        self._count(requests=1)
+        step = timeframe_to_ms(timeframe)
+        now_ms = int(time.time() * 1000)
+
+        try:
+            stored = self.database_manager.get_ohlcv_data(symbol, timeframe, limit=limit)
+        except InsufficientDataError:
+            stored = []
+
+        # A stored candle that was still open when written may be partial
+        closed = [candle for candle in stored if candle[0] + step <= now_ms]
+        contiguous = all(later[0] - earlier[0] == step for earlier, later in zip(closed, closed[1:]))
+
+        since = int(closed[-1][0]) + step if closed else None
+        missing = -(-(now_ms - since) // step) if since is not None else limit
+        full_fetch = not closed or not contiguous or len(closed) + missing < limit or missing > 1000
+
+        if not full_fetch and missing <= 0:
+            self._count(store_only=1, candles_from_store=len(closed))
+            return closed[-limit:]
+
+        try:
+            if full_fetch:
+                fetched = self.market_data_collector.get_klines(symbol, timeframe, limit=limit)
+                self._count(full_fetches=1)
+            else:
+                fetched = self.market_data_collector.get_klines(symbol, timeframe, limit=missing,
+                                                                since=since)
+                self._count(tail_fetches=1)
+        except Exception as e:
+            if not closed:
+                raise
+            logger.warning(f"Serving stored {symbol} {timeframe} candles, tail fetch failed: {e}")
+            self._count(store_fallbacks=1, candles_from_store=len(closed))
+            return closed[-limit:]
+
+        fetched = [[float(value) for value in candle] for candle in fetched]
+        self._count(candles_fetched=len(fetched))
+        self._persist_closed(symbol, timeframe, fetched, step, now_ms)
+
+        if full_fetch:
+            return fetched[-limit:]
+
+        merged = closed + [candle for candle in fetched if candle[0] > closed[-1][0]]
+        self._count(candles_from_store=len(closed))
+        return merged[-limit:]
+
+    def _persist_closed(self, symbol: str, timeframe: str, candles: List[List[float]],
+                        step: int, now_ms: int):
+        """Write fetched closed candles back; the open candle is left to the next fetch."""
+        if not self.persist:
+            return
+
+        closed = [candle for candle in candles if candle[0] + step <= now_ms]
+        if not closed:
+            return
+
+        try:
+            self._count(candles_persisted=self.database_manager.insert_ohlcv_data(symbol, timeframe, closed))
+        except Exception as e:
+            logger.warning(f"Could not store fetched {symbol} {timeframe} candles: {e}")
+
+    def get_latest_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get latest prices, from the store when RealTimeDataCollector wrote them recently.
+
+        Args:
+            symbols (List[str]): Trading symbols
+
+        Returns:
+            Dict[str, float]: Price per symbol (symbols without any price are omitted)
+        """
+        prices: Dict[str, float] = {}
+        cutoff = int(time.time() - self.price_max_age_seconds)
+
+        try:
+            with self.database_manager.read_connection() as conn:
+                for symbol in symbols:
+                    row = conn.execute("""
+                        SELECT price FROM realtime_prices
+                        WHERE symbol = ? AND timestamp >= ?
+                        ORDER BY timestamp DESC LIMIT 1
+                    """, (symbol, cutoff)).fetchone()
+                    if row is not None:
+                        prices[symbol] = float(row[0])
+        except Exception as e:
+            logger.warning(f"Could not read stored prices: {e}")
+
+        pending = [symbol for symbol in symbols if symbol not in prices]
+        if pending:
+            # One bulk ticker request (or cache hits) for everything the store lacks
+            result = self.market_data_collector.get_multiple_symbols_data(pending, data_type="price")
+            prices.update(result['data'])
+
+        return {symbol: prices[symbol] for symbol in symbols if symbol in prices}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get service statistics.
+
+        Returns:
+            Dict[str, Any]: Request counts by path and candles served from store vs exchange
+        """
+        with self.lock:
+            stats = dict(self.stats)
+        served = stats['candles_from_store'] + stats['candles_fetched']
+        stats['store_ratio_percent'] = round(stats['candles_from_store'] / served * 100, 1) if served else 0.0
+        return stats
+
+
+_shared_services: Dict[bool, KlineService] = {}
+_shared_service_lock = threading.Lock()
+
+
+def get_kline_service(testnet: Optional[bool] = None) -> KlineService:
+    """
+    Get the process-wide kline service shared by UI pages and trading consumers.
+
+    Args:
+        testnet (Optional[bool]): Network to serve (config exchange setting if None)
+
+    Returns:
+        KlineService: Shared service instance of that network
+    """
+    with _shared_service_lock:
+        # None means the configured network, which shares the same instance and store
+        if testnet is None:
+            testnet = _load_config("config/config.json").get('exchange', {}).get('testnet', True)
+        testnet = bool(testnet)
+
+        service = _shared_services.get(testnet)
+        if service is None:
+            service = _shared_services[testnet] = KlineService(testnet=testnet)
+        return service
@@ -0,0 +1,383 @@
+"""
+Tiered data retention for cryptocurrency trading bot.
+Rolls expiring candles up into higher timeframes, compacts old real-time prices into
+per-minute bars and deletes in small transactions so collectors are never blocked.
+"""
+
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
+import logging
+
+from data.database import candle_step
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+DAY_SECONDS = 24 * 60 * 60
+
+# Default tiers: fine timeframes expire early but live on as coarser candles.
+# Timeframes missing from ohlcv_days are kept forever.
+DEFAULT_RETENTION_POLICY: Dict[str, Any] = {
+    'ohlcv_days': {
+        '1m': 30, '3m': 30, '5m': 180, '15m': 365, '30m': 365, '1h': 1825
+    },
+    'rollups': {
+        '1m': ['5m', '1h', '1d'],
+        '5m': ['1h', '1d'],
+        '15m': ['1h', '1d'],
+        '1h': ['1d']
+    },
+    'realtime_prices_days': 2,      # raw ticks, then per-minute bars
+    'price_bar_days': 365,
+    'trading_history_days': 90,
+    'batch_size': 5000,             # rows per delete transaction
+    'batch_pause_seconds': 0.01,    # writer lock released between batches
+    'vacuum_pages': 2000            # free pages returned to the OS per run
+}
+
+
+class RetentionManager:
+    """
+    Tiered retention for ohlcv_data and realtime_prices.
+
+    Features:
+    - Rolls expiring candles up into configured higher timeframes before deleting them
+      (exchange-provided candles of the target timeframe are never overwritten)
+    - Compacts expiring real-time prices into per-minute OHLC bars
+    - Rollup and delete of each chunk share one short transaction, so a crash
+      never loses data and the writer lock is released between chunks
+    - Incremental vacuum instead of rewriting the whole file
+    """
+
+    def __init__(self, database_manager, policy: Optional[Dict[str, Any]] = None,
+                 stop_event: Optional[threading.Event] = None):
+        """
+        Initialize the retention manager.
+
+        Args:
+            database_manager (CryptoDatabaseManager): Database to maintain
+            policy (Optional[Dict[str, Any]]): Overrides for DEFAULT_RETENTION_POLICY
+            stop_event (Optional[threading.Event]): Stops a run between chunks when set
+        """
+        self.database_manager = database_manager
+        self.policy = dict(DEFAULT_RETENTION_POLICY)
+        if policy:
+            self.policy.update(policy)
+        self.batch_size = max(1, int(self.policy['batch_size']))
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
+
+    def run(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Apply the whole retention policy.
+
+        Args:
+            now (Optional[float]): Reference time in seconds (default: current time)
+
+        Returns:
+            Dict[str, Any]: Rows rolled up and deleted per table, vacuum results and duration
+        """
+        now = now if now is not None else time.time()
+        start_time = time.time()
+
+        results = {
+            'ohlcv_rolled_up': 0,
+            'ohlcv_deleted': 0,
+            'price_bars_created': 0,
+            'realtime_prices_deleted': 0,
+            'price_bars_deleted': 0,
+            'trading_history_deleted': 0,
+            'series': {},
+            'errors': []
+        }
+
+        steps = [
+            ('ohlcv', lambda: self.apply_ohlcv_retention(now, results)),
+            ('realtime_prices', lambda: self.compact_realtime_prices(now, results)),
+            ('expired_rows', lambda: self.delete_expired_rows(now, results))
+        ]
+        for name, step in steps:
+            if self.stop_event.is_set():
+                break
+            try:
+                step()
+            except Exception as e:
+                error_msg = f"Retention step {name} failed: {e}"
+                results['errors'].append(error_msg)
+                logger.error(error_msg)
+
+        results['vacuum'] = self.reclaim_space()
+        results['duration_seconds'] = round(time.time() - start_time, 3)
+
+        logger.info(f"Retention: {results['ohlcv_rolled_up']} candles rolled up, "
+                   f"{results['ohlcv_deleted']} candles and {results['realtime_prices_deleted']} "
+                   f"prices deleted in {results['duration_seconds']}s")
+        return results
+
+    def apply_ohlcv_retention(self, now: float, results: Dict[str, Any]):
+        """
+        Roll up and delete expired candles of every series with a retention limit.
+
+        Finer timeframes are processed first so their rollups are in place before
+        the coarser tiers expire in turn.
+        """
+        with self.database_manager.read_connection() as conn:
+            series = conn.execute(
+                "SELECT DISTINCT symbol, timeframe FROM ohlcv_coverage"
+            ).fetchall()
+
+        ohlcv_days = self.policy['ohlcv_days']
+        reference_ms = int(now * 1000)
+        series = sorted(
+            ((symbol, timeframe) for symbol, timeframe in series if ohlcv_days.get(timeframe)),
+            key=lambda item: candle_step(item[1], reference_ms) or 0
+        )
+
+        for symbol, timeframe in series:
+            if self.stop_event.is_set():
+                break
+            cutoff_ms = reference_ms - int(ohlcv_days[timeframe] * DAY_SECONDS * 1000)
+            rolled_up, deleted = self.expire_series(symbol, timeframe, cutoff_ms)
+            if rolled_up or deleted:
+                results['series'][f"{symbol}_{timeframe}"] = {'rolled_up': rolled_up, 'deleted': deleted}
+            results['ohlcv_rolled_up'] += rolled_up
+            results['ohlcv_deleted'] += deleted
+
+    def _rollup_targets(self, timeframe: str, step: int, reference: int) -> List[Tuple[str, int]]:
+        """Configured rollup timeframes whose buckets are whole multiples of the source candle."""
+        targets = []
+        for target in self.policy['rollups'].get(timeframe, []):
+            target_step = candle_step(target, reference)
+            # Calendar months have no fixed length and cannot be bucketed by modulo
+            if target == '1M' or target_step is None or target_step <= step or target_step % step:
+                logger.warning(f"Skipping rollup {timeframe} -> {target}: not a whole multiple")
+                continue
+            targets.append((target, target_step))
+        return targets
+
+    def expire_series(self, symbol: str, timeframe: str, cutoff_ms: int) -> Tuple[int, int]:
+        """
+        Roll up and delete one series' candles older than the cutoff, chunk by chunk.
+
+        Args:
+            symbol (str): Trading symbol
+            timeframe (str): Source timeframe
+            cutoff_ms (int): Candles before this time (ms) expire
+
+        Returns:
+            Tuple[int, int]: (candles created in rollup timeframes, candles deleted)
+        """
+        db = self.database_manager
+        oldest = self._oldest_candle(symbol, timeframe, None)
+        if oldest is None:
+            return 0, 0
+
+        step = candle_step(timeframe, oldest) or 1
+        targets = self._rollup_targets(timeframe, step, oldest)
+
+        # Only expire whole buckets of the coarsest target so no rollup is cut in half
+        align = max([step] + [target_step for _, target_step in targets])
+        cutoff = cutoff_ms - cutoff_ms % align
+        span = max(align, (self.batch_size * step) // align * align)
+
+        rolled_up = deleted = 0
+        while oldest is not None and oldest < cutoff and not self.stop_event.is_set():
+            chunk_start = oldest - oldest % align
+            chunk_end = min(chunk_start + span, cutoff)
+            rollup_rows: Dict[str, List[List[float]]] = {}
+
+            with db.get_connection() as conn:
+                cursor = conn.cursor()
+
+                for target, target_step in targets:
+                    rolled_up += self._rollup_chunk(cursor, symbol, timeframe, target, target_step,
+                                                    chunk_start, chunk_end)
+                    cursor.execute("""
+                        SELECT timestamp, open_price, high_price, low_price, close_price, volume
+                        FROM ohlcv_data
+                        WHERE symbol = ? AND timeframe = ? AND timestamp >= ? AND timestamp < ?
+                        ORDER BY timestamp
+                    """, (symbol, target, chunk_start, chunk_end))
+                    rows = [list(row) for row in cursor.fetchall()]
+                    if rows:
+                        db._extend_coverage(cursor, symbol, target, [row[0] for row in rows])
+                        rollup_rows[target] = rows
+
+                cursor.execute("""
+                    DELETE FROM ohlcv_data
+                    WHERE symbol = ? AND timeframe = ? AND timestamp >= ? AND timestamp < ?
+                """, (symbol, timeframe, chunk_start, chunk_end))
+                deleted += cursor.rowcount
+
+                db._trim_coverage(cursor, chunk_end, symbol, timeframe)
+                conn.commit()
+
+            if db.columnar_store is not None:
+                for target, rows in rollup_rows.items():
+                    db._sync_columnar_series(symbol, target, rows)
+                db.columnar_store.delete_before(symbol, timeframe, chunk_end)
+
+            oldest = self._oldest_candle(symbol, timeframe, chunk_end)
+            self.stop_event.wait(self.policy['batch_pause_seconds'])
+
+        if deleted:
+            logger.info(f"Expired {deleted} {timeframe} candles for {symbol} "
+                       f"({rolled_up} rolled up into {[target for target, _ in targets]})")
+        return rolled_up, deleted
+
+    def _oldest_candle(self, symbol: str, timeframe: str, after: Optional[int]) -> Optional[int]:
+        """Oldest candle timestamp of a series, optionally at or after a bound."""
+        with self.database_manager.read_connection() as conn:
+            row = conn.execute("""
+                SELECT MIN(timestamp) FROM ohlcv_data
+                WHERE symbol = ? AND timeframe = ? AND timestamp >= ?
+            """, (symbol, timeframe, after if after is not None else -2 ** 63)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _rollup_chunk(cursor, symbol: str, timeframe: str, target: str, target_step: int,
+                      chunk_start: int, chunk_end: int) -> int:
+        """Aggregate one chunk of source candles into target candles missing from the table."""
+        cursor.execute("""
+            INSERT OR IGNORE INTO ohlcv_data
+            (symbol, timeframe, timestamp, open_price, high_price, low_price, close_price, volume)
+            SELECT symbol, ?, bucket, MIN(first_open), MAX(high_price), MIN(low_price),
+                   MIN(last_close), SUM(volume)
+            FROM (
+                SELECT symbol, timestamp - timestamp % ? AS bucket, high_price, low_price, volume,
+                       FIRST_VALUE(open_price) OVER bucket_window AS first_open,
+                       LAST_VALUE(close_price) OVER bucket_window AS last_close
+                FROM ohlcv_data
+                WHERE symbol = ? AND timeframe = ? AND timestamp >= ? AND timestamp < ?
+                WINDOW bucket_window AS (
+                    PARTITION BY timestamp - timestamp % ? ORDER BY timestamp
+                    ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                )
+            )
+            GROUP BY symbol, bucket
+        """, (target, target_step, symbol, timeframe, chunk_start, chunk_end, target_step))
+        return max(cursor.rowcount, 0)
+
+    def compact_realtime_prices(self, now: float, results: Dict[str, Any]):
+        """
+        Replace expired real-time prices with per-minute OHLC bars.
+
+        Chunks end on a minute boundary after at most batch_size rows, so each bar is
+        built from all of its ticks in one transaction.
+        """
+        cutoff = int(now) - int(self.policy['realtime_prices_days'] * DAY_SECONDS)
+        cutoff -= cutoff % 60
+
+        db = self.database_manager
+        while not self.stop_event.is_set():
+            with db.read_connection() as conn:
+                oldest = conn.execute("SELECT MIN(timestamp) FROM realtime_prices").fetchone()[0]
+                if oldest is None or oldest >= cutoff:
+                    return
+                boundary = conn.execute("""
+                    SELECT timestamp FROM realtime_prices
+                    WHERE timestamp >= ? ORDER BY timestamp LIMIT 1 OFFSET ?
+                """, (oldest, self.batch_size)).fetchone()
+
+            chunk_start = oldest - oldest % 60
+            chunk_end = cutoff
+            if boundary is not None:
+                chunk_end = min(cutoff, max(boundary[0] - boundary[0] % 60, chunk_start + 60))
+
+            with db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT OR IGNORE INTO realtime_price_bars
+                    (symbol, timestamp, open_price, high_price, low_price, close_price,
+                     volume_24h, samples)
+                    SELECT symbol, bucket, MIN(first_price), MAX(price), MIN(price),
+                           MIN(last_price), MIN(last_volume), COUNT(*)
+                    FROM (
+                        SELECT symbol, price, timestamp - timestamp % 60 AS bucket,
+                               FIRST_VALUE(price) OVER minute_window AS first_price,
+                               LAST_VALUE(price) OVER minute_window AS last_price,
+                               LAST_VALUE(volume_24h) OVER minute_window AS last_volume
+                        FROM realtime_prices
+                        WHERE timestamp >= ? AND timestamp < ?
+                        WINDOW minute_window AS (
+                            PARTITION BY symbol, timestamp - timestamp % 60 ORDER BY timestamp
+                            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                        )
+                    )
+                    GROUP BY symbol, bucket
+                """, (chunk_start, chunk_end))
+                results['price_bars_created'] += max(cursor.rowcount, 0)
+
+                cursor.execute("""
+                    DELETE FROM realtime_prices WHERE timestamp >= ? AND timestamp < ?
+                """, (chunk_start, chunk_end))
+                results['realtime_prices_deleted'] += cursor.rowcount
+                conn.commit()
+
+            self.stop_event.wait(self.policy['batch_pause_seconds'])
+
+    def delete_expired_rows(self, now: float, results: Dict[str, Any]):
+        """Delete expired per-minute price bars and trading history in batches."""
+        tables = [
+            ('realtime_price_bars', 'price_bars_deleted', self.policy.get('price_bar_days')),
+            ('trading_history', 'trading_history_deleted', self.policy.get('trading_history_days'))
+        ]
+        for table, result_key, days in tables:
+            if days:
+                results[result_key] += self._delete_in_batches(table, int(now) - int(days * DAY_SECONDS))
+
+    def _delete_in_batches(self, table: str, cutoff: int) -> int:
+        """Delete rows with timestamp < cutoff, batch_size rows per transaction."""
+        deleted = 0
+        while not self.stop_event.is_set():
+            with self.database_manager.get_connection() as conn:
+                cursor = conn.execute(f"""
+                    DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table} WHERE timestamp < ? LIMIT ?
+                    )
+                """, (cutoff, self.batch_size))
+                count = cursor.rowcount
+                conn.commit()
+
+            deleted += count
+            if count < self.batch_size:
+                break
+            self.stop_event.wait(self.policy['batch_pause_seconds'])
+        return deleted
+
+    def reclaim_space(self, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Return free pages to the file system without rewriting the database.
+
+        Needs auto_vacuum=INCREMENTAL, which new databases get at creation and older ones
+        after their next full VACUUM (optimize_database). Without it freed pages are
+        still reused by new inserts, so the file does not keep growing.
+
+        Args:
+            max_pages (Optional[int]): Pages to release (default: policy vacuum_pages)
+
+        Returns:
+            Dict[str, Any]: auto_vacuum mode and free pages before and after
+        """
+        max_pages = max_pages if max_pages is not None else int(self.policy['vacuum_pages'])
+
+        with self.database_manager.get_connection() as conn:
+            mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+            if mode == 2 and free_before and max_pages > 0:
+                # executescript steps the pragma to completion; execute() frees a single page
+                conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+
+            free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        return {
+            'auto_vacuum': {0: 'none', 1: 'full', 2: 'incremental'}.get(mode, str(mode)),
+            'free_pages_before': free_before,
+            'free_pages_after': free_after
+        }
+
+    def stop(self):
+        """Stop after the chunk currently being processed."""
+        self.stop_event.set()
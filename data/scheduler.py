@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from data.collector import RealTimeDataCollector
+from data.retention import RetentionManager
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -191,6 +192,9 @@ class DataCollectionScheduler:
         self.max_consecutive_failures = 3
         self.failure_backoff_multiplier = 2.0
 
+        # Tiered retention, created on the first daily cleanup
+        self.retention_manager: Optional[RetentionManager] = None
+
         # Market awareness
         self.respect_market_hours = False  # Set to True to reduce weekend collection
         self.volatility_multiplier = 1.0  # Adjust frequency based on market volatility
@@ -319,6 +323,10 @@ class DataCollectionScheduler:
         if self.scheduler_thread and self.scheduler_thread.is_alive():
             self.scheduler_thread.join(timeout=10)
 
+        # Interrupt a running retention pass between chunks
+        if self.retention_manager is not None:
+            self.retention_manager.stop()
+
         # Shutdown executor
         self.executor.shutdown(wait=True)
 
@@ -572,8 +580,14 @@ class DataCollectionScheduler:
         logger.info("Starting daily cleanup...")
 
         try:
-            # Clean old data (keep 30 days)
-            cleanup_results = self.collector.database_manager.cleanup_old_data(days=30)
+            # Roll up and expire old data per retention tier
+            if self.retention_manager is None:
+                policy = self.config.get('database', {}).get('retention')
+                collector_config = getattr(self.collector, 'config', None)
+                if policy is None and isinstance(collector_config, dict):
+                    policy = collector_config.get('database', {}).get('retention')
+                self.retention_manager = RetentionManager(self.collector.database_manager, policy=policy)
+            cleanup_results = self.retention_manager.run()
 
             # Clean execution history
             self._cleanup_execution_history(force=True)
@@ -8,7 +8,6 @@
 - 시스템 상태 관리
 """
 
-import sqlite3
 import threading
 import json
 from datetime import datetime, timedelta
@@ -17,6 +16,8 @@ import logging
 from contextlib import contextmanager
 from pathlib import Path
 
+from utils.sqlite_pool import SQLiteConnectionPool
+
 from .models import AutoTradingConfig, AutoTradingLog, AISignalLog, PerformanceData
 
 class AutoTradingDB:
@@ -39,6 +40,9 @@ class AutoTradingDB:
         # 데이터베이스 디렉토리 생성
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+        # WAL 튜닝 연결 풀 (쓰기 1개 + 읽기 전용 연결)
+        self.pool = SQLiteConnectionPool(db_path, max_readers=4)
+
         # 테이블 생성
         self._create_tables()
 
@@ -46,15 +50,19 @@ class AutoTradingDB:
 
     @contextmanager
     def get_connection(self):
-        """데이터베이스 연결 컨텍스트 매니저"""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+        """데이터베이스 쓰기 연결 컨텍스트 매니저 (커밋하지 않은 변경은 종료 시 롤백)"""
+        with self.pool.writer() as conn:
             yield conn
-        finally:
-            if conn:
-                conn.close()
+
+    @contextmanager
+    def read_connection(self):
+        """읽기 전용 연결 컨텍스트 매니저 (쓰기와 동시에 실행)"""
+        with self.pool.reader() as conn:
+            yield conn
+
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """연결 풀 대기 시간/사용률 지표"""
+        return self.pool.get_metrics()
 
     def _create_tables(self):
         """테이블 생성"""
@@ -205,7 +213,7 @@ class AutoTradingDB:
     def load_config(self, user_id: int = 1) -> Optional[AutoTradingConfig]:
         """자동매매 설정 로드"""
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -271,7 +279,7 @@ class AutoTradingDB:
                  level: str = None, component: str = None) -> List[AutoTradingLog]:
         """로그 조회"""
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 query = """
@@ -407,7 +415,7 @@ class AutoTradingDB:
                                days: int = 30) -> List[PerformanceData]:
         """성과 기록 조회"""
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 start_date = (datetime.now() - timedelta(days=days)).date()
@@ -455,7 +463,7 @@ class AutoTradingDB:
     def get_system_status(self) -> Dict[str, Dict[str, Any]]:
         """전체 시스템 상태 조회"""
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -507,7 +515,7 @@ class AutoTradingDB:
     def get_database_stats(self) -> Dict[str, Any]:
         """데이터베이스 통계"""
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
 
                 stats = {}
@@ -532,5 +540,5 @@ class AutoTradingDB:
 
     def close(self):
         """데이터베이스 연결 종료"""
-        # SQLite는 자동으로 연결이 닫히므로 특별한 처리 불필요
+        self.pool.close_all()
         self.logger.info("AutoTradingDB 종료")
\ No newline at end of file
@@ -11,6 +11,8 @@ import os
 import logging
 from typing import List, Optional, Dict, Any
 
+from utils.sqlite_pool import install_sqlalchemy_pragmas
+
 from .models import Base, User, ApiKey, TradingSettings, TradingSession, TradeHistory, NotificationSettings, UserSession
 
 # 로그 설정
@@ -29,6 +31,7 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        install_sqlalchemy_pragmas(self.engine)  # WAL, synchronous=NORMAL, mmap, cache
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
         # 데이터베이스 테이블 생성
@@ -171,47 +171,33 @@ class PerformanceValidator:
         try:
             print("[INFO] Simulating original AI system signals...")
 
-            signals = []
-            prices_pred = []
-            confidences = []
-
-            for i in range(50, len(df)):  # Start after enough data for indicators
-                try:
-                    current_data = df.iloc[i:i+1]
+            # Start after enough data for indicators
+            features = df.iloc[50:][feature_columns].values.astype(np.float64)
 
-                    # Prepare features
-                    features = current_data[feature_columns].values
+            signals = np.full(len(features), 'HOLD', dtype=object)
+            prices_pred = np.zeros(len(features))
+            confidences = np.zeros(len(features))
 
-                    # Check for NaN values
-                    if np.isnan(features).any():
-                        signals.append('HOLD')
-                        prices_pred.append(0.0)
-                        confidences.append(0.0)
-                        continue
+            # Rows with NaN (or other non-finite) values stay HOLD
+            valid = np.isfinite(features).all(axis=1)
 
-                    # Scale features
-                    features_scaled = scaler.transform(features)
+            if valid.any():
+                # Scale features and predict all rows at once
+                features_scaled = scaler.transform(features[valid])
 
-                    # Get predictions
-                    signal_pred = model_signal.predict(features_scaled)[0]
-                    signal_prob = model_signal.predict_proba(features_scaled)[0]
-                    price_pred = model_price.predict(features_scaled)[0]
+                signal_pred = model_signal.predict(features_scaled).astype(object)
+                signal_prob = model_signal.predict_proba(features_scaled)
+                price_pred = model_price.predict(features_scaled)
 
-                    # Calculate confidence (max probability)
-                    confidence = np.max(signal_prob)
+                # Calculate confidence (max probability)
+                confidence = np.max(signal_prob, axis=1)
 
-                    # Apply confidence threshold (similar to original system)
-                    if confidence < 0.6:
-                        signal_pred = 'HOLD'
+                # Apply confidence threshold (similar to original system)
+                signal_pred[confidence < 0.6] = 'HOLD'
 
-                    signals.append(signal_pred)
-                    prices_pred.append(price_pred)
-                    confidences.append(confidence)
-
-                except Exception as e:
-                    signals.append('HOLD')
-                    prices_pred.append(0.0)
-                    confidences.append(0.0)
+                signals[valid] = signal_pred
+                prices_pred[valid] = price_pred
+                confidences[valid] = confidence
 
             # Add results to dataframe
             df_result = df.iloc[50:].copy()
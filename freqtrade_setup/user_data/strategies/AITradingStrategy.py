@@ -224,40 +224,38 @@ class AITradingStrategy(IStrategy):
                 features_df = features_df.fillna(method='ffill').fillna(0)
 
                 # Initialize prediction columns
-                dataframe['ai_signal'] = 'HOLD'
-                dataframe['ai_confidence'] = 0.5
-                dataframe['ai_predicted_return'] = 0.0
-
-                # Make predictions for each row where we have enough history
-                for i in range(50, len(dataframe)):  # Need some history for features
-                    try:
-                        current_features = features_df.iloc[i:i+1]
-
-                        if not current_features.isna().any().any():
-                            # Scale features
-                            features_scaled = self.scaler.transform(current_features)
-
-                            # Predict signal
-                            signal_proba = self.model_signal.predict_proba(features_scaled)[0]
-                            signal_classes = self.model_signal.classes_
-                            signal_confidence = max(signal_proba)
-                            predicted_signal = signal_classes[np.argmax(signal_proba)]
-
-                            # Predict price movement
-                            predicted_return = self.model_price.predict(features_scaled)[0]
-
-                            # Apply confidence threshold
-                            if signal_confidence < self.signal_confidence_threshold:
-                                predicted_signal = 'HOLD'
-
-                            # Update dataframe
-                            dataframe.iloc[i, dataframe.columns.get_loc('ai_signal')] = predicted_signal
-                            dataframe.iloc[i, dataframe.columns.get_loc('ai_confidence')] = signal_confidence
-                            dataframe.iloc[i, dataframe.columns.get_loc('ai_predicted_return')] = predicted_return
-
-                    except Exception as e:
-                        # Skip this prediction if there's an error
-                        continue
+                ai_signal = np.full(len(dataframe), 'HOLD', dtype=object)
+                ai_confidence = np.full(len(dataframe), 0.5)
+                ai_predicted_return = np.zeros(len(dataframe))
+
+                # Predict every row with enough history in one batch; rows the scaler
+                # would reject (non-finite values) keep the defaults
+                valid = np.isfinite(features_df.to_numpy(dtype=np.float64)).all(axis=1)
+                valid[:50] = False  # Need some history for features
+
+                if valid.any():
+                    # Scale features
+                    features_scaled = self.scaler.transform(features_df[valid])
+
+                    # Predict signal
+                    signal_proba = self.model_signal.predict_proba(features_scaled)
+                    signal_confidence = signal_proba.max(axis=1)
+                    predicted_signal = self.model_signal.classes_[signal_proba.argmax(axis=1)].astype(object)
+
+                    # Predict price movement
+                    predicted_return = self.model_price.predict(features_scaled)
+
+                    # Apply confidence threshold
+                    predicted_signal[signal_confidence < self.signal_confidence_threshold] = 'HOLD'
+
+                    ai_signal[valid] = predicted_signal
+                    ai_confidence[valid] = signal_confidence
+                    ai_predicted_return[valid] = predicted_return
+
+                # Update dataframe
+                dataframe['ai_signal'] = ai_signal
+                dataframe['ai_confidence'] = ai_confidence
+                dataframe['ai_predicted_return'] = ai_predicted_return
 
         except Exception as e:
             print(f"[AI Strategy] Error in AI predictions: {e}")
@@ -138,7 +138,9 @@ class CryptoTradingBot:
 
             # Initialize database manager
             db_path = self.config['database']['path']
-            self.database_manager = CryptoDatabaseManager(db_path)
+            self.database_manager = CryptoDatabaseManager(
+                db_path, columnar_path=self.config['database'].get('columnar_path')
+            )
             self.database_manager.initialize_database()
             print(f"{Fore.GREEN}[OK] Database initialized: {db_path}")
 
@@ -4,12 +4,13 @@ Web Dashboard Notification System for Crypto Trader Pro
 """
 
 import json
-import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 import logging
 import os
 
+from utils.sqlite_pool import SQLiteConnectionPool
+
 from .base_notifier import BaseNotifier, NotificationMessage, NotificationType
 
 logger = logging.getLogger(__name__)
@@ -23,13 +24,16 @@ class WebNotifier(BaseNotifier):
         self.max_notifications = config.get('max_notifications', 100)
         self.retention_days = config.get('retention_days', 30)
 
+        # WAL 튜닝 연결 풀 (쓰기 1개 + 읽기 전용 연결)
+        self.pool = SQLiteConnectionPool(self.db_path, max_readers=2)
+
         # 알림 테이블 생성
         self._create_notification_table()
 
     def _create_notification_table(self):
         """웹 알림 테이블 생성"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS web_notifications (
@@ -83,7 +87,7 @@ class WebNotifier(BaseNotifier):
     def _store_notification(self, message: NotificationMessage) -> bool:
         """알림을 데이터베이스에 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
 
                 data_json = json.dumps(message.data) if message.data else None
@@ -118,8 +122,7 @@ class WebNotifier(BaseNotifier):
     ) -> List[Dict[str, Any]]:
         """사용자 알림 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
 
                 # 쿼리 조건 구성
@@ -164,7 +167,7 @@ class WebNotifier(BaseNotifier):
     def mark_as_read(self, user_id: int, notification_ids: List[int]) -> bool:
         """알림을 읽음으로 표시"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
 
                 # 여러 ID를 한번에 처리
@@ -186,7 +189,7 @@ class WebNotifier(BaseNotifier):
     def mark_all_as_read(self, user_id: int) -> bool:
         """모든 알림을 읽음으로 표시"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -208,7 +211,7 @@ class WebNotifier(BaseNotifier):
     def delete_notification(self, user_id: int, notification_id: int) -> bool:
         """알림 삭제"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -231,7 +234,7 @@ class WebNotifier(BaseNotifier):
     def get_unread_count(self, user_id: int) -> int:
         """읽지 않은 알림 개수"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -249,7 +252,7 @@ class WebNotifier(BaseNotifier):
     def _cleanup_old_notifications(self, user_id: int):
         """오래된 알림 정리"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
 
                 # 보존 기간 초과된 알림 삭제
@@ -278,7 +281,7 @@ class WebNotifier(BaseNotifier):
     def get_notification_stats(self, user_id: int) -> Dict[str, Any]:
         """알림 통계 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
 
                 # 전체 통계
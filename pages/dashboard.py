@@ -304,25 +304,28 @@ def render_account_status(user_data: dict):
 def show_current_prices(symbols: list):
     """실시간 가격 정보 표시"""
     try:
-        from binance_testnet_connector import BinanceTestnetConnector
-
-        connector = BinanceTestnetConnector()
+        from data.kline_service import get_kline_service
 
         st.markdown("#### 📊 실시간 시장 가격")
 
-        for symbol in symbols:
-            try:
-                price_result = connector.get_current_price(symbol)
-                if price_result and price_result.get('success'):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"**{symbol}**")
-                    with col2:
-                        st.write(f"${price_result['price']:,.2f}")
-                else:
-                    st.warning(f"⚠️ {symbol} 가격 조회 실패")
-            except Exception as e:
-                st.error(f"{symbol} 가격 조회 오류: {e}")
+        # 'BTCUSDT' 형식도 'BTC/USDT' 로 변환 (공유 서비스는 ccxt 심볼 사용)
+        pairs = {
+            symbol: symbol if '/' in symbol or not symbol.endswith('USDT') else f"{symbol[:-4]}/USDT"
+            for symbol in symbols
+        }
+
+        # 수집기가 저장한 최신 가격 우선, 없으면 일괄 시세 1회 조회
+        prices = get_kline_service().get_latest_prices(list(pairs.values()))
+
+        for symbol, pair in pairs.items():
+            if pair in prices:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**{symbol}**")
+                with col2:
+                    st.write(f"${prices[pair]:,.2f}")
+            else:
+                st.warning(f"⚠️ {symbol} 가격 조회 실패")
 
     except Exception as e:
         st.error(f"가격 조회 시스템 오류: {e}")
@@ -420,6 +423,74 @@ def render_quick_actions(user_id: int):
     if st.button("🔄 설정 새로고침", use_container_width=True):
         st.rerun()
 
+
+@st.cache_data(ttl=15, show_spinner=False)
+def load_account_snapshot(user_id: int, api_key: str, _api_secret: str):
+    """
+    USDT 환산 계좌 스냅샷 조회 (사용자별 15초 캐시)
+
+    Streamlit은 상호작용마다 페이지를 재실행하므로, 캐시된 스냅샷을 재사용하여
+    계좌/가격 서명 요청이 매번 반복되지 않도록 함. 조회 실패 시 None
+    """
+    from binance_testnet_connector import BinanceTestnetConnector
+
+    connector = BinanceTestnetConnector()
+    connector.api_key = api_key
+    connector.secret_key = _api_secret
+    connector.session.headers.update({'X-MBX-APIKEY': api_key})
+
+    logger.info(f"API 연결 시도 - user_id: {user_id}, testnet: True")
+    account_result = connector.get_account_info()
+
+    if account_result and account_result.get('success'):
+        balances = account_result.get('balances', [])
+        logger.info(f"계좌 정보 조회 성공 - 자산 수: {len(balances)}")
+
+        # 모든 자산을 USDT 기준으로 계산
+        total_usdt_value = 0.0
+        free_usdt_value = 0.0
+        locked_usdt_value = 0.0
+
+        for balance in balances:
+            asset = balance['asset']
+            total = balance['total']
+            free = balance['free']
+            locked = balance['locked']
+
+            if total > 0:  # 잔고가 있는 자산만 처리
+                if asset == 'USDT':
+                    # USDT는 1:1 비율
+                    total_usdt_value += total
+                    free_usdt_value += free
+                    locked_usdt_value += locked
+                    logger.info(f"USDT 잔고: {total}")
+                else:
+                    # 다른 암호화폐는 USDT로 환산
+                    try:
+                        symbol = f"{asset}USDT"
+                        price_result = connector.get_current_price(symbol)
+                        if price_result and price_result.get('success'):
+                            current_price = price_result['price']
+                            asset_usdt_value = total * current_price
+                            total_usdt_value += asset_usdt_value
+                            free_usdt_value += free * current_price
+                            locked_usdt_value += locked * current_price
+                            logger.info(f"{asset} 환산: {total} * {current_price} = {asset_usdt_value} USDT")
+                    except Exception as price_error:
+                        logger.warning(f"{asset} 가격 조회 실패: {price_error}")
+
+        return {
+            'total': total_usdt_value,
+            'free': free_usdt_value,
+            'locked': locked_usdt_value,
+            'asset_breakdown': balances  # 원본 자산 정보 보관
+        }
+    else:
+        error_msg = account_result.get('error', '알 수 없는 오류') if account_result else 'API 응답 없음'
+        logger.error(f"계좌 정보 조회 실패: {error_msg}")
+        return None
+
+
 def load_user_data(user_id: int) -> dict:
     """사용자 데이터 로드 - 실제 API 연동"""
     try:
@@ -446,66 +517,9 @@ def load_user_data(user_id: int) -> dict:
                 else:
                     api_key, api_secret = credentials
 
-                    # 실제 계좌 정보 조회
-                    from binance_testnet_connector import BinanceTestnetConnector
-
-                    connector = BinanceTestnetConnector()
-                    connector.api_key = api_key
-                    connector.secret_key = api_secret
-                    connector.session.headers.update({'X-MBX-APIKEY': api_key})
-
-                    logger.info(f"API 연결 시도 - user_id: {user_id}, testnet: True")
-                    account_result = connector.get_account_info()
-
-                    if account_result and account_result.get('success'):
-                        api_status['connected'] = True
-                        balances = account_result.get('balances', [])
-                        logger.info(f"계좌 정보 조회 성공 - 자산 수: {len(balances)}")
-
-                        # 모든 자산을 USDT 기준으로 계산
-                        total_usdt_value = 0.0
-                        free_usdt_value = 0.0
-                        locked_usdt_value = 0.0
-
-                        for balance in balances:
-                            asset = balance['asset']
-                            total = balance['total']
-                            free = balance['free']
-                            locked = balance['locked']
-
-                            if total > 0:  # 잔고가 있는 자산만 처리
-                                if asset == 'USDT':
-                                    # USDT는 1:1 비율
-                                    total_usdt_value += total
-                                    free_usdt_value += free
-                                    locked_usdt_value += locked
-                                    logger.info(f"USDT 잔고: {total}")
-                                else:
-                                    # 다른 암호화폐는 USDT로 환산
-                                    try:
-                                        symbol = f"{asset}USDT"
-                                        price_result = connector.get_current_price(symbol)
-                                        if price_result and price_result.get('success'):
-                                            current_price = price_result['price']
-                                            asset_usdt_value = total * current_price
-                                            total_usdt_value += asset_usdt_value
-                                            free_usdt_value += free * current_price
-                                            locked_usdt_value += locked * current_price
-                                            logger.info(f"{asset} 환산: {total} * {current_price} = {asset_usdt_value} USDT")
-                                    except Exception as price_error:
-                                        logger.warning(f"{asset} 가격 조회 실패: {price_error}")
-
-                        real_balance_data = {
-                            'total': total_usdt_value,
-                            'free': free_usdt_value,
-                            'locked': locked_usdt_value,
-                            'asset_breakdown': balances  # 원본 자산 정보 보관
-                        }
-                        logger.info(f"총 USDT 환산 자산: {total_usdt_value}")
-                    else:
-                        error_msg = account_result.get('error', '알 수 없는 오류') if account_result else 'API 응답 없음'
-                        logger.error(f"계좌 정보 조회 실패: {error_msg}")
-                        api_status['connected'] = False
+                    # 계좌 스냅샷 조회 (짧은 TTL 캐시로 재실행마다 서명 요청 반복 방지)
+                    real_balance_data = load_account_snapshot(user_id, api_key, api_secret)
+                    api_status['connected'] = real_balance_data is not None
 
             except Exception as e:
                 logger.error(f"API 연결 중 예외 발생 - user_id: {user_id}, error: {e}")
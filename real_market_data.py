@@ -11,6 +11,8 @@ from datetime import datetime, timedelta
 import time
 import ccxt
 
+from data.kline_service import get_kline_service
+
 class RealMarketDataFetcher:
     """실시간 시장 데이터 조회 클래스"""
 
@@ -72,17 +74,13 @@ class RealMarketDataFetcher:
             return None
 
     def get_real_ohlcv_data(self, symbol, timeframe='1h', limit=100):
-        """실시간 OHLCV 데이터 조회"""
+        """실시간 OHLCV 데이터 조회 (로컬 저장소 우선, 부족한 최신 구간만 거래소 조회)"""
         try:
-            # Binance에서 OHLCV 데이터 조회
-            if symbol.upper() == 'BTC':
-                pair = 'BTC/USDT'
-            elif symbol.upper() == 'ETH':
-                pair = 'ETH/USDT'
-            else:
-                return None
+            # 'BTC' 와 'BTC/USDT' 형식 모두 지원
+            pair = symbol.upper() if '/' in symbol else f"{symbol.upper()}/USDT"
 
-            ohlcv = self.binance.fetch_ohlcv(pair, timeframe, limit=limit)
+            # AI 신호는 메인넷 캔들 기준 (테스트넷 설정과 무관)
+            ohlcv = get_kline_service(testnet=False).get_klines(pair, timeframe, limit=limit)
 
             # DataFrame으로 변환
             df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
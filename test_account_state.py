@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the shared futures account snapshot.
+Runs AccountStateService against a counting fake client: concurrent readers
+sharing one refresh, user data stream merges, REST-age based freshness, and the
+client registry keeping a pinned user's snapshot shared past the idle TTL.
+"""
+
+import sys
+import os
+import asyncio
+from types import SimpleNamespace
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from app.services.account_state import AccountStateService
+from app.services.client_registry import ExchangeClientRegistry
+from testkit import ScriptTestRunner
+
+
+class FakeFuturesClient:
+    """get_account_info/get_positions with a request counter and a slow response"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self.wallet = 1000.0
+        self.positions = [{
+            "symbol": "BTCUSDT", "position_amt": 0.01, "unrealized_pnl": 5.0,
+            "mark_price": 50500.0, "liquidation_price": 40000.0, "notional": 505.0
+        }]
+
+    async def get_account_info(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"success": True, "data": {
+            "total_wallet_balance": self.wallet,
+            "total_unrealized_pnl": sum(p["unrealized_pnl"] for p in self.positions),
+            "total_maint_margin": 2.5,
+            "balances": [{"asset": "USDT", "wallet_balance": self.wallet}]
+        }}
+
+    async def get_positions(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"success": True, "data": [dict(p) for p in self.positions]}
+
+
+async def check_shared_refresh() -> str:
+    """Concurrent readers of a stale snapshot share one request pair"""
+    client = FakeFuturesClient()
+    state = AccountStateService(client)
+
+    snapshots = await asyncio.gather(*(state.get_snapshot() for _ in range(10)))
+    assert client.calls == 2, f"{client.calls} requests for 10 readers"
+    assert len({s.version for s in snapshots}) == 1, "readers got different snapshots"
+    assert state.stats["shared_refreshes"] == 9
+
+    await state.get_snapshot()
+    assert client.calls == 2, "fresh snapshot refreshed again"
+    return f"{state.stats['refreshes']} refresh"
+
+
+async def check_stream_merge() -> str:
+    """ACCOUNT_UPDATE merges balances/positions and keeps REST-only fields"""
+    client = FakeFuturesClient()
+    state = AccountStateService(client)
+    rest = await state.refresh()
+
+    await state.apply_account_update({
+        "balances": {"USDT": {"wallet_balance": 1200.0}},
+        "changed_positions": [{"symbol": "BTCUSDT", "position_amt": 0.02, "unrealized_pnl": 12.0}]
+    })
+    merged = state.snapshot
+    assert merged.version == rest.version + 1 and merged.source == "stream"
+    assert merged.account["total_wallet_balance"] == 1200.0
+    assert merged.account["balances"][0]["wallet_balance"] == 1200.0
+    assert merged.account["total_unrealized_pnl"] == 12.0
+    assert merged.account["total_margin_balance"] == 1212.0
+    assert merged.account["total_maint_margin"] == 2.5, "REST-only account field lost"
+    (position,) = merged.positions
+    assert position["position_amt"] == 0.02 and position["mark_price"] == 50500.0
+    assert client.calls == 2, "known position triggered a REST refresh"
+
+    # 처음 보는 포지션은 REST 전용 필드가 없으므로 백그라운드 새로고침
+    await state.apply_account_update({
+        "changed_positions": [{"symbol": "ETHUSDT", "position_amt": 1.0, "unrealized_pnl": 0.0}]
+    })
+    assert {p["symbol"] for p in state.snapshot.positions} == {"BTCUSDT", "ETHUSDT"}
+    await state._refresh_task
+    assert client.calls == 4 and state.snapshot.source == "rest"
+
+    # 청산된 포지션은 제거
+    await state.apply_account_update({
+        "changed_positions": [{"symbol": "BTCUSDT", "position_amt": 0, "unrealized_pnl": 0.0}]
+    })
+    assert "BTCUSDT" not in {p["symbol"] for p in state.snapshot.positions}
+    return f"v{state.snapshot.version}"
+
+
+async def check_rest_age_freshness() -> str:
+    """Stream updates do not make a snapshot with old REST data look fresh"""
+    client = FakeFuturesClient(delay=0)
+    state = AccountStateService(client, max_age=0.2)
+    await state.refresh()
+
+    await asyncio.sleep(0.3)
+    await state.apply_account_update({"balances": {"USDT": {"wallet_balance": 900.0}}})
+    snapshot = state.snapshot
+    assert snapshot.age < 0.1 and snapshot.rest_age >= 0.3, "stream merge reset the REST age"
+
+    refreshed = await state.get_snapshot()
+    assert client.calls == 4, "snapshot with stale REST fields served as fresh"
+    assert refreshed.source == "rest" and refreshed.rest_age < 0.1
+
+    # 새로고침 실패 시 이전 스냅샷 제공
+    async def failing():
+        return {"success": False, "error": "down"}
+    client.get_account_info = failing
+    await asyncio.sleep(0.3)
+    served = await state.get_snapshot()
+    assert served is refreshed and state.stats["errors"] == 1
+    return f"rest_age {served.rest_age:.2f}s"
+
+
+async def check_registry_pin() -> str:
+    """A pinned user keeps one account state past the idle TTL until the keys change"""
+    registry = ExchangeClientRegistry(idle_ttl=0.05, sweep_interval=0)
+    user = SimpleNamespace(id=1, binance_api_key="key", binance_api_secret="secret", use_testnet=False)
+    other = SimpleNamespace(id=2, binance_api_key="key2", binance_api_secret="secret2", use_testnet=False)
+    invalidated = []
+    registry.add_invalidation_listener(invalidated.append)
+
+    state = registry.get_account_state(user)
+    assert registry.get_account_state(user) is state
+    registry.pin_user(user.id)
+
+    await asyncio.sleep(0.1)
+    registry.get_futures_client(other)  # 스윕 실행
+    assert registry.get_account_state(user) is state, "pinned account state evicted when idle"
+    assert registry.get_futures_client(user) is state.client, "pinned futures client evicted when idle"
+
+    await asyncio.sleep(0.1)
+    registry.get_futures_client(user)
+    assert (("futures", 2) not in {k[:2] for k in registry._clients}), "unpinned client survived the idle TTL"
+
+    registry.invalidate_user(user.id)
+    assert invalidated == [user.id], "listener not told about the key change"
+    assert user.id not in registry._pinned, "invalidated user still pinned"
+    assert registry.get_account_state(user) is not state
+
+    # 키가 바뀐 채로 요청이 들어와도 이전 키 클라이언트 폐기를 알림
+    user.binance_api_key = "new-key"
+    registry.get_futures_client(user)
+    assert invalidated == [user.id, user.id]
+    return f"{registry.get_stats()['invalidated']} invalidated"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("ACCOUNT STATE TESTS")
+    runner.run_test(check_shared_refresh, "Shared refresh")
+    runner.run_test(check_stream_merge, "Stream merge")
+    runner.run_test(check_rest_age_freshness, "REST-age freshness")
+    runner.run_test(check_registry_pin, "Registry pin and invalidation")
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the async Binance REST clients.
+Runs BinanceClient and BinanceFuturesClient against the local MockExchangeServer:
+HMAC request signing, API key/signature rejections and request weight accounting.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from app.services.async_binance import (
+    AsyncBinanceREST, ENDPOINT_WEIGHTS, FUTURES_WEIGHT_PER_MINUTE, close_http_client
+)
+from app.services.binance_client import BinanceClient
+from app.services.binance_futures_client import BinanceFuturesClient
+from app.services.mock_exchange import MockExchangeServer
+from testkit import ScriptTestRunner
+
+API_KEY = "mock-api-key"
+API_SECRET = "mock-api-secret"
+
+
+async def with_server(check):
+    server = MockExchangeServer(api_key=API_KEY, api_secret=API_SECRET)
+    base_url = await server.start()
+    try:
+        return await check(server, base_url)
+    finally:
+        await server.stop()
+        await close_http_client()
+
+
+async def check_signature_vector(server, base_url) -> str:
+    """_sign matches the HMAC-SHA256 example of the Binance API docs"""
+    rest = AsyncBinanceREST(API_KEY, "NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j",
+                            base_url, max_weight_per_minute=1200)
+    query = ("symbol=LTCBTC&side=BUY&type=LIMIT&timeInForce=GTC&quantity=1&price=0.1"
+             "&recvWindow=5000&timestamp=1499827319559")
+    signature = rest._sign(query)
+    assert signature == "c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71", signature
+    return "docs vector"
+
+
+async def check_signed_requests(server, base_url) -> str:
+    """Signed spot and futures requests are accepted and round-trip orders"""
+    spot = BinanceClient(API_KEY, API_SECRET, base_url=base_url)
+    futures = BinanceFuturesClient(API_KEY, API_SECRET, base_url=base_url)
+
+    connection = await spot.test_connection()
+    assert connection["success"], connection
+    account = await futures.get_account_info()
+    assert account["success"] and account["data"]["total_wallet_balance"] == 10000.0, account
+
+    placed = await futures.place_order("BTCUSDT", "SELL", "LIMIT", quantity=0.01, price=60000)
+    assert placed["success"], placed
+    order_id = placed["data"]["order_id"]
+    status = await futures.get_order_status("BTCUSDT", order_id)
+    assert status["success"] and status["data"]["status"] == "NEW", status
+    cancelled = await futures.cancel_order("BTCUSDT", order_id)
+    assert cancelled["success"], cancelled
+    assert server.orders[order_id]["status"] == "CANCELED"
+
+    assert server.stats["rejected"] == 0, f"{server.stats['rejected']} requests rejected"
+    return f"{server.stats['requests']} requests"
+
+
+async def check_bad_signature(server, base_url) -> str:
+    """A wrong secret is rejected with -1022, a wrong key with -2015"""
+    spot = BinanceClient(API_KEY, "wrong-secret", base_url=base_url)
+    result = await spot.test_connection()
+    assert not result["success"] and result["error_code"] == -1022, result
+
+    futures = BinanceFuturesClient(API_KEY, "wrong-secret", base_url=base_url)
+    result = await futures.test_connection()
+    assert not result["success"] and result["error_code"] == -1022, result
+    account = await futures.get_account_info()
+    assert not account["success"] and "-1022" in account["error"], account
+
+    result = await BinanceFuturesClient("wrong-key", API_SECRET, base_url=base_url).test_connection()
+    assert not result["success"] and result["error_code"] == -2015, result
+
+    assert server.stats["rejected"] == 4, f"{server.stats['rejected']} rejected"
+    return "-1022/-2015"
+
+
+async def check_weight_accounting(server, base_url) -> str:
+    """Clients of one host share a weight budget that matches the server's count"""
+    spot = BinanceClient(API_KEY, API_SECRET, base_url=base_url)
+    futures = BinanceFuturesClient(API_KEY, API_SECRET, base_url=base_url)
+
+    await futures.get_account_info()
+    await futures.get_positions()
+    await futures.get_ticker_price("BTCUSDT")
+    await spot.get_ticker_prices()
+
+    expected = (ENDPOINT_WEIGHTS[("GET", "/fapi/v2/account")][1] +
+                ENDPOINT_WEIGHTS[("GET", "/fapi/v2/positionRisk")][1] +
+                ENDPOINT_WEIGHTS[("GET", "/fapi/v1/ticker/price")][0] +
+                ENDPOINT_WEIGHTS[("GET", "/api/v3/ticker/price")][1])
+
+    stats = futures.client.get_weight_stats()
+    assert stats == spot.client.get_weight_stats(), "clients do not share the budget"
+    assert stats["weight"] == expected, f"local weight {stats['weight']} != {expected}"
+    assert stats["used_weight_1m"] == server.used_weight() == expected, \
+        f"used weight {stats['used_weight_1m']} != server {server.used_weight()}"
+    assert stats["max_weight_per_minute"] == FUTURES_WEIGHT_PER_MINUTE
+    return f"{expected} weight"
+
+
+async def check_weight_budget_waits(server, base_url) -> str:
+    """A request that does not fit into the budget waits instead of being sent"""
+    rest = AsyncBinanceREST(API_KEY, API_SECRET, base_url, max_weight_per_minute=10)
+    await rest.futures_account()  # 5
+    await rest.futures_position_information()  # 5
+    sent = server.stats["requests"]
+
+    try:
+        await asyncio.wait_for(rest.futures_account(), 0.3)
+        raise AssertionError("request over budget was sent immediately")
+    except asyncio.TimeoutError:
+        pass
+
+    assert server.stats["requests"] == sent, "request over budget reached the server"
+    assert rest.get_weight_stats()["waits"] >= 1
+    return "blocked at 10/10"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("ASYNC BINANCE CLIENT TESTS")
+    runner.run_test(with_server, "HMAC signature vector", check_signature_vector)
+    runner.run_test(with_server, "Signed spot/futures requests", check_signed_requests)
+    runner.run_test(with_server, "Bad signature / API key", check_bad_signature)
+    runner.run_test(with_server, "Shared weight accounting", check_weight_accounting)
+    runner.run_test(with_server, "Weight budget wait", check_weight_budget_waits)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
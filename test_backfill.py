@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the historical backfill planner.
+Checks gap merging, page boundaries, checkpoint resume after an interrupted
+run and the rejection of calendar-month candles, using a fake exchange and
+database.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.backfill import (
+    HistoricalBackfillEngine, BackfillCheckpoint, merge_gap_ranges, plan_pages, timeframe_to_ms
+)
+from testkit import ScriptTestRunner
+
+MINUTE = 60_000
+START_MS = 1_672_531_200_000  # 2023-01-01 00:00 UTC
+
+
+class FakeCollector:
+    """get_klines over a continuous 1m history; optionally stops the engine after N pages"""
+
+    def __init__(self, stop_after=None):
+        self.stop_after = stop_after
+        self.engine = None
+        self.requests = []
+
+    def get_klines(self, symbol, interval, limit, since, end_time):
+        self.requests.append((since, end_time))
+        step = timeframe_to_ms(interval)
+        candles = [[t, 1.0, 1.0, 1.0, 1.0, 1.0] for t in range(since, end_time + 1, step)][:limit]
+        if self.stop_after is not None and len(self.requests) >= self.stop_after:
+            self.engine.stop()
+        return candles
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.timestamps = set()
+
+    def insert_ohlcv_data(self, symbol, timeframe, candles):
+        before = len(self.timestamps)
+        self.timestamps.update(candle[0] for candle in candles)
+        return len(self.timestamps) - before
+
+
+def check_merge_gap_ranges() -> str:
+    """Overlapping, adjacent and nearby gaps merge; reversed ranges are ignored"""
+    gaps = [
+        (START_MS + 50 * MINUTE, START_MS + 60 * MINUTE),
+        (START_MS, START_MS + 10 * MINUTE),
+        (START_MS + 5 * MINUTE, START_MS + 12 * MINUTE),   # overlaps the first
+        (START_MS + 13 * MINUTE, START_MS + 20 * MINUTE),  # adjacent candle
+        (START_MS + 40 * MINUTE, START_MS + 30 * MINUTE),  # end before start
+    ]
+    assert merge_gap_ranges(gaps, MINUTE) == [
+        (START_MS, START_MS + 20 * MINUTE),
+        (START_MS + 50 * MINUTE, START_MS + 60 * MINUTE),
+    ]
+
+    # 29 stored candles between the ranges: bridged only when allowed
+    assert len(merge_gap_ranges(gaps, MINUTE, max_bridge_candles=28)) == 2
+    assert merge_gap_ranges(gaps, MINUTE, max_bridge_candles=29) == [(START_MS, START_MS + 60 * MINUTE)]
+    assert merge_gap_ranges([], MINUTE) == []
+    return "merged and bridged"
+
+
+def check_plan_pages() -> str:
+    """Pages are candle-aligned, contiguous, at most page_limit candles and stop at end"""
+    start = START_MS + 30_000  # mid-candle
+    end = START_MS + 2_499 * MINUTE
+    pages = plan_pages(start, end, MINUTE, 1000)
+
+    assert pages == [
+        (START_MS, START_MS + 999 * MINUTE),
+        (START_MS + 1000 * MINUTE, START_MS + 1999 * MINUTE),
+        (START_MS + 2000 * MINUTE, end),
+    ], pages
+    for (_, first_end), (second_since, _) in zip(pages, pages[1:]):
+        assert second_since - first_end == MINUTE, "pages overlap or leave a candle out"
+
+    assert plan_pages(START_MS, START_MS, MINUTE, 1000) == [(START_MS, START_MS)]
+    assert plan_pages(START_MS, START_MS + 999 * MINUTE, MINUTE, 1000) == [(START_MS, START_MS + 999 * MINUTE)]
+    assert plan_pages(START_MS + MINUTE, START_MS, MINUTE, 1000) == []
+    return f"{len(pages)} pages"
+
+
+def check_checkpoint_resume() -> str:
+    """An interrupted backfill resumes with exactly the pages it did not finish"""
+    end = START_MS + 20 * 100 * MINUTE - MINUTE  # 20 pages of 100 candles
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'checkpoint.json')
+        db = FakeDatabase()
+
+        collector = FakeCollector(stop_after=5)
+        engine = HistoricalBackfillEngine(collector, db, page_limit=100, max_workers=1,
+                                          checkpoint_path=path, checkpoint_every=100)
+        collector.engine = engine
+        first = engine.backfill('BTC/USDT', '1m', START_MS, end)
+        assert first['pages_planned'] == 20
+        assert 0 < first['pages_fetched'] < 20, f"{first['pages_fetched']} pages before the stop"
+
+        # 저장된 체크포인트로 새 엔진이 이어서 진행
+        checkpoint = BackfillCheckpoint(path)
+        done = [page for page in plan_pages(START_MS, end, MINUTE, 100)
+                if checkpoint.is_done('BTC/USDT', '1m', *page)]
+        assert len(done) == first['pages_fetched'], "checkpoint does not match the fetched pages"
+
+        collector = FakeCollector()
+        engine = HistoricalBackfillEngine(collector, db, page_limit=100, max_workers=4, checkpoint_path=path)
+        second = engine.backfill('BTC/USDT', '1m', START_MS, end)
+        assert second['pages_planned'] == 20 - len(done), f"{second['pages_planned']} pages re-planned"
+        assert not set(collector.requests) & set(done), "finished page fetched again"
+        assert len(db.timestamps) == 2000, f"{len(db.timestamps)} of 2000 candles stored"
+
+        third = HistoricalBackfillEngine(FakeCollector(), db, page_limit=100, checkpoint_path=path) \
+            .backfill('BTC/USDT', '1m', START_MS, end)
+        assert third['pages_planned'] == 0, "completed range planned again"
+        return f"{first['pages_fetched']} + {second['pages_fetched']} pages"
+
+
+def check_calendar_month_rejected() -> str:
+    """'1M' candles cannot be paged by a fixed spacing and fail without requests"""
+    collector = FakeCollector()
+    engine = HistoricalBackfillEngine(collector, FakeDatabase())
+    results = engine.run({
+        ('BTC/USDT', '1M'): [(START_MS, START_MS + 365 * 24 * 60 * MINUTE)],
+        ('BTC/USDT', '1h'): [(START_MS, START_MS + 10 * 60 * MINUTE)],
+    })
+
+    assert results['failed_series'] == [('BTC/USDT', '1M')], results['failed_series']
+    assert results['pages_fetched'] == 1 and results['records_inserted'] == 11
+    assert all(end - since < 30 * 24 * 60 * MINUTE for since, end in collector.requests), "1M page requested"
+
+    only_month = engine.run({('ETH/USDT', '1M'): [(START_MS, START_MS + MINUTE)]})
+    assert only_month['failed_series'] == [('ETH/USDT', '1M')] and only_month['pages_planned'] == 0
+    return "1M rejected"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("BACKFILL PLANNER TESTS")
+    runner.run_test(check_merge_gap_ranges, "Gap merging")
+    runner.run_test(check_plan_pages, "Page boundaries")
+    runner.run_test(check_checkpoint_resume, "Checkpoint resume")
+    runner.run_test(check_calendar_month_rejected, "Calendar month rejected")
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the columnar OHLCV tier.
+Checks that write_batch mirrors candles into the series files, that a series
+predating the tier is rebuilt on first read, and that a rebuild racing a
+concurrent write keeps the candles committed after its SQLite snapshot.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.database import CryptoDatabaseManager
+from testkit import ScriptTestRunner
+
+SYMBOL = 'BTC/USDT'
+START_MS = 1700000000000 // 60000 * 60000
+
+
+def make_candles(count: int, offset: int = 0, base: float = 100.0):
+    """count consecutive valid 1m candles starting offset minutes after START_MS"""
+    return [
+        [START_MS + (offset + i) * 60000, base + i, (base + i) * 1.01, (base + i) * 0.99, base + i, 10.0]
+        for i in range(count)
+    ]
+
+
+def sqlite_timestamps(db: CryptoDatabaseManager):
+    with db.read_connection() as conn:
+        rows = conn.execute("SELECT timestamp FROM ohlcv_data WHERE symbol = ? AND timeframe = '1m' "
+                            "ORDER BY timestamp", (SYMBOL,)).fetchall()
+    return [row[0] for row in rows]
+
+
+def check_write_mirrors(tmp: str) -> str:
+    """Appended, overlapping and out-of-order batches end up identical to SQLite"""
+    db = CryptoDatabaseManager(db_path=os.path.join(tmp, "mirror.db"), columnar_path=os.path.join(tmp, "mirror"))
+    try:
+        db.store_ohlcv_data(SYMBOL, '1m', make_candles(100))
+        db.store_ohlcv_data(SYMBOL, '1m', make_candles(50, offset=100))   # append
+        db.store_ohlcv_data(SYMBOL, '1m', make_candles(40, offset=130))   # overlap
+        db.store_ohlcv_data(SYMBOL, '1m', make_candles(10, offset=-10))   # older candles
+
+        array = db.get_ohlcv_array(SYMBOL, '1m')
+        assert list(array['timestamp']) == sqlite_timestamps(db), "columnar series differs from SQLite"
+        assert len(array) == 180, f"{len(array)} candles"
+        assert np.all(np.diff(array['timestamp']) > 0), "series not sorted or has duplicates"
+
+        window = db.get_ohlcv_array(SYMBOL, '1m', START_MS, START_MS + 9 * 60000)
+        assert len(window) == 10 and window['close'][0] == 100.0
+        return f"{len(array)} candles"
+    finally:
+        db.close()
+
+
+def check_rebuild_on_read(tmp: str) -> str:
+    """A series written before the tier was enabled is rebuilt from SQLite on first read"""
+    db_path = os.path.join(tmp, "legacy.db")
+    db = CryptoDatabaseManager(db_path=db_path)
+    db.store_ohlcv_data(SYMBOL, '1m', make_candles(300))
+    db.close()
+
+    db = CryptoDatabaseManager(db_path=db_path, columnar_path=os.path.join(tmp, "legacy"))
+    try:
+        assert not db.columnar_store.has_series(SYMBOL, '1m')
+        array = db.get_ohlcv_array(SYMBOL, '1m')
+        assert len(array) == 300 and db.columnar_store.has_series(SYMBOL, '1m')
+
+        # 재구성된 파일 뒤로 새 캔들이 이어서 붙음
+        db.store_ohlcv_data(SYMBOL, '1m', make_candles(5, offset=300))
+        assert list(db.get_ohlcv_array(SYMBOL, '1m')['timestamp']) == sqlite_timestamps(db)
+        return f"{len(array)} candles rebuilt"
+    finally:
+        db.close()
+
+
+def check_rebuild_keeps_concurrent_write(tmp: str) -> str:
+    """Candles committed between a rebuild's SQLite read and its replace are not lost"""
+    db_path = os.path.join(tmp, "race.db")
+    db = CryptoDatabaseManager(db_path=db_path)
+    db.store_ohlcv_data(SYMBOL, '1m', make_candles(100))
+    db.close()
+
+    db = CryptoDatabaseManager(db_path=db_path, columnar_path=os.path.join(tmp, "race"))
+    store = db.columnar_store
+    to_records = store.to_records
+    writer = threading.Thread(target=db.store_ohlcv_data, args=(SYMBOL, '1m', make_candles(20, offset=100)))
+
+    def to_records_after_concurrent_write(rows):
+        # 스냅샷을 읽은 직후, 교체 전에 다른 스레드가 새 캔들을 커밋
+        del store.to_records
+        writer.start()
+        while len(sqlite_timestamps(db)) < 120:
+            pass
+        writer.join(timeout=0.5)  # 동기화는 리빌드가 끝날 때까지 기다려야 함
+        return to_records(rows)
+
+    try:
+        store.to_records = to_records_after_concurrent_write
+        rebuilt = db.rebuild_columnar_series(SYMBOL, '1m')
+        writer.join(timeout=10)
+        assert not writer.is_alive(), "concurrent write never finished"
+
+        array = db.get_ohlcv_array(SYMBOL, '1m')
+        assert rebuilt == 100, f"rebuild read {rebuilt} candles"
+        assert len(array) == 120, f"{len(array)} of 120 candles after the rebuild"
+        assert list(array['timestamp']) == sqlite_timestamps(db), "columnar series differs from SQLite"
+        return f"{rebuilt} rebuilt + 20 concurrent"
+    finally:
+        db.close()
+
+
+def main() -> int:
+    runner = ScriptTestRunner("COLUMNAR STORE TESTS")
+    with tempfile.TemporaryDirectory() as tmp:
+        runner.run_test(check_write_mirrors, "write_batch mirrors to columnar", tmp)
+        runner.run_test(check_rebuild_on_read, "Rebuild on first read", tmp)
+        runner.run_test(check_rebuild_keeps_concurrent_write, "Rebuild vs concurrent write", tmp)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
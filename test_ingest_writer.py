@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the batched ingest writer.
+Runs BatchedIngestWriter against a temporary CryptoDatabaseManager: concurrent
+submitters, backpressure on a full queue, flush(), per-item failures within a
+batch, the final drain on stop() and stop() on a stalled writer.
+"""
+
+import sys
+import os
+import time
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import wait
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.database import CryptoDatabaseManager
+from data.ingest import BatchedIngestWriter
+from testkit import ScriptTestRunner
+
+START_MS = 1700000000000 // 60000 * 60000
+
+
+def make_candles(count: int, offset: int = 0, base: float = 100.0):
+    """count consecutive valid 1m candles starting offset minutes after START_MS"""
+    return [
+        [START_MS + (offset + i) * 60000, base, base * 1.01, base * 0.99, base * 1.005, 10.0]
+        for i in range(count)
+    ]
+
+
+def make_price(price: float, **extra):
+    return {'price': price, 'volume_24h': 1000.0, 'timestamp': int(time.time()), **extra}
+
+
+def count_rows(db: CryptoDatabaseManager, table: str) -> int:
+    with db.read_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def check_concurrent_submitters(db: CryptoDatabaseManager) -> str:
+    """Eight threads submitting at once end up in few transactions"""
+    writer = BatchedIngestWriter(db, max_batch_rows=500, flush_interval=0.2)
+    writer.start()
+    futures, lock = [], threading.Lock()
+
+    def submitter(n: int):
+        for i in range(25):
+            future = writer.submit_ohlcv(f"C{n}/USDT", '1m', make_candles(4, offset=i * 4))
+            price_future = writer.submit_price(f"C{n}/USDT", make_price(100.0 + i))
+            with lock:
+                futures.extend([future, price_future])
+
+    threads = [threading.Thread(target=submitter, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    done, pending = wait(futures, timeout=10)
+    writer.stop()
+    assert not pending, f"{len(pending)} submissions never resolved"
+    assert all(future.exception() is None for future in done), "a submission failed"
+
+    assert count_rows(db, 'ohlcv_data') == 8 * 25 * 4
+    metrics = writer.get_metrics()
+    assert metrics['flushes'] < len(futures) / 4, f"{metrics['flushes']} flushes for {len(futures)} submissions"
+    return f"{len(futures)} submissions in {metrics['flushes']} flushes"
+
+
+def check_full_queue_times_out(db: CryptoDatabaseManager) -> str:
+    """A submitter blocked on a full queue gets TimeoutError after put_timeout"""
+    writer = BatchedIngestWriter(db, max_queue_size=2, flush_interval=0.0, put_timeout=0.1)
+    writer.start()
+
+    # Writer blocks on the database lock while the queue fills up
+    blocker = sqlite3.connect(db.db_path, timeout=30)
+    blocker.execute("BEGIN IMMEDIATE")
+    try:
+        accepted = []
+        start = time.perf_counter()
+        try:
+            for i in range(10):
+                accepted.append(writer.submit_ohlcv('FULL/USDT', '1m', make_candles(1, offset=i)))
+            raise AssertionError("queue never filled")
+        except TimeoutError:
+            waited = time.perf_counter() - start
+    finally:
+        blocker.rollback()
+        blocker.close()
+
+    assert writer.flush(timeout=10), "flush after releasing the lock did not complete"
+    writer.stop()
+    assert waited >= 0.1, f"TimeoutError after {waited:.3f}s"
+    assert all(future.result(timeout=1) == 1 for future in accepted), "accepted submission lost"
+    metrics = writer.get_metrics()
+    assert metrics['rejected'] == 1 and metrics['backpressure_waits'] >= 1, metrics
+    return f"{len(accepted)} accepted before timeout"
+
+
+def check_flush(db: CryptoDatabaseManager) -> str:
+    """flush() writes submissions before their batch would age out"""
+    writer = BatchedIngestWriter(db, flush_interval=60.0)
+    writer.start()
+    future = writer.submit_ohlcv('FLUSH/USDT', '1m', make_candles(30))
+
+    start = time.perf_counter()
+    assert writer.flush(timeout=5), "flush timed out"
+    elapsed = time.perf_counter() - start
+    assert future.done() and future.result() == 30
+    assert len(db.get_ohlcv_data('FLUSH/USDT', '1m', limit=100)) == 30
+    writer.stop()
+    return f"flushed in {elapsed * 1000:.1f}ms"
+
+
+def check_bad_item_isolated(db: CryptoDatabaseManager) -> str:
+    """A submission the database rejects fails alone; the rest of its batch commits"""
+    writer = BatchedIngestWriter(db, flush_interval=60.0)
+    writer.start()
+    good_candles = writer.submit_ohlcv('GOOD/USDT', '1m', make_candles(5))
+    bad_price = writer.submit_price('BAD/USDT', make_price(1.0, volume_24h={'not': 'bindable'}))
+    good_price = writer.submit_price('GOOD/USDT', make_price(2.0))
+    writer.flush(timeout=5)
+    writer.stop()
+
+    assert good_candles.result() == 5
+    assert good_price.result() is True
+    assert bad_price.exception() is not None, "unbindable price was written"
+    assert count_rows(db, 'realtime_prices') == 1
+    metrics = writer.get_metrics()
+    assert metrics['failed_flushes'] == 1, metrics
+    return type(bad_price.exception()).__name__
+
+
+def check_stop_drains(db: CryptoDatabaseManager) -> str:
+    """stop() writes everything queued; later submissions fail without writing"""
+    writer = BatchedIngestWriter(db, flush_interval=60.0, max_batch_rows=100000)
+    writer.start()
+    futures = [writer.submit_ohlcv('STOP/USDT', '1m', make_candles(1, offset=i)) for i in range(200)]
+    writer.stop()
+
+    assert all(future.done() and future.result() == 1 for future in futures), "queued submission not written"
+    assert len(db.get_ohlcv_data('STOP/USDT', '1m', limit=1000)) == 200
+
+    late = writer.submit_ohlcv('STOP/USDT', '1m', make_candles(1, offset=500))
+    assert isinstance(late.exception(timeout=1), RuntimeError), "submission after stop() not rejected"
+    assert writer.flush(timeout=1)
+    assert len(db.get_ohlcv_data('STOP/USDT', '1m', limit=1000)) == 200, "submission after stop() written"
+    return "200 drained"
+
+
+def check_stalled_stop(db: CryptoDatabaseManager) -> str:
+    """stop() on a stalled writer returns in time and start() refuses a second writer"""
+    writer = BatchedIngestWriter(db, max_queue_size=2, flush_interval=0.0, put_timeout=0.1)
+    writer.start()
+
+    blocker = sqlite3.connect(db.db_path, timeout=30)
+    blocker.execute("BEGIN IMMEDIATE")
+    try:
+        accepted = []
+        try:
+            for i in range(10):
+                accepted.append(writer.submit_ohlcv('STALL/USDT', '1m', make_candles(1, offset=i)))
+        except TimeoutError:
+            pass
+
+        start = time.perf_counter()
+        writer.stop(timeout=0.2)
+        waited = time.perf_counter() - start
+        assert waited < 1.0, f"stop() blocked {waited:.2f}s on a full queue"
+        assert not writer.is_running, "stopping writer still accepts submissions"
+        assert isinstance(writer.submit_ohlcv('STALL/USDT', '1m', make_candles(1, offset=50)).exception(timeout=1),
+                          RuntimeError), "submission accepted while stopping"
+        try:
+            writer.start()
+            raise AssertionError("start() spawned a second writer while the first is alive")
+        except RuntimeError:
+            pass
+    finally:
+        blocker.rollback()
+        blocker.close()
+
+    writer.stop(timeout=10)
+    assert all(future.result(timeout=1) == 1 for future in accepted), "accepted submission lost"
+    assert writer._thread is None, "writer thread still referenced after it exited"
+
+    writer.start()
+    assert writer.submit_ohlcv('STALL/USDT', '1m', make_candles(1, offset=100)).result(timeout=5) == 1
+    writer.stop()
+    return f"stop() returned after {waited:.2f}s"
+
+
+def with_database(test, tmp: str) -> str:
+    """Runs a check against its own database file"""
+    db = CryptoDatabaseManager(db_path=os.path.join(tmp, f"{test.__name__}.db"))
+    try:
+        return test(db)
+    finally:
+        db.close()
+
+
+def main() -> int:
+    runner = ScriptTestRunner("INGEST WRITER TESTS")
+    with tempfile.TemporaryDirectory() as tmp:
+        runner.run_test(with_database, "Concurrent submitters", check_concurrent_submitters, tmp)
+        runner.run_test(with_database, "Full queue TimeoutError", check_full_queue_times_out, tmp)
+        runner.run_test(with_database, "flush()", check_flush, tmp)
+        runner.run_test(with_database, "Bad item isolated", check_bad_item_isolated, tmp)
+        runner.run_test(with_database, "stop() drains queue", check_stop_drains, tmp)
+        runner.run_test(with_database, "Stalled writer stop()", check_stalled_stop, tmp)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the read-through kline service.
+Runs KlineService over a temporary CryptoDatabaseManager and a recording exchange
+source: first full fetch, incremental tail fetches, hole detection, store fallback
+on exchange errors and latest prices from the store.
+"""
+
+import sys
+import os
+import time
+import logging
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.database import CryptoDatabaseManager
+from data.kline_service import KlineService
+from testkit import ScriptTestRunner
+
+STEP = 3600 * 1000  # 1h
+SYMBOL = 'BTC/USDT'
+
+
+def candle(timestamp: int):
+    """Deterministic candle of an open time"""
+    base = 100.0 + (timestamp // STEP) % 500
+    return [float(timestamp), base, base + 2, base - 1, base + 0.5, 10.0]
+
+
+class RecordingSource:
+    """Exchange stand-in with MarketDataCollector's get_klines signature"""
+
+    testnet = False
+
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+        self.prices = {}
+
+    def get_klines(self, symbol, timeframe, limit=500, since=None, end_time=None):
+        self.calls.append({'limit': limit, 'since': since})
+        if self.fail:
+            raise ConnectionError("exchange unavailable")
+        current = int(time.time() * 1000) // STEP * STEP  # open candle
+        if since is None:
+            since = current - (limit - 1) * STEP
+        return [candle(ts) for ts in range(since, current + 1, STEP)][:limit]
+
+    def get_multiple_symbols_data(self, symbols, data_type="price"):
+        self.calls.append({'prices': list(symbols)})
+        return {'data': {symbol: self.prices[symbol] for symbol in symbols if symbol in self.prices}}
+
+
+def expected_series(limit: int):
+    current = int(time.time() * 1000) // STEP * STEP
+    return [candle(ts) for ts in range(current - (limit - 1) * STEP, current + 1, STEP)]
+
+
+def make_service(tmp: str, name: str):
+    db = CryptoDatabaseManager(db_path=os.path.join(tmp, f"{name}.db"))
+    source = RecordingSource()
+    return KlineService(database_manager=db, market_data_collector=source), db, source
+
+
+def check_first_call_full_fetch(tmp: str) -> str:
+    """An empty store costs one full request; only closed candles are stored"""
+    service, db, source = make_service(tmp, "full")
+    result = service.get_klines(SYMBOL, '1h', limit=50)
+
+    assert result == expected_series(50), "served series differs from the exchange"
+    assert source.calls == [{'limit': 50, 'since': None}], source.calls
+    stored = db.get_ohlcv_data(SYMBOL, '1h', limit=100)
+    assert len(stored) == 49 and stored[-1][0] == result[-2][0], "open candle stored or closed candle missing"
+    db.close()
+    return "49 closed stored"
+
+
+def check_tail_fetch(tmp: str) -> str:
+    """With closed history stored, only the candles after it are requested"""
+    service, db, source = make_service(tmp, "tail")
+    current = int(time.time() * 1000) // STEP * STEP
+    # Store closed candles up to three hours ago
+    db.insert_ohlcv_data(SYMBOL, '1h', [candle(ts) for ts in range(current - 60 * STEP, current - 2 * STEP, STEP)])
+
+    result = service.get_klines(SYMBOL, '1h', limit=50)
+    assert result == expected_series(50), "merged series differs from the exchange"
+    assert source.calls == [{'limit': 3, 'since': current - 2 * STEP}], source.calls
+
+    # The fetched closed candles were written back: next call asks for the open candle only
+    source.calls.clear()
+    assert service.get_klines(SYMBOL, '1h', limit=50) == expected_series(50)
+    assert source.calls == [{'limit': 1, 'since': current}], source.calls
+
+    stats = service.get_stats()
+    assert stats['tail_fetches'] == 2 and stats['full_fetches'] == 0, stats
+    assert stats['store_ratio_percent'] > 90, stats
+    db.close()
+    return f"store ratio {stats['store_ratio_percent']}%"
+
+
+def check_hole_triggers_full_fetch(tmp: str) -> str:
+    """A gap in the stored window is refetched in one full request"""
+    service, db, source = make_service(tmp, "hole")
+    current = int(time.time() * 1000) // STEP * STEP
+    timestamps = [ts for ts in range(current - 30 * STEP, current, STEP) if ts != current - 10 * STEP]
+    db.insert_ohlcv_data(SYMBOL, '1h', [candle(ts) for ts in timestamps])
+
+    result = service.get_klines(SYMBOL, '1h', limit=20)
+    assert result == expected_series(20)
+    assert source.calls == [{'limit': 20, 'since': None}], source.calls
+    assert len(db.get_ohlcv_data(SYMBOL, '1h', limit=100)) == 30, "hole not filled from the full fetch"
+    db.close()
+    return "hole filled"
+
+
+def check_store_fallback(tmp: str) -> str:
+    """A failed tail fetch serves the stored closed candles instead of raising"""
+    service, db, source = make_service(tmp, "fallback")
+    current = int(time.time() * 1000) // STEP * STEP
+    db.insert_ohlcv_data(SYMBOL, '1h', [candle(ts) for ts in range(current - 40 * STEP, current - STEP, STEP)])
+
+    source.fail = True
+    result = service.get_klines(SYMBOL, '1h', limit=20)
+    assert result == [candle(ts) for ts in range(current - 21 * STEP, current - STEP, STEP)], \
+        "fallback did not serve the newest stored candles"
+    assert service.get_stats()['store_fallbacks'] == 1
+
+    empty, empty_db, empty_source = make_service(tmp, "empty")
+    empty_source.fail = True
+    try:
+        empty.get_klines(SYMBOL, '1h', limit=20)
+        raise AssertionError("empty store with failing exchange did not raise")
+    except ConnectionError:
+        pass
+    empty_db.close()
+    db.close()
+    return "stored candles served"
+
+
+def check_latest_prices(tmp: str) -> str:
+    """Fresh stored prices are served; only missing symbols reach the exchange"""
+    service, db, source = make_service(tmp, "prices")
+    db.insert_realtime_price(SYMBOL, {'price': 50000.0, 'timestamp': int(time.time())})
+    db.insert_realtime_price('ETH/USDT', {'price': 3000.0, 'timestamp': int(time.time()) - 3600})
+    source.prices = {'ETH/USDT': 3100.0}
+
+    prices = service.get_latest_prices([SYMBOL, 'ETH/USDT', 'XRP/USDT'])
+    assert prices == {SYMBOL: 50000.0, 'ETH/USDT': 3100.0}, prices
+    assert source.calls == [{'prices': ['ETH/USDT', 'XRP/USDT']}], source.calls
+    db.close()
+    return "1 from store, 1 from exchange"
+
+
+def main() -> int:
+    logging.disable(logging.WARNING)
+
+    # Keep the hourly boundary out of the run
+    if int(time.time() * 1000) % STEP > STEP - 5000:
+        time.sleep(6)
+
+    runner = ScriptTestRunner("KLINE SERVICE TESTS")
+    with tempfile.TemporaryDirectory() as tmp:
+        runner.run_test(check_first_call_full_fetch, "First call full fetch", tmp)
+        runner.run_test(check_tail_fetch, "Incremental tail fetch", tmp)
+        runner.run_test(check_hole_triggers_full_fetch, "Hole triggers full fetch", tmp)
+        runner.run_test(check_store_fallback, "Store fallback", tmp)
+        runner.run_test(check_latest_prices, "Latest prices", tmp)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
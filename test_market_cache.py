@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the bounded market data cache.
+Checks MarketDataCache request coalescing, stale-while-revalidate, per-type TTLs
+and LRU eviction with deterministic loaders.
+"""
+
+import sys
+import os
+import time
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.market_cache import MarketDataCache, CachePolicy
+from testkit import ScriptTestRunner
+
+
+class CountingLoader:
+    """Loader returning call numbers, optionally slow or failing"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"load {call} failed")
+        return call
+
+
+def check_coalescing() -> str:
+    """Concurrent misses for one key share a single load, including its failure"""
+    cache = MarketDataCache()
+    loader = CountingLoader(delay=0.2)
+    results = []
+    barrier = threading.Barrier(10)
+
+    def reader():
+        barrier.wait()
+        results.append(cache.get_or_load('price:BTCUSDT', loader, 'price'))
+
+    threads = [threading.Thread(target=reader) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1, f"{loader.calls} loads for 10 concurrent readers"
+    assert results == [1] * 10, results
+    stats = cache.get_stats()
+    assert stats['misses'] == 1 and stats['coalesced'] == 9, stats
+
+    failing = CountingLoader(delay=0.2, fail=True)
+    errors = []
+
+    def failing_reader():
+        try:
+            cache.get_or_load('price:ETHUSDT', failing, 'price')
+        except ConnectionError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=failing_reader) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert failing.calls == 1 and errors == ["load 1 failed"] * 5, (failing.calls, errors)
+    assert cache.get_stats()['inflight'] == 0, "failed load left in flight"
+    return "10 readers, 1 load"
+
+
+def check_stale_while_revalidate() -> str:
+    """A stale entry is served at once while one background refresh replaces it"""
+    cache = MarketDataCache(policies={'ticker': CachePolicy(ttl=0.1, stale_ttl=1.0)})
+    loader = CountingLoader(delay=0.2)
+    assert cache.get_or_load('ticker:BTCUSDT', loader, 'ticker') == 1
+    time.sleep(0.15)  # fresh -> stale
+
+    start = time.perf_counter()
+    stale_values = [cache.get_or_load('ticker:BTCUSDT', loader, 'ticker') for _ in range(5)]
+    elapsed = time.perf_counter() - start
+    assert stale_values == [1] * 5, stale_values
+    assert elapsed < 0.1, f"stale reads waited {elapsed:.3f}s for the refresh"
+
+    deadline = time.monotonic() + 2
+    while cache.get('ticker:BTCUSDT') != 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get('ticker:BTCUSDT') == 2, "background refresh did not replace the entry"
+    assert loader.calls == 2, f"{loader.calls} loads, expected one refresh"
+
+    stats = cache.get_stats()
+    assert stats['stale_hits'] == 5 and stats['refreshes'] == 1, stats
+
+    # Past the stale window the caller waits for a load again
+    time.sleep(1.2)
+    assert cache.get('ticker:BTCUSDT', allow_stale=True) is None
+    assert cache.get_or_load('ticker:BTCUSDT', loader, 'ticker') == 3
+    cache.close()
+    return f"5 stale hits in {elapsed * 1000:.1f}ms"
+
+
+def check_type_ttls() -> str:
+    """Each data type expires by its own policy"""
+    cache = MarketDataCache(policies={'book_top': CachePolicy(ttl=0.05),
+                                      'symbol_validation': CachePolicy(ttl=60.0)})
+    cache.set('book:BTCUSDT', {'bid': 1}, 'book_top')
+    cache.set('valid:BTCUSDT', True, 'symbol_validation')
+    time.sleep(0.1)
+
+    assert cache.get('book:BTCUSDT') is None, "book_top entry outlived its TTL"
+    assert cache.get('book:BTCUSDT', allow_stale=True) is None, "book_top has no stale window"
+    assert cache.get('valid:BTCUSDT') is True
+    assert cache.get_stats()['expired_entries'] == 1
+    return "book_top expired, symbols kept"
+
+
+def check_lru_eviction() -> str:
+    """Beyond max_entries the least recently used entry goes first"""
+    cache = MarketDataCache(max_entries=3)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key.upper())
+
+    assert cache.get('a') == 'A'  # a is now most recently used
+    cache.set('d', 'D')
+
+    assert len(cache) == 3
+    assert cache.get('b') is None, "least recently used entry kept"
+    assert [cache.get(key) for key in ('a', 'c', 'd')] == ['A', 'C', 'D']
+    assert cache.get_stats()['evictions'] == 1
+    return "b evicted"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("MARKET DATA CACHE TESTS")
+    runner.run_test(check_coalescing, "Request coalescing")
+    runner.run_test(check_stale_while_revalidate, "Stale-while-revalidate")
+    runner.run_test(check_type_ttls, "Per-type TTLs")
+    runner.run_test(check_lru_eviction, "LRU eviction")
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
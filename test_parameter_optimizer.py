@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the StrategyOptimizer search methods.
+Checks that successive halving finds the grid-search best score on a small
+space, that TPE gets close to it on a space much larger than its trial budget
+and stops once a small space is exhausted, and that a single-candidate space
+is still scored on the full window.
+"""
+
+import sys
+import os
+import itertools
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from auto_trading_dashboard.backtesting_system import (
+    StrategyEngine, BacktestParameters, BacktestStrategy, TimeFrame, BacktestingSystem
+)
+from auto_trading_dashboard.parameter_optimizer import StrategyOptimizer, ParamSpec, PARAMETER_CONSTRAINTS
+from auto_trading_dashboard.parameter_sweep import ParameterSweepRunner, params_key
+from testkit import ScriptTestRunner
+
+OBJECTIVE = "총 수익률"
+
+
+def make_dataset(n: int = 1500, seed: int = 5) -> pd.DataFrame:
+    """Fixed hourly OHLCV random walk with alternating trends"""
+    rng = np.random.default_rng(seed)
+    drift = np.where((np.arange(n) // 150) % 2 == 0, 0.0015, -0.001)
+    close = 40000 * np.exp(np.cumsum(drift + rng.normal(0, 0.01, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.uniform(50, 500, n)
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h'))
+
+
+def make_params(strategy: BacktestStrategy) -> BacktestParameters:
+    return BacktestParameters(
+        strategy=strategy,
+        symbol='BTC/USDT',
+        timeframe=TimeFrame.H1,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 3, 1),
+        initial_capital=100000,
+        max_position_size=10000,
+        commission=0.001,
+        slippage=0.0005,
+        risk_per_trade=0.02,
+        stop_loss=0.02,
+        take_profit=0.04
+    )
+
+
+def score_fn(metrics):
+    return BacktestingSystem.score_metrics(metrics, OBJECTIVE)
+
+
+def grid_scores(data: pd.DataFrame, base_params: BacktestParameters, space) -> np.ndarray:
+    """Exhaustive sweep over every valid step of the space"""
+    axes = [np.arange(spec.low, spec.high + spec.step / 2, spec.step) for spec in space]
+    combinations = [
+        {spec.name: spec.from_unit(spec.to_unit(value)) for spec, value in zip(space, values)}
+        for values in itertools.product(*axes)
+    ]
+    combinations = [
+        params for params in combinations
+        if all(params[lower] < params[upper] for lower, upper in PARAMETER_CONSTRAINTS
+               if lower in params and upper in params)
+    ]
+    sweep = ParameterSweepRunner(max_workers=1).run(
+        data, combinations, StrategyEngine, base_params, score_fn=score_fn
+    )
+    return np.array([record.score for record in sweep['records']])
+
+
+def check_halving_matches_grid(data: pd.DataFrame) -> str:
+    space = [ParamSpec('short_ma', 5, 15, 5), ParamSpec('long_ma', 20, 60, 20)]
+    base_params = make_params(BacktestStrategy.MOVING_AVERAGE)
+    expected = grid_scores(data, base_params, space).max()
+
+    optimizer = StrategyOptimizer(data, StrategyEngine, base_params, score_fn=score_fn, space=space, seed=3)
+    report = optimizer.successive_halving(n_candidates=27, min_bars=300)
+
+    assert report.best_params is not None, "no best result"
+    assert np.isclose(report.best_score, expected), f"best {report.best_score} != grid {expected}"
+    return f"score {expected:.3f}, {report.full_equivalent_evaluations:.1f} full-equivalent"
+
+
+def check_tpe_large_space(data: pd.DataFrame) -> str:
+    """On a space much larger than n_trials TPE stays under the grid cost and lands near its best"""
+    space = [ParamSpec('short_ma', 5, 30, 1), ParamSpec('long_ma', 20, 120, 5)]
+    base_params = make_params(BacktestStrategy.MOVING_AVERAGE)
+    scores = grid_scores(data, base_params, space)
+
+    optimizer = StrategyOptimizer(data, StrategyEngine, base_params, score_fn=score_fn, space=space, seed=3)
+    report = optimizer.tpe_search(n_trials=40, n_startup=10)
+
+    assert report.best_params is not None, "no best result"
+    assert report.full_evaluations == 40, f"{report.full_evaluations} of 40 trials evaluated"
+    assert report.full_equivalent_evaluations < len(scores) / 10, \
+        f"{report.full_equivalent_evaluations:.1f} full-equivalent for a {len(scores)}-point grid"
+    percentile = (scores < report.best_score).mean() * 100
+    assert percentile >= 90, f"best {report.best_score:.3f} beats only {percentile:.0f}% of the grid"
+    return (f"score {report.best_score:.3f} (grid {scores.max():.3f}, top {100 - percentile:.0f}%), "
+            f"{report.full_equivalent_evaluations:.0f} of {len(scores)} full-equivalent")
+
+
+def check_tpe_exhausted_space(data: pd.DataFrame) -> str:
+    """When every value has been tried TPE stops instead of evaluating repeats"""
+    space = [ParamSpec('breakout_period', 10, 40, 5)]
+    base_params = make_params(BacktestStrategy.BREAKOUT)
+    expected = grid_scores(data, base_params, space).max()
+
+    optimizer = StrategyOptimizer(data, StrategyEngine, base_params, score_fn=score_fn, space=space, seed=3)
+    report = optimizer.tpe_search(n_trials=30, n_startup=3)
+
+    evaluated = [params_key(result['params']) for result in report.results]
+    assert len(evaluated) == len(set(evaluated)), "a combination was evaluated twice"
+    assert report.full_evaluations == 7 and report.evaluations == 7, \
+        f"{report.full_evaluations} trials on a 7-value space"
+    assert np.isclose(report.best_score, expected), f"best {report.best_score} != grid {expected}"
+    return f"stopped after {report.full_evaluations} trials"
+
+
+def check_single_candidate(data: pd.DataFrame) -> str:
+    """One unique candidate is evaluated on the full window, not only a partial one"""
+    base_params = make_params(BacktestStrategy.BREAKOUT)
+    results = []
+    for space, min_fraction in (([ParamSpec('breakout_period', 20, 20, 1)], None), ([], 0.2)):
+        optimizer = StrategyOptimizer(data, StrategyEngine, base_params, score_fn=score_fn, space=space, seed=1)
+        report = optimizer.successive_halving(min_fraction=min_fraction, min_bars=100)
+        assert report.best_params is not None, f"space {[s.name for s in space]}: no best result"
+        assert report.full_evaluations == 1 and report.evaluations == 1, \
+            f"{report.evaluations} evaluations, {report.full_evaluations} on the full window"
+        results.append(report.best_params)
+    return f"best {results}"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("PARAMETER OPTIMIZER TESTS")
+    print("Preparing fixed dataset...")
+    data = make_dataset()
+
+    runner.run_test(check_halving_matches_grid, "Successive halving vs grid", data)
+    runner.run_test(check_tpe_large_space, "TPE on a large space", data)
+    runner.run_test(check_tpe_exhausted_space, "TPE on an exhausted space", data)
+    runner.run_test(check_single_candidate, "Single-candidate space", data)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for resuming a ParameterSweepRunner from its results file.
+Checks that records of the same run are reused with their score recomputed, and
+that records written under a different objective, symbol or without a run
+signature are evaluated again instead of reused.
+"""
+
+import sys
+import os
+import json
+import tempfile
+from dataclasses import replace
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from auto_trading_dashboard.backtesting_system import (
+    StrategyEngine, BacktestParameters, BacktestStrategy, TimeFrame, BacktestingSystem
+)
+from auto_trading_dashboard.parameter_sweep import ParameterSweepRunner, run_signature
+from testkit import ScriptTestRunner
+
+COMBINATIONS = [{'breakout_period': period} for period in (10, 20, 30, 40)]
+
+
+def make_dataset(n: int = 800, seed: int = 11) -> pd.DataFrame:
+    """Fixed hourly OHLCV random walk"""
+    rng = np.random.default_rng(seed)
+    close = 40000 * np.exp(np.cumsum(rng.normal(0.0002, 0.01, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.uniform(50, 500, n)
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h'))
+
+
+def make_params() -> BacktestParameters:
+    return BacktestParameters(
+        strategy=BacktestStrategy.BREAKOUT,
+        symbol='BTC/USDT',
+        timeframe=TimeFrame.H1,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 2, 3),
+        initial_capital=100000,
+        max_position_size=10000,
+        commission=0.001,
+        slippage=0.0005,
+        risk_per_trade=0.02,
+        stop_loss=0.02,
+        take_profit=0.04
+    )
+
+
+def sweep(data: pd.DataFrame, path: str, objective: str, base_params: BacktestParameters = None):
+    base_params = base_params or make_params()
+    return ParameterSweepRunner(max_workers=1, results_path=path).run(
+        data, COMBINATIONS, StrategyEngine, base_params,
+        score_fn=lambda metrics: BacktestingSystem.score_metrics(metrics, objective),
+        signature=run_signature(base_params, objective)
+    )
+
+
+def result_lines(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def check_same_run_resumes(data: pd.DataFrame, tmp: str) -> str:
+    """A rerun with the same signature reuses every record and appends nothing"""
+    path = os.path.join(tmp, 'same.jsonl')
+    first = sweep(data, path, "총 수익률")
+    lines = result_lines(path)
+    assert len(lines) == len(COMBINATIONS) + 1 and 'signature' in lines[0], f"{len(lines)} lines written"
+
+    second = sweep(data, path, "총 수익률")
+    assert second['resumed'] == len(COMBINATIONS) and second['skipped'] == 0
+    assert len(result_lines(path)) == len(lines), "resumed records written again"
+    assert second['best'].params == first['best'].params
+    return f"{second['resumed']} resumed"
+
+
+def check_score_recomputed(data: pd.DataFrame, tmp: str) -> str:
+    """Resumed records are scored from their metrics, not from the stored score"""
+    path = os.path.join(tmp, 'tampered.jsonl')
+    expected = sweep(data, path, "총 수익률")
+
+    lines = result_lines(path)
+    for entry in lines[1:]:
+        entry['score'] = 1e9
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(json.dumps(entry) + '\n' for entry in lines)
+
+    resumed = sweep(data, path, "총 수익률")
+    assert resumed['resumed'] == len(COMBINATIONS)
+    assert np.isclose(resumed['best'].score, expected['best'].score), \
+        f"best {resumed['best'].score} != {expected['best'].score}"
+    return f"score {resumed['best'].score:.3f}"
+
+
+def check_other_run_skipped(data: pd.DataFrame, tmp: str) -> str:
+    """Records of another objective or symbol are evaluated again, then both runs resume"""
+    path = os.path.join(tmp, 'shared.jsonl')
+    sweep(data, path, "총 수익률")
+
+    other_objective = sweep(data, path, "승률")
+    assert other_objective['resumed'] == 0 and other_objective['skipped'] == len(COMBINATIONS)
+    fresh = sweep(data, None, "승률")
+    assert np.isclose(other_objective['best'].score, fresh['best'].score), "scored with the old objective"
+
+    other_symbol = sweep(data, path, "승률", replace(make_params(), symbol='ETH/USDT'))
+    assert other_symbol['resumed'] == 0, "records of another symbol reused"
+
+    # 각 구간은 그대로 남아 자기 서명으로 다시 재개됨
+    for objective in ("총 수익률", "승률"):
+        again = sweep(data, path, objective)
+        assert again['resumed'] == len(COMBINATIONS), f"{objective}: {again['resumed']} resumed"
+    return f"{other_objective['skipped']} skipped"
+
+
+def check_legacy_file_skipped(data: pd.DataFrame, tmp: str) -> str:
+    """A results file without a signature line is not trusted"""
+    path = os.path.join(tmp, 'legacy.jsonl')
+    sweep(data, path, "총 수익률")
+    lines = result_lines(path)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(json.dumps(entry) + '\n' for entry in lines[1:])
+
+    resumed = sweep(data, path, "총 수익률")
+    assert resumed['resumed'] == 0 and resumed['skipped'] == len(COMBINATIONS)
+    assert sweep(data, path, "총 수익률")['resumed'] == len(COMBINATIONS)
+    return f"{resumed['skipped']} unsigned records skipped"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("PARAMETER SWEEP RESUME TESTS")
+    print("Preparing fixed dataset...")
+    data = make_dataset()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runner.run_test(check_same_run_resumes, "Same run resumes", data, tmp)
+        runner.run_test(check_score_recomputed, "Score recomputed on resume", data, tmp)
+        runner.run_test(check_other_run_skipped, "Other objective/symbol skipped", data, tmp)
+        runner.run_test(check_legacy_file_skipped, "Unsigned file skipped", data, tmp)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the SQLite-backed response cache.
+Checks PersistentCache persistence across reopen, lazy loading, TTL with stale
+fallback, the in-memory LRU front, compaction and concurrent writers.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.persistent_cache import PersistentCache
+from testkit import ScriptTestRunner
+
+
+def check_persistence(tmp: str) -> str:
+    """Entries survive a reopen and are read lazily from disk"""
+    path = os.path.join(tmp, "persist.db")
+    cache = PersistentCache(path, compaction_interval=0)
+    assert not os.path.exists(path), "cache file created before first use"
+
+    payload = {'Time Series (5min)': {'2024-01-01 00:00:00': {'1. open': '100.0'}}, 'count': 3}
+    cache.set('standard_btc', payload, ttl=60)
+    cache.close()
+
+    reopened = PersistentCache(path, compaction_interval=0)
+    value, stored_at = reopened.get('standard_btc')
+    assert value == payload, value
+    assert time.time() - stored_at < 5
+    stats = reopened.get_stats()
+    assert stats['disk_hits'] == 1 and stats['memory_hits'] == 0, stats
+
+    reopened.get('standard_btc')
+    assert reopened.get_stats()['memory_hits'] == 1, "second read did not hit the memory front"
+    assert reopened.get('missing') is None and reopened.get_stats()['misses'] == 1
+    reopened.close()
+    return "reopened"
+
+
+def check_ttl_and_stale(tmp: str) -> str:
+    """Expired entries miss, but stay available as a stale fallback"""
+    cache = PersistentCache(os.path.join(tmp, "ttl.db"), compaction_interval=0, memory_entries=0)
+    cache.set('indicator_rsi', {'rsi': 55.5}, ttl=0.05)
+    assert cache.get('indicator_rsi')[0] == {'rsi': 55.5}
+    time.sleep(0.1)
+
+    assert cache.get('indicator_rsi') is None, "expired entry served as fresh"
+    stale = cache.get('indicator_rsi', allow_expired=True)
+    assert stale is not None and stale[0] == {'rsi': 55.5}, stale
+    assert cache.get_stats()['stale_hits'] == 1
+
+    cache.set('indicator_rsi', {'rsi': 60.0}, ttl=60)
+    assert cache.get('indicator_rsi')[0] == {'rsi': 60.0}, "refresh did not replace the entry"
+    cache.close()
+    return "stale fallback"
+
+
+def check_memory_lru(tmp: str) -> str:
+    """The memory front keeps only the most recently used entries"""
+    cache = PersistentCache(os.path.join(tmp, "lru.db"), compaction_interval=0, memory_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key, ttl=60)
+
+    stats = cache.get_stats()
+    assert stats['memory_entries'] == 2 and stats['disk_entries'] == 3, stats
+    assert cache.get('a')[0] == 'a' and cache.get_stats()['disk_hits'] == 1, "evicted key not read from disk"
+    assert cache.get('c')[0] == 'c' and cache.get_stats()['memory_hits'] == 1
+    cache.close()
+    return "2 in memory, 3 on disk"
+
+
+def check_compaction(tmp: str) -> str:
+    """Compaction drops long-expired entries and the oldest entries beyond max_entries"""
+    cache = PersistentCache(os.path.join(tmp, "compact.db"), max_entries=5,
+                            retain_expired_seconds=0.05, compaction_interval=0, batch_size=2)
+    for i in range(3):
+        cache.set(f"expired_{i}", i, ttl=0.01)
+    for i in range(8):
+        cache.set(f"live_{i}", i, ttl=60)
+        time.sleep(0.001)  # distinct stored_at order
+    time.sleep(0.1)
+
+    removed = cache.compact()
+    assert removed == {'expired': 3, 'evicted': 3}, removed
+    assert len(cache) == 5
+    assert cache.get('expired_0', allow_expired=True) is None, "long-expired entry kept"
+    assert [cache.get(f"live_{i}") is not None for i in range(8)] == [False] * 3 + [True] * 5, \
+        "eviction did not remove the oldest entries"
+    cache.close()
+    return "3 expired, 3 evicted"
+
+
+def check_concurrent_writers(tmp: str) -> str:
+    """Threads reading and writing at once leave every entry intact"""
+    cache = PersistentCache(os.path.join(tmp, "threads.db"), compaction_interval=0, memory_entries=16)
+    errors = []
+
+    def worker(n: int):
+        try:
+            for i in range(50):
+                cache.set(f"t{n}_{i}", {'n': n, 'i': i}, ttl=60)
+                assert cache.get(f"t{n}_{i}")[0] == {'n': n, 'i': i}
+        except Exception as e:
+            errors.append(repr(e))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, errors[:3]
+    assert len(cache) == 400
+    assert cache.get_stats()['writes'] == 400
+    cache.close()
+    return "400 entries"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("PERSISTENT CACHE TESTS")
+    with tempfile.TemporaryDirectory() as tmp:
+        runner.run_test(check_persistence, "Persistence and lazy load", tmp)
+        runner.run_test(check_ttl_and_stale, "TTL and stale fallback", tmp)
+        runner.run_test(check_memory_lru, "Memory LRU front", tmp)
+        runner.run_test(check_compaction, "Compaction", tmp)
+        runner.run_test(check_concurrent_writers, "Concurrent writers", tmp)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for tiered data retention.
+Seeds a temporary database with three days of 1m candles and old real-time ticks,
+runs RetentionManager at a fixed time and checks the 5m/1h/1d rollups, the trimmed
+1m coverage and the per-minute price bars.
+"""
+
+import sys
+import os
+import logging
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.database import CryptoDatabaseManager
+from data.retention import RetentionManager, DAY_SECONDS
+from testkit import ScriptTestRunner
+
+DAY_MS = DAY_SECONDS * 1000
+START_MS = 1700000000000 // DAY_MS * DAY_MS  # 2023-11-14 00:00 UTC
+NOW = START_MS / 1000 + 3 * DAY_SECONDS + 3600  # 1m cutoff lands inside day 2
+SYMBOL = 'BTC/USDT'
+POLICY = {'ohlcv_days': {'1m': 1}, 'realtime_prices_days': 1, 'batch_size': 500,
+          'batch_pause_seconds': 0.0}
+
+
+def minute_candle(i: int):
+    """1m candle i: open 100+i, close +0.5, high +2, low -1, volume 1"""
+    open_price = 100.0 + i
+    return [START_MS + i * 60000, open_price, open_price + 2, open_price - 1, open_price + 0.5, 1.0]
+
+
+def expected_rollup(first: int, count: int):
+    """OHLCV of count consecutive 1m candles starting at index first"""
+    candles = [minute_candle(i) for i in range(first, first + count)]
+    return [candles[0][0], candles[0][1], max(c[2] for c in candles), min(c[3] for c in candles),
+            candles[-1][4], sum(c[5] for c in candles)]
+
+
+def seed(db: CryptoDatabaseManager):
+    db.insert_ohlcv_data(SYMBOL, '1m', [minute_candle(i) for i in range(3 * 1440)])
+
+    # 5 ticks per minute for 3 minutes, two days before NOW (expired)
+    tick_start = int(START_MS / 1000 + DAY_SECONDS)
+    for minute in range(3):
+        for tick in range(5):
+            db.insert_realtime_price(SYMBOL, {
+                'price': 200.0 + minute * 10 + [0, 4, -3, 2, 1][tick],
+                'volume_24h': 1000.0 + minute * 5 + tick,
+                'timestamp': tick_start + minute * 60 + tick * 10
+            })
+    # One recent tick that must stay raw
+    db.insert_realtime_price(SYMBOL, {'price': 300.0, 'timestamp': int(NOW) - 60})
+
+
+def rows(db: CryptoDatabaseManager, timeframe: str):
+    with db.read_connection() as conn:
+        return [list(row) for row in conn.execute("""
+            SELECT timestamp, open_price, high_price, low_price, close_price, volume
+            FROM ohlcv_data WHERE symbol = ? AND timeframe = ? ORDER BY timestamp
+        """, (SYMBOL, timeframe)).fetchall()]
+
+
+def check_rollups(db: CryptoDatabaseManager, results) -> str:
+    """Expired 1m candles live on as exact 5m/1h/1d candles"""
+    expired = 2 * 1440
+    assert results['ohlcv_deleted'] == expired, f"{results['ohlcv_deleted']} deleted"
+    assert results['ohlcv_rolled_up'] == expired // 5 + expired // 60 + 2, results['ohlcv_rolled_up']
+
+    for timeframe, minutes in (('5m', 5), ('1h', 60), ('1d', 1440)):
+        stored = rows(db, timeframe)
+        expected = [expected_rollup(first, minutes) for first in range(0, expired, minutes)]
+        assert len(stored) == len(expected), f"{timeframe}: {len(stored)} candles, expected {len(expected)}"
+        mismatch = next((i for i, (s, e) in enumerate(zip(stored, expected)) if s != e), None)
+        assert mismatch is None, f"{timeframe}[{mismatch}]: {stored[mismatch]} != {expected[mismatch]}"
+    return f"{results['ohlcv_rolled_up']} candles"
+
+
+def check_remaining_minutes(db: CryptoDatabaseManager, results) -> str:
+    """The unexpired day of 1m candles is untouched and its coverage trimmed to it"""
+    stored = rows(db, '1m')
+    assert stored == [minute_candle(i) for i in range(2 * 1440, 3 * 1440)], "unexpired 1m candles changed"
+
+    with db.read_connection() as conn:
+        coverage = conn.execute("""
+            SELECT timeframe, start_timestamp, end_timestamp FROM ohlcv_coverage
+            WHERE symbol = ? ORDER BY timeframe
+        """, (SYMBOL,)).fetchall()
+    coverage = {timeframe: (start, end) for timeframe, start, end in coverage}
+
+    assert coverage['1m'] == (START_MS + 2 * DAY_MS, START_MS + 3 * DAY_MS - 60000), coverage['1m']
+    assert coverage['5m'] == (START_MS, START_MS + 2 * DAY_MS - 300000), coverage['5m']
+    assert coverage['1h'] == (START_MS, START_MS + 2 * DAY_MS - 3600000), coverage['1h']
+    assert coverage['1d'] == (START_MS, START_MS + DAY_MS), coverage['1d']
+    return "coverage trimmed"
+
+
+def check_price_bars(db: CryptoDatabaseManager, results) -> str:
+    """Expired ticks become one OHLC bar per minute; recent ticks stay raw"""
+    assert results['price_bars_created'] == 3 and results['realtime_prices_deleted'] == 15, results
+
+    with db.read_connection() as conn:
+        bars = conn.execute("""
+            SELECT timestamp, open_price, high_price, low_price, close_price, volume_24h, samples
+            FROM realtime_price_bars WHERE symbol = ? ORDER BY timestamp
+        """, (SYMBOL,)).fetchall()
+        raw = conn.execute("SELECT price FROM realtime_prices WHERE symbol = ?", (SYMBOL,)).fetchall()
+
+    tick_start = int(START_MS / 1000 + DAY_SECONDS)
+    expected = [
+        (tick_start + minute * 60, 200.0 + minute * 10, 204.0 + minute * 10, 197.0 + minute * 10,
+         201.0 + minute * 10, 1004.0 + minute * 5, 5)
+        for minute in range(3)
+    ]
+    assert [tuple(bar) for bar in bars] == expected, [tuple(bar) for bar in bars]
+    assert [tuple(row) for row in raw] == [(300.0,)], f"{len(raw)} raw ticks left"
+    return "3 bars"
+
+
+def check_rerun_is_noop(db: CryptoDatabaseManager, results) -> str:
+    """A second run at the same time finds nothing to expire"""
+    again = RetentionManager(db, POLICY).run(now=NOW)
+    assert again['ohlcv_deleted'] == again['ohlcv_rolled_up'] == again['price_bars_created'] == 0, again
+    assert not again['errors'], again['errors']
+    return "idempotent"
+
+
+def main() -> int:
+    logging.disable(logging.INFO)
+    runner = ScriptTestRunner("RETENTION TESTS")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = CryptoDatabaseManager(db_path=os.path.join(tmp, "retention.db"))
+        seed(db)
+        results = RetentionManager(db, POLICY).run(now=NOW)
+        print(f"Retention run: {results['duration_seconds']}s, errors: {results['errors']}")
+
+        runner.run_test(check_rollups, "5m/1h/1d rollups", db, results)
+        runner.run_test(check_remaining_minutes, "Remaining 1m and coverage", db, results)
+        runner.run_test(check_price_bars, "Per-minute price bars", db, results)
+        runner.run_test(check_rerun_is_noop, "Second run", db, results)
+        db.close()
+
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the array-based StrategyEngine simulator.
+Checks that execute_backtest(vectorized=True) reproduces the iterrows loop for
+every strategy on a fixed random walk, including a high risk_per_trade run
+where equity turns negative and 'buy' trades open with negative quantity.
+"""
+
+import sys
+import os
+from dataclasses import asdict, replace
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from auto_trading_dashboard.backtesting_system import (
+    StrategyEngine, BacktestParameters, BacktestStrategy, TimeFrame
+)
+from testkit import ScriptTestRunner
+
+STRATEGIES = [s for s in BacktestStrategy if s != BacktestStrategy.CUSTOM]
+
+
+def make_dataset(n: int = 5000, seed: int = 11) -> pd.DataFrame:
+    """Fixed hourly OHLCV random walk"""
+    rng = np.random.default_rng(seed)
+    close = 40000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.uniform(50, 500, n)
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h'))
+
+
+def make_params(strategy: BacktestStrategy, risk_per_trade: float) -> BacktestParameters:
+    return BacktestParameters(
+        strategy=strategy,
+        symbol='BTC/USDT',
+        timeframe=TimeFrame.H1,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 8, 1),
+        initial_capital=100000,
+        max_position_size=10000,
+        commission=0.001,
+        slippage=0.0005,
+        risk_per_trade=risk_per_trade,
+        stop_loss=0.02,
+        take_profit=0.04
+    )
+
+
+def assert_same(expected, actual, path: str = 'result'):
+    """Recursive equality with float tolerance"""
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict), f"{path}: {type(actual).__name__} instead of dict"
+        assert set(expected) == set(actual), f"{path}: keys differ {set(expected) ^ set(actual)}"
+        for key in expected:
+            assert_same(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(expected, actual, check_dtype=False, obj=path)
+    elif isinstance(expected, (list, tuple)):
+        assert len(expected) == len(actual), f"{path}: length {len(actual)} != {len(expected)}"
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            assert_same(e, a, f"{path}[{i}]")
+    elif pd.api.types.is_scalar(expected) and expected is not None and pd.isna(expected):
+        assert pd.api.types.is_scalar(actual) and pd.isna(actual), f"{path}: {actual!r} != {expected!r}"
+    elif isinstance(expected, (float, np.floating)) and not isinstance(expected, bool):
+        assert np.isclose(expected, actual, rtol=1e-9, atol=1e-9), f"{path}: {actual} != {expected}"
+    else:
+        assert expected == actual, f"{path}: {actual!r} != {expected!r}"
+
+
+def run_parity(data: pd.DataFrame, risk_per_trade: float) -> str:
+    """vectorized=True == vectorized=False for every strategy"""
+    details = []
+    negative_quantity_runs = 0
+
+    for strategy in STRATEGIES:
+        params = make_params(strategy, risk_per_trade)
+        loop = StrategyEngine(params).execute_backtest(data, vectorized=False)
+        arrays = StrategyEngine(replace(params)).execute_backtest(data, vectorized=True)
+
+        name = strategy.name
+        assert_same([asdict(t) for t in loop.trades], [asdict(t) for t in arrays.trades], f"{name}.trades")
+        assert_same(loop.equity_curve, arrays.equity_curve, f"{name}.equity_curve")
+        assert_same(loop.performance_metrics, arrays.performance_metrics, f"{name}.performance_metrics")
+        assert_same(loop.monthly_returns, arrays.monthly_returns, f"{name}.monthly_returns")
+        assert_same(loop.drawdown_periods, arrays.drawdown_periods, f"{name}.drawdown_periods")
+        assert loop.total_bars == arrays.total_bars
+
+        if any(t.side == 'buy' and t.quantity < 0 for t in loop.trades):
+            negative_quantity_runs += 1
+        details.append(f"{name}={len(loop.trades)}")
+
+    return f"{', '.join(details)}; negative-quantity buys in {negative_quantity_runs} strategies"
+
+
+def check_default_risk(data: pd.DataFrame) -> str:
+    return run_parity(data, 0.02)
+
+
+def check_high_risk(data: pd.DataFrame) -> str:
+    """risk_per_trade=0.5 drives equity negative, so reversals follow the position sign"""
+    return run_parity(data, 0.5)
+
+
+def main() -> int:
+    runner = ScriptTestRunner("STRATEGY BACKTEST TESTS")
+    print("Preparing fixed dataset...")
+    data = make_dataset()
+
+    runner.run_test(check_default_risk, "Arrays vs loop (risk 0.02)", data)
+    runner.run_test(check_high_risk, "Arrays vs loop (risk 0.5)", data)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the WebSocket stream broadcaster.
+Runs ClientChannel, StreamBroadcaster and ConnectionManager against fake
+WebSockets: ticker coalescing, drop-oldest, overflow disconnects, send failures,
+Binance stream unsubscribe after the last subscriber, and a slow client next to
+a fast one.
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import threading
+from types import SimpleNamespace
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+import app.db.base  # noqa: F401  (models first, as the app does, before the API module imports User)
+from app.api.v1.websocket import ConnectionManager
+from app.services.stream_broadcaster import ClientChannel, StreamBroadcaster
+from app.services.websocket_service import websocket_manager
+from testkit import ScriptTestRunner
+
+
+class FakeWebSocket:
+    """send_text that takes `delay` seconds (or fails) and records what was sent"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        if self.fail:
+            raise ConnectionError("socket closed")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+class FakeBinanceStreams:
+    """Stands in for BinanceWebSocketManager; records started and stopped streams"""
+
+    is_running = True
+
+    def __init__(self):
+        self.started = []
+        self.stopped = []
+
+    def subscribe_ticker(self, symbol, callback):
+        self.started.append(f"ticker_{symbol.lower()}")
+
+    def unsubscribe(self, stream_name, callback):
+        self.stopped.append(stream_name)
+
+
+async def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    return condition()
+
+
+def ticker(stream: str, price: float) -> str:
+    return json.dumps({"type": "ticker", "stream": stream, "price": price})
+
+
+async def check_ticker_coalescing() -> str:
+    """Queued tickers of one stream are replaced by the newest, keeping their place"""
+    websocket = FakeWebSocket(delay=0.2)
+    channel = ClientChannel("c1", websocket)
+    channel.start()
+
+    channel.enqueue(ticker("ticker_btcusdt", 0))
+    await asyncio.sleep(0.01)  # 첫 메시지는 전송 중
+    for price in range(1, 51):
+        channel.enqueue(ticker("ticker_btcusdt", price), key="ticker_btcusdt")
+        channel.enqueue(ticker("ticker_ethusdt", price), key="ticker_ethusdt")
+    assert len(channel._queue) == 2, f"{len(channel._queue)} queued for 2 streams"
+
+    assert await wait_for(lambda: len(websocket.sent) == 3)
+    assert [m["stream"] for m in websocket.sent[1:]] == ["ticker_btcusdt", "ticker_ethusdt"], "queue order changed"
+    assert all(m["price"] == 50 for m in websocket.sent[1:]), "stale ticker sent"
+    assert channel.stats["coalesced"] == 98
+    channel.close()
+    return f"{channel.stats['coalesced']} coalesced"
+
+
+async def check_drop_oldest() -> str:
+    """Stream messages beyond max_queue drop the oldest queued one"""
+    websocket = FakeWebSocket(delay=0.5)
+    failures = []
+    channel = ClientChannel("c1", websocket, max_queue=10, on_failure=failures.append)
+    channel.start()
+
+    channel.enqueue(json.dumps({"seq": -1}))
+    await asyncio.sleep(0.01)
+    channel.enqueue(json.dumps({"type": "pong"}), droppable=False)
+    for seq in range(100):
+        channel.enqueue(json.dumps({"seq": seq}))
+
+    queued = [json.loads(m.text) for m in channel._queue]
+    assert len(queued) == 10, f"queue grew to {len(queued)}"
+    assert queued[0] == {"type": "pong"}, "direct reply dropped"
+    assert [m["seq"] for m in queued[1:]] == list(range(91, 100)), "newest messages not kept"
+    assert channel.stats["dropped"] == 91 and not failures
+    channel.close()
+    return f"{channel.stats['dropped']} dropped"
+
+
+async def check_overflow_disconnect() -> str:
+    """A queue full of undroppable replies disconnects instead of growing"""
+    websocket = FakeWebSocket(delay=5)
+    failures = []
+    channel = ClientChannel("c1", websocket, max_queue=5, on_failure=failures.append)
+    channel.start()
+    task = channel._task
+
+    channel.enqueue(json.dumps({"type": "pong"}), droppable=False)
+    await asyncio.sleep(0.01)
+    for _ in range(6):
+        channel.enqueue(json.dumps({"type": "pong"}), droppable=False)
+
+    assert failures == ["c1"], f"on_failure calls: {failures}"
+    assert channel.stats["overflowed"] and not channel._queue
+    assert await wait_for(lambda: websocket.closed_with == 1013), "socket not closed"
+    await asyncio.sleep(0)
+    assert task.cancelled(), "sender task left running"
+
+    channel.enqueue(json.dumps({"type": "pong"}), droppable=False)
+    assert not channel._queue, "closed channel accepted a message"
+    return "disconnected at 5 queued"
+
+
+async def check_send_failure_disconnects() -> str:
+    """A failed send disconnects through ConnectionManager without cancelling the sender itself"""
+    websocket_manager.binance_ws = streams = FakeBinanceStreams()
+    manager = ConnectionManager()
+    user = SimpleNamespace(id=1, username="tester", use_testnet=False)
+    websocket = FakeWebSocket(fail=True)
+
+    await manager.connect(websocket, "c1", user)
+    task = manager.broadcaster.channels["c1"]._task
+    manager.subscribe("c1", "ticker_btcusdt",
+                      lambda callback: streams.subscribe_ticker("BTCUSDT", callback))
+    await manager.send_personal_message({"type": "pong"}, "c1")
+
+    assert await wait_for(task.done), "sender task still running"
+    assert not task.cancelled(), "sender task cancelled itself while disconnecting"
+    assert "c1" not in manager.active_connections and "1" not in manager.user_connections
+    assert "c1" not in manager.broadcaster.channels
+    assert streams.stopped == ["ticker_btcusdt"], f"stopped streams: {streams.stopped}"
+    assert await wait_for(lambda: websocket.closed_with == 1013)
+    return "connection removed"
+
+
+async def check_last_subscriber_unsubscribes() -> str:
+    """The Binance stream stops only when its last subscriber leaves"""
+    websocket_manager.binance_ws = streams = FakeBinanceStreams()
+    manager = ConnectionManager()
+    start = lambda callback: streams.subscribe_ticker("BTCUSDT", callback)
+
+    for n in (1, 2, 3):
+        await manager.connect(FakeWebSocket(), f"c{n}", SimpleNamespace(id=n, username=f"u{n}", use_testnet=False))
+        manager.subscribe(f"c{n}", "ticker_btcusdt", start)
+    assert streams.started == ["ticker_btcusdt"], f"stream started {len(streams.started)} times"
+
+    manager.unsubscribe("c1", "ticker_btcusdt")
+    manager.unsubscribe("c1", "ticker_btcusdt")  # 중복 해제는 무시
+    manager.disconnect("c2")
+    assert streams.stopped == [], "stream stopped while subscribed"
+
+    manager.disconnect("c3")
+    assert streams.stopped == ["ticker_btcusdt"], f"stopped streams: {streams.stopped}"
+    assert "ticker_btcusdt" not in manager.broadcaster.subscriptions
+    manager.disconnect("c1")
+    return "stopped after last subscriber"
+
+
+async def check_slow_client_isolated() -> str:
+    """A slow client neither blocks nor grows the queue of a fast client"""
+    broadcaster = StreamBroadcaster(max_queue=20, send_timeout=30)
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=0.5)
+    broadcaster.register("fast", fast)
+    broadcaster.register("slow", slow)
+    for connection_id in ("fast", "slow"):
+        broadcaster.subscribe(connection_id, "kline_btcusdt_1m")
+        broadcaster.subscribe(connection_id, "ticker_btcusdt")
+
+    count = 500
+    max_queues = {"fast": 0, "slow": 0}
+
+    def publisher():
+        for seq in range(count):
+            broadcaster.publish_threadsafe({"type": "kline", "stream": "kline_btcusdt_1m", "seq": seq})
+            broadcaster.publish_threadsafe({"type": "ticker", "stream": "ticker_btcusdt", "seq": seq})
+            if seq % 10 == 0:
+                time.sleep(0.002)  # 실제 스트림 속도에 가깝게
+
+    start = time.monotonic()
+    thread = threading.Thread(target=publisher)
+    thread.start()
+    while thread.is_alive():
+        for connection_id, channel in broadcaster.channels.items():
+            max_queues[connection_id] = max(max_queues[connection_id], len(channel._queue))
+        await asyncio.sleep(0.001)
+    thread.join()
+
+    assert await wait_for(lambda: sum(m["type"] == "kline" for m in fast.sent) == count), \
+        f"fast client got {len(fast.sent)} messages"
+    elapsed = time.monotonic() - start
+    assert elapsed < 2.0, f"fast client finished after {elapsed:.2f}s"
+
+    stats = broadcaster.get_stats()["connections"]
+    assert stats["fast"]["dropped"] == 0, f"fast client dropped {stats['fast']['dropped']}"
+    assert max_queues["slow"] <= 20, f"slow queue grew to {max_queues['slow']}"
+    assert stats["slow"]["dropped"] > 0 and len(slow.sent) < 10
+    tickers = [m["seq"] for m in fast.sent if m["type"] == "ticker"]
+    assert tickers[-1] == count - 1, "fast client missed the last ticker"
+
+    for connection_id in ("fast", "slow"):
+        broadcaster.unregister(connection_id)
+    return f"fast max queue {max_queues['fast']}, slow dropped {stats['slow']['dropped']}"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("STREAM BROADCASTER TESTS")
+    runner.run_test(check_ticker_coalescing, "Ticker coalescing")
+    runner.run_test(check_drop_oldest, "Drop oldest")
+    runner.run_test(check_overflow_disconnect, "Overflow disconnect")
+    runner.run_test(check_send_failure_disconnects, "Send failure disconnect")
+    runner.run_test(check_last_subscriber_unsubscribes, "Last subscriber unsubscribe")
+    runner.run_test(check_slow_client_isolated, "Slow client isolation")
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
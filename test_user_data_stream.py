@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for event-driven trade management.
+Runs UserDataStream and AutoTradingEngine against the local MockExchangeServer:
+stream fills closing trades, REST reconciliation after a reconnect, listenKey
+expiry, the double-close guard and exchange-cancelled protective orders.
+"""
+
+import sys
+import os
+import time
+import asyncio
+from datetime import datetime, timedelta
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from app.core.ai_signal_generator import AISignal, SignalType, ConfidenceLevel
+from app.core.auto_trading_engine import AutoTradingEngine, OrderStatus
+from app.services.account_state import AccountStateService
+from app.services.async_binance import close_http_client
+from app.services.binance_futures_client import BinanceFuturesClient
+from app.services.mock_exchange import MockExchangeServer
+from app.services.user_data_stream import UserDataStream
+from testkit import ScriptTestRunner
+
+
+class Harness:
+    """Mock exchange with a connected engine and user data stream"""
+
+    async def __aenter__(self):
+        self.server = MockExchangeServer(api_key="mock-api-key", api_secret="mock-api-secret")
+        base_url = await self.server.start()
+        ws_url = await self.server.start_user_stream()
+
+        self.client = BinanceFuturesClient("mock-api-key", "mock-api-secret", base_url=base_url)
+        self.engine = AutoTradingEngine(self.client, AccountStateService(self.client))
+        await self.engine.account_state.refresh()
+
+        # start_monitoring()과 같은 연결, 스트림 주소만 mock 서버로
+        self.stream = UserDataStream(
+            self.client, ws_url=ws_url,
+            on_order_update=self.engine._on_order_update,
+            on_account_update=self.engine.account_state.apply_account_update,
+            on_reconnect=self.engine._reconcile_orders
+        )
+        self.engine.user_stream = self.stream
+        await self.stream.start()
+        assert await self.stream.wait_connected(5), "user data stream did not connect"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stream.stop()
+        await self.server.stop()
+        await close_http_client()
+
+    async def open_trade(self, symbol: str = "BTCUSDT", valid_for: float = 3600):
+        price = self.server.prices[symbol]
+        signal = AISignal(
+            symbol=symbol, signal_type=SignalType.LONG, confidence=90.0,
+            confidence_level=ConfidenceLevel.VERY_HIGH, entry_price=price,
+            stop_loss=price * 0.98, take_profit=price * 1.04, risk_reward_ratio=2.0,
+            reasoning="test", technical_score=90.0, market_condition_score=90.0,
+            timestamp=datetime.now(), valid_until=datetime.now() + timedelta(seconds=valid_for)
+        )
+        result = await self.engine._execute_trade(signal, {"position_quantity": 0.01, "leverage": 5})
+        assert result["success"], f"trade not opened: {result.get('reason')}"
+        return self.engine.active_trades[result["trade_id"]]
+
+    def close_orders(self, symbol: str):
+        return [order for order in self.server.orders.values()
+                if order["symbol"] == symbol and order["reduceOnly"]]
+
+
+async def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    return condition()
+
+
+async def check_fill_closes_trade() -> str:
+    """A streamed take-profit fill closes the trade without polling"""
+    async with Harness() as h:
+        trade = await h.open_trade()
+        tp_id = trade.take_profit_order.order_id
+        sl_id = trade.stop_loss_order.order_id
+
+        h.server.fill_order(tp_id)
+        assert await wait_for(lambda: not h.engine.active_trades), "trade still active after TP fill"
+
+        assert h.engine.trade_history == [trade]
+        assert trade.take_profit_order.status == OrderStatus.FILLED
+        assert h.server.orders[sl_id]["status"] == "CANCELED", "stop loss left on the exchange"
+        assert "BTCUSDT" not in h.server.positions, "position left open"
+        assert await wait_for(lambda: h.engine.account_state.snapshot.source == "stream")
+        assert tp_id not in h.stream.orders, "consumed order still tracked by the stream"
+        return f"pnl {trade.realized_pnl:.2f}"
+
+
+async def check_reconnect_reconciles() -> str:
+    """A fill missed while disconnected is found over REST after reconnecting"""
+    async with Harness() as h:
+        trade = await h.open_trade()
+
+        await h.server.drop_stream_connections()
+        assert await wait_for(lambda: not h.stream.connected and not h.server._stream_queues)
+
+        h.server.fill_order(trade.stop_loss_order.order_id)  # 끊긴 동안의 체결 (이벤트 유실)
+        assert await wait_for(lambda: h.stream.stats["connects"] == 2), "stream did not reconnect"
+        assert await wait_for(lambda: not h.engine.active_trades), "missed fill not reconciled"
+        assert trade.stop_loss_order.status == OrderStatus.FILLED
+        return f"{h.stream.stats['connects']} connects"
+
+
+async def check_listen_key_expiry() -> str:
+    """listenKeyExpired renews the key and the new connection receives events"""
+    async with Harness() as h:
+        old_key = h.stream.listen_key
+        h.server.expire_listen_key()
+        assert await wait_for(lambda: h.stream.stats["connects"] == 2 and h.stream.connected), \
+            "stream did not reconnect after listenKey expiry"
+        assert h.stream.listen_key != old_key, "listenKey not renewed"
+
+        trade = await h.open_trade()
+        h.server.fill_order(trade.take_profit_order.order_id)
+        assert await wait_for(lambda: not h.engine.active_trades), "no events on the renewed stream"
+        return "key renewed"
+
+
+async def check_double_close_guard() -> str:
+    """Concurrent closes of one trade send one close order"""
+    async with Harness() as h:
+        trade = await h.open_trade(valid_for=0.05)
+        await asyncio.sleep(0.1)  # 신호 만료 -> 모니터링 루프도 종료 시도
+
+        await asyncio.gather(h.engine._close_trade(trade), h.engine._close_trade(trade),
+                             h.engine._check_active_trades())
+
+        assert len(h.close_orders("BTCUSDT")) == 1, f"{len(h.close_orders('BTCUSDT'))} close orders sent"
+        assert h.engine.trade_history == [trade]
+        stats = h.engine.stats
+        assert stats.winning_trades + stats.losing_trades == 1, "trade counted more than once"
+        assert not h.engine._closing_trades
+        return "1 close order"
+
+
+async def check_cancelled_stop_replaced() -> str:
+    """An exchange-cancelled stop is re-placed, and the trade closed once that is exhausted"""
+    async with Harness() as h:
+        trade = await h.open_trade()
+        first = trade.stop_loss_order
+
+        h.server.expire_order(first.order_id)
+        assert await wait_for(lambda: trade.stop_loss_order is not first), "stop loss not re-placed"
+        assert first.status == OrderStatus.CANCELLED
+        assert h.server.orders[trade.stop_loss_order.order_id]["status"] == "NEW"
+
+        h.engine.config.max_protective_replacements = 1
+        h.server.expire_order(trade.stop_loss_order.order_id, status="REJECTED")
+        assert await wait_for(lambda: not h.engine.active_trades), "unprotected trade left open"
+        assert "BTCUSDT" not in h.server.positions, "unprotected position left open"
+        return f"{trade.protective_replacements} replacement"
+
+
+async def check_terminal_orders_capped() -> str:
+    """Finished orders nobody consumes are evicted beyond max_terminal_orders"""
+    async with Harness() as h:
+        h.stream.max_terminal_orders = 3
+        for _ in range(5):
+            await h.client.place_order("ETHUSDT", "BUY", "MARKET", quantity=0.1)
+        assert await wait_for(lambda: h.stream.stats["order_updates"] >= 10)
+        assert len(h.stream.orders) == 3, f"{len(h.stream.orders)} orders tracked"
+        return "3 kept"
+
+
+def main() -> int:
+    runner = ScriptTestRunner("USER DATA STREAM TESTS")
+    runner.run_test(check_fill_closes_trade, "Stream fill closes trade")
+    runner.run_test(check_reconnect_reconciles, "Reconnect REST reconciliation")
+    runner.run_test(check_listen_key_expiry, "listenKeyExpired reconnect")
+    runner.run_test(check_double_close_guard, "Double-close guard")
+    runner.run_test(check_cancelled_stop_replaced, "Exchange-cancelled stop loss")
+    runner.run_test(check_terminal_orders_capped, "Terminal order eviction")
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test script for the vectorized backtest path.
+Checks that MLSignalGenerator.predict_signals_batch and BacktestingEngine's
+vectorized backtest reproduce the bar-by-bar loop on a fixed dataset.
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_trading_signals import Config, TechnicalIndicators, MLSignalGenerator, BacktestingEngine
+from testkit import ScriptTestRunner
+
+
+def make_dataset(n: int = 320, seed: int = 7) -> pd.DataFrame:
+    """Fixed OHLCV random walk with trending and ranging stretches"""
+    rng = np.random.default_rng(seed)
+    drift = np.where((np.arange(n) // 60) % 2 == 0, 0.002, -0.0015)
+    close = 40000 * np.exp(np.cumsum(drift + rng.normal(0, 0.012, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.006, n)) * close
+
+    df = pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.uniform(50, 500, n)
+    }, index=pd.date_range('2024-01-01', periods=n, freq='1h'))
+
+    return TechnicalIndicators.add_all_indicators(df)
+
+
+def assert_same(expected, actual, path: str = 'result'):
+    """Recursive equality with float tolerance"""
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict), f"{path}: {type(actual).__name__} instead of dict"
+        assert set(expected) == set(actual), f"{path}: keys differ {set(expected) ^ set(actual)}"
+        for key in expected:
+            assert_same(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(expected, actual, check_dtype=False, obj=path)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(expected, actual, check_dtype=False, obj=path)
+    elif isinstance(expected, (list, tuple)):
+        assert len(expected) == len(actual), f"{path}: length {len(actual)} != {len(expected)}"
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            assert_same(e, a, f"{path}[{i}]")
+    elif pd.api.types.is_scalar(expected) and expected is not None and pd.isna(expected):
+        assert pd.api.types.is_scalar(actual) and pd.isna(actual), f"{path}: {actual!r} != {expected!r}"
+    elif isinstance(expected, (float, np.floating)) and not isinstance(expected, bool):
+        assert np.isclose(expected, actual, rtol=1e-9, atol=1e-9, equal_nan=True), \
+            f"{path}: {actual} != {expected}"
+    else:
+        assert expected == actual, f"{path}: {actual!r} != {expected!r}"
+
+
+def check_signals_match_loop(df: pd.DataFrame, model: MLSignalGenerator) -> int:
+    """predict_signals_batch row i == predict_signal(df.iloc[:i+1])"""
+    batch = model.predict_signals_batch(df)
+    min_lookback = max(Config.ML_LOOKBACK_PERIODS, 50)
+
+    compared = 0
+    for i in range(min_lookback, len(df)):
+        single = model.predict_signal(df.iloc[:i + 1])
+        row = batch.iloc[i]
+
+        if "error" in single:
+            assert not row['has_features'], f"bar {i}: batch has features, loop returned {single['error']}"
+            continue
+
+        assert row['has_features'], f"bar {i}: loop has features, batch does not"
+        assert row['signal'] == single['signal'], f"bar {i}: signal {row['signal']} != {single['signal']}"
+        assert row['risk_level'] == single['risk_level'], f"bar {i}: risk {row['risk_level']} != {single['risk_level']}"
+        assert np.isclose(row['confidence'], single['confidence']), f"bar {i}: confidence differs"
+        assert np.isclose(row['predicted_return'], single['predicted_return']), f"bar {i}: predicted return differs"
+        compared += 1
+
+    assert compared > 0, "no bar had features"
+    return compared
+
+
+def check_backtest_matches_loop(df: pd.DataFrame, model: MLSignalGenerator) -> int:
+    """run_backtest(vectorized=True) == run_backtest(vectorized=False)"""
+    engine = BacktestingEngine(initial_capital=10000)
+    loop_result = engine.run_backtest(df, model, vectorized=False)
+    vectorized_result = engine.run_backtest(df, model, vectorized=True)
+
+    assert "error" not in loop_result, f"loop backtest failed: {loop_result.get('error')}"
+    assert_same(loop_result, vectorized_result)
+    return len(loop_result.get('trades', []))
+
+
+def main() -> int:
+    runner = ScriptTestRunner("VECTORIZED BACKTEST TESTS")
+    print("Preparing fixed dataset and model...")
+    df = make_dataset()
+    model = MLSignalGenerator()
+    model.train_model(df)
+
+    runner.run_test(check_signals_match_loop, "Batch signals vs per-bar predict_signal", df, model)
+    runner.run_test(check_backtest_matches_loop, "Vectorized vs loop backtest", df, model)
+    return runner.summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Shared runner for the standalone test scripts.
+Same terminal output as the MarketDataTester harness in test_market_data.py:
+colored per-test PASS/FAIL lines with timing and a summary at the end.
+"""
+
+import asyncio
+import inspect
+import time
+from datetime import datetime
+
+
+class TestColors:
+    """ANSI color codes for terminal output."""
+    __test__ = False  # not a pytest test class
+
+    GREEN = '\033[92m'  # Success
+    RED = '\033[91m'    # Failure
+    YELLOW = '\033[93m' # Warning
+    BLUE = '\033[94m'   # Info
+    PURPLE = '\033[95m' # Header
+    CYAN = '\033[96m'   # Test name
+    RESET = '\033[0m'   # Reset color
+
+
+class ScriptTestRunner:
+    """
+    Runs check functions and reports them like test_market_data.py.
+
+    A check passes unless it raises; the string it returns is shown as the detail
+    line. Coroutine checks are run on a fresh event loop with a timeout.
+    """
+
+    def __init__(self, title: str, async_timeout: float = 30.0):
+        self.title = title
+        self.async_timeout = async_timeout
+        self.test_results = []
+        self.start_time = time.time()
+
+        self.print_header(title)
+        print(f"{TestColors.BLUE}📅 Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{TestColors.RESET}")
+
+    def print_header(self, title: str):
+        """Print formatted test section header."""
+        print(f"\n{TestColors.PURPLE}{'='*60}{TestColors.RESET}")
+        print(f"{TestColors.PURPLE}{title.center(60)}{TestColors.RESET}")
+        print(f"{TestColors.PURPLE}{'='*60}{TestColors.RESET}")
+
+    def print_test(self, test_name: str, status: str, message: str = "", duration: float = 0):
+        """Print formatted test result."""
+        color = TestColors.GREEN if status == "PASS" else TestColors.RED
+        status_symbol = "✓" if status == "PASS" else "✗"
+
+        print(f"{TestColors.CYAN}{test_name:<40}{TestColors.RESET} "
+              f"[{color}{status_symbol} {status}{TestColors.RESET}] "
+              f"{TestColors.BLUE}({duration:.3f}s){TestColors.RESET}")
+
+        if message:
+            print(f"    {TestColors.YELLOW}→ {message}{TestColors.RESET}")
+
+        self.test_results.append({
+            'name': test_name,
+            'status': status,
+            'message': message,
+            'duration': duration
+        })
+
+    def run_test(self, test_func, test_name: str, *args, **kwargs):
+        """Run individual test with timing and error handling."""
+        test_start = time.time()
+        try:
+            result = test_func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = asyncio.run(asyncio.wait_for(result, self.async_timeout))
+            duration = time.time() - test_start
+            self.print_test(test_name, "PASS", "" if result is None else str(result), duration)
+
+        except AssertionError as e:
+            duration = time.time() - test_start
+            self.print_test(test_name, "FAIL", str(e) or "assertion failed", duration)
+        except Exception as e:
+            duration = time.time() - test_start
+            self.print_test(test_name, "FAIL", f"Exception: {e!r}", duration)
+
+    def summary(self) -> int:
+        """
+        Print the test summary.
+
+        Returns:
+            int: Process exit code (0 if every test passed)
+        """
+        total_time = time.time() - self.start_time
+        total_tests = len(self.test_results)
+        passed_tests = len([r for r in self.test_results if r['status'] == 'PASS'])
+        failed_tests = total_tests - passed_tests
+
+        self.print_header("TEST SUMMARY")
+
+        if failed_tests == 0:
+            print(f"\n{TestColors.GREEN}✓ ALL TESTS PASSED{TestColors.RESET}")
+        else:
+            print(f"\n{TestColors.RED}✗ SOME TESTS FAILED{TestColors.RESET}")
+
+        print(f"\n📊 Results:")
+        print(f"   {TestColors.GREEN}✓ Passed: {passed_tests}{TestColors.RESET}")
+        print(f"   {TestColors.RED}✗ Failed: {failed_tests}{TestColors.RESET}")
+        print(f"   ⏱️  Total Time: {total_time:.2f} seconds")
+
+        if failed_tests > 0:
+            print(f"\n{TestColors.RED}❌ Failed Tests:{TestColors.RESET}")
+            for result in self.test_results:
+                if result['status'] == 'FAIL':
+                    print(f"   • {result['name']}: {result['message']}")
+
+        return 0 if failed_tests == 0 else 1
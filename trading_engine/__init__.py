@@ -5,12 +5,15 @@ Trading Engine Package for Crypto Trader Pro
 
 from .background_trader import BackgroundTradingBot
 from .market_monitor import MarketDataMonitor
+from .market_data_bus import MarketDataBus, MarketSubscription
 from .user_trading_context import UserTradingContext
 from .trading_scheduler import TradingScheduler, TaskPriority, ScheduledTask
 
 __all__ = [
     'BackgroundTradingBot',
     'MarketDataMonitor',
+    'MarketDataBus',
+    'MarketSubscription',
     'UserTradingContext',
     'TradingScheduler',
     'TaskPriority',
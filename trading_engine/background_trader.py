@@ -41,7 +41,8 @@ class BackgroundTradingBot:
         self.db_manager = get_db_manager()
         self.api_key_manager = get_api_key_manager()
         self.market_monitor = MarketDataMonitor()
-        self.trading_scheduler = TradingScheduler()
+        # 사용자 워커는 모니터가 발행하는 틱에 맞춰 깨어남
+        self.trading_scheduler = TradingScheduler(market_bus=self.market_monitor.market_bus)
 
         self.is_running = False
         self.active_users: Dict[int, UserTradingContext] = {}
@@ -84,12 +85,15 @@ class BackgroundTradingBot:
                 logger.error(f"Error stopping trading for user {user_id}: {e}")
 
         self.active_users.clear()
+        self.market_monitor.close()
         logger.info("Background Trading Bot stopped")
 
     async def _main_loop(self):
         """메인 거래 루프"""
         logger.info("📊 Main trading loop started")
 
+        await self.trading_scheduler.start_scheduler()
+
         while self.is_running:
             try:
                 # 활성 사용자 체크 (5분마다)
@@ -97,12 +101,9 @@ class BackgroundTradingBot:
                     await self._check_active_users()
                     self.last_user_check = datetime.utcnow()
 
-                # 시장 데이터 업데이트
+                # 시장 데이터 업데이트 (새 틱이 발행되면 구독 중인 사용자 워커가 깨어남)
                 await self.market_monitor.update_market_data()
 
-                # 각 사용자별 거래 실행
-                await self._process_user_trading()
-
                 # 1초 대기
                 await asyncio.sleep(1)
 
@@ -110,6 +111,8 @@ class BackgroundTradingBot:
                 logger.error(f"Main loop error: {e}")
                 await asyncio.sleep(5)  # 오류 시 5초 대기
 
+        await self.trading_scheduler.stop_scheduler()
+
     async def _check_active_users(self):
         """활성 거래 사용자 확인 및 업데이트"""
         try:
@@ -167,6 +170,7 @@ class BackgroundTradingBot:
             success = await user_context.start_trading()
             if success:
                 self.active_users[user.id] = user_context
+                await self.trading_scheduler.add_user_to_scheduler(user.id, user_context)
                 logger.info(f"✅ Added user {user.id} ({user.username}) to active trading")
             else:
                 logger.error(f"Failed to start trading for user {user.id}")
@@ -179,6 +183,7 @@ class BackgroundTradingBot:
         try:
             if user_id in self.active_users:
                 context = self.active_users[user_id]
+                await self.trading_scheduler.remove_user_from_scheduler(user_id)
                 await context.stop_trading()
                 del self.active_users[user_id]
                 logger.info(f"❌ Removed user {user_id} from active trading")
@@ -186,28 +191,6 @@ class BackgroundTradingBot:
         except Exception as e:
             logger.error(f"Error removing user {user_id}: {e}")
 
-    async def _process_user_trading(self):
-        """모든 활성 사용자에 대해 거래 처리"""
-        if not self.active_users:
-            return
-
-        # 각 사용자별 병렬 처리
-        tasks = []
-        for user_id, context in self.active_users.items():
-            if context.is_active:
-                task = asyncio.create_task(context.process_trading_cycle())
-                tasks.append(task)
-
-        if tasks:
-            # 모든 거래 작업을 병렬로 실행
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # 결과 처리
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    user_id = list(self.active_users.keys())[i]
-                    logger.error(f"Trading error for user {user_id}: {result}")
-
     def _load_active_users(self):
         """시작 시 활성 사용자 로드"""
         try:
@@ -243,7 +226,8 @@ class BackgroundTradingBot:
                 for user_id, context in self.active_users.items()
             ],
             'last_user_check': self.last_user_check,
-            'market_data_status': self.market_monitor.get_status()
+            'market_data_status': self.market_monitor.get_status(),
+            'scheduler_status': self.trading_scheduler.get_scheduler_status()
         }
 
 def main():
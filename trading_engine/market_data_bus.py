@@ -0,0 +1,142 @@
+"""
+Market Data Bus for Background Trading Bot
+틱 단위 시장 데이터 발행/구독 및 전략 신호 공유
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+class MarketSubscription:
+    """사용자 워커용 구독 핸들 - 새 틱이나 작업이 들어오면 깨어남"""
+
+    def __init__(self, subscriber_id: int, symbols: Optional[Iterable[str]] = None):
+        """
+        구독 초기화
+
+        Args:
+            subscriber_id: 구독자 ID (사용자 ID)
+            symbols: 관심 심볼 목록 ('exchange:BASE/QUOTE' 형식이 아닌 'BASE/QUOTE' 형식), None이면 전체
+        """
+        self.subscriber_id = subscriber_id
+        self.symbols: Optional[Set[str]] = set(symbols) if symbols is not None else None
+        self.latest_tick = 0
+        self.seen_tick = 0
+        self._event = asyncio.Event()
+
+    def notify(self, tick_id: Optional[int] = None):
+        """구독자 깨우기 (tick_id가 있으면 새 틱으로 기록)"""
+        if tick_id is not None:
+            self.latest_tick = tick_id
+        self._event.set()
+
+    def consume_tick(self) -> bool:
+        """마지막 확인 이후 새 틱이 있었는지 확인하고 소비"""
+        if self.latest_tick > self.seen_tick:
+            self.seen_tick = self.latest_tick
+            return True
+        return False
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """알림 대기 (타임아웃 시 False)"""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+
+class MarketDataBus:
+    """시장 데이터 팬아웃 버스 - 틱마다 심볼별 스냅샷 1개, 동일 전략 설정의 신호는 1회만 계산"""
+
+    def __init__(self):
+        """버스 초기화"""
+        self.tick_id = 0
+        self.snapshots: Dict[str, Dict] = {}
+        self.subscriptions: Dict[int, MarketSubscription] = {}
+
+        # (전략 키, 'exchange:symbol') -> 현재 틱의 신호
+        self._signal_cache: Dict[Tuple[str, str], Optional[Dict]] = {}
+
+        self.stats = {
+            'ticks_published': 0,
+            'signal_evaluations': 0,
+            'signal_cache_hits': 0
+        }
+
+    @staticmethod
+    def strategy_key(strategy_config: Dict[str, Any]) -> str:
+        """전략 설정의 정규화 키 (같은 설정이면 같은 키)"""
+        return json.dumps(strategy_config, sort_keys=True, default=str)
+
+    def subscribe(self, subscriber_id: int, symbols: Optional[Iterable[str]] = None) -> MarketSubscription:
+        """구독 등록 (같은 ID의 기존 구독은 교체)"""
+        subscription = MarketSubscription(subscriber_id, symbols)
+        subscription.seen_tick = self.tick_id
+        subscription.latest_tick = self.tick_id
+        self.subscriptions[subscriber_id] = subscription
+        return subscription
+
+    def unsubscribe(self, subscriber_id: int):
+        """구독 해제"""
+        self.subscriptions.pop(subscriber_id, None)
+
+    def publish(self, snapshots: Dict[str, Dict]) -> int:
+        """
+        새 틱 발행
+
+        Args:
+            snapshots: 'exchange:symbol' -> 이번 틱에 갱신된 시장 데이터
+
+        Returns:
+            새 틱 ID
+        """
+        if not snapshots:
+            return self.tick_id
+
+        self.tick_id += 1
+        self.snapshots.update(snapshots)
+        self._signal_cache.clear()
+        self.stats['ticks_published'] += 1
+
+        updated_symbols = {key.split(':', 1)[1] for key in snapshots}
+        for subscription in self.subscriptions.values():
+            if subscription.symbols is None or subscription.symbols & updated_symbols:
+                subscription.notify(self.tick_id)
+
+        return self.tick_id
+
+    def get_snapshot(self, exchange: str, symbol: str) -> Optional[Dict]:
+        """최신 스냅샷 조회"""
+        return self.snapshots.get(f"{exchange}:{symbol}")
+
+    def get_signal(self, strategy_key: str, exchange: str, symbol: str,
+                   compute: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """
+        현재 틱의 공유 신호 조회 - 같은 전략 키/심볼 조합은 틱당 한 번만 계산
+
+        반환된 신호는 여러 사용자가 공유하므로 읽기 전용으로 다뤄야 함
+        """
+        cache_key = (strategy_key, f"{exchange}:{symbol}")
+        if cache_key in self._signal_cache:
+            self.stats['signal_cache_hits'] += 1
+            return self._signal_cache[cache_key]
+
+        signal = compute()
+        self._signal_cache[cache_key] = signal
+        self.stats['signal_evaluations'] += 1
+        return signal
+
+    def get_status(self) -> Dict[str, Any]:
+        """버스 상태 조회"""
+        return {
+            'tick_id': self.tick_id,
+            'snapshots': len(self.snapshots),
+            'subscribers': len(self.subscriptions),
+            'cached_signals': len(self._signal_cache),
+            **self.stats
+        }
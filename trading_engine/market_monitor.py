@@ -5,12 +5,17 @@ Market Data Monitor for Background Trading Bot
 
 import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import ccxt
-import pandas as pd
 from collections import defaultdict, deque
 
+from utils.market_data import RateLimiter, BINANCE_WEIGHT_PER_MINUTE, binance_request_weight
+from utils.streaming_indicators import get_indicator_engine
+from .market_data_bus import MarketDataBus
+
 logger = logging.getLogger(__name__)
 
 class MarketDataMonitor:
@@ -31,9 +36,36 @@ class MarketDataMonitor:
         self.last_update_time = datetime.utcnow()
         self.update_interval = 10  # 10초마다 업데이트
 
+        # 증분 기술적 지표 엔진 (모든 모니터가 공유)
+        self.indicator_engine = get_indicator_engine()
+
         # 모니터링할 심볼 목록
         self.symbols = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'ADA/USDT', 'SOL/USDT']
 
+        # 비동기 동시 조회 설정
+        # ccxt 동기 클라이언트는 전용 스레드 풀에서 실행하여 이벤트 루프를 막지 않음
+        self.max_concurrent_requests = 8  # 모든 심볼/거래소가 공유하는 동시 요청 예산
+        self.symbol_timeout = 5.0  # 심볼별 타임아웃 (초)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_requests,
+            thread_name_prefix='market-fetch'
+        )
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+
+        # 요청 가중치 기반 토큰 버킷 (CRYPTO_TRADER_RATE_LIMIT_FILE 설정 시 다른 프로세스와 한도 공유)
+        self.rate_limiter = RateLimiter(
+            max_calls_per_second=10,
+            max_calls_per_minute=1200,
+            enable_burst_protection=False,
+            max_weight_per_minute=BINANCE_WEIGHT_PER_MINUTE
+        )
+
+        # 사이클별 지연 시간 지표
+        self.cycle_metrics: deque = deque(maxlen=100)
+
+        # 사용자 워커에게 틱 단위로 스냅샷을 발행하는 버스
+        self.market_bus = MarketDataBus()
+
         logger.info("Market Data Monitor initialized")
 
     async def update_market_data(self):
@@ -45,99 +77,180 @@ class MarketDataMonitor:
             if current_time - self.last_update_time < timedelta(seconds=self.update_interval):
                 return
 
-            # 각 거래소별 데이터 업데이트
-            for exchange_name, exchange in self.exchanges.items():
-                await self._update_exchange_data(exchange_name, exchange)
+            cycle_start = time.perf_counter()
 
+            # 모든 거래소 데이터를 동시에 업데이트
+            results = await asyncio.gather(*[
+                self._update_exchange_data(exchange_name, exchange)
+                for exchange_name, exchange in self.exchanges.items()
+            ])
+
+            self._record_cycle_metrics(cycle_start, results)
             self.last_update_time = current_time
 
+            # 이번 틱에 갱신된 심볼 스냅샷 발행
+            self._publish_tick(results)
+
         except Exception as e:
             logger.error(f"Market data update error: {e}")
 
-    async def _update_exchange_data(self, exchange_name: str, exchange):
-        """특정 거래소 데이터 업데이트"""
-        try:
-            for symbol in self.symbols:
-                try:
-                    # 현재 가격 및 티커 데이터
-                    ticker = exchange.fetch_ticker(symbol)
+    async def _run_request(self, func, *args, **kwargs):
+        """공유 동시 요청 예산 안에서 동기 ccxt 호출을 스레드 풀로 실행"""
+        # 한도 대기는 세마포어 밖에서 - 대기 중인 요청이 동시 요청 슬롯을 점유하지 않도록
+        weight = binance_request_weight(getattr(func, '__name__', ''), kwargs.get('limit'))
+        await self.rate_limiter.acquire_async(weight)
 
-                    # OHLCV 데이터 (최근 100개)
-                    ohlcv = exchange.fetch_ohlcv(symbol, '1m', limit=100)
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
-                    # 시장 데이터 구성
-                    market_data = {
-                        'symbol': symbol,
-                        'exchange': exchange_name,
-                        'timestamp': datetime.utcnow(),
-                        'price': ticker['last'],
-                        'bid': ticker['bid'],
-                        'ask': ticker['ask'],
-                        'volume': ticker['quoteVolume'],
-                        'change_24h': ticker['percentage'],
-                        'high_24h': ticker['high'],
-                        'low_24h': ticker['low'],
-                        'ticker': ticker,
-                        'ohlcv': ohlcv
-                    }
-
-                    # 기술적 분석 지표 계산
-                    technical_data = self._calculate_technical_indicators(symbol, ohlcv)
-                    market_data.update(technical_data)
-
-                    # 데이터 저장
-                    self.market_data[f"{exchange_name}:{symbol}"] = market_data
-
-                    # 가격 히스토리 저장
-                    self.price_history[f"{exchange_name}:{symbol}"].append({
-                        'timestamp': datetime.utcnow(),
-                        'price': ticker['last'],
-                        'volume': ticker['quoteVolume']
-                    })
+        async with self._request_semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
 
-                except Exception as e:
-                    logger.error(f"Error updating {symbol} on {exchange_name}: {e}")
+    async def _update_exchange_data(self, exchange_name: str, exchange) -> Dict[str, Dict[str, Any]]:
+        """특정 거래소 데이터 업데이트 (모든 심볼 동시 조회)"""
+        try:
+            results = await asyncio.gather(*[
+                self._update_symbol_data(exchange_name, exchange, symbol)
+                for symbol in self.symbols
+            ])
+            return dict(zip(self.symbols, results))
 
         except Exception as e:
             logger.error(f"Error updating exchange {exchange_name}: {e}")
+            return {}
 
-    def _calculate_technical_indicators(self, symbol: str, ohlcv: List) -> Dict[str, Any]:
-        """기술적 분석 지표 계산"""
-        try:
-            if not ohlcv or len(ohlcv) < 20:
-                return {'technical_indicators': {}}
+    async def _update_symbol_data(self, exchange_name: str, exchange, symbol: str) -> Dict[str, Any]:
+        """단일 심볼 업데이트 - 심볼별 타임아웃으로 느린 심볼이 다른 심볼을 지연시키지 않음"""
+        start = time.perf_counter()
+        status = 'ok'
 
-            # OHLCV 데이터를 DataFrame으로 변환
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        try:
+            # 현재 가격 및 티커 데이터 + OHLCV 데이터 (최근 100개) 동시 조회
+            ticker, ohlcv = await asyncio.wait_for(
+                asyncio.gather(
+                    self._run_request(exchange.fetch_ticker, symbol),
+                    self._run_request(exchange.fetch_ohlcv, symbol, '1m', limit=100)
+                ),
+                timeout=self.symbol_timeout
+            )
+
+            # 시장 데이터 구성
+            market_data = {
+                'symbol': symbol,
+                'exchange': exchange_name,
+                'timestamp': datetime.utcnow(),
+                'price': ticker['last'],
+                'bid': ticker['bid'],
+                'ask': ticker['ask'],
+                'volume': ticker['quoteVolume'],
+                'change_24h': ticker['percentage'],
+                'high_24h': ticker['high'],
+                'low_24h': ticker['low'],
+                'ticker': ticker,
+                'ohlcv': ohlcv
+            }
 
-            indicators = {}
+            # 기술적 분석 지표 계산
+            technical_data = self._calculate_technical_indicators(exchange_name, symbol, ohlcv)
+            market_data.update(technical_data)
 
-            # RSI 계산
-            indicators['rsi'] = self._calculate_rsi(df['close'])
+            # 데이터 저장
+            self.market_data[f"{exchange_name}:{symbol}"] = market_data
 
-            # 이동평균 계산
-            indicators['sma_20'] = df['close'].rolling(window=20).mean().iloc[-1]
-            indicators['ema_20'] = df['close'].ewm(span=20).mean().iloc[-1]
+            # 가격 히스토리 저장
+            self.price_history[f"{exchange_name}:{symbol}"].append({
+                'timestamp': datetime.utcnow(),
+                'price': ticker['last'],
+                'volume': ticker['quoteVolume']
+            })
 
-            # MACD 계산
-            macd_data = self._calculate_macd(df['close'])
-            indicators.update(macd_data)
+        except asyncio.TimeoutError:
+            status = 'timeout'
+            logger.warning(f"Timeout updating {symbol} on {exchange_name} (>{self.symbol_timeout}s)")
+        except Exception as e:
+            status = 'error'
+            logger.error(f"Error updating {symbol} on {exchange_name}: {e}")
+
+        return {'status': status, 'latency_ms': (time.perf_counter() - start) * 1000}
+
+    def _publish_tick(self, results: List[Dict[str, Dict[str, Any]]]):
+        """성공적으로 갱신된 심볼만 버스에 발행"""
+        snapshots = {}
+        for exchange_name, exchange_results in zip(self.exchanges.keys(), results):
+            for symbol, result in exchange_results.items():
+                key = f"{exchange_name}:{symbol}"
+                if result['status'] == 'ok' and key in self.market_data:
+                    snapshots[key] = self.market_data[key]
+
+        self.market_bus.publish(snapshots)
+
+    def _record_cycle_metrics(self, cycle_start: float, results: List[Dict[str, Dict[str, Any]]]):
+        """사이클별 지연 시간 지표 기록"""
+        symbol_results = [result for exchange_results in results for result in exchange_results.values()]
+        latencies = sorted(result['latency_ms'] for result in symbol_results)
+
+        self.cycle_metrics.append({
+            'timestamp': datetime.utcnow(),
+            'cycle_ms': (time.perf_counter() - cycle_start) * 1000,
+            'symbols': len(symbol_results),
+            'max_symbol_ms': latencies[-1] if latencies else 0,
+            'p50_symbol_ms': latencies[len(latencies) // 2] if latencies else 0,
+            'timeouts': sum(1 for result in symbol_results if result['status'] == 'timeout'),
+            'errors': sum(1 for result in symbol_results if result['status'] == 'error')
+        })
+
+    def get_latency_metrics(self) -> Dict[str, Any]:
+        """업데이트 사이클 지연 시간 지표 조회"""
+        if not self.cycle_metrics:
+            return {'cycles': 0}
+
+        cycle_times = [metric['cycle_ms'] for metric in self.cycle_metrics]
+        last = self.cycle_metrics[-1]
 
-            # 볼린저 밴드
-            bb_data = self._calculate_bollinger_bands(df['close'])
-            indicators.update(bb_data)
+        return {
+            'cycles': len(self.cycle_metrics),
+            'last_cycle_ms': round(last['cycle_ms'], 2),
+            'avg_cycle_ms': round(sum(cycle_times) / len(cycle_times), 2),
+            'max_cycle_ms': round(max(cycle_times), 2),
+            'last_p50_symbol_ms': round(last['p50_symbol_ms'], 2),
+            'last_max_symbol_ms': round(last['max_symbol_ms'], 2),
+            'total_timeouts': sum(metric['timeouts'] for metric in self.cycle_metrics),
+            'total_errors': sum(metric['errors'] for metric in self.cycle_metrics)
+        }
 
-            # 거래량 분석
-            indicators['volume_sma_20'] = df['volume'].rolling(window=20).mean().iloc[-1]
-            indicators['volume_ratio'] = df['volume'].iloc[-1] / indicators['volume_sma_20'] if indicators['volume_sma_20'] > 0 else 1
+    def _calculate_technical_indicators(self, exchange_name: str, symbol: str, ohlcv: List) -> Dict[str, Any]:
+        """기술적 분석 지표 계산 (스트리밍 엔진 - 새로 들어온 캔들만 반영)"""
+        try:
+            if not ohlcv or len(ohlcv) < 20:
+                return {'technical_indicators': {}}
 
-            # 변동성 계산
-            indicators['volatility'] = df['close'].pct_change().rolling(window=20).std().iloc[-1] * 100
+            # 마지막 캔들은 진행 중인 캔들로 처리
+            values = self.indicator_engine.update_ohlcv(exchange_name, symbol, '1m', ohlcv)
+            if not values:
+                return {'technical_indicators': {}}
 
-            # 가격 변화율
-            indicators['price_change_1h'] = ((df['close'].iloc[-1] - df['close'].iloc[-60]) / df['close'].iloc[-60] * 100) if len(df) >= 60 else 0
-            indicators['price_change_4h'] = ((df['close'].iloc[-1] - df['close'].iloc[-240]) / df['close'].iloc[-240] * 100) if len(df) >= 240 else 0
+            def _value(key: str) -> float:
+                value = values.get(key)
+                return float('nan') if value is None else value
+
+            indicators = {
+                'rsi': values['rsi'] if values.get('rsi') is not None else 50,
+                'sma_20': _value('sma_20'),
+                'ema_20': _value('ema_20'),
+                'macd_line': _value('macd_line'),
+                'macd_signal': _value('macd_signal'),
+                'macd_histogram': _value('macd_histogram'),
+                'bb_upper': _value('bb_upper'),
+                'bb_middle': _value('bb_middle'),
+                'bb_lower': _value('bb_lower'),
+                'bb_width': _value('bb_width'),
+                'volume_sma_20': _value('volume_sma'),
+                'volume_ratio': _value('volume_ratio'),
+                'volatility': _value('volatility'),
+                'price_change_1h': values.get('price_change_60', 0),
+                'price_change_4h': values.get('price_change_240', 0)
+            }
 
             return {'technical_indicators': indicators}
 
@@ -145,67 +258,6 @@ class MarketDataMonitor:
             logger.error(f"Technical indicators calculation error for {symbol}: {e}")
             return {'technical_indicators': {}}
 
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
-        """RSI 계산"""
-        try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-
-            return rsi.iloc[-1] if not pd.isna(rsi.iloc[-1]) else 50
-
-        except Exception:
-            return 50
-
-    def _calculate_macd(self, prices: pd.Series) -> Dict[str, float]:
-        """MACD 계산"""
-        try:
-            ema_12 = prices.ewm(span=12).mean()
-            ema_26 = prices.ewm(span=26).mean()
-            macd_line = ema_12 - ema_26
-            signal_line = macd_line.ewm(span=9).mean()
-            histogram = macd_line - signal_line
-
-            return {
-                'macd_line': macd_line.iloc[-1],
-                'macd_signal': signal_line.iloc[-1],
-                'macd_histogram': histogram.iloc[-1]
-            }
-
-        except Exception:
-            return {
-                'macd_line': 0,
-                'macd_signal': 0,
-                'macd_histogram': 0
-            }
-
-    def _calculate_bollinger_bands(self, prices: pd.Series, period: int = 20, std_dev: int = 2) -> Dict[str, float]:
-        """볼린저 밴드 계산"""
-        try:
-            sma = prices.rolling(window=period).mean()
-            std = prices.rolling(window=period).std()
-
-            upper_band = sma + (std * std_dev)
-            lower_band = sma - (std * std_dev)
-
-            return {
-                'bb_upper': upper_band.iloc[-1],
-                'bb_middle': sma.iloc[-1],
-                'bb_lower': lower_band.iloc[-1],
-                'bb_width': ((upper_band.iloc[-1] - lower_band.iloc[-1]) / sma.iloc[-1]) * 100
-            }
-
-        except Exception:
-            return {
-                'bb_upper': 0,
-                'bb_middle': 0,
-                'bb_lower': 0,
-                'bb_width': 0
-            }
-
     def get_market_data(self, exchange: str, symbol: str) -> Optional[Dict]:
         """특정 심볼의 시장 데이터 조회"""
         key = f"{exchange}:{symbol}"
@@ -308,5 +360,12 @@ class MarketDataMonitor:
             'monitored_symbols': len(self.symbols),
             'data_points': len(self.market_data),
             'exchanges': list(self.exchanges.keys()),
-            'symbols': self.symbols
-        }
\ No newline at end of file
+            'symbols': self.symbols,
+            'latency': self.get_latency_metrics(),
+            'market_bus': self.market_bus.get_status(),
+            'rate_limiter': self.rate_limiter.get_stats()
+        }
+
+    def close(self):
+        """조회 스레드 풀 정리"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -10,16 +10,25 @@ from typing import Dict, List, Optional, Any, Callable
 from collections import defaultdict
 import json
 
+from .market_data_bus import MarketDataBus, MarketSubscription
+
 logger = logging.getLogger(__name__)
 
 class TradingScheduler:
     """거래 스케줄러 클래스"""
 
-    def __init__(self):
-        """스케줄러 초기화"""
+    def __init__(self, market_bus: Optional[MarketDataBus] = None):
+        """
+        스케줄러 초기화
+
+        Args:
+            market_bus: 시장 데이터 버스 - 지정하면 워커가 폴링 대신 새 틱/작업 알림에 깨어남
+        """
         self.scheduled_tasks: Dict[str, Dict] = {}
         self.user_task_queues: Dict[int, asyncio.Queue] = defaultdict(lambda: asyncio.Queue())
         self.user_workers: Dict[int, asyncio.Task] = {}
+        self.user_subscriptions: Dict[int, MarketSubscription] = {}
+        self.market_bus = market_bus
         self.is_running = False
 
         # 스케줄링 설정
@@ -83,6 +92,8 @@ class TradingScheduler:
 
                 del self.user_workers[user_id]
 
+            self._unsubscribe_user(user_id)
+
             # 큐 정리
             if user_id in self.user_task_queues:
                 # 큐의 남은 작업들을 모두 소비
@@ -105,6 +116,14 @@ class TradingScheduler:
         """사용자별 워커 - 독립적인 거래 루프"""
         logger.info(f"Starting worker for user {user_id}")
 
+        # 버스가 있으면 새 틱마다 신호 처리, 없으면 고정 간격 폴링
+        subscription = None
+        if self.market_bus is not None:
+            subscription = self.market_bus.subscribe(
+                user_id, getattr(trading_context, 'market_symbols', None)
+            )
+            self.user_subscriptions[user_id] = subscription
+
         try:
             last_signal_time = datetime.utcnow()
             last_position_check = datetime.utcnow()
@@ -115,7 +134,11 @@ class TradingScheduler:
                     current_time = datetime.utcnow()
 
                     # 신호 생성 스케줄
-                    if (current_time - last_signal_time).total_seconds() >= self.default_intervals['signal_generation']:
+                    if subscription is not None:
+                        if subscription.consume_tick():
+                            await self._schedule_signal_generation(user_id, trading_context)
+                            last_signal_time = current_time
+                    elif (current_time - last_signal_time).total_seconds() >= self.default_intervals['signal_generation']:
                         await self._schedule_signal_generation(user_id, trading_context)
                         last_signal_time = current_time
 
@@ -132,8 +155,17 @@ class TradingScheduler:
                     # 큐에서 대기 중인 작업 처리
                     await self._process_user_queue(user_id, trading_context)
 
-                    # 짧은 대기
-                    await asyncio.sleep(1)
+                    if subscription is not None:
+                        # 다음 틱, 커스텀 작업, 또는 다음 주기 작업 시점까지 대기
+                        now = datetime.utcnow()
+                        next_due = min(
+                            self.default_intervals['position_check'] - (now - last_position_check).total_seconds(),
+                            self.default_intervals['risk_check'] - (now - last_risk_check).total_seconds()
+                        )
+                        await subscription.wait(timeout=max(next_due, 0.1))
+                    else:
+                        # 짧은 대기
+                        await asyncio.sleep(1)
 
                 except asyncio.CancelledError:
                     break
@@ -146,8 +178,22 @@ class TradingScheduler:
         except Exception as e:
             logger.error(f"Worker error for user {user_id}: {e}")
         finally:
+            if self.user_subscriptions.get(user_id) is subscription:
+                self._unsubscribe_user(user_id)
             logger.info(f"Worker for user {user_id} stopped")
 
+    def _unsubscribe_user(self, user_id: int):
+        """사용자 버스 구독 해제"""
+        self.user_subscriptions.pop(user_id, None)
+        if self.market_bus is not None:
+            self.market_bus.unsubscribe(user_id)
+
+    def _wake_user(self, user_id: int):
+        """새 작업이 들어왔을 때 대기 중인 워커 깨우기"""
+        subscription = self.user_subscriptions.get(user_id)
+        if subscription is not None:
+            subscription.notify()
+
     async def _schedule_signal_generation(self, user_id: int, trading_context):
         """신호 생성 스케줄링"""
         try:
@@ -199,13 +245,14 @@ class TradingScheduler:
         try:
             queue = self.user_task_queues[user_id]
 
-            # 큐에서 작업 하나씩 처리 (논블로킹)
-            try:
-                task = queue.get_nowait()
+            # 대기 중인 작업을 모두 처리 (논블로킹)
+            while True:
+                try:
+                    task = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
                 await self._execute_task(task, trading_context)
                 queue.task_done()
-            except asyncio.QueueEmpty:
-                pass
 
         except Exception as e:
             logger.error(f"Error processing queue for user {user_id}: {e}")
@@ -248,6 +295,7 @@ class TradingScheduler:
             }
 
             await self.user_task_queues[user_id].put(task)
+            self._wake_user(user_id)
 
         except Exception as e:
             logger.error(f"Error scheduling custom task for user {user_id}: {e}")
@@ -285,6 +333,7 @@ class TradingScheduler:
                 'active_workers': active_workers,
                 'total_queue_size': total_queue_size,
                 'intervals': self.default_intervals,
+                'event_driven': self.market_bus is not None,
                 'user_statuses': user_statuses
             }
 
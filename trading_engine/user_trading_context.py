@@ -12,6 +12,7 @@ import ccxt
 
 from database import get_db_manager, User, TradingSettings, TradingSession
 from .market_monitor import MarketDataMonitor
+from .market_data_bus import MarketDataBus
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class UserTradingContext:
         self.trading_settings = trading_settings
         self.api_key, self.api_secret = api_credentials
         self.market_monitor = market_monitor
+        self.market_bus: MarketDataBus = market_monitor.market_bus
         self.db_manager = get_db_manager()
 
         # 거래 상태
@@ -96,6 +98,10 @@ class UserTradingContext:
                 'min_signal_confidence': 70
             }
 
+        # 공유 신호 캐시 키 및 버스 구독 심볼 ('BTCUSDT' -> 'BTC/USDT')
+        self.strategy_key = MarketDataBus.strategy_key(self.strategy_config)
+        self.market_symbols = [symbol.replace('USDT', '/USDT') for symbol in self.symbols]
+
     async def start_trading(self) -> bool:
         """거래 세션 시작"""
         try:
@@ -191,7 +197,16 @@ class UserTradingContext:
             logger.error(f"Symbol trading error for {symbol}, user {self.user.id}: {e}")
 
     def _generate_trading_signal(self, symbol: str, market_data: Dict) -> Optional[Dict]:
-        """거래 신호 생성"""
+        """거래 신호 생성 - 같은 전략 설정을 쓰는 사용자끼리 틱당 한 번만 계산해 공유"""
+        return self.market_bus.get_signal(
+            self.strategy_key,
+            market_data.get('exchange', 'binance'),
+            symbol,
+            lambda: self._compute_trading_signal(symbol, market_data)
+        )
+
+    def _compute_trading_signal(self, symbol: str, market_data: Dict) -> Optional[Dict]:
+        """전략 신호 계산 (사용자 상태에 의존하지 않는 순수 계산)"""
         try:
             indicators = market_data.get('technical_indicators', {})
             price = market_data['price']
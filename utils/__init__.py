@@ -3,14 +3,25 @@ Utility modules for Crypto Trader Pro.
 
 This module provides essential utilities for cryptocurrency trading including:
 - Market data collection and API integration (MarketDataCollector)
+- Token bucket API rate limiting with request weights (RateLimiter)
+- Bounded LRU/TTL market data cache with request coalescing (MarketDataCache)
+- Keyed SQLite response cache with TTL and background compaction (PersistentCache)
 - Custom exception handling system (TradingBotException and derivatives)
 - Input validation and data sanitization (validation helpers)
+- Tuned SQLite connections and writer/reader pool (SQLiteConnectionPool)
+- Incremental technical indicators shared by market monitors (StreamingIndicatorEngine)
 - Error handling decorators and utilities
 
 Version: 1.0.0
 """
 
-from .market_data import MarketDataCollector, calculate_price_change, validate_ohlcv_data
+from .market_data import (
+    MarketDataCollector,
+    RateLimiter,
+    binance_request_weight,
+    calculate_price_change,
+    validate_ohlcv_data
+)
 from .exceptions import (
     TradingBotException,
     APIConnectionError,
@@ -35,11 +46,16 @@ from .validation_helpers import (
     validate_amount,
     validate_percentage,
     validate_ohlcv_candle,
+    validate_ohlcv_array,
     validate_orderbook_data,
     validate_ticker_data,
     sanitize_input,
     validate_trading_params as validate_trading_params_decorator
 )
+from .market_cache import MarketDataCache, CachePolicy
+from .persistent_cache import PersistentCache
+from .sqlite_pool import SQLiteConnectionPool, connect_sqlite, install_sqlalchemy_pragmas
+from .streaming_indicators import StreamingIndicatorEngine, get_indicator_engine
 
 __version__ = "1.0.0"
 __author__ = "Crypto Trader Pro Team"
@@ -47,8 +63,13 @@ __author__ = "Crypto Trader Pro Team"
 __all__ = [
     # Market data collection
     'MarketDataCollector',
+    'RateLimiter',
+    'binance_request_weight',
     'calculate_price_change',
     'validate_ohlcv_data',
+    'MarketDataCache',
+    'CachePolicy',
+    'PersistentCache',
 
     # Exception handling
     'TradingBotException',
@@ -74,8 +95,18 @@ __all__ = [
     'validate_amount',
     'validate_percentage',
     'validate_ohlcv_candle',
+    'validate_ohlcv_array',
     'validate_orderbook_data',
     'validate_ticker_data',
     'sanitize_input',
-    'validate_trading_params_decorator'
+    'validate_trading_params_decorator',
+
+    # SQLite connections
+    'SQLiteConnectionPool',
+    'connect_sqlite',
+    'install_sqlalchemy_pragmas',
+
+    # Streaming indicators
+    'StreamingIndicatorEngine',
+    'get_indicator_engine'
 ]
\ No newline at end of file
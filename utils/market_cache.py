@@ -0,0 +1,280 @@
+"""
+Bounded market data cache for cryptocurrency trading bot.
+LRU eviction, per-data-type TTLs, stale-while-revalidate and request coalescing.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Freshness rules for one data type.
+
+    Attributes:
+        ttl (float): Seconds an entry is served as fresh
+        stale_ttl (float): Further seconds it is served while a background refresh runs
+    """
+    ttl: float
+    stale_ttl: float = 0.0
+
+
+# Order books move fastest and are never served stale; symbol lists barely change
+DEFAULT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    'default': CachePolicy(ttl=5.0),
+    'price': CachePolicy(ttl=2.0, stale_ttl=3.0),
+    'ticker': CachePolicy(ttl=5.0, stale_ttl=10.0),
+    'book_top': CachePolicy(ttl=1.0),
+    'orderbook': CachePolicy(ttl=2.0),
+    'klines': CachePolicy(ttl=10.0, stale_ttl=20.0),
+    'symbol_validation': CachePolicy(ttl=3600.0)
+}
+
+
+class _CacheEntry:
+    __slots__ = ('value', 'data_type', 'stored_at', 'fresh_until', 'stale_until')
+
+    def __init__(self, value: Any, data_type: str, policy: CachePolicy, now: float):
+        self.value = value
+        self.data_type = data_type
+        self.stored_at = now
+        self.fresh_until = now + policy.ttl
+        self.stale_until = self.fresh_until + policy.stale_ttl
+
+
+class MarketDataCache:
+    """
+    Thread-safe bounded cache for exchange responses.
+
+    Features:
+    - Size bound with least-recently-used eviction
+    - TTL per data type (CachePolicy)
+    - Stale-while-revalidate: a stale entry is returned at once and refreshed in the background
+    - Request coalescing: concurrent misses for one key share a single fetch
+    - Hit/miss/eviction counters for monitoring
+    """
+
+    def __init__(self, max_entries: int = 2048,
+                 policies: Optional[Dict[str, CachePolicy]] = None,
+                 refresh_workers: int = 2):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum cached entries before LRU eviction
+            policies (Optional[Dict[str, CachePolicy]]): Overrides for DEFAULT_CACHE_POLICIES
+            refresh_workers (int): Threads for background stale-while-revalidate refreshes
+        """
+        self.max_entries = max(1, max_entries)
+        self.policies = dict(DEFAULT_CACHE_POLICIES)
+        if policies:
+            self.policies.update(policies)
+        self.refresh_workers = max(1, refresh_workers)
+
+        self._entries: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+
+        self._counters = dict.fromkeys(
+            ('hits', 'stale_hits', 'misses', 'coalesced', 'evictions',
+             'refreshes', 'refresh_errors'), 0
+        )
+
+    def policy(self, data_type: str) -> CachePolicy:
+        """Get the policy of a data type (the 'default' policy if it has none)."""
+        return self.policies.get(data_type, self.policies['default'])
+
+    def set_policy(self, data_type: str, ttl: float, stale_ttl: float = 0.0):
+        """Set the TTLs of a data type; applies to entries stored afterwards."""
+        self.policies[data_type] = CachePolicy(ttl=ttl, stale_ttl=stale_ttl)
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """
+        Get a cached value without loading it.
+
+        Args:
+            key (str): Cache key
+            allow_stale (bool): Also return entries inside their stale window
+
+        Returns:
+            Optional[Any]: Cached value, or None on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (now < entry.fresh_until or (allow_stale and now < entry.stale_until)):
+                self._entries.move_to_end(key)
+                self._counters['hits' if now < entry.fresh_until else 'stale_hits'] += 1
+                return entry.value
+
+            self._counters['misses'] += 1
+            return None
+
+    def set(self, key: str, value: Any, data_type: str = 'default'):
+        """
+        Store a value, evicting least recently used entries beyond max_entries.
+
+        Args:
+            key (str): Cache key
+            value (Any): Value to cache
+            data_type (str): Data type selecting the TTL policy
+        """
+        entry = _CacheEntry(value, data_type, self.policy(data_type), time.monotonic())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], data_type: str = 'default') -> Any:
+        """
+        Get a value, loading it on a miss.
+
+        Concurrent callers missing the same key wait for one load. A stale entry is
+        returned immediately while a single background refresh replaces it.
+
+        Args:
+            key (str): Cache key
+            loader (Callable[[], Any]): Fetches the value (its exceptions reach every waiting caller)
+            data_type (str): Data type selecting the TTL policy
+
+        Returns:
+            Any: Cached or freshly loaded value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.fresh_until:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+                return entry.value
+
+            if entry is not None and now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self._counters['stale_hits'] += 1
+                if key not in self._inflight:
+                    self._inflight[key] = Future()
+                    self._counters['refreshes'] += 1
+                    self._executor().submit(self._refresh, key, loader, data_type)
+                return entry.value
+
+            pending = self._inflight.get(key)
+            if pending is not None:
+                self._counters['coalesced'] += 1
+            else:
+                self._counters['misses'] += 1
+                future = Future()
+                self._inflight[key] = future
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = loader()
+            self.set(key, value, data_type)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _refresh(self, key: str, loader: Callable[[], Any], data_type: str):
+        """Background refresh of a stale entry."""
+        with self._lock:
+            future = self._inflight.get(key)
+        try:
+            value = loader()
+            self.set(key, value, data_type)
+            if future is not None:
+                future.set_result(value)
+        except Exception as e:
+            with self._lock:
+                self._counters['refresh_errors'] += 1
+            logger.warning(f"Background refresh of {key} failed: {e}")
+            if future is not None:
+                future.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._refresh_executor is None:
+            self._refresh_executor = ThreadPoolExecutor(max_workers=self.refresh_workers,
+                                                        thread_name_prefix='cache-refresh')
+        return self._refresh_executor
+
+    def invalidate(self, key: str):
+        """Drop one entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Entry counts (fresh/stale/expired, per type), hit/miss/eviction
+                            counters and hit rate
+        """
+        now = time.monotonic()
+        with self._lock:
+            fresh = stale = expired = 0
+            by_type: Dict[str, int] = {}
+            for entry in self._entries.values():
+                if now < entry.fresh_until:
+                    fresh += 1
+                elif now < entry.stale_until:
+                    stale += 1
+                else:
+                    expired += 1
+                by_type[entry.data_type] = by_type.get(entry.data_type, 0) + 1
+
+            counters = dict(self._counters)
+            total = len(self._entries)
+            inflight = len(self._inflight)
+
+        lookups = counters['hits'] + counters['stale_hits'] + counters['misses'] + counters['coalesced']
+        served = counters['hits'] + counters['stale_hits'] + counters['coalesced']
+        return {
+            'total_entries': total,
+            'valid_entries': fresh,
+            'stale_entries': stale,
+            'expired_entries': expired,
+            'max_entries': self.max_entries,
+            'entries_by_type': by_type,
+            'inflight': inflight,
+            'hit_rate_percent': round(served / lookups * 100, 1) if lookups else 0.0,
+            **counters,
+            'policies': {name: {'ttl': p.ttl, 'stale_ttl': p.stale_ttl} for name, p in self.policies.items()}
+        }
+
+    def close(self):
+        """Stop the background refresh threads."""
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False)
+            self._refresh_executor = None
@@ -8,7 +8,7 @@ Enhanced Features:
 - Automatic call distribution to prevent API limit violations
 - Configurable rate limits for different exchange profiles
 - Real-time statistics and monitoring
-- Intelligent caching with TTL support
+- Bounded LRU cache with per-data-type TTLs, stale-while-revalidate and request coalescing
 - Comprehensive error handling with safe loop-based retry logic (no recursion)
 
 Recursion Safety:
@@ -19,7 +19,14 @@ Recursion Safety:
 - No decorators used - all retry logic is inline and explicit
 """
 
+import asyncio
+import os
+import struct
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 import ccxt
 from typing import Dict, List, Optional, Any, Union
 from functools import wraps
@@ -33,6 +40,7 @@ from .exceptions import (
     InsufficientDataError,
     NetworkTimeoutError
 )
+from .market_cache import CachePolicy, MarketDataCache
 from .validation_helpers import (
     validate_symbol as validate_symbol_format,
     validate_limit,
@@ -41,6 +49,13 @@ from .validation_helpers import (
     validate_ohlcv_candle
 )
 
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -215,97 +230,337 @@ def _is_retryable_error(exception: Exception) -> bool:
     return True
 
 
+# Binance spot REQUEST_WEIGHT per ccxt method (/api/v3 endpoints)
+BINANCE_REQUEST_WEIGHTS = {
+    'fetch_time': 1,
+    'load_markets': 20,
+    'fetch_ticker': 2,
+    'fetch_tickers': 80,
+    'fetch_bids_asks': 4,
+    'fetch_ohlcv': 2,
+    'fetch_trades': 25,
+}
+
+# Order book weight depends on the requested depth: (max limit, weight)
+BINANCE_ORDER_BOOK_WEIGHTS = ((100, 5), (500, 25), (1000, 50), (5000, 250))
+
+# Binance spot REQUEST_WEIGHT limit per IP
+BINANCE_WEIGHT_PER_MINUTE = 6000
+
+# Processes that set this variable to the same path share one rate-limit quota
+SHARED_QUOTA_ENV_VAR = 'CRYPTO_TRADER_RATE_LIMIT_FILE'
+
+# Cache key prefix -> data type whose TTL policy applies (see DEFAULT_CACHE_POLICIES)
+CACHE_KEY_TYPES = (
+    ('current_price_', 'price'),
+    ('24h_ticker_', 'ticker'),
+    ('book_top_', 'book_top'),
+    ('orderbook_', 'orderbook'),
+    ('klines_', 'klines'),
+    ('symbol_validation_', 'symbol_validation'),
+)
+
+
+def binance_request_weight(method: str, limit: Optional[int] = None) -> int:
+    """
+    Get the Binance request weight of a ccxt call.
+
+    Args:
+        method (str): ccxt method name (e.g. 'fetch_ticker')
+        limit (Optional[int]): Requested depth for 'fetch_order_book'
+
+    Returns:
+        int: Request weight (1 for unknown methods)
+    """
+    if method == 'fetch_order_book':
+        depth = limit or 100
+        for max_limit, weight in BINANCE_ORDER_BOOK_WEIGHTS:
+            if depth <= max_limit:
+                return weight
+        return BINANCE_ORDER_BOOK_WEIGHTS[-1][1]
+    return BINANCE_REQUEST_WEIGHTS.get(method, 1)
+
+
+class _SharedQuotaFile:
+    """
+    File-backed token bucket state shared by every process using the same path.
+
+    The file holds one (tokens, last_refill) pair of doubles per bucket slot and is
+    updated under an exclusive OS file lock, so limiters in separate processes draw
+    from a single quota.
+    """
+
+    SLOTS = 3
+    _FORMAT = '<' + 'd' * (2 * SLOTS)
+    _SIZE = struct.calcsize(_FORMAT)
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+
+    def _lock(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def update(self, func):
+        """Apply func to the bucket state list under the file lock and persist it."""
+        self._lock()
+        try:
+            raw = os.pread(self._fd, self._SIZE, 0) if hasattr(os, 'pread') else self._read()
+            if len(raw) == self._SIZE:
+                values = struct.unpack(self._FORMAT, raw)
+                state = [[values[2 * i], values[2 * i + 1]] for i in range(self.SLOTS)]
+            else:
+                state = [[0.0, 0.0] for _ in range(self.SLOTS)]
+
+            result = func(state)
+
+            data = struct.pack(self._FORMAT, *[value for pair in state for value in pair])
+            if hasattr(os, 'pwrite'):
+                os.pwrite(self._fd, data, 0)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, data)
+            return result
+        finally:
+            self._unlock()
+
+    def _read(self) -> bytes:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        return os.read(self._fd, self._SIZE)
+
+    def close(self):
+        os.close(self._fd)
+
+
 class RateLimiter:
     """
-    Advanced rate limiter to control API call frequency with multiple time windows.
+    Token bucket rate limiter with weight accounting and optional cross-process quota.
 
     Features:
-    - Configurable rate limits for different time windows
-    - Automatic distribution of calls over time
-    - Burst protection with gradual backoff
-    - Exchange-specific rate limit profiles
+    - Per-second and per-minute call buckets plus an optional per-minute weight bucket
+    - O(1) reservation: each acquire refills the buckets and reserves its slot under a
+      short lock, then sleeps outside the lock, so concurrent threads queue fairly
+    - Blocking (acquire / wait_if_needed) and asyncio (acquire_async) variants
+    - Binance request weights via binance_request_weight()
+    - Optional file-backed quota shared by all processes using the same path
     """
 
+    # Bucket slots (also the layout of the shared quota file)
+    _SECOND_SLOT = 0
+    _MINUTE_SLOT = 1
+    _WEIGHT_SLOT = 2
+
+    # Share of a per-minute limit available as a burst. The remainder refills over the
+    # minute, so no 60 s window exceeds the limit: burst + refill per minute == limit.
+    MINUTE_BURST_FRACTION = 0.2
+
     def __init__(self,
                  max_calls_per_second: int = 10,
                  max_calls_per_minute: int = 600,
                  enable_burst_protection: bool = True,
-                 exchange_profile: str = "binance"):
+                 exchange_profile: str = "binance",
+                 max_weight_per_minute: Optional[int] = None,
+                 shared_quota_path: Optional[str] = None):
         """
         Initialize rate limiter with configurable limits.
 
         Args:
             max_calls_per_second (int): Maximum API calls per second
             max_calls_per_minute (int): Maximum API calls per minute
-            enable_burst_protection (bool): Enable burst protection for smooth distribution
+            enable_burst_protection (bool): Space calls evenly instead of allowing a burst
+                                            of max_calls_per_second at once
             exchange_profile (str): Exchange-specific rate limit profile
+            max_weight_per_minute (Optional[int]): Request weight budget per minute (disabled if None)
+            shared_quota_path (Optional[str]): File backing a quota shared across processes.
+                                               Defaults to the CRYPTO_TRADER_RATE_LIMIT_FILE
+                                               environment variable when set.
         """
         self.max_calls_per_second = max_calls_per_second
         self.max_calls_per_minute = max_calls_per_minute
+        self.max_weight_per_minute = max_weight_per_minute
         self.enable_burst_protection = enable_burst_protection
         self.exchange_profile = exchange_profile
 
-        # Track calls in different time windows
-        self.calls_1s = []  # Calls in last 1 second
-        self.calls_1m = []  # Calls in last 1 minute
+        self._lock = threading.Lock()
+
+        # Shared quota uses wall-clock time so that timestamps agree across processes
+        shared_quota_path = shared_quota_path or os.environ.get(SHARED_QUOTA_ENV_VAR)
+        self._shared = _SharedQuotaFile(shared_quota_path) if shared_quota_path else None
+        self._clock = time.time if self._shared else time.monotonic
+        self._state = [[0.0, 0.0] for _ in range(_SharedQuotaFile.SLOTS)]
 
-        # Burst protection settings
-        self.min_interval = 1.0 / max_calls_per_second if enable_burst_protection else 0
-        self.last_call_time = 0
+        # Recent call times for statistics (trimmed as they expire)
+        self.calls_1s: deque = deque()
+        self.calls_1m: deque = deque()
 
         # Statistics
         self.total_calls = 0
+        self.total_weight = 0
         self.total_wait_time = 0
 
         logger.debug(f"RateLimiter initialized: {max_calls_per_second}/s, {max_calls_per_minute}/m, "
-                    f"burst_protection={enable_burst_protection}, profile={exchange_profile}")
+                    f"weight={max_weight_per_minute}/m, burst_protection={enable_burst_protection}, "
+                    f"profile={exchange_profile}, shared_quota={shared_quota_path}")
+
+    @property
+    def min_interval(self) -> float:
+        """Minimum spacing between calls enforced by burst protection."""
+        if self.enable_burst_protection and self.max_calls_per_second > 0:
+            return 1.0 / self.max_calls_per_second
+        return 0
+
+    def configure(self,
+                  max_calls_per_second: Optional[int] = None,
+                  max_calls_per_minute: Optional[int] = None,
+                  enable_burst_protection: Optional[bool] = None,
+                  max_weight_per_minute: Optional[int] = None):
+        """
+        Change limits at runtime; accumulated bucket state is kept.
+
+        Args:
+            max_calls_per_second (Optional[int]): New calls per second limit
+            max_calls_per_minute (Optional[int]): New calls per minute limit
+            enable_burst_protection (Optional[bool]): Enable/disable burst protection
+            max_weight_per_minute (Optional[int]): New weight per minute budget
+        """
+        with self._lock:
+            if max_calls_per_second is not None:
+                self.max_calls_per_second = max_calls_per_second
+            if max_calls_per_minute is not None:
+                self.max_calls_per_minute = max_calls_per_minute
+            if enable_burst_protection is not None:
+                self.enable_burst_protection = enable_burst_protection
+            if max_weight_per_minute is not None:
+                self.max_weight_per_minute = max_weight_per_minute
+
+    def _buckets(self, weight: int) -> List[tuple]:
+        """Active buckets as (slot, capacity, refill rate per second, cost)."""
+        # Burst protection = capacity 1, i.e. calls spaced 1/rate apart
+        second_capacity = 1 if self.enable_burst_protection else self.max_calls_per_second
+        buckets = [
+            (self._SECOND_SLOT, second_capacity, float(self.max_calls_per_second), 1),
+            (self._MINUTE_SLOT, *self._minute_bucket(self.max_calls_per_minute), 1),
+        ]
+        if self.max_weight_per_minute:
+            buckets.append((self._WEIGHT_SLOT, *self._minute_bucket(self.max_weight_per_minute), weight))
+        return [bucket for bucket in buckets if bucket[1] > 0 and bucket[2] > 0]
+
+    def _minute_bucket(self, limit: int) -> tuple:
+        """(capacity, refill rate per second) admitting at most `limit` per rolling minute."""
+        capacity = max(1, int(limit * self.MINUTE_BURST_FRACTION)) if limit > 0 else 0
+        return capacity, max(limit - capacity, 0) / 60.0
+
+    def _reserve_in_state(self, state: List[List[float]], now: float, weight: int) -> float:
+        """Reserve the earliest time all buckets can pay for the call; returns that time."""
+        buckets = self._buckets(weight)
+
+        # An untouched slot (last_refill == 0) starts full
+        for slot, capacity, _, _ in buckets:
+            if state[slot][1] <= 0:
+                state[slot][0], state[slot][1] = capacity, now
+
+        execute_at = now
+        for slot, capacity, rate, cost in buckets:
+            tokens, last_refill = state[slot]
+            reference = max(now, last_refill)
+            available = min(capacity, tokens + (reference - last_refill) * rate)
+            ready = reference if available >= cost else reference + (cost - available) / rate
+            execute_at = max(execute_at, ready)
+
+        for slot, capacity, rate, cost in buckets:
+            tokens, last_refill = state[slot]
+            state[slot][0] = min(capacity, tokens + (execute_at - last_refill) * rate) - cost
+            state[slot][1] = execute_at
+
+        return execute_at
+
+    def reserve(self, weight: int = 1) -> float:
+        """
+        Reserve capacity for one call without sleeping.
+
+        Args:
+            weight (int): Request weight of the call
 
-    def wait_if_needed(self):
+        Returns:
+            float: Seconds the caller must wait before issuing the call
         """
-        Wait if necessary to respect rate limits across multiple time windows.
-        Implements intelligent distribution of calls to avoid hitting limits.
+        with self._lock:
+            now = self._clock()
+            if self._shared is not None:
+                execute_at = self._shared.update(lambda state: self._reserve_in_state(state, now, weight))
+            else:
+                execute_at = self._reserve_in_state(self._state, now, weight)
+
+            delay = max(0.0, execute_at - now)
+
+            # Statistics
+            self.calls_1s.append(execute_at)
+            self.calls_1m.append(execute_at)
+            self._trim_history(now)
+            self.total_calls += 1
+            self.total_weight += weight
+            self.total_wait_time += delay
+
+        if delay > 0:
+            logger.debug(f"Rate limiting: waiting {delay:.3f}s (weight={weight})")
+        return delay
+
+    def acquire(self, weight: int = 1) -> float:
         """
-        now = time.time()
-        wait_time = 0
-
-        # Clean old calls from tracking lists
-        self.calls_1s = [t for t in self.calls_1s if now - t < 1.0]
-        self.calls_1m = [t for t in self.calls_1m if now - t < 60.0]
-
-        # Check burst protection (minimum interval between calls)
-        if self.enable_burst_protection and self.last_call_time > 0:
-            time_since_last = now - self.last_call_time
-            if time_since_last < self.min_interval:
-                burst_wait = self.min_interval - time_since_last
-                wait_time = max(wait_time, burst_wait)
-                logger.debug(f"Burst protection: minimum interval {burst_wait:.3f}s")
-
-        # Check 1-second limit
-        if len(self.calls_1s) >= self.max_calls_per_second:
-            oldest_call = min(self.calls_1s)
-            second_wait = 1.0 - (now - oldest_call) + 0.001  # Small buffer
-            wait_time = max(wait_time, second_wait)
-            logger.debug(f"1-second limit: waiting {second_wait:.3f}s")
-
-        # Check 1-minute limit
-        if len(self.calls_1m) >= self.max_calls_per_minute:
-            oldest_call = min(self.calls_1m)
-            minute_wait = 60.0 - (now - oldest_call) + 0.001  # Small buffer
-            wait_time = max(wait_time, minute_wait)
-            logger.debug(f"1-minute limit: waiting {minute_wait:.3f}s")
-
-        # Perform the wait if needed
-        if wait_time > 0:
-            logger.debug(f"Rate limiting: sleeping for {wait_time:.3f}s")
-            time.sleep(wait_time)
-            now = time.time()  # Update time after sleep
-            self.total_wait_time += wait_time
-
-        # Record this call
-        self.calls_1s.append(now)
-        self.calls_1m.append(now)
-        self.last_call_time = now
-        self.total_calls += 1
+        Block until a call of the given weight may be issued.
+
+        Args:
+            weight (int): Request weight of the call
+
+        Returns:
+            float: Seconds waited
+        """
+        delay = self.reserve(weight)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, weight: int = 1) -> float:
+        """
+        Asyncio variant of acquire(); waits without blocking the event loop.
+
+        Args:
+            weight (int): Request weight of the call
+
+        Returns:
+            float: Seconds waited
+        """
+        delay = self.reserve(weight)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def wait_if_needed(self, weight: int = 1):
+        """
+        Wait if necessary to respect rate limits (alias of acquire()).
+
+        Args:
+            weight (int): Request weight of the call
+        """
+        self.acquire(weight)
+
+    def _trim_history(self, now: float):
+        while self.calls_1s and now - self.calls_1s[0] >= 1.0:
+            self.calls_1s.popleft()
+        while self.calls_1m and now - self.calls_1m[0] >= 60.0:
+            self.calls_1m.popleft()
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -314,30 +569,39 @@ class RateLimiter:
         Returns:
             Dict[str, Any]: Statistics including total calls, wait time, etc.
         """
-        now = time.time()
-
-        # Clean old calls for accurate current stats
-        self.calls_1s = [t for t in self.calls_1s if now - t < 1.0]
-        self.calls_1m = [t for t in self.calls_1m if now - t < 60.0]
-
-        return {
-            'total_calls': self.total_calls,
-            'total_wait_time_seconds': round(self.total_wait_time, 3),
-            'calls_last_second': len(self.calls_1s),
-            'calls_last_minute': len(self.calls_1m),
-            'max_calls_per_second': self.max_calls_per_second,
-            'max_calls_per_minute': self.max_calls_per_minute,
-            'burst_protection_enabled': self.enable_burst_protection,
-            'exchange_profile': self.exchange_profile,
-            'efficiency_percent': round((self.total_calls / max(self.total_calls + self.total_wait_time, 1)) * 100, 1)
-        }
+        with self._lock:
+            now = self._clock()
+            self._trim_history(now)
+
+            return {
+                'total_calls': self.total_calls,
+                'total_weight': self.total_weight,
+                'total_wait_time_seconds': round(self.total_wait_time, 3),
+                'calls_last_second': sum(1 for t in self.calls_1s if t <= now),
+                'calls_last_minute': sum(1 for t in self.calls_1m if t <= now),
+                'max_calls_per_second': self.max_calls_per_second,
+                'max_calls_per_minute': self.max_calls_per_minute,
+                'max_weight_per_minute': self.max_weight_per_minute,
+                'burst_protection_enabled': self.enable_burst_protection,
+                'exchange_profile': self.exchange_profile,
+                'shared_quota': str(self._shared.path) if self._shared else None,
+                'efficiency_percent': round((self.total_calls / max(self.total_calls + self.total_wait_time, 1)) * 100, 1)
+            }
 
     def reset_stats(self):
         """Reset statistics counters."""
-        self.total_calls = 0
-        self.total_wait_time = 0
+        with self._lock:
+            self.total_calls = 0
+            self.total_weight = 0
+            self.total_wait_time = 0
         logger.debug("Rate limiter statistics reset")
 
+    def close(self):
+        """Release the shared quota file, if any."""
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
 
 class MarketDataCollector:
     """
@@ -346,7 +610,7 @@ class MarketDataCollector:
     Features:
     - Automatic retry with exponential backoff
     - Rate limiting compliance
-    - Data validation and caching
+    - Data validation and bounded caching (LRU, per-type TTLs, request coalescing)
     - Comprehensive error handling
     - Support for both testnet and mainnet
     """
@@ -358,7 +622,11 @@ class MarketDataCollector:
                  enable_rate_limiting: bool = True,
                  rate_limit_calls_per_second: int = 10,
                  rate_limit_calls_per_minute: int = 600,
-                 enable_burst_protection: bool = True):
+                 enable_burst_protection: bool = True,
+                 rate_limit_weight_per_minute: Optional[int] = BINANCE_WEIGHT_PER_MINUTE,
+                 rate_limit_shared_quota_path: Optional[str] = None,
+                 cache_max_entries: int = 2048,
+                 cache_ttls: Optional[Dict[str, Any]] = None):
         """
         Initialize market data collector with advanced rate limiting.
 
@@ -370,6 +638,13 @@ class MarketDataCollector:
             rate_limit_calls_per_second (int): Max API calls per second (default: 10)
             rate_limit_calls_per_minute (int): Max API calls per minute (default: 600)
             enable_burst_protection (bool): Enable burst protection for smooth distribution (default: True)
+            rate_limit_weight_per_minute (Optional[int]): Binance request weight budget per minute
+                                                          (default: 6000, None disables weight accounting)
+            rate_limit_shared_quota_path (Optional[str]): File for a quota shared by all collector
+                                                          processes (default: CRYPTO_TRADER_RATE_LIMIT_FILE)
+            cache_max_entries (int): Cached responses kept before LRU eviction (default: 2048)
+            cache_ttls (Optional[Dict[str, Any]]): Per data type TTL overrides, either seconds or
+                                                   (ttl, stale_ttl) - e.g. {'price': 1, 'klines': (30, 60)}
         """
         self.testnet = testnet
         self.enable_rate_limiting = enable_rate_limiting
@@ -380,13 +655,18 @@ class MarketDataCollector:
                 max_calls_per_second=rate_limit_calls_per_second,
                 max_calls_per_minute=rate_limit_calls_per_minute,
                 enable_burst_protection=enable_burst_protection,
-                exchange_profile="binance"
+                exchange_profile="binance",
+                max_weight_per_minute=rate_limit_weight_per_minute,
+                shared_quota_path=rate_limit_shared_quota_path
             )
         else:
             self.rate_limiter = None
 
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.cache_ttl = 5  # Cache timeout in seconds
+        policies = {}
+        for data_type, ttl in (cache_ttls or {}).items():
+            policies[data_type] = CachePolicy(*ttl) if isinstance(ttl, (tuple, list)) else CachePolicy(float(ttl))
+        self.cache = MarketDataCache(max_entries=cache_max_entries, policies=policies)
+        self.cache_ttl = self.cache.policy('default').ttl  # Fallback TTL in seconds
 
         # Initialize exchange
         try:
@@ -407,10 +687,15 @@ class MarketDataCollector:
                 exchange="binance"
             )
 
-    def _apply_rate_limiting(self):
-        """Apply rate limiting if enabled."""
+    def _apply_rate_limiting(self, weight: int = 1):
+        """
+        Apply rate limiting if enabled.
+
+        Args:
+            weight (int): Request weight of the upcoming call (see binance_request_weight)
+        """
         if self.enable_rate_limiting and self.rate_limiter:
-            self._apply_rate_limiting()
+            self.rate_limiter.acquire(weight)
 
     def get_rate_limiter_stats(self) -> Optional[Dict[str, Any]]:
         """
@@ -431,7 +716,8 @@ class MarketDataCollector:
     def configure_rate_limits(self,
                             calls_per_second: int = None,
                             calls_per_minute: int = None,
-                            enable_burst_protection: bool = None):
+                            enable_burst_protection: bool = None,
+                            weight_per_minute: int = None):
         """
         Dynamically reconfigure rate limits.
 
@@ -439,52 +725,52 @@ class MarketDataCollector:
             calls_per_second (int, optional): New calls per second limit
             calls_per_minute (int, optional): New calls per minute limit
             enable_burst_protection (bool, optional): Enable/disable burst protection
+            weight_per_minute (int, optional): New request weight budget per minute
         """
         if not self.enable_rate_limiting or not self.rate_limiter:
             logger.warning("Rate limiting is disabled, cannot configure limits")
             return
 
-        if calls_per_second is not None:
-            self.rate_limiter.max_calls_per_second = calls_per_second
-            if enable_burst_protection is not False:  # Don't change if explicitly set to False
-                self.rate_limiter.min_interval = 1.0 / calls_per_second
-
-        if calls_per_minute is not None:
-            self.rate_limiter.max_calls_per_minute = calls_per_minute
-
-        if enable_burst_protection is not None:
-            self.rate_limiter.enable_burst_protection = enable_burst_protection
-            if enable_burst_protection:
-                self.rate_limiter.min_interval = 1.0 / self.rate_limiter.max_calls_per_second
-            else:
-                self.rate_limiter.min_interval = 0
+        self.rate_limiter.configure(
+            max_calls_per_second=calls_per_second,
+            max_calls_per_minute=calls_per_minute,
+            enable_burst_protection=enable_burst_protection,
+            max_weight_per_minute=weight_per_minute
+        )
 
         logger.info(f"Rate limits reconfigured: {calls_per_second}/s, {calls_per_minute}/m, "
-                   f"burst_protection={enable_burst_protection}")
+                   f"weight={weight_per_minute}/m, burst_protection={enable_burst_protection}")
+
+    @staticmethod
+    def _cache_type(cache_key: str) -> str:
+        """Data type (TTL policy) of a cache key."""
+        for prefix, data_type in CACHE_KEY_TYPES:
+            if cache_key.startswith(prefix):
+                return data_type
+        return 'default'
 
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached data is still valid."""
-        if cache_key not in self.cache:
-            return False
-
-        cache_time = self.cache[cache_key].get('timestamp', 0)
-        return time.time() - cache_time < self.cache_ttl
+        return self.cache.get(cache_key) is not None
 
     def _get_from_cache(self, cache_key: str) -> Optional[Any]:
         """Get data from cache if valid."""
-        if self._is_cache_valid(cache_key):
-            logger.debug(f"Cache hit for {cache_key}")
-            return self.cache[cache_key]['data']
-        return None
+        return self.cache.get(cache_key)
 
     def _set_cache(self, cache_key: str, data: Any):
-        """Store data in cache with timestamp."""
-        self.cache[cache_key] = {
-            'data': data,
-            'timestamp': time.time()
-        }
+        """Store data in cache under the TTL policy of its data type."""
+        self.cache.set(cache_key, data, self._cache_type(cache_key))
         logger.debug(f"Cached data for {cache_key}")
 
+    def _get_cached(self, cache_key: str, loader) -> Any:
+        """
+        Get data from cache, loading it on a miss.
+
+        Concurrent misses for one key share a single API call, and types with a
+        stale window are refreshed in the background while the old value is served.
+        """
+        return self.cache.get_or_load(cache_key, loader, self._cache_type(cache_key))
+
     def test_connection(self) -> bool:
         """
         Test connection to Binance API.
@@ -504,8 +790,7 @@ class MarketDataCollector:
         for attempt in range(max_retries):
             try:
                 # Apply rate limiting if enabled
-                if self.enable_rate_limiting and self.rate_limiter:
-                    self.rate_limiter.wait_if_needed()
+                self._apply_rate_limiting(binance_request_weight('fetch_time'))
 
                 # Direct API call - just fetch server time
                 server_time = self.exchange.fetch_time()
@@ -574,19 +859,15 @@ class MarketDataCollector:
             if cached_result is not None:
                 return cached_result
 
-            self._apply_rate_limiting()
-
             # Load markets if not already loaded
             if not hasattr(self.exchange, 'markets') or not self.exchange.markets:
+                self._apply_rate_limiting(binance_request_weight('load_markets'))
                 self.exchange.load_markets()
 
             is_valid = symbol in self.exchange.markets
 
-            # Cache the result for longer (symbols don't change often)
-            self.cache[cache_key] = {
-                'data': is_valid,
-                'timestamp': time.time()
-            }
+            # Cached for longer (symbols don't change often)
+            self._set_cache(cache_key, is_valid)
 
             if not is_valid:
                 raise InvalidSymbolError(
@@ -627,12 +908,6 @@ class MarketDataCollector:
             APIConnectionError: If API connection fails
             DataValidationError: If price data is invalid
         """
-        # Check cache first
-        cache_key = f"current_price_{symbol}"
-        cached_price = self._get_from_cache(cache_key)
-        if cached_price is not None:
-            return cached_price
-
         # Simple validation without retry - check if symbol format is valid
         if not symbol or '/' not in symbol:
             raise InvalidSymbolError(
@@ -641,6 +916,10 @@ class MarketDataCollector:
                 message=f"Invalid symbol format: {symbol}"
             )
 
+        return self._get_cached(f"current_price_{symbol}", lambda: self._fetch_current_price(symbol))
+
+    def _fetch_current_price(self, symbol: str) -> float:
+        """Fetch the last price of a symbol, bypassing the cache."""
         # Direct API call with simple retry loop
         max_retries = 3
         last_error = None
@@ -648,8 +927,7 @@ class MarketDataCollector:
         for attempt in range(max_retries):
             try:
                 # Apply rate limiting
-                if self.enable_rate_limiting and self.rate_limiter:
-                    self.rate_limiter.wait_if_needed()
+                self._apply_rate_limiting(binance_request_weight('fetch_ticker'))
 
                 # Direct ccxt API call
                 ticker = self.exchange.fetch_ticker(symbol)
@@ -675,9 +953,6 @@ class MarketDataCollector:
                 # Convert to float
                 price = float(price)
 
-                # Cache the successful result
-                self._set_cache(cache_key, price)
-
                 logger.debug(f"Current price for {symbol}: {price}")
                 return price
 
@@ -758,12 +1033,9 @@ class MarketDataCollector:
         self.validate_symbol(symbol)
 
         cache_key = f"24h_ticker_{symbol}"
-        cached_ticker = self._get_from_cache(cache_key)
-        if cached_ticker is not None:
-            return cached_ticker
 
         def _fetch_ticker():
-            self._apply_rate_limiting()
+            self._apply_rate_limiting(binance_request_weight('fetch_ticker'))
 
             ticker = self.exchange.fetch_ticker(symbol)
 
@@ -791,8 +1063,6 @@ class MarketDataCollector:
                 if normalized_ticker.get(field) is None:
                     logger.debug(f"Optional field {field} missing in ticker data for {symbol}")
 
-            self._set_cache(cache_key, normalized_ticker)
-
             # Use safe access for logging
             volume_info = normalized_ticker.get('volume', 'N/A')
             change_info = normalized_ticker.get('percentage', 'N/A')
@@ -801,7 +1071,7 @@ class MarketDataCollector:
             return normalized_ticker
 
         try:
-            return simple_retry_call(_fetch_ticker, max_retries=3)
+            return self._get_cached(cache_key, lambda: simple_retry_call(_fetch_ticker, max_retries=3))
         except Exception as e:
             if isinstance(e, DataValidationError):
                 raise
@@ -934,29 +1204,20 @@ class MarketDataCollector:
         limit = validate_limit(limit, min_value=1, max_value=1000, field_name="limit")
 
         cache_key = f"orderbook_{symbol}_{limit}"
-        cached_orderbook = self._get_from_cache(cache_key)
-        if cached_orderbook is not None:
-            return cached_orderbook
 
         def _fetch_orderbook():
-            self._apply_rate_limiting()
+            self._apply_rate_limiting(binance_request_weight('fetch_order_book', limit))
 
             orderbook = self.exchange.fetch_order_book(symbol, limit)
 
             # Use validation helper to thoroughly validate orderbook structure
             validated_orderbook = validate_orderbook_data(orderbook)
 
-            # Reduce cache TTL for orderbook (more volatile)
-            original_ttl = self.cache_ttl
-            self.cache_ttl = 2  # 2 seconds for orderbook
-            self._set_cache(cache_key, validated_orderbook)
-            self.cache_ttl = original_ttl
-
             logger.debug(f"Orderbook for {symbol}: {len(validated_orderbook['bids'])} bids, {len(validated_orderbook['asks'])} asks")
             return validated_orderbook
 
         try:
-            return simple_retry_call(_fetch_orderbook, max_retries=3)
+            return self._get_cached(cache_key, lambda: simple_retry_call(_fetch_orderbook, max_retries=3))
         except Exception as e:
             if isinstance(e, DataValidationError):
                 raise
@@ -973,14 +1234,20 @@ class MarketDataCollector:
 
             raise categorized_exception
 
-    def get_klines(self, symbol: str, interval: str = '5m', limit: int = 500) -> List[List[float]]:
+    def get_klines(self, symbol: str, interval: str = '5m', limit: int = 500,
+                   since: Optional[int] = None, end_time: Optional[int] = None) -> List[List[float]]:
         """
         Get candlestick (OHLCV) data.
 
+        Without since the most recent candles are returned; with since the request pages
+        forward through history from that timestamp.
+
         Args:
             symbol (str): Trading symbol (e.g., 'BTC/USDT')
             interval (str): Time interval ('1m', '5m', '15m', '1h', '4h', '1d', etc.)
             limit (int): Number of candles (max 1000)
+            since (Optional[int]): Open time (ms) of the first candle to return
+            end_time (Optional[int]): Open time (ms) of the last candle to return (inclusive)
 
         Returns:
             List[List[float]]: List of OHLCV data [timestamp, open, high, low, close, volume]
@@ -996,17 +1263,16 @@ class MarketDataCollector:
         interval = validate_interval(interval)
         limit = validate_limit(limit, min_value=1, max_value=1000, field_name="limit")
 
-        cache_key = f"klines_{symbol}_{interval}_{limit}"
-        cached_klines = self._get_from_cache(cache_key)
-        if cached_klines is not None:
-            return cached_klines
+        cache_key = f"klines_{symbol}_{interval}_{limit}_{since}_{end_time}"
 
         def _fetch_klines():
-            self._apply_rate_limiting()
+            self._apply_rate_limiting(binance_request_weight('fetch_ohlcv'))
 
-            ohlcv = self.exchange.fetch_ohlcv(symbol, interval, limit=limit)
+            params = {'endTime': int(end_time)} if end_time is not None else {}
+            ohlcv = self.exchange.fetch_ohlcv(symbol, interval, since=since, limit=limit, params=params)
 
-            if len(ohlcv) < limit * 0.8:  # If we got less than 80% of requested data
+            # Historical pages legitimately come back short (listing date, endTime, outages)
+            if since is None and len(ohlcv) < limit * 0.8:  # If we got less than 80% of requested data
                 logger.warning(f"Received {len(ohlcv)} candles, requested {limit} for {symbol}")
 
             if len(ohlcv) == 0:
@@ -1031,13 +1297,11 @@ class MarketDataCollector:
                         expected_type="array of length 6 [timestamp, open, high, low, close, volume]"
                     )
 
-            self._set_cache(cache_key, ohlcv)
-
             logger.debug(f"Retrieved {len(ohlcv)} {interval} candles for {symbol}")
             return ohlcv
 
         try:
-            return simple_retry_call(_fetch_klines, max_retries=3)
+            return self._get_cached(cache_key, lambda: simple_retry_call(_fetch_klines, max_retries=3))
         except Exception as e:
             if isinstance(e, (DataValidationError, InsufficientDataError)):
                 raise
@@ -1054,16 +1318,22 @@ class MarketDataCollector:
 
             raise categorized_exception
 
-    def get_multiple_symbols_data(self, symbols: List[str], data_type: str = "price") -> Dict[str, Any]:
+    def get_multiple_symbols_data(self, symbols: List[str], data_type: str = "price",
+                                  bulk: bool = True, max_workers: int = 4) -> Dict[str, Any]:
         """
         Get data for multiple symbols efficiently with intelligent rate limiting.
 
-        This method automatically distributes API calls over time to respect rate limits
-        when fetching data for multiple symbols.
+        Prices and tickers come from one fetch_tickers call and book tops from one
+        fetch_bids_asks call, and every symbol's cache entry is filled from that
+        single response. Symbols the bulk response lacks, and data types without a
+        batched endpoint (full order books), are fetched per symbol with bounded
+        concurrency; each call reserves its own weighted rate limit slot.
 
         Args:
             symbols (List[str]): List of trading symbols
-            data_type (str): Type of data ('price', 'ticker', 'orderbook')
+            data_type (str): Type of data ('price', 'ticker', 'orderbook', 'book_top')
+            bulk (bool): Use batched exchange endpoints when available (default: True)
+            max_workers (int): Concurrent per-symbol requests for the fallback path
 
         Returns:
             Dict[str, Any]: Dictionary with symbol as key and data as value
@@ -1071,43 +1341,75 @@ class MarketDataCollector:
         results = {}
         errors = {}
 
-        # Log the start of multi-symbol data collection
-        logger.debug(f"Fetching {data_type} data for {len(symbols)} symbols with rate limiting")
-
-        for i, symbol in enumerate(symbols):
-            try:
-                # Apply rate limiting before each API call
-                # Note: Individual methods also apply their own rate limiting,
-                # but this ensures proper distribution across multiple symbols
-                if i > 0:  # Skip rate limiting for first symbol
-                    self._apply_rate_limiting()
-
-                if data_type == "price":
-                    results[symbol] = self.get_current_price(symbol)
-                elif data_type == "ticker":
-                    results[symbol] = self.get_24h_ticker(symbol)
-                elif data_type == "orderbook":
-                    results[symbol] = self.get_orderbook(symbol)
-                else:
-                    raise DataValidationError(
-                        field="data_type",
-                        value=data_type,
-                        expected_type="'price', 'ticker', or 'orderbook'"
-                    )
+        fetchers = {
+            "price": self.get_current_price,
+            "ticker": self.get_24h_ticker,
+            "orderbook": self.get_orderbook,
+            "book_top": self._get_book_top
+        }
 
-                logger.debug(f"Successfully fetched {data_type} for {symbol} ({i+1}/{len(symbols)})")
+        if data_type not in fetchers:
+            error = DataValidationError(
+                field="data_type",
+                value=data_type,
+                expected_type="'price', 'ticker', 'orderbook', or 'book_top'"
+            )
+            errors = {symbol: str(error) for symbol in symbols}
+            symbols = []
+
+        logger.debug(f"Fetching {data_type} data for {len(symbols)} symbols")
+
+        # Symbols still cached need no request at all
+        cache_prefix = {"price": "current_price_", "ticker": "24h_ticker_", "book_top": "book_top_"}
+        pending = []
+        for symbol in dict.fromkeys(symbols):
+            cached = None
+            if data_type in cache_prefix:
+                cached = self._get_from_cache(f"{cache_prefix[data_type]}{symbol}")
+            if cached is not None:
+                results[symbol] = cached
+            else:
+                pending.append(symbol)
 
+        if pending and bulk:
+            bulk_results = None
+            try:
+                if data_type in ("price", "ticker") and self.exchange.has.get('fetchTickers'):
+                    bulk_results = self._fetch_tickers_bulk(pending, data_type)
+                elif data_type == "book_top" and self.exchange.has.get('fetchBidsAsks'):
+                    bulk_results = self._fetch_book_tops_bulk(pending)
             except Exception as e:
-                errors[symbol] = str(e)
-                logger.error(f"Failed to get {data_type} for {symbol}: {e}")
+                logger.warning(f"Bulk {data_type} request failed, falling back to per-symbol requests: {e}")
+
+            if bulk_results is not None:
+                results.update(bulk_results)
+                pending = [symbol for symbol in pending if symbol not in bulk_results]
+
+        if pending:
+            fetch = fetchers[data_type]
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending))),
+                                    thread_name_prefix='market-data') as executor:
+                futures = {executor.submit(fetch, symbol): symbol for symbol in pending}
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        results[symbol] = future.result()
+                        logger.debug(f"Successfully fetched {data_type} for {symbol}")
+                    except Exception as e:
+                        errors[symbol] = str(e)
+                        logger.error(f"Failed to get {data_type} for {symbol}: {e}")
 
         if errors:
             logger.warning(f"Errors occurred for {len(errors)} symbols: {list(errors.keys())}")
 
+        # Keep the caller's symbol order
+        results = {symbol: results[symbol] for symbol in symbols if symbol in results}
+
         # Log completion statistics
-        success_rate = (len(results) / len(symbols)) * 100 if symbols else 0
+        total = len(results) + len(errors)
+        success_rate = (len(results) / total) * 100 if total else 0
         logger.info(f"Multi-symbol {data_type} collection completed: "
-                   f"{len(results)}/{len(symbols)} successful ({success_rate:.1f}%)")
+                   f"{len(results)}/{total} successful ({success_rate:.1f}%)")
 
         return {
             "data": results,
@@ -1117,29 +1419,109 @@ class MarketDataCollector:
             "success_rate_percent": round(success_rate, 1)
         }
 
-    def get_cache_stats(self) -> Dict[str, Any]:
+    def _fetch_tickers_bulk(self, symbols: List[str], data_type: str) -> Dict[str, Any]:
         """
-        Get cache statistics for monitoring.
+        Fetch tickers of many symbols in one request and cache them per symbol.
+
+        Args:
+            symbols (List[str]): Trading symbols
+            data_type (str): 'price' (last price) or 'ticker' (normalized 24h ticker)
 
         Returns:
-            Dict[str, Any]: Cache statistics
+            Dict[str, Any]: Requested symbols found in the response
         """
-        now = time.time()
-        valid_entries = 0
-        expired_entries = 0
+        def _fetch_tickers():
+            self._apply_rate_limiting(binance_request_weight('fetch_tickers'))
+            return self.exchange.fetch_tickers(symbols)
 
-        for key, entry in self.cache.items():
-            if now - entry['timestamp'] < self.cache_ttl:
-                valid_entries += 1
-            else:
-                expired_entries += 1
+        tickers = simple_retry_call(_fetch_tickers, max_retries=3)
 
-        return {
-            "total_entries": len(self.cache),
-            "valid_entries": valid_entries,
-            "expired_entries": expired_entries,
-            "cache_ttl": self.cache_ttl
+        wanted = set(symbols)
+        results = {}
+        for symbol, ticker in tickers.items():
+            last = ticker.get('last')
+            if not isinstance(last, (int, float)) or last <= 0:
+                continue
+
+            # Every ticker in the response is cached, not only the requested ones
+            normalized = self._normalize_ticker_data(ticker, symbol)
+            self._set_cache(f"24h_ticker_{symbol}", normalized)
+            self._set_cache(f"current_price_{symbol}", float(last))
+
+            if symbol in wanted:
+                results[symbol] = float(last) if data_type == "price" else normalized
+
+        logger.debug(f"Bulk tickers: {len(tickers)} received, {len(results)}/{len(symbols)} requested")
+        return results
+
+    def _fetch_book_tops_bulk(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch best bid/ask of many symbols in one request and cache them per symbol.
+
+        Args:
+            symbols (List[str]): Trading symbols
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Requested symbols found in the response
+        """
+        def _fetch_bids_asks():
+            self._apply_rate_limiting(binance_request_weight('fetch_bids_asks'))
+            return self.exchange.fetch_bids_asks(symbols)
+
+        quotes = simple_retry_call(_fetch_bids_asks, max_retries=3)
+
+        wanted = set(symbols)
+        results = {}
+        for symbol, quote in quotes.items():
+            if quote.get('bid') is None or quote.get('ask') is None:
+                continue
+
+            book_top = {
+                'symbol': symbol,
+                'bid': float(quote['bid']),
+                'ask': float(quote['ask']),
+                'bid_volume': quote.get('bidVolume'),
+                'ask_volume': quote.get('askVolume'),
+                'timestamp': quote.get('timestamp') or int(time.time() * 1000)
+            }
+            self._set_cache(f"book_top_{symbol}", book_top)
+
+            if symbol in wanted:
+                results[symbol] = book_top
+
+        return results
+
+    def _get_book_top(self, symbol: str) -> Dict[str, Any]:
+        """Best bid/ask of one symbol from a shallow order book (per-symbol fallback)."""
+        return self._get_cached(f"book_top_{symbol}", lambda: self._fetch_book_top(symbol))
+
+    def _fetch_book_top(self, symbol: str) -> Dict[str, Any]:
+        """Fetch best bid/ask of one symbol, bypassing the book top cache."""
+        orderbook = self.get_orderbook(symbol, limit=5)
+        if not orderbook['bids'] or not orderbook['asks']:
+            raise InsufficientDataError(data_type="order book", required_count=1, available_count=0)
+
+        book_top = {
+            'symbol': symbol,
+            'bid': float(orderbook['bids'][0][0]),
+            'ask': float(orderbook['asks'][0][0]),
+            'bid_volume': float(orderbook['bids'][0][1]),
+            'ask_volume': float(orderbook['asks'][0][1]),
+            'timestamp': orderbook.get('timestamp') or int(time.time() * 1000)
         }
+        return book_top
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dict[str, Any]: Entry counts, hit/miss/stale/coalesced/eviction counters,
+                            hit rate and per-type TTL policies
+        """
+        stats = self.cache.get_stats()
+        stats["cache_ttl"] = self.cache_ttl
+        return stats
 
     def clear_cache(self):
         """Clear all cached data."""
@@ -0,0 +1,271 @@
+"""
+Keyed on-disk response cache for cryptocurrency trading bot.
+
+Entries live in one SQLite table keyed by cache key, so a lookup or store touches a
+single row no matter how large the cache grows:
+- Lazy loading: nothing is read at startup, entries are loaded on first use
+- Per-entry TTL: expired entries stay available as a fallback until compacted
+- Background compaction removes long-expired entries and enforces the size bound
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+import logging
+
+from .sqlite_pool import connect_sqlite
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class PersistentCache:
+    """
+    Thread-safe SQLite-backed cache with an in-memory LRU front.
+
+    Features:
+    - O(log n) get/set against an indexed table instead of rewriting a whole file
+    - Small in-memory LRU for hot keys, filled lazily from disk
+    - Per-entry expiry; expired values can still be read as a stale fallback
+    - Background compaction deletes entries expired longer than retain_expired_seconds
+      and evicts the oldest entries beyond max_entries, in small transactions
+    """
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 max_entries: int = 10000,
+                 memory_entries: int = 256,
+                 retain_expired_seconds: float = 86400.0,
+                 compaction_interval: float = 300.0,
+                 batch_size: int = 500):
+        """
+        Initialize the cache. The database file is created on first use.
+
+        Args:
+            path (Union[str, Path]): SQLite cache file
+            max_entries (int): Entries kept on disk before the oldest are evicted
+            memory_entries (int): Entries kept in the in-memory LRU
+            retain_expired_seconds (float): How long expired entries remain as fallback
+            compaction_interval (float): Seconds between background compactions (0 disables)
+            batch_size (int): Rows deleted per compaction transaction
+        """
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.memory_entries = max(0, memory_entries)
+        self.retain_expired_seconds = retain_expired_seconds
+        self.compaction_interval = compaction_interval
+        self.batch_size = max(1, batch_size)
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._memory: 'OrderedDict[str, Tuple[Any, float, float]]' = OrderedDict()
+
+        self._stop_event = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+
+        self.stats = dict.fromkeys(
+            ('memory_hits', 'disk_hits', 'misses', 'stale_hits', 'writes', 'compacted', 'evicted'), 0
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the cache database on first use (caller holds the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = connect_sqlite(str(self.path), row_factory=None,
+                                        pragmas={'cache_size': -2000, 'mmap_size': 0})
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    cache_key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries (expires_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_stored ON cache_entries (stored_at)")
+            self._conn.commit()
+            self._start_compactor()
+        return self._conn
+
+    def _remember(self, key: str, entry: Tuple[Any, float, float]):
+        if self.memory_entries == 0:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[Tuple[Any, float]]:
+        """
+        Look up an entry.
+
+        Args:
+            key (str): Cache key
+            allow_expired (bool): Also return entries past their TTL (stale fallback)
+
+        Returns:
+            Optional[Tuple[Any, float]]: (value, stored_at) or None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                source = 'memory_hits'
+            else:
+                try:
+                    row = self._connection().execute(
+                        "SELECT value, stored_at, expires_at FROM cache_entries WHERE cache_key = ?",
+                        (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning(f"Cache read failed for {key}: {e}")
+                    row = None
+
+                if row is None:
+                    self.stats['misses'] += 1
+                    return None
+
+                entry = (json.loads(row[0]), row[1], row[2])
+                self._remember(key, entry)
+                source = 'disk_hits'
+
+            value, stored_at, expires_at = entry
+            if now < expires_at:
+                self.stats[source] += 1
+                return value, stored_at
+
+            if allow_expired:
+                self.stats['stale_hits'] += 1
+                return value, stored_at
+
+            self.stats['misses'] += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        Store an entry.
+
+        Args:
+            key (str): Cache key
+            value (Any): JSON-serialisable value (other objects are stored via str())
+            ttl (float): Seconds until the entry expires
+        """
+        now = time.time()
+        payload = json.dumps(value, default=str)
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (cache_key, value, stored_at, expires_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, payload, now, now + ttl)
+                )
+                conn.commit()
+                self.stats['writes'] += 1
+            except sqlite3.Error as e:
+                logger.warning(f"Cache write failed for {key}: {e}")
+            self._remember(key, (value, now, now + ttl))
+
+    def __len__(self) -> int:
+        with self._lock:
+            try:
+                return self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            except sqlite3.Error:
+                return len(self._memory)
+
+    def _start_compactor(self):
+        if self.compaction_interval > 0 and self._compactor is None:
+            self._compactor = threading.Thread(target=self._compaction_loop, name='cache-compactor',
+                                               daemon=True)
+            self._compactor.start()
+
+    def _compaction_loop(self):
+        while not self._stop_event.wait(self.compaction_interval):
+            try:
+                self.compact()
+            except Exception as e:
+                logger.warning(f"Cache compaction failed: {e}")
+
+    def _delete_batch(self, where: str, params: tuple) -> int:
+        """Delete one batch of rows; the lock is released between batches."""
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute(
+                f"DELETE FROM cache_entries WHERE rowid IN "
+                f"(SELECT rowid FROM cache_entries {where} LIMIT ?)",
+                params + (self.batch_size,)
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Remove long-expired entries and evict the oldest entries beyond max_entries.
+
+        Returns:
+            Dict[str, int]: Entries removed as expired and as evicted
+        """
+        cutoff = time.time() - self.retain_expired_seconds
+        removed = {'expired': 0, 'evicted': 0}
+
+        while not self._stop_event.is_set():
+            count = self._delete_batch("WHERE expires_at < ?", (cutoff,))
+            removed['expired'] += count
+            if count < self.batch_size:
+                break
+
+        while not self._stop_event.is_set():
+            excess = len(self) - self.max_entries
+            if excess <= 0:
+                break
+            with self._lock:
+                conn = self._connection()
+                cursor = conn.execute(
+                    "DELETE FROM cache_entries WHERE rowid IN "
+                    "(SELECT rowid FROM cache_entries ORDER BY stored_at LIMIT ?)",
+                    (min(excess, self.batch_size),)
+                )
+                conn.commit()
+                removed['evicted'] += cursor.rowcount
+
+        with self._lock:
+            # Drop memory copies of entries that are gone from disk
+            if removed['expired'] or removed['evicted']:
+                self._memory.clear()
+            self.stats['compacted'] += removed['expired']
+            self.stats['evicted'] += removed['evicted']
+
+        if removed['expired'] or removed['evicted']:
+            logger.debug(f"Cache compaction removed {removed['expired']} expired and "
+                        f"{removed['evicted']} evicted entries from {self.path}")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss/write/compaction counters and entry counts
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats['memory_entries'] = len(self._memory)
+        stats['disk_entries'] = len(self)
+        stats['max_entries'] = self.max_entries
+        return stats
+
+    def close(self):
+        """Stop compaction and close the database."""
+        self._stop_event.set()
+        if self._compactor is not None:
+            self._compactor.join(timeout=5)
+            self._compactor = None
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,339 @@
+"""
+Tuned SQLite connections and writer/reader connection pool.
+
+Every SQLite database in the project opens its connections through connect_sqlite()
+so they share one set of PRAGMAs:
+- WAL journal: readers never block the writer and the writer never blocks readers
+- synchronous=NORMAL: durable at checkpoints, no fsync per transaction in WAL mode
+- mmap_size / cache_size: hot pages are served from memory instead of read() calls
+- busy_timeout: lock contention waits inside SQLite instead of failing immediately
+- auto_vacuum=INCREMENTAL (new files): deleted pages can be returned without a full VACUUM
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+# Default PRAGMAs for file-backed databases
+SQLITE_PRAGMAS: Dict[str, Any] = {
+    # Must precede journal_mode: only takes effect before the file header is written
+    'auto_vacuum': 'INCREMENTAL',
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 30000,           # ms
+    'mmap_size': 256 * 1024 * 1024,  # 256 MB
+    'cache_size': -64000,            # negative = KiB, i.e. 64 MB per connection
+    'temp_store': 'MEMORY',
+}
+
+
+def is_memory_database(database_path: str) -> bool:
+    """Return True for in-memory databases, which cannot use WAL or be shared across connections."""
+    return database_path in ('', ':memory:') or 'mode=memory' in database_path
+
+
+def configure_sqlite_connection(conn: sqlite3.Connection, read_only: bool = False,
+                                pragmas: Optional[Dict[str, Any]] = None) -> sqlite3.Connection:
+    """
+    Apply the project PRAGMAs to an open connection.
+
+    Args:
+        conn (sqlite3.Connection): Connection to configure (sqlite3 or DBAPI connection of a
+                                   SQLAlchemy engine)
+        read_only (bool): Reject writes on this connection (PRAGMA query_only)
+        pragmas (Optional[Dict[str, Any]]): Overrides for SQLITE_PRAGMAS
+
+    Returns:
+        sqlite3.Connection: The same connection
+    """
+    settings = dict(SQLITE_PRAGMAS)
+    if pragmas:
+        settings.update(pragmas)
+
+    cursor = conn.cursor()
+    try:
+        for name, value in settings.items():
+            if value is None:
+                continue
+            try:
+                cursor.execute(f"PRAGMA {name}={value}")
+            except sqlite3.DatabaseError as e:
+                # e.g. WAL on a read-only directory - keep the connection usable
+                logger.warning(f"Could not set PRAGMA {name}={value}: {e}")
+
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+    return conn
+
+
+def connect_sqlite(database_path: str, read_only: bool = False, timeout: float = 30.0,
+                   row_factory: Optional[Any] = sqlite3.Row, check_same_thread: bool = False,
+                   pragmas: Optional[Dict[str, Any]] = None) -> sqlite3.Connection:
+    """
+    Open a tuned SQLite connection.
+
+    Args:
+        database_path (str): Database file path
+        read_only (bool): Reject writes on this connection
+        timeout (float): Seconds to wait for a database lock
+        row_factory (Optional[Any]): Row factory (sqlite3.Row for access by column name)
+        check_same_thread (bool): sqlite3 same-thread check (off for pooled connections)
+        pragmas (Optional[Dict[str, Any]]): Overrides for SQLITE_PRAGMAS
+
+    Returns:
+        sqlite3.Connection: Configured connection
+    """
+    conn = sqlite3.connect(database_path, timeout=timeout, check_same_thread=check_same_thread)
+    if row_factory is not None:
+        conn.row_factory = row_factory
+
+    if is_memory_database(database_path):
+        pragmas = {**(pragmas or {}), 'journal_mode': None, 'mmap_size': None}
+
+    return configure_sqlite_connection(conn, read_only=read_only, pragmas=pragmas)
+
+
+def install_sqlalchemy_pragmas(engine, pragmas: Optional[Dict[str, Any]] = None):
+    """
+    Apply the project PRAGMAs to every connection a SQLAlchemy engine opens.
+
+    Non-SQLite engines are left untouched.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine to configure
+        pragmas (Optional[Dict[str, Any]]): Overrides for SQLITE_PRAGMAS
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+
+    from sqlalchemy import event
+
+    memory = is_memory_database(engine.url.database or '')
+
+    @event.listens_for(engine, 'connect')
+    def _configure(dbapi_connection, connection_record):
+        overrides = dict(pragmas or {})
+        if memory:
+            overrides.update(journal_mode=None, mmap_size=None)
+        configure_sqlite_connection(dbapi_connection, pragmas=overrides)
+
+
+class PoolMetrics:
+    """
+    Thread-safe wait-time and utilisation counters for SQLiteConnectionPool.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all counters."""
+        with self.lock:
+            self.acquisitions = {'reader': 0, 'writer': 0}
+            self.total_wait = {'reader': 0.0, 'writer': 0.0}
+            self.max_wait = {'reader': 0.0, 'writer': 0.0}
+            self.busy_time = {'reader': 0.0, 'writer': 0.0}
+            self.in_use = {'reader': 0, 'writer': 0}
+            self.started_at = time.perf_counter()
+
+    def acquired(self, kind: str, wait: float):
+        with self.lock:
+            self.acquisitions[kind] += 1
+            self.total_wait[kind] += wait
+            self.max_wait[kind] = max(self.max_wait[kind], wait)
+            self.in_use[kind] += 1
+
+    def released(self, kind: str, held: float):
+        with self.lock:
+            self.in_use[kind] -= 1
+            self.busy_time[kind] += held
+
+    def snapshot(self, sizes: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Get current metrics.
+
+        Args:
+            sizes (Dict[str, int]): Number of connections per kind
+
+        Returns:
+            Dict[str, Any]: Per-kind acquisitions, wait times (ms) and utilisation (%)
+        """
+        with self.lock:
+            elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+            metrics = {}
+            for kind in ('writer', 'reader'):
+                count = self.acquisitions[kind]
+                metrics[kind] = {
+                    'connections': sizes.get(kind, 0),
+                    'in_use': self.in_use[kind],
+                    'acquisitions': count,
+                    'avg_wait_ms': round(self.total_wait[kind] / count * 1000, 3) if count else 0.0,
+                    'max_wait_ms': round(self.max_wait[kind] * 1000, 3),
+                    'utilisation_percent': round(
+                        self.busy_time[kind] / (elapsed * max(sizes.get(kind, 0), 1)) * 100, 1
+                    )
+                }
+            return metrics
+
+
+class SQLiteConnectionPool:
+    """
+    One writer connection plus N read-only reader connections to a SQLite database.
+
+    SQLite allows a single writer at a time. Writers queue on a Python lock around
+    the one writer connection rather than on SQLite's file lock, which avoids
+    "database is locked" busy-loops. In WAL mode readers run concurrently with the
+    writer on their own connections.
+    """
+
+    def __init__(self, database_path: str, max_readers: int = 4, timeout: float = 30.0,
+                 pragmas: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the pool. Connections are opened lazily.
+
+        Args:
+            database_path (str): Database file path
+            max_readers (int): Maximum reader connections (in-memory databases use the writer only)
+            timeout (float): Seconds to wait for a connection before raising TimeoutError
+            pragmas (Optional[Dict[str, Any]]): Overrides for SQLITE_PRAGMAS
+        """
+        self.database_path = database_path
+        self.timeout = timeout
+        self.pragmas = pragmas
+
+        # In-memory databases are private to one connection
+        self.max_readers = 0 if is_memory_database(database_path) else max(0, max_readers)
+
+        self._writer: Optional[sqlite3.Connection] = None
+        # Re-entrant so a writer block can call helpers that open their own writer block
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+
+        self._readers_idle: List[sqlite3.Connection] = []
+        self._readers_open = 0
+        self._readers_cond = threading.Condition()
+
+        self.metrics = PoolMetrics()
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        return connect_sqlite(self.database_path, read_only=read_only, timeout=self.timeout,
+                              pragmas=self.pragmas)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Exclusive access to the writer connection.
+
+        Uncommitted changes are rolled back when the outermost block exits, so a
+        failed transaction never leaks into the next user of the connection.
+
+        Yields:
+            sqlite3.Connection: The writer connection
+        """
+        start = time.perf_counter()
+        if not self._writer_lock.acquire(timeout=self.timeout):
+            raise TimeoutError(f"Timed out waiting for the writer connection of {self.database_path}")
+
+        acquired = time.perf_counter()
+        self._writer_depth += 1
+        outermost = self._writer_depth == 1
+        if outermost:
+            self.metrics.acquired('writer', acquired - start)
+        try:
+            if self._writer is None:
+                self._writer = self._open(read_only=False)
+            yield self._writer
+        finally:
+            self._writer_depth -= 1
+            try:
+                if outermost and self._writer is not None and self._writer.in_transaction:
+                    self._writer.rollback()
+            finally:
+                if outermost:
+                    self.metrics.released('writer', time.perf_counter() - acquired)
+                self._writer_lock.release()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        A read-only connection (the writer connection if the pool has no readers).
+
+        Yields:
+            sqlite3.Connection: Read-only connection
+        """
+        if self.max_readers == 0:
+            with self.writer() as conn:
+                yield conn
+            return
+
+        start = time.perf_counter()
+        conn = None
+        with self._readers_cond:
+            while not self._readers_idle and self._readers_open >= self.max_readers:
+                remaining = self.timeout - (time.perf_counter() - start)
+                if remaining <= 0 or not self._readers_cond.wait(timeout=remaining):
+                    raise TimeoutError(f"Timed out waiting for a reader connection of {self.database_path}")
+            if self._readers_idle:
+                conn = self._readers_idle.pop()
+            else:
+                self._readers_open += 1
+
+        if conn is None:
+            try:
+                conn = self._open(read_only=True)
+            except Exception:
+                with self._readers_cond:
+                    self._readers_open -= 1
+                    self._readers_cond.notify()
+                raise
+
+        acquired = time.perf_counter()
+        self.metrics.acquired('reader', acquired - start)
+        try:
+            yield conn
+        finally:
+            # End the read transaction so the WAL can be checkpointed
+            if conn.in_transaction:
+                conn.rollback()
+            self.metrics.released('reader', time.perf_counter() - acquired)
+            with self._readers_cond:
+                self._readers_idle.append(conn)
+                self._readers_cond.notify()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get pool wait-time and utilisation metrics.
+
+        Returns:
+            Dict[str, Any]: Metrics per connection kind ('writer', 'reader')
+        """
+        with self._readers_cond:
+            readers = self._readers_open
+        sizes = {'writer': 1 if self._writer is not None else 0, 'reader': readers}
+        metrics = self.metrics.snapshot(sizes)
+        metrics['max_readers'] = self.max_readers
+        return metrics
+
+    def close_all(self):
+        """Close the writer and all idle reader connections."""
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._readers_cond:
+            for conn in self._readers_idle:
+                conn.close()
+            self._readers_open -= len(self._readers_idle)
+            self._readers_idle.clear()
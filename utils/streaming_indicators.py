@@ -0,0 +1,474 @@
+"""
+Incremental (streaming) technical indicators for cryptocurrency trading bot.
+
+Every indicator keeps O(1) state and is advanced one value at a time, so a monitor can
+refresh hundreds of symbols per second without rebuilding a DataFrame on every tick.
+Values match the pandas batch implementations used elsewhere in the project
+(rolling mean/std, ewm(span) with adjust=True/False, SMA-based RSI).
+
+Each indicator exposes step(value, commit):
+- commit=True advances the state with a closed value
+- commit=False returns the value as if `value` were appended, leaving state untouched
+  (used for a candle that is still forming)
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# OHLCV candle layout used throughout the project
+TIMESTAMP, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+
+
+class StreamingEMA:
+    """
+    Exponential moving average equivalent to pandas Series.ewm(span=span, adjust=adjust).mean().
+
+    The recurrence mirrors pandas' ewma kernel, so values are identical to the batch
+    computation over the same history.
+    """
+
+    def __init__(self, span: int, adjust: bool = True):
+        com = (span - 1) / 2.0
+        alpha = 1.0 / (1.0 + com)
+        self.span = span
+        self.adjust = adjust
+        self._old_wt_factor = 1.0 - alpha
+        self._new_wt = 1.0 if adjust else alpha
+        self._weighted: Optional[float] = None
+        self._old_wt = 1.0
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._weighted
+
+    def step(self, x: float, commit: bool = True) -> float:
+        if self._weighted is None:
+            weighted, old_wt = float(x), 1.0
+        else:
+            old_wt = self._old_wt * self._old_wt_factor
+            weighted = self._weighted
+            if weighted != x:
+                weighted = ((old_wt * weighted) + (self._new_wt * x)) / (old_wt + self._new_wt)
+            old_wt = old_wt + self._new_wt if self.adjust else 1.0
+
+        if commit:
+            self._weighted, self._old_wt = weighted, old_wt
+        return weighted
+
+
+class RollingWindow:
+    """
+    Fixed-size rolling mean and sample standard deviation (ddof=1).
+
+    Uses Welford add/remove updates, the same scheme pandas uses for rolling var.
+    Values are None until the window is full (pandas min_periods=window).
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: Deque[float] = deque()
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def is_ready(self) -> bool:
+        return self._n == self.period
+
+    def _advance(self, x: float) -> Tuple[int, float, float]:
+        n, mean, m2 = self._n, self._mean, self._m2
+
+        if len(self.window) == self.period:
+            old = self.window[0]
+            n -= 1
+            if n == 0:
+                mean, m2 = 0.0, 0.0
+            else:
+                delta = old - mean
+                mean -= delta / n
+                m2 -= delta * (old - mean)
+
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        return n, mean, max(m2, 0.0)
+
+    def step(self, x: float, commit: bool = True) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Returns:
+            Tuple[Optional[float], Optional[float]]: (mean, std) once the window is full
+        """
+        x = float(x)
+        n, mean, m2 = self._advance(x)
+
+        if commit:
+            if len(self.window) == self.period:
+                self.window.popleft()
+            self.window.append(x)
+            self._n, self._mean, self._m2 = n, mean, m2
+
+        if n < self.period:
+            return None, None
+        std = math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+        return mean, std
+
+
+class StreamingRSI:
+    """
+    Relative Strength Index.
+
+    method='sma' matches the project's batch RSI (rolling mean of gains/losses, the first
+    bar counting as a zero change). method='wilder' uses Wilder's smoothing seeded with
+    the SMA of the first `period` changes.
+    """
+
+    def __init__(self, period: int = 14, method: str = 'sma'):
+        if method not in ('sma', 'wilder'):
+            raise ValueError(f"Unknown RSI method: {method}")
+        self.period = period
+        self.method = method
+        self._prev: Optional[float] = None
+
+        # sma mode
+        self._gains = RollingWindow(period)
+        self._losses = RollingWindow(period)
+
+        # wilder mode
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    @staticmethod
+    def _rsi(gain: Optional[float], loss: Optional[float]) -> Optional[float]:
+        if gain is None or loss is None:
+            return None
+        if loss == 0:
+            return 100.0 if gain > 0 else None
+        return 100.0 - (100.0 / (1.0 + gain / loss))
+
+    def step(self, x: float, commit: bool = True) -> Optional[float]:
+        x = float(x)
+        delta = 0.0 if self._prev is None else x - self._prev
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+
+        if self.method == 'sma':
+            avg_gain, _ = self._gains.step(gain, commit)
+            avg_loss, _ = self._losses.step(loss, commit)
+            if commit:
+                self._prev = x
+            return self._rsi(avg_gain, avg_loss)
+
+        # Wilder: the first bar only seeds the previous close
+        if self._prev is None:
+            if commit:
+                self._prev = x
+            return None
+
+        count = self._count + 1
+        if count <= self.period:
+            avg_gain = (self._avg_gain * (count - 1) + gain) / count
+            avg_loss = (self._avg_loss * (count - 1) + loss) / count
+        else:
+            avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+            avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+
+        if commit:
+            self._prev, self._count = x, count
+            self._avg_gain, self._avg_loss = avg_gain, avg_loss
+
+        if count < self.period:
+            return None
+        return self._rsi(avg_gain, avg_loss)
+
+
+class StreamingMACD:
+    """MACD line, signal line and histogram from ewm(span) with adjust=True."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = StreamingEMA(fast)
+        self._slow = StreamingEMA(slow)
+        self._signal = StreamingEMA(signal)
+
+    def step(self, x: float, commit: bool = True) -> Tuple[float, float, float]:
+        macd_line = self._fast.step(x, commit) - self._slow.step(x, commit)
+        signal_line = self._signal.step(macd_line, commit)
+        return macd_line, signal_line, macd_line - signal_line
+
+
+class StreamingATR:
+    """Average True Range, matching ATRCalculator (true range smoothed with ewm(span, adjust=False))."""
+
+    def __init__(self, period: int = 14):
+        self._ema = StreamingEMA(period, adjust=False)
+        self._prev_close: Optional[float] = None
+
+    def step(self, high: float, low: float, close: float, commit: bool = True) -> Tuple[float, float]:
+        true_range = high - low
+        if self._prev_close is not None:
+            true_range = max(true_range, abs(high - self._prev_close), abs(low - self._prev_close))
+
+        atr = self._ema.step(true_range, commit)
+        if commit:
+            self._prev_close = float(close)
+        return atr, true_range
+
+
+class IndicatorSeries:
+    """
+    Indicator state for one (exchange, symbol, timeframe) series.
+
+    Closed candles are committed; a candle that is still forming is kept as `pending`
+    and only committed once a newer candle arrives, so repeated updates of the live
+    candle cost O(1) each and never corrupt the state.
+    """
+
+    def __init__(self, rsi_period: int = 14, rsi_method: str = 'sma',
+                 sma_periods: Sequence[int] = (10, 20, 50), ema_periods: Sequence[int] = (10, 20),
+                 macd: Tuple[int, int, int] = (12, 26, 9), bb_period: int = 20, bb_std: float = 2.0,
+                 atr_period: int = 14, volume_period: int = 20, volatility_period: int = 20,
+                 change_lookbacks: Sequence[int] = (60, 240)):
+        self.rsi = StreamingRSI(rsi_period, rsi_method)
+        self.smas = {period: RollingWindow(period) for period in sma_periods}
+        self.emas = {period: StreamingEMA(period) for period in ema_periods}
+        self.macd = StreamingMACD(*macd)
+        self.bollinger = RollingWindow(bb_period)
+        self.bb_std = bb_std
+        self.atr = StreamingATR(atr_period)
+        self.volume = RollingWindow(volume_period)
+        self.returns = RollingWindow(volatility_period)
+        self.change_lookbacks = tuple(change_lookbacks)
+        self.closes: Deque[float] = deque(maxlen=max(self.change_lookbacks, default=0) + 1)
+
+        self.last_committed_ts: Optional[int] = None
+        self.pending: Optional[List[float]] = None
+        self.candle_count = 0
+        self.snapshot: Dict[str, Any] = {}
+
+    def _evaluate(self, candle: Sequence[float], commit: bool) -> Dict[str, Any]:
+        high, low = float(candle[HIGH]), float(candle[LOW])
+        close, volume = float(candle[CLOSE]), float(candle[VOLUME])
+        prev_close = self.closes[-1] if self.closes else None
+
+        values: Dict[str, Any] = {
+            'timestamp': candle[TIMESTAMP],
+            'close': close,
+            'rsi': self.rsi.step(close, commit)
+        }
+
+        for period, window in self.smas.items():
+            values[f'sma_{period}'] = window.step(close, commit)[0]
+        for period, ema in self.emas.items():
+            values[f'ema_{period}'] = ema.step(close, commit)
+
+        values['macd_line'], values['macd_signal'], values['macd_histogram'] = self.macd.step(close, commit)
+
+        middle, std = self.bollinger.step(close, commit)
+        if middle is not None:
+            values['bb_middle'] = middle
+            values['bb_upper'] = middle + std * self.bb_std
+            values['bb_lower'] = middle - std * self.bb_std
+            values['bb_width'] = ((values['bb_upper'] - values['bb_lower']) / middle) * 100 if middle else None
+        else:
+            values['bb_middle'] = values['bb_upper'] = values['bb_lower'] = values['bb_width'] = None
+
+        values['atr'], values['true_range'] = self.atr.step(high, low, close, commit)
+
+        volume_sma = self.volume.step(volume, commit)[0]
+        values['volume_sma'] = volume_sma
+        values['volume_ratio'] = (volume / volume_sma if volume_sma else 1) if volume_sma is not None else None
+
+        if prev_close is not None and prev_close != 0:
+            volatility = self.returns.step(close / prev_close - 1, commit)[1]
+            values['volatility'] = volatility * 100 if volatility is not None else None
+        else:
+            values['volatility'] = None
+
+        # Percentage change versus `lookback` bars back, counting the current bar
+        if commit:
+            self.closes.append(close)
+        count = len(self.closes) + (0 if commit else 1)
+        for lookback in self.change_lookbacks:
+            if count >= lookback:
+                index = count - lookback
+                base = self.closes[index] if index < len(self.closes) else close
+                values[f'price_change_{lookback}'] = (close - base) / base * 100 if base else 0
+            else:
+                values[f'price_change_{lookback}'] = 0
+
+        return values
+
+    def update(self, candle: Sequence[float], closed: bool = False) -> Dict[str, Any]:
+        """
+        Feed one candle [timestamp, open, high, low, close, volume].
+
+        Args:
+            candle (Sequence[float]): OHLCV candle
+            closed (bool): True if the candle is final
+
+        Returns:
+            Dict[str, Any]: Latest indicator values
+        """
+        timestamp = candle[TIMESTAMP]
+
+        # Ignore candles older than what is already committed
+        if self.last_committed_ts is not None and timestamp <= self.last_committed_ts:
+            return self.snapshot
+
+        if self.pending is not None and timestamp != self.pending[TIMESTAMP]:
+            if timestamp < self.pending[TIMESTAMP]:
+                return self.snapshot
+            self._commit(self.pending)
+            self.pending = None
+
+        if closed:
+            self.pending = None
+            self.snapshot = self._commit(candle)
+        else:
+            self.pending = list(candle)
+            self.snapshot = self._evaluate(candle, commit=False)
+
+        return self.snapshot
+
+    def _commit(self, candle: Sequence[float]) -> Dict[str, Any]:
+        values = self._evaluate(candle, commit=True)
+        self.last_committed_ts = candle[TIMESTAMP]
+        self.candle_count += 1
+        return values
+
+
+class StreamingIndicatorEngine:
+    """
+    Registry of IndicatorSeries keyed by (exchange, symbol, timeframe).
+
+    Thread-safe; each series has its own lock so monitors on different threads or
+    event loops can feed different symbols concurrently.
+    """
+
+    def __init__(self, **series_params):
+        """
+        Initialize the engine.
+
+        Args:
+            **series_params: Indicator parameters forwarded to every IndicatorSeries
+        """
+        self.series_params = series_params
+        self._series: Dict[Tuple[str, str, str], IndicatorSeries] = {}
+        self._locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _get(self, key: Tuple[str, str, str]) -> Tuple[IndicatorSeries, threading.Lock]:
+        with self._guard:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = IndicatorSeries(**self.series_params)
+                self._locks[key] = threading.Lock()
+            return series, self._locks[key]
+
+    def update_candle(self, exchange: str, symbol: str, timeframe: str,
+                      candle: Sequence[float], closed: bool = False) -> Dict[str, Any]:
+        """
+        Feed a single candle for a series.
+
+        Args:
+            exchange (str): Exchange name
+            symbol (str): Trading symbol
+            timeframe (str): Candle timeframe
+            candle (Sequence[float]): [timestamp, open, high, low, close, volume]
+            closed (bool): True if the candle is final
+
+        Returns:
+            Dict[str, Any]: Latest indicator values
+        """
+        series, lock = self._get((exchange, symbol, timeframe))
+        with lock:
+            return series.update(candle, closed)
+
+    def update_ohlcv(self, exchange: str, symbol: str, timeframe: str,
+                     ohlcv: Iterable[Sequence[float]], last_is_open: bool = True) -> Dict[str, Any]:
+        """
+        Feed a fetched OHLCV window; only candles newer than the series state are processed.
+
+        Args:
+            exchange (str): Exchange name
+            symbol (str): Trading symbol
+            timeframe (str): Candle timeframe
+            ohlcv (Iterable[Sequence[float]]): Chronological OHLCV candles
+            last_is_open (bool): Treat the last candle as still forming
+
+        Returns:
+            Dict[str, Any]: Latest indicator values
+        """
+        candles = list(ohlcv)
+        series, lock = self._get((exchange, symbol, timeframe))
+
+        with lock:
+            if not candles:
+                return series.snapshot
+
+            # Skip everything already committed without touching it
+            start = 0
+            if series.last_committed_ts is not None:
+                while start < len(candles) and candles[start][TIMESTAMP] <= series.last_committed_ts:
+                    start += 1
+
+            last = len(candles) - 1
+            for i in range(start, len(candles)):
+                series.update(candles[i], closed=not (last_is_open and i == last))
+            return series.snapshot
+
+    def get_snapshot(self, exchange: str, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """
+        Get the latest indicator values for a series without feeding data.
+
+        Returns:
+            Dict[str, Any]: Latest indicator values (empty if the series is unknown)
+        """
+        with self._guard:
+            series = self._series.get((exchange, symbol, timeframe))
+        return dict(series.snapshot) if series is not None else {}
+
+    def candle_count(self, exchange: str, symbol: str, timeframe: str) -> int:
+        """Number of committed candles for a series."""
+        with self._guard:
+            series = self._series.get((exchange, symbol, timeframe))
+        return series.candle_count if series is not None else 0
+
+    def reset(self, exchange: Optional[str] = None, symbol: Optional[str] = None,
+              timeframe: Optional[str] = None):
+        """Drop series matching the given filters (all series if no filter is given)."""
+        with self._guard:
+            for key in list(self._series):
+                if ((exchange is None or key[0] == exchange) and
+                        (symbol is None or key[1] == symbol) and
+                        (timeframe is None or key[2] == timeframe)):
+                    del self._series[key]
+                    del self._locks[key]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Engine statistics."""
+        with self._guard:
+            return {
+                'series_count': len(self._series),
+                'series': [f"{e}:{s}:{t}" for e, s, t in self._series]
+            }
+
+
+_shared_engine: Optional[StreamingIndicatorEngine] = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_indicator_engine() -> StreamingIndicatorEngine:
+    """
+    Get the process-wide indicator engine shared by all market monitors.
+
+    Returns:
+        StreamingIndicatorEngine: Shared engine instance
+    """
+    global _shared_engine
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            _shared_engine = StreamingIndicatorEngine()
+        return _shared_engine
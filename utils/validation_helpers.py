@@ -3,7 +3,10 @@ Validation helper functions for cryptocurrency trading bot.
 Provides common validation logic for parameters, data integrity, and input sanitization.
 """
 
-from typing import Any, List, Dict, Optional, Union
+from typing import Any, List, Dict, Optional, Tuple, Union
+
+import numpy as np
+
 from .exceptions import DataValidationError
 
 
@@ -474,6 +477,140 @@ def _validate_positive_prices_lenient(open_price: float, high: float, low: float
         )
 
 
+# Rejection reasons of validate_ohlcv_array, in the order they are checked
+OHLCV_REJECTION_REASONS = (
+    'malformed',             # not a row, fewer than 5 fields or non-numeric values
+    'non_finite',            # NaN or infinity
+    'negative_volume',
+    'high_below_open_close',
+    'low_above_open_close',
+    'non_positive_price',
+    'duplicate_timestamp',   # later rows repeating an accepted timestamp
+    'out_of_order'           # strict only: timestamp not above every earlier accepted row
+)
+
+
+def ohlcv_to_array(ohlcv: Union[List[Any], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert OHLCV rows to an (n, 6) float64 array.
+
+    Rows are normalised like validate_ohlcv_candle: a missing volume is padded with
+    0.0 and fields beyond the sixth are dropped. Rows that cannot be converted are
+    filled with NaN and flagged.
+
+    Args:
+        ohlcv (Union[List[Any], np.ndarray]): Rows of [timestamp, open, high, low, close, volume]
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (n, 6) values and a boolean mask of malformed rows
+    """
+    n = len(ohlcv)
+
+    # Fast path: rectangular numeric input converts in one call
+    try:
+        values = np.asarray(ohlcv, dtype=np.float64)
+        if values.ndim == 2 and values.shape[1] >= 5:
+            if values.shape[1] == 5:
+                values = np.column_stack([values, np.zeros(n)])
+            return np.ascontiguousarray(values[:, :6]), np.zeros(n, dtype=bool)
+    except (TypeError, ValueError, OverflowError):
+        pass
+
+    # Slow path: ragged rows, None or non-numeric fields
+    values = np.full((n, 6), np.nan)
+    malformed = np.zeros(n, dtype=bool)
+    for i, candle in enumerate(ohlcv):
+        if not isinstance(candle, (list, tuple, np.ndarray)) or len(candle) < 5:
+            malformed[i] = True
+            continue
+        try:
+            row = [float(value.strip() if isinstance(value, str) else value) for value in candle[:6]]
+        except (TypeError, ValueError, OverflowError):
+            malformed[i] = True
+            continue
+        values[i, :len(row)] = row
+        if len(row) == 5:
+            values[i, 5] = 0.0
+
+    return values, malformed
+
+
+def validate_ohlcv_array(ohlcv: Union[List[Any], np.ndarray],
+                         strict: bool = False) -> Tuple[np.ndarray, np.ndarray, Dict[str, int]]:
+    """
+    Validate a whole batch of OHLCV candles in a few vectorized passes.
+
+    Applies the same rules as validate_ohlcv_candle (including its strict/lenient
+    tolerances) to every row at once, and additionally rejects duplicate timestamps
+    and, in strict mode, timestamps that go backwards.
+
+    Args:
+        ohlcv (Union[List[Any], np.ndarray]): (n, 6) array or list of OHLCV rows
+        strict (bool): Enable strict validation for production data
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, Dict[str, int]]: (n, 6) float64 values, boolean mask
+            of accepted rows, and rejected row counts per reason (each rejected row is
+            counted under the first failing reason in OHLCV_REJECTION_REASONS)
+    """
+    values, malformed = ohlcv_to_array(ohlcv)
+    timestamp, open_price, high, low, close, volume = values.T
+
+    max_oc = np.maximum(open_price, close)
+    min_oc = np.minimum(open_price, close)
+    prices = values[:, 1:5]
+
+    if strict:
+        high_bad = high < max_oc
+        low_bad = low > min_oc
+        price_bad = (prices <= 0).any(axis=1)
+    else:
+        # Same tolerances as the lenient per-candle checks
+        tolerance = 0.01
+        high_bad = high < max_oc * (1 - tolerance)
+        low_bad = low > min_oc * (1 + tolerance)
+        price_bad = (prices < -0.001).any(axis=1)
+
+    accepted = np.ones(len(values), dtype=bool)
+    rejections: Dict[str, int] = {}
+
+    def reject(reason: str, failed: np.ndarray):
+        failed = failed & accepted
+        count = int(failed.sum())
+        if count:
+            rejections[reason] = count
+            accepted[failed] = False
+
+    reject('malformed', malformed)
+    reject('non_finite', ~np.isfinite(values).all(axis=1))
+    reject('negative_volume', volume < 0)
+    reject('high_below_open_close', high_bad)
+    reject('low_above_open_close', low_bad)
+    reject('non_positive_price', price_bad)
+
+    # Timestamp checks only consider rows that passed everything else
+    candidates = np.flatnonzero(accepted)
+    if len(candidates):
+        candidate_ts = timestamp[candidates]
+
+        _, first = np.unique(candidate_ts, return_index=True)
+        duplicate = np.ones(len(candidates), dtype=bool)
+        duplicate[first] = False
+        repeated = np.zeros(len(values), dtype=bool)
+        repeated[candidates[duplicate]] = True
+        reject('duplicate_timestamp', repeated)
+
+        if strict:
+            candidates = np.flatnonzero(accepted)
+            candidate_ts = timestamp[candidates]
+            previous_max = np.maximum.accumulate(np.concatenate(([-np.inf], candidate_ts[:-1])))
+            backwards = np.zeros(len(values), dtype=bool)
+            backwards[candidates[candidate_ts <= previous_max]] = True
+            reject('out_of_order', backwards)
+
+    return values, accepted, rejections
+
+
 def validate_orderbook_data(orderbook: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate orderbook data structure.